@@ -0,0 +1,43 @@
+"""Add mindscape_graph_fragments for the materialized derived graph.
+
+Revision ID: 20261016090000
+Revises: 20260802100000
+
+One row per workspace holds the derived intent and execution nodes plus the
+change-counter version they were built at, so graph reads only re-derive
+what changed since the last read.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016090000"
+down_revision = "20260802100000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "mindscape_graph_fragments",
+        sa.Column("workspace_id", sa.Text(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "nodes",
+            sa.Text(),
+            nullable=False,
+            comment="JSON-serialized derived nodes for the workspace",
+        ),
+        sa.Column("derived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("mindscape_graph_fragments")
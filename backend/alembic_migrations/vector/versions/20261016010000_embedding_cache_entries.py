@@ -0,0 +1,76 @@
+"""Add the content-addressed embedding cache tier.
+
+Revision ID: 20261016010000
+Revises: 20260729010000
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016010000"
+down_revision = "20260729010000"
+branch_labels = None
+depends_on = None
+
+RUNTIME_ROLE = "mindscape_vector_runtime"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_cache_entries",
+        sa.Column("cache_key", sa.Text(), primary_key=True),
+        sa.Column("model", sa.Text(), nullable=False),
+        sa.Column("role", sa.Text(), nullable=False),
+        sa.Column("provider", sa.Text(), nullable=False),
+        sa.Column("dimension", sa.Integer(), nullable=False),
+        sa.Column("embedding", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "hit_count",
+            sa.BigInteger(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column(
+            "last_hit_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.CheckConstraint(
+            "char_length(cache_key) = 64",
+            name="ck_embedding_cache_key",
+        ),
+        sa.CheckConstraint(
+            "role IN ('query', 'document', 'symmetric')",
+            name="ck_embedding_cache_role",
+        ),
+        sa.CheckConstraint(
+            "dimension > 0 AND octet_length(embedding) = dimension * 4",
+            name="ck_embedding_cache_dimension",
+        ),
+    )
+    op.create_index(
+        "idx_embedding_cache_last_hit",
+        "embedding_cache_entries",
+        ["last_hit_at"],
+    )
+    op.execute(
+        f"""
+        GRANT SELECT, INSERT, UPDATE, DELETE
+        ON TABLE public.embedding_cache_entries TO {RUNTIME_ROLE}
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_cache_entries")
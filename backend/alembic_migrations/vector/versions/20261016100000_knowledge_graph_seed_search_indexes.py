@@ -0,0 +1,120 @@
+"""Index the lexical documents of knowledge-graph seed search.
+
+The graph tables get expression GIN indexes rather than stored generated
+columns: adding a stored column rewrites the whole table under ACCESS
+EXCLUSIVE, while CREATE INDEX CONCURRENTLY keeps reads and writes running.
+
+Revision ID: 20261016100000
+Revises: 20261016010000
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261016100000"
+down_revision = "20261016010000"
+branch_labels = None
+depends_on = None
+
+BIGRAM_FUNCTION = "public.knowledge_cjk_bigram_text"
+
+# Same ranges and width as knowledge_retrieval.keyword_query.cjk_prefix_tsquery:
+# the 'simple' parser keeps a CJK run as one token, so bigram prefix terms
+# only match mid-run once the document carries the bigrams as lexemes.
+CREATE_BIGRAM_FUNCTION = rf"""
+CREATE OR REPLACE FUNCTION {BIGRAM_FUNCTION}(input text)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT COALESCE(string_agg(substr(run.value, bigram.start, 2), ' '), '')
+    FROM regexp_matches(
+        COALESCE(input, ''),
+        '[\u3400-\u4dbf\u4e00-\u9fff\U00020000-\U0002fa1f]+',
+        'g'
+    ) AS run_match(parts)
+    CROSS JOIN LATERAL (SELECT run_match.parts[1] AS value) AS run
+    CROSS JOIN LATERAL generate_series(1, char_length(run.value) - 1)
+        AS bigram(start)
+$$
+"""
+
+SEARCH_DOCUMENT_COLUMNS = [
+    ("knowledge_graph_entities", "canonical_key"),
+    ("knowledge_graph_mentions", "surface_text"),
+    ("knowledge_projection_records", "search_text"),
+]
+
+
+def search_document_sql(column: str) -> str:
+    """Same expression as the seed query's ``search_document_sql``."""
+    return (
+        "to_tsvector('simple'::regconfig, "
+        f"{column} || ' ' || {BIGRAM_FUNCTION}({column}))"
+    )
+
+
+INDEXES = [
+    *(
+        (
+            f"idx_{table}_search_document",
+            f"ON {table} USING gin (({search_document_sql(column)}))",
+        )
+        for table, column in SEARCH_DOCUMENT_COLUMNS
+    ),
+    (
+        "idx_knowledge_graph_entities_canonical_key_trgm",
+        "ON knowledge_graph_entities USING gin (canonical_key gin_trgm_ops)",
+    ),
+    (
+        "idx_knowledge_graph_mentions_surface_text_trgm",
+        "ON knowledge_graph_mentions USING gin (surface_text gin_trgm_ops)",
+    ),
+    (
+        "idx_knowledge_graph_mentions_evidence_unit",
+        """
+        ON knowledge_graph_mentions (evidence_unit_row_id)
+        WHERE evidence_unit_row_id IS NOT NULL
+        """,
+    ),
+    (
+        "idx_knowledge_graph_mentions_projection_record",
+        """
+        ON knowledge_graph_mentions (projection_record_id)
+        WHERE projection_record_id IS NOT NULL
+        """,
+    ),
+    (
+        "idx_external_docs_cjk_bigram_simple",
+        f"""
+        ON external_docs
+        USING gin ((
+            to_tsvector(
+                'simple'::regconfig,
+                {BIGRAM_FUNCTION}(
+                    COALESCE(title, '') || ' ' || COALESCE(content, '')
+                )
+            )
+        ))
+        """,
+    ),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(CREATE_BIGRAM_FUNCTION)
+    with op.get_context().autocommit_block():
+        for index_name, ddl in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} {ddl}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _ddl in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+    op.execute(f"DROP FUNCTION IF EXISTS {BIGRAM_FUNCTION}(text)")
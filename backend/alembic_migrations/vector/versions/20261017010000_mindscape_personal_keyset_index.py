@@ -0,0 +1,33 @@
+"""Index mindscape_personal for keyset-paged embedding migrations.
+
+Revision ID: 20261017010000
+Revises: 20261016100000
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261017010000"
+down_revision = "20261016100000"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "idx_mindscape_personal_created_at_id"
+
+# embedding_migration_queries.fetch_embedding_page pages with
+# ``(created_at, id) > (...) ORDER BY created_at, id LIMIT n``; a matching
+# index keeps each page a range scan instead of a sort of the whole table.
+INDEX_DDL = "ON mindscape_personal (created_at, id)"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} {INDEX_DDL}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
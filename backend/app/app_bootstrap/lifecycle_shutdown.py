@@ -199,6 +199,29 @@ def _stop_agent_dispatch_services() -> None:
         )
 
 
+async def _flush_vector_usage_tracker() -> None:
+    try:
+        from backend.app.services.vector_usage_tracker import (
+            get_last_used_at_tracker,
+        )
+
+        await get_last_used_at_tracker().aclose()
+    except Exception as exc:
+        logger.warning("Vector usage tracker shutdown flush failed: %s", exc)
+
+
+async def _close_llm_client_pool() -> None:
+    try:
+        from backend.app.services.llm_providers.client_pool import (
+            get_llm_client_registry,
+        )
+
+        await get_llm_client_registry().aclose()
+        logger.info("Pooled LLM clients closed")
+    except Exception as exc:
+        logger.warning("LLM client pool shutdown failed: %s", exc)
+
+
 async def run_shutdown(app: FastAPI):
     """Cleanup on shutdown."""
     logger.warning("Application shutdown hook entered (pid=%s)", os.getpid())
@@ -207,6 +230,8 @@ async def run_shutdown(app: FastAPI):
     await _cancel_host_resource_lifecycle_tasks(app)
     await _stop_codex_pool_sweeper(app)
     await _disconnect_cloud_connector(app)
+    await _flush_vector_usage_tracker()
+    await _close_llm_client_pool()
     _stop_compile_job_services()
     _stop_scene_generation_dispatch_services()
     _stop_agent_dispatch_services()
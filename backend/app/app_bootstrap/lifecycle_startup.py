@@ -15,6 +15,7 @@ from backend.app.app_bootstrap.lifecycle_common import (
 )
 from backend.app.app_bootstrap.startup_contract import capture_phase_duration
 from backend.app.app_bootstrap.lifecycle_startup_services import (
+    bind_llm_client_pool,
     ensure_meeting_sessions_table,
     ensure_reasoning_traces_table,
     schedule_compile_job_startup_services,
@@ -24,6 +25,7 @@ from backend.app.app_bootstrap.lifecycle_startup_services import (
     start_agent_dispatch_services,
     start_codex_pool_sweeper,
     start_scene_generation_dispatch_services,
+    start_vector_usage_tracker,
     start_zombie_reaper,
 )
 
@@ -278,6 +280,8 @@ async def run_startup(app: FastAPI):
         logger.warning(f"Failed to register playbook handlers: {e}", exc_info=True)
 
     _check_dependency_updates()
+    bind_llm_client_pool()
+    start_vector_usage_tracker()
     _initialize_cloud_connector(app)
     _initialize_execution_pool(app)
     hydrate_knowledge_projection_registry(app)
@@ -271,3 +271,27 @@ def start_codex_pool_sweeper(app: FastAPI) -> None:
             f"Failed to start Codex pool sweeper background service: {e}",
             exc_info=True,
         )
+
+
+def bind_llm_client_pool() -> None:
+    try:
+        from backend.app.services.llm_providers.client_pool import (
+            get_llm_client_registry,
+        )
+
+        get_llm_client_registry().bind_running_loop()
+        logger.info("LLM client pool bound to the application event loop")
+    except Exception as e:
+        logger.warning(f"Failed to bind LLM client pool: {e}")
+
+
+def start_vector_usage_tracker() -> None:
+    try:
+        from backend.app.services.vector_usage_tracker import (
+            get_last_used_at_tracker,
+        )
+
+        get_last_used_at_tracker().start()
+        logger.info("Vector usage tracker flusher started on the application loop")
+    except Exception as e:
+        logger.warning(f"Failed to start vector usage tracker flusher: {e}")
@@ -58,6 +58,22 @@ class ConnectionFactory:
         """
         return self._connect_with_recovery(role, raw=False)
 
+    def is_role_available(self, role: str = "core") -> bool:
+        """
+        Whether a connection for ``role`` can be attempted, without a round trip.
+
+        True when an engine is configured and no recovery backoff is active.
+        Liveness of pooled connections is checked by the pool's pre-ping.
+        """
+        backoff = self._recovery_backoffs.get(role)
+        if backoff is not None and backoff.is_active():
+            return False
+        try:
+            self._get_postgres_engine(role)
+        except RuntimeError:
+            return False
+        return True
+
     def get_raw_connection(self, role: str = "core") -> Any:
         """Get a pooled DBAPI connection for psycopg2-compatible callers."""
         return self._connect_with_recovery(role, raw=True)
@@ -176,3 +176,9 @@ class EmbeddingMigrationProgress(BaseModel):
     estimated_completion: Optional[datetime] = Field(
         None, description="Estimated completion time"
     )
+    rows_per_second: Optional[float] = Field(
+        None, description="Throughput of the current run in rows per second"
+    )
+    eta_seconds: Optional[float] = Field(
+        None, description="Estimated seconds until the remaining rows are processed"
+    )
@@ -23,6 +23,7 @@ class EventType(str, Enum):
     AGENT_EXECUTION = "agent_execution"
     EXECUTION_CHAT = "execution_chat"
     OBSIDIAN_NOTE_UPDATED = "obsidian_note_updated"
+    OBSIDIAN_NOTE_DELETED = "obsidian_note_deleted"
     EXECUTION_PLAN = "execution_plan"
     PHASE_SUMMARY = "phase_summary"
     PIPELINE_STAGE = "pipeline_stage"
@@ -75,6 +75,7 @@ async def list_embedding_migrations(
     """List all embedding migration tasks"""
     try:
         from backend.app.services.embedding_migration_service import EmbeddingMigrationService
+        from backend.app.services.embedding_migration_pipeline import migration_progress
         from backend.app.models.embedding_migration import MigrationStatus
 
         service = EmbeddingMigrationService()
@@ -98,12 +99,15 @@ async def list_embedding_migrations(
                     "processed_count": m.processed_count,
                     "failed_count": m.failed_count,
                     "status": m.status,
-                    "progress_percentage": (m.processed_count / m.total_count * 100) if m.total_count > 0 else 0,
+                    "progress_percentage": progress.progress_percentage,
+                    "rows_per_second": progress.rows_per_second,
+                    "eta_seconds": progress.eta_seconds,
                     "created_at": m.created_at.isoformat(),
                     "started_at": m.started_at.isoformat() if m.started_at else None,
                     "completed_at": m.completed_at.isoformat() if m.completed_at else None
                 }
                 for m in migrations
+                for progress in [migration_progress(m)]
             ],
             "total": len(migrations)
         }
@@ -117,6 +121,7 @@ async def get_embedding_migration(migration_id: str):
     """Get migration task status"""
     try:
         from backend.app.services.embedding_migration_service import EmbeddingMigrationService
+        from backend.app.services.embedding_migration_pipeline import migration_progress
         from uuid import UUID
 
         service = EmbeddingMigrationService()
@@ -125,7 +130,7 @@ async def get_embedding_migration(migration_id: str):
         if not migration:
             raise HTTPException(status_code=404, detail=f"Migration {migration_id} not found")
 
-        progress_percentage = (migration.processed_count / migration.total_count * 100) if migration.total_count > 0 else 0
+        progress = migration_progress(migration)
 
         return {
             "success": True,
@@ -140,7 +145,10 @@ async def get_embedding_migration(migration_id: str):
                 "processed_count": migration.processed_count,
                 "failed_count": migration.failed_count,
                 "status": migration.status,
-                "progress_percentage": progress_percentage,
+                "progress_percentage": progress.progress_percentage,
+                "rows_per_second": progress.rows_per_second,
+                "eta_seconds": progress.eta_seconds,
+                "estimated_completion": progress.estimated_completion.isoformat() if progress.estimated_completion else None,
                 "error_message": migration.error_message,
                 "created_at": migration.created_at.isoformat(),
                 "started_at": migration.started_at.isoformat() if migration.started_at else None,
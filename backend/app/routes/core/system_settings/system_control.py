@@ -251,3 +251,19 @@ async def get_queue_metrics():
     except Exception as e:
         logger.error(f"Failed to get Redis queue metrics: {e}", exc_info=True)
         return {"status": "error", "error": str(e)}
+
+
+@router.get("/health/activity-stream/metrics", response_model=Dict[str, Any])
+async def get_activity_stream_metrics():
+    """Get this process's workspace activity stream fan-out metrics."""
+    from backend.app.services.cache.workspace_stream_hub import get_workspace_stream_hub
+
+    return get_workspace_stream_hub().metrics()
+
+
+@router.get("/health/tool-rag/cache-stats", response_model=Dict[str, Any])
+async def get_tool_rag_cache_stats():
+    """Get this process's Tool RAG result cache hit/miss counters."""
+    from backend.app.services.tool_rag import tool_rag_cache_stats
+
+    return tool_rag_cache_stats()
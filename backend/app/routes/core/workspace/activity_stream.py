@@ -4,7 +4,9 @@ Workspace Activity Stream — SSE endpoint.
 Provides a single Server-Sent Events stream for ALL workspace activity
 (meeting stages, agent turns, task dispatch, task completion).
 
-Backed by Redis Pub/Sub channel ``workspace:{id}:stream``.
+Backed by Redis Pub/Sub channel ``workspace:{id}:stream`` through the
+per-process ``WorkspaceStreamHub``, so every connected tab shares one
+Redis subscription.
 """
 
 import asyncio
@@ -38,9 +40,9 @@ async def workspace_activity_stream(
 
     Falls back to 503 if Redis is unavailable.
     """
-    from backend.app.services.cache.async_redis import (
-        get_async_redis_client,
-        subscribe_workspace_stream,
+    from backend.app.services.cache.async_redis import get_async_redis_client
+    from backend.app.services.cache.workspace_stream_hub import (
+        get_workspace_stream_hub,
     )
 
     # Pre-check Redis availability
@@ -54,17 +56,27 @@ async def workspace_activity_stream(
     async def event_generator():
         last_heartbeat = time.monotonic()
         try:
-            gen = subscribe_workspace_stream(workspace_id)
-            # We need to handle both the subscription and heartbeat
-            # Since subscribe_workspace_stream is an async generator that blocks,
-            # we use asyncio.wait_for with a timeout for heartbeat
-            async for event_data in gen:
-                if request and await request.is_disconnected():
-                    break
-
-                payload = json.dumps(event_data, ensure_ascii=False)
-                yield f"data: {payload}\n\n"
-                last_heartbeat = time.monotonic()
+            async with get_workspace_stream_hub().subscribe(workspace_id) as subscription:
+                while True:
+                    try:
+                        event = await subscription.next_event(
+                            timeout=HEARTBEAT_INTERVAL_S
+                        )
+                    except StopAsyncIteration:
+                        # Closed by the hub's slow-consumer policy; the
+                        # EventSource reconnects with a fresh queue.
+                        break
+                    if request and await request.is_disconnected():
+                        break
+                    if event is None:
+                        if time.monotonic() - last_heartbeat >= HEARTBEAT_INTERVAL_S:
+                            yield ": heartbeat\n\n"
+                            last_heartbeat = time.monotonic()
+                        continue
+
+                    # Serialized once by the hub and shared by every tab.
+                    yield event.sse_frame
+                    last_heartbeat = time.monotonic()
 
         except asyncio.CancelledError:
             return
@@ -3,11 +3,14 @@ from typing import Any, Dict
 from fastapi import HTTPException
 
 from backend.app.models.workspace import TaskStatus
+from backend.app.services.cache.execution_progress_publisher import (
+    build_admission_state as _build_admission_state,
+)
 from backend.app.services.json_safety import json_value_without_nul
 from backend.app.services.queue_position_cache import QUEUE_CACHE as _QUEUE_CACHE
 from backend.app.services.runner_live_state import RunnerLiveStateStore
 from backend.app.services.stores.tasks_store import TasksStore
-from .streaming import _build_admission_state, _extract_artifact_progress_from_content
+from .streaming import _extract_artifact_progress_from_content
 
 def _is_running_status(status: Any) -> bool:
     value = getattr(status, "value", status)
@@ -1,17 +1,39 @@
 import asyncio
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
-
-from backend.app.models.workspace import TaskStatus
+from typing import Any, Dict, List, Optional
+
+from backend.app.services.cache.execution_progress_hub import (
+    ExecutionProgressHub,
+    ExecutionProgressWatch,
+    get_execution_progress_hub,
+)
+from backend.app.services.cache.execution_progress_publisher import (
+    apply_execution_progress_events,
+    execution_progress_fields,
+)
 from backend.app.services.json_safety import json_value_without_nul
 from backend.app.services.queue_position_cache import QUEUE_CACHE as _QUEUE_CACHE
 from backend.app.services.stores.tasks_store import TasksStore
 
 logger = logging.getLogger(__name__)
 
+_LEGACY_POLL_INTERVAL_S = 3.0
+_HEARTBEAT_INTERVAL_S = 15.0
+_ARTIFACT_PROGRESS_POLL_INTERVAL_S = 9.0
+
+
+def _fallback_poll_interval_s() -> float:
+    """Seconds between DB refreshes when runners push no progress events."""
+    try:
+        value = float(os.getenv("EXECUTION_STREAM_FALLBACK_POLL_SECONDS", "30"))
+    except (TypeError, ValueError):
+        value = 30.0
+    return max(_LEGACY_POLL_INTERVAL_S, value)
+
 
 @dataclass
 class _ExecutionStreamState:
@@ -91,37 +113,6 @@ def _build_terminal_payload(task_obj: Any) -> str:
     )
 
 
-def _build_admission_state(task_obj: Any, ctx: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    blocked_reason = getattr(task_obj, "blocked_reason", None)
-    if blocked_reason != "admission_deferred":
-        return None
-
-    admission_ctx = ctx.get("admission") if isinstance(ctx.get("admission"), dict) else {}
-    blocked_payload = (
-        getattr(task_obj, "blocked_payload", None)
-        if isinstance(getattr(task_obj, "blocked_payload", None), dict)
-        else {}
-    )
-    return {
-        "state": "deferred",
-        "reason": admission_ctx.get("reason") or blocked_payload.get("reason"),
-        "defer_until": admission_ctx.get("defer_until")
-        or blocked_payload.get("defer_until")
-        or (
-            task_obj.next_eligible_at.isoformat()
-            if getattr(task_obj, "next_eligible_at", None)
-            else None
-        ),
-        "visibility": admission_ctx.get("visibility")
-        or blocked_payload.get("visibility"),
-        "producer_kind": admission_ctx.get("producer_kind")
-        or blocked_payload.get("producer_kind"),
-        "queue_shard": admission_ctx.get("queue_shard")
-        or blocked_payload.get("queue_shard")
-        or getattr(task_obj, "queue_shard", None),
-    }
-
-
 def _extract_artifact_progress_from_content(content: Any) -> tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
     content_json = json_value_without_nul(content, {})
     if not isinstance(content_json, dict):
@@ -135,6 +126,68 @@ def _extract_artifact_progress_from_content(content: Any) -> tuple[Optional[Dict
     )
 
 
+async def _emit_progress_payload(
+    state: _ExecutionStreamState, payload_obj: Dict[str, Any]
+) -> None:
+    payload = json.dumps(payload_obj)
+    signature = json.dumps(payload_obj, sort_keys=True, default=str)
+    now = time.monotonic()
+
+    should_emit = False
+    async with state.lock:
+        if signature != state.last_progress_signature:
+            should_emit = True
+            state.last_progress_signature = signature
+        elif (now - state.last_emit_monotonic) >= _HEARTBEAT_INTERVAL_S:
+            should_emit = True
+        if should_emit:
+            state.last_payload = payload
+            state.last_emit_monotonic = now
+
+    if should_emit:
+        await _broadcast_to_subscribers(state, payload)
+
+
+async def _wait_for_progress_event(
+    hub: ExecutionProgressHub,
+    watch: ExecutionProgressWatch,
+    state: _ExecutionStreamState,
+    *,
+    fallback_poll_s: float,
+) -> Optional[List[Dict[str, Any]]]:
+    """Block until the runner or a task write pushes progress events.
+
+    Returns None when the DB refresh is due and an empty list when the
+    stream is stopping. While waiting, the last payload is re-sent as a
+    keepalive without touching the DB. Without a live subscription this
+    degrades to the legacy short poll.
+    """
+    if not hub.active:
+        await asyncio.sleep(_LEGACY_POLL_INTERVAL_S)
+        return None
+    deadline = time.monotonic() + fallback_poll_s
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        events = await watch.wait(min(remaining, _HEARTBEAT_INTERVAL_S))
+        if events:
+            return events
+        if not hub.active:
+            return None
+        now = time.monotonic()
+        async with state.lock:
+            if state.stop_requested or not state.subscribers:
+                return []
+            payload = state.last_payload
+            if payload and (now - state.last_emit_monotonic) >= _HEARTBEAT_INTERVAL_S:
+                state.last_emit_monotonic = now
+            else:
+                payload = None
+        if payload:
+            await _broadcast_to_subscribers(state, payload)
+
+
 async def _execution_stream_poller(
     workspace_id: str, execution_id: str, state: _ExecutionStreamState
 ) -> None:
@@ -143,142 +196,118 @@ async def _execution_stream_poller(
     completed_statuses = {"completed", "succeeded", "SUCCEEDED"}
     terminal_statuses = failed_statuses | completed_statuses
 
-    artifact_progress_poll_stride = 3  # 3 loops * 3s = ~9s
-    loops_since_artifact_poll = artifact_progress_poll_stride
+    last_artifact_poll_monotonic = float("-inf")
     last_known_progress = None
-    heartbeat_interval_s = 15.0
+    hub = get_execution_progress_hub()
+    fallback_poll_s = _fallback_poll_interval_s()
 
     try:
-        while True:
-            async with state.lock:
-                if state.stop_requested or not state.subscribers:
+        async with hub.watch(execution_id) as watch:
+            while True:
+                async with state.lock:
+                    if state.stop_requested or not state.subscribers:
+                        break
+
+                task = tasks_store.get_task_by_execution_id(execution_id)
+                if not task:
+                    task = tasks_store.get_task(execution_id)
+                if not task or task.workspace_id != workspace_id:
+                    await _broadcast_to_subscribers(
+                        state,
+                        json.dumps({"type": "execution_error", "error": "Execution not found"}),
+                    )
+                    await _broadcast_to_subscribers(
+                        state,
+                        json.dumps(
+                            {
+                                "type": "stream_end",
+                                "reason": "not_found",
+                                "terminal": True,
+                            }
+                        ),
+                    )
                     break
 
-            task = tasks_store.get_task_by_execution_id(execution_id)
-            if not task:
-                task = tasks_store.get_task(execution_id)
-            if not task or task.workspace_id != workspace_id:
-                await _broadcast_to_subscribers(
-                    state,
-                    json.dumps({"type": "execution_error", "error": "Execution not found"}),
-                )
-                await _broadcast_to_subscribers(
-                    state,
-                    json.dumps(
-                        {
-                            "type": "stream_end",
-                            "reason": "not_found",
-                            "terminal": True,
-                        }
-                    ),
-                )
-                break
-
-            status = (task.status or "").lower().replace(" ", "_")
-            if status in terminal_statuses or task.status in terminal_statuses:
-                await _broadcast_to_subscribers(state, _build_terminal_payload(task))
-                await _broadcast_to_subscribers(
-                    state,
-                    json.dumps(
-                        {
-                            "type": "stream_end",
-                            "reason": "terminal",
-                            "terminal": True,
-                        }
-                    ),
-                )
-                break
-
-            ctx = task.execution_context if isinstance(task.execution_context, dict) else {}
-            progress = ctx.get("progress") if isinstance(ctx, dict) else None
-
-            if isinstance(progress, dict):
-                last_known_progress = progress
-                loops_since_artifact_poll = 0
-            else:
-                loops_since_artifact_poll += 1
-
-            if not progress and loops_since_artifact_poll >= artifact_progress_poll_stride:
-                try:
-                    from sqlalchemy import text as _text
-
-                    with tasks_store.get_connection() as _conn:
-                        _rows = _conn.execute(
-                            _text(
-                                "SELECT content "
-                                "FROM artifacts "
-                                "WHERE workspace_id = :workspace_id "
-                                "AND execution_id = :eid "
-                                "AND content IS NOT NULL "
-                                "ORDER BY updated_at DESC LIMIT 5"
-                            ),
+                status = (task.status or "").lower().replace(" ", "_")
+                if status in terminal_statuses or task.status in terminal_statuses:
+                    await _broadcast_to_subscribers(state, _build_terminal_payload(task))
+                    await _broadcast_to_subscribers(
+                        state,
+                        json.dumps(
                             {
-                                "workspace_id": workspace_id,
-                                "eid": execution_id,
-                            },
-                        ).fetchall()
-                        for _row in _rows:
-                            progress, _content_metadata = _extract_artifact_progress_from_content(
-                                _row[0]
-                            )
-                            if isinstance(progress, dict):
-                                last_known_progress = progress
-                                loops_since_artifact_poll = 0
-                                break
-                except Exception:
-                    pass
-
-            if not progress:
-                progress = last_known_progress
-
-            # Refresh queue cache (shared, max once per 3s across all pollers)
-            _QUEUE_CACHE.refresh_if_stale(tasks_store)
-
-            payload_obj = {
-                "type": "progress",
-                "status": task.status,
-                "progress": progress,
-                "queue_position": _QUEUE_CACHE.get_position(tasks_store, task),
-                "queue_total": _QUEUE_CACHE.get_total(task.queue_shard or "default"),
-                "blocked_reason": task.blocked_reason,
-                "blocked_payload": task.blocked_payload,
-                "frontier_state": task.frontier_state,
-                "next_eligible_at": (
-                    task.next_eligible_at.isoformat() if task.next_eligible_at else None
-                ),
-                "admission_state": _build_admission_state(task, ctx),
-                "dependency_hold": ctx.get("dependency_hold"),
-                "heartbeat_at": (
-                    task.heartbeat_at.isoformat()
-                    if getattr(task, "heartbeat_at", None)
-                    else (
-                        ctx.get("heartbeat_at")
-                        if task.status == TaskStatus.RUNNING
-                        else None
+                                "type": "stream_end",
+                                "reason": "terminal",
+                                "terminal": True,
+                            }
+                        ),
                     )
-                ),
-                "runner_id": getattr(task, "runner_id", None)
-                or (ctx.get("runner_id") if task.status == TaskStatus.RUNNING else None),
-            }
-            payload = json.dumps(payload_obj)
-            signature = json.dumps(payload_obj, sort_keys=True, default=str)
-            now = time.monotonic()
-
-            should_emit = False
-            async with state.lock:
-                if signature != state.last_progress_signature:
-                    should_emit = True
-                    state.last_progress_signature = signature
-                elif (now - state.last_emit_monotonic) >= heartbeat_interval_s:
-                    should_emit = True
-                if should_emit:
-                    state.last_payload = payload
-                    state.last_emit_monotonic = now
-
-            if should_emit:
-                await _broadcast_to_subscribers(state, payload)
-
-            await asyncio.sleep(3)
+                    break
+
+                fields = execution_progress_fields(task)
+                progress = fields.pop("progress")
+
+                if isinstance(progress, dict):
+                    last_known_progress = progress
+                    last_artifact_poll_monotonic = time.monotonic()
+
+                if not progress and (
+                    time.monotonic() - last_artifact_poll_monotonic
+                    >= _ARTIFACT_PROGRESS_POLL_INTERVAL_S
+                ):
+                    last_artifact_poll_monotonic = time.monotonic()
+                    try:
+                        from sqlalchemy import text as _text
+
+                        with tasks_store.get_connection() as _conn:
+                            _rows = _conn.execute(
+                                _text(
+                                    "SELECT content "
+                                    "FROM artifacts "
+                                    "WHERE workspace_id = :workspace_id "
+                                    "AND execution_id = :eid "
+                                    "AND content IS NOT NULL "
+                                    "ORDER BY updated_at DESC LIMIT 5"
+                                ),
+                                {
+                                    "workspace_id": workspace_id,
+                                    "eid": execution_id,
+                                },
+                            ).fetchall()
+                            for _row in _rows:
+                                progress, _content_metadata = _extract_artifact_progress_from_content(
+                                    _row[0]
+                                )
+                                if isinstance(progress, dict):
+                                    last_known_progress = progress
+                                    break
+                    except Exception:
+                        pass
+
+                if not progress:
+                    progress = last_known_progress
+
+                # Refresh queue cache (shared, max once per 3s across all pollers)
+                _QUEUE_CACHE.refresh_if_stale(tasks_store)
+
+                payload_obj = {
+                    "type": "progress",
+                    "status": fields.pop("status"),
+                    "progress": progress,
+                    "queue_position": _QUEUE_CACHE.get_position(tasks_store, task),
+                    "queue_total": _QUEUE_CACHE.get_total(task.queue_shard or "default"),
+                    **fields,
+                }
+                await _emit_progress_payload(state, payload_obj)
+
+                # Pushed snapshots and heartbeats render without a DB read;
+                # anything else, or the fallback timeout, re-reads the task.
+                while True:
+                    events = await _wait_for_progress_event(
+                        hub, watch, state, fallback_poll_s=fallback_poll_s
+                    )
+                    if not events or not apply_execution_progress_events(payload_obj, events):
+                        break
+                    await _emit_progress_payload(state, payload_obj)
     except asyncio.CancelledError:
         raise
     except Exception as e:
@@ -196,6 +196,7 @@ async def get_mindscape_graph(
             "scope_type": graph.scope_type,
             "scope_id": graph.scope_id,
             "derived_at": graph.derived_at.isoformat() if graph.derived_at else None,
+            "graph_version": graph.last_event_seq,
         }
     except Exception as e:
         logger.error(f"Failed to get mindscape graph: {e}", exc_info=True)
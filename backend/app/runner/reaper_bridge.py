@@ -53,7 +53,7 @@ async def _refill_ready_frontier_from_db(
         queue_client = client if queue_store is redis_queue else await queue_store._get_client()
         if not queue_client:
             continue
-        pending_members = await queue_client.lrange(queue_store.q_pending, 0, -1)
+        pending_members = await queue_client.zrange(queue_store.q_pending, 0, -1)
         temp_members = await queue_client.lrange(queue_store.q_temp, 0, -1)
         processing_members = await queue_client.zrange(
             queue_store.q_processing, 0, -1
@@ -252,7 +252,7 @@ async def _reap_redis_queues(
             except Exception as e:
                 logger.error(f"Failed to recycle visibility task {task_id}: {e}")
 
-        ready_depth = await client.llen(redis_queue.q_pending)
+        ready_depth = await client.zcard(redis_queue.q_pending)
         try:
             ready_refilled_count = await _refill_ready_frontier_from_db(
                 tasks_store,
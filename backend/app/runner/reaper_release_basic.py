@@ -8,7 +8,10 @@ from typing import Any
 
 from backend.app.models.workspace import TaskStatus
 from backend.app.services.stores.tasks_store import TasksStore
-from backend.app.services.stores.redis.runner_queue_store import RedisRunnerQueueStore
+from backend.app.services.stores.redis.runner_queue_store import (
+    RedisRunnerQueueStore,
+    pending_front_score,
+)
 from backend.app.services.task_admission_service import (
     ADMISSION_DEFERRED_REASON,
     TASK_ADMISSION_SERVICE,
@@ -104,7 +107,8 @@ async def _release_admission_deferred_tasks(
     try:
         pipe = client.pipeline()
         for task_id in released_task_ids:
-            pipe.rpush(redis_queue.q_pending, task_id)
+            pipe.zadd(redis_queue.q_pending, {task_id: pending_front_score()})
+            pipe.publish(redis_queue.q_wakeup, task_id)
         await pipe.execute()
     except Exception as exc:
         logger.warning(
@@ -189,7 +193,8 @@ async def _release_dependency_hold_tasks(
     try:
         pipe = client.pipeline()
         for task_id in released_task_ids:
-            pipe.rpush(redis_queue.q_pending, task_id)
+            pipe.zadd(redis_queue.q_pending, {task_id: pending_front_score()})
+            pipe.publish(redis_queue.q_wakeup, task_id)
         await pipe.execute()
     except Exception as exc:
         logger.warning(
@@ -272,7 +277,8 @@ async def _release_unblocked_cold_tasks(
     try:
         pipe = client.pipeline()
         for task_id in released_task_ids:
-            pipe.rpush(redis_queue.q_pending, task_id)
+            pipe.zadd(redis_queue.q_pending, {task_id: pending_front_score()})
+            pipe.publish(redis_queue.q_wakeup, task_id)
         await pipe.execute()
     except Exception as exc:
         logger.warning(
@@ -389,7 +395,8 @@ async def _release_concurrency_locked_tasks(
     try:
         pipe = client.pipeline()
         for task_id in released_task_ids:
-            pipe.rpush(redis_queue.q_pending, task_id)
+            pipe.zadd(redis_queue.q_pending, {task_id: pending_front_score()})
+            pipe.publish(redis_queue.q_wakeup, task_id)
         await pipe.execute()
     except Exception as exc:
         logger.warning(
@@ -8,7 +8,10 @@ from datetime import timedelta
 from typing import Any, Callable
 
 from backend.app.services.stores.tasks_store import TasksStore
-from backend.app.services.stores.redis.runner_queue_store import RedisRunnerQueueStore
+from backend.app.services.stores.redis.runner_queue_store import (
+    RedisRunnerQueueStore,
+    pending_front_score,
+)
 from backend.app.services.host_resources.workspace_quota_admission import (
     decide_workspace_quota_admission_for_task,
 )
@@ -238,7 +241,8 @@ async def _release_workspace_quota_tasks(
     try:
         pipe = client.pipeline()
         for task_id in released_task_ids:
-            pipe.rpush(redis_queue.q_pending, task_id)
+            pipe.zadd(redis_queue.q_pending, {task_id: pending_front_score()})
+            pipe.publish(redis_queue.q_wakeup, task_id)
         await pipe.execute()
     except Exception as exc:
         logger.warning(
@@ -382,6 +386,7 @@ async def _release_resource_wait_tasks(
                     try_release_resource_wait_task,
                     task.id,
                     released_at=now,
+                    workspace_id=getattr(task, "workspace_id", None),
                 )
                 if not transitioned:
                     continue
@@ -424,7 +429,8 @@ async def _release_resource_wait_tasks(
     try:
         pipe = client.pipeline()
         for task_id in released_task_ids:
-            pipe.rpush(redis_queue.q_pending, task_id)
+            pipe.zadd(redis_queue.q_pending, {task_id: pending_front_score()})
+            pipe.publish(redis_queue.q_wakeup, task_id)
         await pipe.execute()
     except Exception as exc:
         logger.warning(
@@ -69,7 +69,7 @@ async def _queued_transport_task_ids(
         queue_client = await queue_store._get_client()
         if not queue_client:
             continue
-        pending_members = await queue_client.lrange(queue_store.q_pending, 0, -1)
+        pending_members = await queue_client.zrange(queue_store.q_pending, 0, -1)
         temp_members = await queue_client.lrange(queue_store.q_temp, 0, -1)
         processing_members = await queue_client.zrange(queue_store.q_processing, 0, -1)
         delayed_members = await queue_client.zrange(queue_store.q_delayed, 0, -1)
@@ -7,7 +7,10 @@ from datetime import datetime
 from typing import Any, Awaitable, Callable, Optional
 
 from backend.app.models.workspace import TaskStatus
-from backend.app.services.stores.redis.runner_queue_store import RedisRunnerQueueStore
+from backend.app.services.stores.redis.runner_queue_store import (
+    RedisRunnerQueueStore,
+    pending_enqueue_score,
+)
 
 TERMINAL_TASK_STATUSES = {
     TaskStatus.SUCCEEDED,
@@ -47,12 +50,15 @@ async def reconcile_transport_membership(
         return
 
     pipe = client.pipeline()
-    pipe.lrem(redis_queue.q_pending, 0, normalized_task_id)
+    pipe.zrem(redis_queue.q_pending, normalized_task_id)
     pipe.lrem(redis_queue.q_temp, 0, normalized_task_id)
     pipe.zrem(redis_queue.q_processing, normalized_task_id)
     pipe.zrem(redis_queue.q_delayed, normalized_task_id)
     if reenqueue_pending:
-        pipe.lpush(redis_queue.q_pending, normalized_task_id)
+        pipe.zadd(
+            redis_queue.q_pending,
+            {normalized_task_id: pending_enqueue_score()},
+        )
     await pipe.execute()
 
 
@@ -15,6 +15,7 @@ from backend.app.services.stores.redis.runner_queue_store import RedisRunnerQueu
 from backend.app.services.stores.tasks_store import TasksStore
 
 from backend.app.runner.lifecycle_hooks import _invoke_on_fail_hook
+from backend.app.runner.task_executor_events import _publish_execution_progress
 from backend.app.runner.resource_pressure import build_runner_resource_snapshot
 from backend.app.runner.resource_failure_policy import decide_resource_failure
 from backend.app.services.runner_resources import NODE_BUDGET_CONTEXT_KEY
@@ -236,6 +237,13 @@ async def _mark_task_failed(
                     new_state="FAILED",
                     reason="execution_failed",
                 )
+            await _publish_execution_progress(
+                latest,
+                redis_queue,
+                event_type="status",
+                status=new_status,
+                terminal=is_deadletter,
+            )
 
             if redis_queue:
                 if is_deadletter:
@@ -314,6 +322,12 @@ async def _mark_task_succeeded(
                 runner_id=None,
                 heartbeat_at=None,
             )
+            await _publish_execution_progress(
+                latest,
+                redis_queue,
+                event_type="status",
+                status=TaskStatus.PENDING,
+            )
             if redis_queue:
                 await redis_queue.ack_task(latest.id)
             return
@@ -407,6 +421,13 @@ async def _mark_task_succeeded(
                 new_state="DONE",
                 reason="execution_completed",
             )
+            await _publish_execution_progress(
+                latest,
+                redis_queue,
+                event_type="status",
+                status=TaskStatus.SUCCEEDED,
+                terminal=True,
+            )
 
         if redis_queue:
             await redis_queue.ack_task(task_id)
@@ -1,10 +1,13 @@
 """Task executor event emission helpers."""
 
+import json
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from backend.app.models.workspace import Task
+from backend.app.services.cache.async_redis import execution_progress_channel
 from backend.app.services.mindscape_store import MindscapeStore
+from backend.app.services.stores.redis.runner_queue_store import RedisRunnerQueueStore
 
 logger = logging.getLogger(__name__)
 
@@ -62,3 +65,48 @@ def _emit_run_state_changed_for_task(
             task.execution_id,
             emit_error,
         )
+
+
+async def _publish_execution_progress(
+    task: Task,
+    redis_queue: Optional[RedisRunnerQueueStore],
+    *,
+    event_type: str,
+    status: Any,
+    terminal: bool = False,
+    **fields: Any,
+) -> bool:
+    """Push a progress event so execution streams refresh without polling.
+
+    Best effort: stream routes fall back to a slow DB poll when nothing
+    arrives, so a lost publish only delays the update.
+    """
+    if redis_queue is None:
+        return False
+    execution_id = task.execution_id or str(task.id)
+    try:
+        client = await redis_queue._get_client()
+        if not client or not hasattr(client, "publish"):
+            return False
+        payload = {
+            "type": event_type,
+            "task_id": task.id,
+            "execution_id": execution_id,
+            "status": getattr(status, "value", status),
+            "terminal": terminal,
+            **fields,
+        }
+        await client.publish(
+            execution_progress_channel(execution_id),
+            json.dumps(payload, default=str),
+        )
+        return True
+    except Exception as publish_error:
+        logger.debug(
+            "Failed to publish %s progress event for task %s (%s): %s",
+            event_type,
+            task.id,
+            execution_id,
+            publish_error,
+        )
+        return False
@@ -7,6 +7,7 @@ import time
 from threading import Event, Thread
 from typing import Any, Callable, Optional
 
+from backend.app.models.workspace import TaskStatus
 from backend.app.services.runner_live_state import RunnerLiveStateStore
 from backend.app.services.runner_resources import (
     NodeBudgetReservation,
@@ -17,6 +18,8 @@ from backend.app.services.runner_resources import (
 from backend.app.services.stores.redis.runner_queue_store import RedisRunnerQueueStore
 
 from backend.app.runner.database_backoff import is_database_recovery_error
+from backend.app.runner.task_executor_events import _publish_execution_progress
+from backend.app.runner.utils import _utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -260,6 +263,19 @@ def start_heartbeat_thread(
                             hb_redis_elapsed_ms,
                             touch_ok,
                         )
+                    # Fire-and-forget: open execution streams refresh on this
+                    # beat instead of polling the task row.
+                    asyncio_module.run_coroutine_threadsafe(
+                        _publish_execution_progress(
+                            task,
+                            redis_queue,
+                            event_type="heartbeat",
+                            status=TaskStatus.RUNNING,
+                            runner_id=runner_id,
+                            heartbeat_at=_utc_now().isoformat(),
+                        ),
+                        main_loop,
+                    )
             except FutureTimeoutError:
                 loop_future_timeouts += 1
                 _handle_loop_future_timeout(
@@ -0,0 +1,300 @@
+"""Runner worker batch claim path (one SKIP LOCKED transaction per cycle)."""
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Mapping, Sequence
+
+from backend.app.models.workspace import TaskStatus
+from backend.app.services.runner_resources import (
+    RedisNodeBudgetStore,
+    RedisResourceLeaseStore,
+    acquire_task_resource_admission,
+    build_resource_wait_task_update,
+    release_acquired_resource_admission,
+    resolve_resource_requirements,
+)
+from backend.app.services.runner_topology import (
+    resolve_installed_playbook_runner_metadata,
+    runner_profile_can_claim_task,
+)
+from backend.app.services.stores.redis.runner_queue_store import RedisRunnerQueueStore
+from backend.app.services.stores.tasks_store import TasksStore
+from backend.app.runner.concurrency import _resolve_lock_keys
+from backend.app.runner.database_backoff import RunnerDatabaseRecoveryBackoff
+from backend.app.runner.dependency_check import DependencyChecker
+from backend.app.runner.resource_pressure import is_browser_resource_profile
+from backend.app.runner.terminal_handoff_gate import (
+    release_terminal_handoff_after_claim,
+)
+from backend.app.runner.utils import _utc_now
+from backend.app.runner.worker_claim_policy import _build_parked_task_update
+from backend.app.runner.worker_dispatch import _spawn_claimed_task
+from backend.app.runner.worker_startup import _purge_task_ids_from_transport
+
+logger = logging.getLogger("backend.app.runner.worker")
+
+
+def _bulk_claim_enabled(runner_profile, *, runner_id: str) -> bool:
+    """Return whether this runner claims ready work in SKIP LOCKED batches."""
+    # Browser runners keep the fair-candidate scheduler; the batch claim path
+    # is for short compute/API tasks where per-claim round-trips dominate.
+    enabled = runner_profile.bulk_claim_enabled and not is_browser_resource_profile(
+        runner_profile
+    )
+    if enabled:
+        logger.info(
+            "Runner batch claim enabled runner_id=%s profile=%s",
+            runner_id,
+            runner_profile.profile_code,
+        )
+    return enabled
+
+
+def _task_lock_keys(task) -> list[str]:
+    ctx = task.execution_context if isinstance(task.execution_context, dict) else {}
+    return _resolve_lock_keys(
+        ctx,
+        task.pack_id,
+        persisted_concurrency_key=getattr(task, "concurrency_key", None),
+    )
+
+
+async def _release_bulk_claim(
+    tasks_store: TasksStore,
+    task,
+    update: dict[str, Any],
+) -> None:
+    """Return a batch-claimed task to PENDING with a parked/wait update."""
+    await asyncio.to_thread(
+        tasks_store.update_task,
+        task.id,
+        status=TaskStatus.PENDING,
+        started_at=None,
+        runner_id=None,
+        heartbeat_at=None,
+        expected_statuses=(TaskStatus.RUNNING,),
+        **update,
+    )
+
+
+async def _start_bulk_claimed_task(
+    task,
+    task_queue: RedisRunnerQueueStore,
+    *,
+    tasks_store: TasksStore,
+    runner_id: str,
+    redis_queue: RedisRunnerQueueStore,
+    runner_profile,
+    capacity,
+    dep_checker: DependencyChecker,
+    lock_ttl_seconds: int,
+    post_claim_start_delay_ms: int = 0,
+) -> asyncio.Task | None:
+    """
+    Finish the runner-side admission of a task the batch claim already owns.
+
+    The DB claim has settled status, concurrency keys and workspace quota.
+    Dependency holds, resource leases and Redis locks are still checked here;
+    a task that fails one of them is released back to PENDING parked, exactly
+    as the single-task path would have parked it before claiming.
+    """
+    lock_owner_id = f"{runner_id}:{task.id}"
+    lock_ctx = task.execution_context if isinstance(task.execution_context, dict) else {}
+    queue_shard = getattr(task, "queue_shard", None)
+
+    playbook_code = lock_ctx.get("playbook_code") or task.pack_id or ""
+    unmet = await dep_checker.check_playbook_deps(
+        playbook_code,
+        execution_context=lock_ctx,
+    )
+    if unmet:
+        now_dt = _utc_now()
+        await _release_bulk_claim(
+            tasks_store,
+            task,
+            _build_parked_task_update(
+                lock_ctx,
+                reason="dependency_hold",
+                delay_seconds=30,
+                now=now_dt,
+                dependency_hold={"deps": unmet, "checked_at": now_dt.isoformat()},
+                current_queue_shard=queue_shard,
+            ),
+        )
+        return None
+
+    resource_lease_store = RedisResourceLeaseStore(task_queue)
+    node_budget_store = RedisNodeBudgetStore(task_queue)
+    resource_decision = await acquire_task_resource_admission(
+        task=task,
+        requirements=resolve_resource_requirements(
+            task,
+            execution_context=lock_ctx,
+            playbook_metadata=resolve_installed_playbook_runner_metadata(
+                playbook_code
+            ),
+        ),
+        runner_profile=runner_profile,
+        capacity=capacity,
+        lease_store=resource_lease_store,
+        node_budget_store=node_budget_store,
+        owner_id=lock_owner_id,
+        ttl_seconds=lock_ttl_seconds,
+    )
+    if not resource_decision.allow:
+        await _release_bulk_claim(
+            tasks_store,
+            task,
+            build_resource_wait_task_update(
+                lock_ctx,
+                resource_decision,
+                current_queue_shard=queue_shard,
+            ),
+        )
+        return None
+    if resource_decision.execution_context_updates:
+        lock_ctx = {**lock_ctx, **resource_decision.execution_context_updates}
+        await asyncio.to_thread(
+            tasks_store.update_task,
+            task.id,
+            execution_context=lock_ctx,
+        )
+
+    acquired_keys: list[str] = []
+    for lock_key in _task_lock_keys(task):
+        if not await redis_queue.acquire_lock(
+            lock_key, lock_owner_id, ttl_seconds=lock_ttl_seconds
+        ):
+            for acquired_key in reversed(acquired_keys):
+                try:
+                    await redis_queue.release_lock(acquired_key, lock_owner_id)
+                except Exception:
+                    pass
+            await release_acquired_resource_admission(
+                lease_store=resource_lease_store,
+                node_budget_store=node_budget_store,
+                decision=resource_decision,
+                owner_id=lock_owner_id,
+            )
+            await _release_bulk_claim(
+                tasks_store,
+                task,
+                _build_parked_task_update(
+                    lock_ctx,
+                    reason="concurrency_locked",
+                    delay_seconds=30,
+                    now=_utc_now(),
+                    lock_key=acquired_keys[0] if acquired_keys else lock_key,
+                    conflicting_lock_key=lock_key,
+                    current_queue_shard=queue_shard,
+                ),
+            )
+            return None
+        acquired_keys.append(lock_key)
+
+    await release_terminal_handoff_after_claim(redis_queue, runner_id=runner_id)
+    return _spawn_claimed_task(
+        task,
+        task_queue,
+        tasks_store=tasks_store,
+        runner_id=runner_id,
+        lock_owner_id=lock_owner_id,
+        resource_decision=resource_decision,
+        post_claim_start_delay_ms=post_claim_start_delay_ms,
+    )
+
+
+async def _claim_and_dispatch_ready_batch(
+    *,
+    tasks_store: TasksStore,
+    runner_id: str,
+    redis_queue: RedisRunnerQueueStore,
+    ready_queues: Mapping[str, RedisRunnerQueueStore],
+    queue_cycle: Sequence[RedisRunnerQueueStore],
+    runner_profile,
+    capacity,
+    dep_checker: DependencyChecker,
+    lock_ttl_seconds: int,
+    scan_limit: int,
+    db_recovery_backoff: RunnerDatabaseRecoveryBackoff,
+) -> list[asyncio.Task]:
+    """
+    Claim up to the free inflight capacity in one DB transaction and start it.
+
+    Claimed ids are purged from the Redis transport in one pipeline per
+    queue so the single-task path does not pop them again as duplicates.
+    """
+    try:
+        claimed = await asyncio.to_thread(
+            tasks_store.claim_ready_tasks,
+            runner_id,
+            queue_shards=runner_profile.accepted_queue_partitions,
+            limit=capacity.available_slots,
+            scan_limit=scan_limit,
+            task_filter=lambda task: runner_profile_can_claim_task(
+                runner_profile, task
+            ),
+            concurrency_keys_for=_task_lock_keys,
+        )
+    except Exception as exc:
+        if db_recovery_backoff.note_failure(exc):
+            logger.warning(
+                "Runner batch claim deferred while PostgreSQL is recovering delay=%ss",
+                db_recovery_backoff.delay_seconds,
+            )
+        else:
+            logger.warning("Runner batch claim failed: %s", exc, exc_info=True)
+        return []
+    if not claimed:
+        return []
+
+    await _purge_task_ids_from_transport([task.id for task in claimed], queue_cycle)
+
+    dispatched: list[asyncio.Task] = []
+    for task in claimed:
+        task_queue = ready_queues.get(str(task.queue_shard or "")) or redis_queue
+        try:
+            dispatch_task = await _start_bulk_claimed_task(
+                task,
+                task_queue,
+                tasks_store=tasks_store,
+                runner_id=runner_id,
+                redis_queue=redis_queue,
+                runner_profile=runner_profile,
+                capacity=capacity,
+                dep_checker=dep_checker,
+                lock_ttl_seconds=lock_ttl_seconds,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Runner batch-claimed task start failed task_id=%s: %s",
+                task.id,
+                exc,
+                exc_info=True,
+            )
+            # Mirror the single-task failsafe: stay runnable, retry in 15s.
+            retry_ctx = dict(task.execution_context or {})
+            retry_ctx.pop("runner_id", None)
+            retry_ctx.pop("heartbeat_at", None)
+            await _release_bulk_claim(
+                tasks_store,
+                task,
+                {
+                    "execution_context": retry_ctx,
+                    "next_eligible_at": _utc_now() + timedelta(seconds=15),
+                    "frontier_state": "ready",
+                    "blocked_reason": None,
+                },
+            )
+            continue
+        if dispatch_task is not None:
+            dispatched.append(dispatch_task)
+
+    logger.info(
+        "Runner batch claim runner_id=%s claimed=%s started=%s",
+        runner_id,
+        len(claimed),
+        len(dispatched),
+    )
+    return dispatched
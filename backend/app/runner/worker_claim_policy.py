@@ -110,7 +110,7 @@ async def _dequeue_by_route_gate_policy(
         if not client:
             continue
         try:
-            queue_length = max(0, int(await client.llen(queue_store.q_pending)))
+            queue_length = max(0, int(await client.zcard(queue_store.q_pending)))
             if queue_length <= 0:
                 continue
             scan_count = min(scan_limit, queue_length)
@@ -119,7 +119,7 @@ async def _dequeue_by_route_gate_policy(
                 % queue_length
             )
             first_end = min(queue_length - 1, scan_start + scan_count - 1)
-            candidate_ids = list(await client.lrange(
+            candidate_ids = list(await client.zrange(
                 queue_store.q_pending,
                 scan_start,
                 first_end,
@@ -127,7 +127,7 @@ async def _dequeue_by_route_gate_policy(
             remaining = scan_count - len(candidate_ids)
             if remaining > 0 and scan_start > 0:
                 candidate_ids.extend(
-                    await client.lrange(
+                    await client.zrange(
                         queue_store.q_pending,
                         0,
                         remaining - 1,
@@ -265,7 +265,7 @@ async def _dequeue_by_browser_fair_candidate_policy(
         if cursor_client is None:
             cursor_client = client
         try:
-            queue_length = max(0, int(await client.llen(queue_store.q_pending)))
+            queue_length = max(0, int(await client.zcard(queue_store.q_pending)))
             if queue_length <= 0:
                 continue
             scan_count = min(scan_limit, queue_length)
@@ -278,7 +278,7 @@ async def _dequeue_by_browser_fair_candidate_policy(
             )
             first_end = min(queue_length - 1, scan_start + scan_count - 1)
             candidate_ids = list(
-                await client.lrange(
+                await client.zrange(
                     queue_store.q_pending,
                     scan_start,
                     first_end,
@@ -287,7 +287,7 @@ async def _dequeue_by_browser_fair_candidate_policy(
             remaining = scan_count - len(candidate_ids)
             if remaining > 0 and scan_start > 0:
                 candidate_ids.extend(
-                    await client.lrange(
+                    await client.zrange(
                         queue_store.q_pending,
                         0,
                         remaining - 1,
@@ -41,6 +41,47 @@ from backend.app.runner.worker_transport import (
 logger = logging.getLogger("backend.app.runner.worker")
 
 
+def _spawn_claimed_task(
+    t_data,
+    task_queue: RedisRunnerQueueStore,
+    *,
+    tasks_store: TasksStore,
+    runner_id: str,
+    lock_owner_id: str,
+    resource_decision,
+    post_claim_start_delay_ms: int = 0,
+) -> asyncio.Task:
+    # The row is already a real RUNNING claim with its canonical locks and
+    # resource reservation. A bounded post-claim delay spreads expensive
+    # browser startups without reducing the active-run floor in the UI/DB.
+    async def _run_claimed_task_after_delay():
+        delay_ms = max(0, int(post_claim_start_delay_ms or 0))
+        if delay_ms:
+            logger.info(
+                "Runner delaying claimed task start task_id=%s runner_id=%s delay_ms=%s",
+                t_data.id,
+                runner_id,
+                delay_ms,
+            )
+            await asyncio.sleep(delay_ms / 1000)
+        return await _run_single_task(
+            tasks_store,
+            runner_id,
+            t_data.id,
+            redis_queue=task_queue,
+            lock_owner_id=lock_owner_id,
+            node_budget_reservation=(
+                resource_decision.node_budget_reservation
+                if resource_decision is not None
+                else None
+            ),
+        )
+
+    dispatch_task = asyncio.create_task(_run_claimed_task_after_delay())
+    setattr(dispatch_task, "_mindscape_pack_id", str(t_data.pack_id or ""))
+    return dispatch_task
+
+
 async def _dispatch_claimed_task(
     task_id: str,
     task_queue: RedisRunnerQueueStore,
@@ -461,36 +502,15 @@ async def _dispatch_claimed_task(
             runner_id=runner_id,
         )
 
-        # The row is already a real RUNNING claim with its canonical locks and
-        # resource reservation. A bounded post-claim delay spreads expensive
-        # browser startups without reducing the active-run floor in the UI/DB.
-        async def _run_claimed_task_after_delay():
-            delay_ms = max(0, int(post_claim_start_delay_ms or 0))
-            if delay_ms:
-                logger.info(
-                    "Runner delaying claimed task start task_id=%s runner_id=%s delay_ms=%s",
-                    t_data.id,
-                    runner_id,
-                    delay_ms,
-                )
-                await asyncio.sleep(delay_ms / 1000)
-            return await _run_single_task(
-                tasks_store,
-                runner_id,
-                t_data.id,
-                redis_queue=task_queue,
-                lock_owner_id=lock_owner_id,
-                node_budget_reservation=(
-                    resource_decision.node_budget_reservation
-                    if resource_decision is not None
-                    else None
-                ),
-            )
-
-        task_coro = _run_claimed_task_after_delay()
-        dispatch_task = asyncio.create_task(task_coro)
-        setattr(dispatch_task, "_mindscape_pack_id", str(t_data.pack_id or ""))
-        return dispatch_task
+        return _spawn_claimed_task(
+            t_data,
+            task_queue,
+            tasks_store=tasks_store,
+            runner_id=runner_id,
+            lock_owner_id=lock_owner_id,
+            resource_decision=resource_decision,
+            post_claim_start_delay_ms=post_claim_start_delay_ms,
+        )
 
     except Exception as e:
         if db_recovery_backoff.note_failure(e):
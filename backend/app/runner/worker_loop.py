@@ -14,11 +14,7 @@ from backend.app.services.stores.tasks_store import TasksStore
 from backend.app.runner.database_backoff import RunnerDatabaseRecoveryBackoff
 from backend.app.runner.db_pool_pressure import DbPoolPressureDecision, check_db_pool_pressure
 from backend.app.runner.dependency_check import DependencyChecker
-from backend.app.runner.resource_pressure import (
-    build_runner_resource_snapshot,
-    is_browser_resource_profile,
-    should_defer_browser_claim,
-)
+from backend.app.runner.resource_pressure import is_browser_resource_profile
 from backend.app.runner.maintenance_leader import (
     resolve_maintenance_lease_seconds,
     try_hold_maintenance_leadership,
@@ -30,8 +26,13 @@ from backend.app.runner.worker_claim_policy import (
     _route_drain_after_current_status,
     _runner_claim_gate_paused,
 )
+from backend.app.runner.worker_bulk_claim import (
+    _bulk_claim_enabled,
+    _claim_and_dispatch_ready_batch,
+)
 from backend.app.runner.worker_dispatch import _dispatch_claimed_task
 from backend.app.runner.worker_loop_control import (
+    _browser_claim_deferred,
     _build_initial_resource_snapshot,
     _discard_finished_tasks,
     _exit_for_restart_if_requested,
@@ -51,6 +52,10 @@ from backend.app.runner.worker_startup import (
     _reset_orphaned_running_tasks,
     _runner_lock_ttl_seconds,
 )
+from backend.app.runner.worker_wakeup import (
+    _wait_for_inflight_slot,
+    runner_queue_wakeup,
+)
 from backend.app.runner.worker_transport import (
     _build_ready_queue_stores,
     _dequeue_from_ready_queues,
@@ -198,6 +203,9 @@ async def run_forever() -> None:
     inflight: set[asyncio.Task] = set()
     dep_checker = DependencyChecker(cache_ttl=5.0)
     is_browser_runner = is_browser_resource_profile(runner_profile)
+    bulk_claim_enabled = _bulk_claim_enabled(runner_profile, runner_id=runner_id)
+    push_wakeup_enabled = _env_bool("LOCAL_CORE_RUNNER_PUSH_WAKEUP_ENABLED", True)
+    idle_wait_seconds = max(poll_interval_ms / 1000, 2.0) if push_wakeup_enabled else 2
     next_resource_defer_log_at = 0.0
     next_claim_gate_log_at = 0.0
     next_route_drain_gate_log_at = 0.0
@@ -245,239 +253,241 @@ async def run_forever() -> None:
         "Runner maintenance loop started (interval=%ss)", reap_interval_seconds
     )
 
-    while True:
-        _discard_finished_tasks(inflight)
-        capacity = resolve_runner_capacity_snapshot(
-            runner_profile,
-            inflight=len(inflight),
-            configured_poll_batch_limit=configured_poll_batch_limit,
-        )
-        resource_snapshot = _build_initial_resource_snapshot(
-            runner_profile,
-            inflight=len(inflight),
-            max_inflight=max_inflight,
-        )
-        (
-            runner_claim_control,
-            runner_claiming_enabled,
-            db_pressure,
-            db_budget,
-        ) = await _resolve_loop_claim_budget(
-            redis_queue,
-            runner_id=runner_id,
-            runner_profile=runner_profile,
-            inflight=len(inflight),
-            max_inflight=max_inflight,
-        )
-        (
-            last_postgres_heartbeat_epoch,
-            next_postgres_heartbeat_pressure_log_at,
-        ) = _maybe_write_postgres_runner_heartbeat(
-            enabled=postgres_heartbeat_enabled,
-            tasks_store=tasks_store,
-            runner_id=runner_id,
-            runner_profile=runner_profile,
-            inflight=len(inflight),
-            resource_snapshot=resource_snapshot,
-            db_budget=db_budget,
-            db_pressure=db_pressure,
-            db_recovery_backoff=db_recovery_backoff,
-            runner_claiming_enabled=runner_claiming_enabled,
-            last_write_epoch=last_postgres_heartbeat_epoch,
-            next_pressure_log_at=next_postgres_heartbeat_pressure_log_at,
-        )
-        await _publish_resource_heartbeat(
-            redis_queue,
-            runner_id=runner_id,
-            runner_profile=runner_profile,
-            capacity=capacity,
-            resource_snapshot=resource_snapshot,
-            runner_claim_control=runner_claim_control,
-        )
-        await _exit_for_restart_if_requested(inflight)
-        _discard_finished_tasks(inflight)
-
-        if db_recovery_backoff.is_active():
-            if db_recovery_backoff.should_log():
-                logger.warning(
-                    "Runner claim loop paused while PostgreSQL is recovering; inflight=%s remaining_backoff=%.1fs",
-                    len(inflight),
-                    db_recovery_backoff.remaining_seconds(),
-                )
-            await asyncio.sleep(
-                min(
-                    max(poll_interval_ms / 1000, 0.25),
-                    db_recovery_backoff.remaining_seconds(),
-                    5.0,
-                )
+    # Enqueues publish on the partition wakeup channel, so an idle runner
+    # reacts in milliseconds and the poll interval is only a fallback timeout.
+    async with runner_queue_wakeup(queue_cycle, enabled=push_wakeup_enabled) as queue_wakeup:
+        while True:
+            _discard_finished_tasks(inflight)
+            capacity = resolve_runner_capacity_snapshot(
+                runner_profile,
+                inflight=len(inflight),
+                configured_poll_batch_limit=configured_poll_batch_limit,
+            )
+            resource_snapshot = _build_initial_resource_snapshot(
+                runner_profile,
+                inflight=len(inflight),
+                max_inflight=max_inflight,
             )
-            continue
+            (
+                runner_claim_control,
+                runner_claiming_enabled,
+                db_pressure,
+                db_budget,
+            ) = await _resolve_loop_claim_budget(
+                redis_queue,
+                runner_id=runner_id,
+                runner_profile=runner_profile,
+                inflight=len(inflight),
+                max_inflight=max_inflight,
+            )
+            (
+                last_postgres_heartbeat_epoch,
+                next_postgres_heartbeat_pressure_log_at,
+            ) = _maybe_write_postgres_runner_heartbeat(
+                enabled=postgres_heartbeat_enabled,
+                tasks_store=tasks_store,
+                runner_id=runner_id,
+                runner_profile=runner_profile,
+                inflight=len(inflight),
+                resource_snapshot=resource_snapshot,
+                db_budget=db_budget,
+                db_pressure=db_pressure,
+                db_recovery_backoff=db_recovery_backoff,
+                runner_claiming_enabled=runner_claiming_enabled,
+                last_write_epoch=last_postgres_heartbeat_epoch,
+                next_pressure_log_at=next_postgres_heartbeat_pressure_log_at,
+            )
+            await _publish_resource_heartbeat(
+                redis_queue,
+                runner_id=runner_id,
+                runner_profile=runner_profile,
+                capacity=capacity,
+                resource_snapshot=resource_snapshot,
+                runner_claim_control=runner_claim_control,
+            )
+            await _exit_for_restart_if_requested(inflight)
+            _discard_finished_tasks(inflight)
 
-        if not runner_claiming_enabled:
-            now_loop = asyncio.get_event_loop().time()
-            if now_loop >= next_runner_claim_control_log_at:
-                logger.warning(
-                    "Runner claim mode blocks new claims runner_id=%s profile=%s mode=%s inflight=%s reason=%s",
-                    runner_id,
-                    runner_profile.profile_code,
-                    runner_claim_control.mode,
-                    len(inflight),
-                    runner_claim_control.reason,
+            if db_recovery_backoff.is_active():
+                if db_recovery_backoff.should_log():
+                    logger.warning(
+                        "Runner claim loop paused while PostgreSQL is recovering; inflight=%s remaining_backoff=%.1fs",
+                        len(inflight),
+                        db_recovery_backoff.remaining_seconds(),
+                    )
+                await asyncio.sleep(
+                    min(
+                        max(poll_interval_ms / 1000, 0.25),
+                        db_recovery_backoff.remaining_seconds(),
+                        5.0,
+                    )
                 )
-                next_runner_claim_control_log_at = now_loop + 30.0
-            await asyncio.sleep(poll_interval_ms / 1000)
-            continue
+                continue
 
-        claim_gate_paused, claim_gate = _runner_claim_gate_paused()
-        if claim_gate_paused:
-            now_loop = asyncio.get_event_loop().time()
-            if now_loop >= next_claim_gate_log_at:
-                logger.warning(
-                    "Runner claim gate paused profile=%s reason=%s source=%s inflight=%s",
-                    runner_profile.profile_code,
-                    claim_gate.get("reason"),
-                    claim_gate.get("source"),
-                    len(inflight),
-                )
-                next_claim_gate_log_at = now_loop + 30.0
-            await asyncio.sleep(poll_interval_ms / 1000)
-            continue
+            if not runner_claiming_enabled:
+                now_loop = asyncio.get_event_loop().time()
+                if now_loop >= next_runner_claim_control_log_at:
+                    logger.warning(
+                        "Runner claim mode blocks new claims runner_id=%s profile=%s mode=%s inflight=%s reason=%s",
+                        runner_id,
+                        runner_profile.profile_code,
+                        runner_claim_control.mode,
+                        len(inflight),
+                        runner_claim_control.reason,
+                    )
+                    next_runner_claim_control_log_at = now_loop + 30.0
+                await asyncio.sleep(poll_interval_ms / 1000)
+                continue
 
-        if not db_budget.allow_claim_scan:
-            now_loop = asyncio.get_event_loop().time()
-            if now_loop >= next_db_pressure_log_at:
-                logger.warning(
-                    "Runner claim loop paused by DB budget "
-                    "profile=%s reason=%s wait_seconds=%s inflight=%s",
-                    runner_profile.profile_code,
-                    db_budget.reason,
-                    db_budget.wait_seconds,
-                    len(inflight),
+            claim_gate_paused, claim_gate = _runner_claim_gate_paused()
+            if claim_gate_paused:
+                now_loop = asyncio.get_event_loop().time()
+                if now_loop >= next_claim_gate_log_at:
+                    logger.warning(
+                        "Runner claim gate paused profile=%s reason=%s source=%s inflight=%s",
+                        runner_profile.profile_code,
+                        claim_gate.get("reason"),
+                        claim_gate.get("source"),
+                        len(inflight),
+                    )
+                    next_claim_gate_log_at = now_loop + 30.0
+                await asyncio.sleep(poll_interval_ms / 1000)
+                continue
+
+            if not db_budget.allow_claim_scan:
+                now_loop = asyncio.get_event_loop().time()
+                if now_loop >= next_db_pressure_log_at:
+                    logger.warning(
+                        "Runner claim loop paused by DB budget "
+                        "profile=%s reason=%s wait_seconds=%s inflight=%s",
+                        runner_profile.profile_code,
+                        db_budget.reason,
+                        db_budget.wait_seconds,
+                        len(inflight),
+                    )
+                    next_db_pressure_log_at = now_loop + 30.0
+                await asyncio.sleep(
+                    max(poll_interval_ms / 1000, min(db_budget.wait_seconds, 5))
                 )
-                next_db_pressure_log_at = now_loop + 30.0
-            await asyncio.sleep(
-                max(poll_interval_ms / 1000, min(db_budget.wait_seconds, 5))
-            )
-            continue
+                continue
 
-        if capacity.saturated:
-            await asyncio.sleep(poll_interval_ms / 1000)
-            continue
+            if capacity.saturated:
+                await _wait_for_inflight_slot(inflight, timeout=poll_interval_ms / 1000)
+                continue
 
-        if is_browser_runner:
-            try:
-                resource_snapshot = build_runner_resource_snapshot(
-                    profile_code=runner_profile.profile_code,
+            if is_browser_runner:
+                (
+                    resource_snapshot,
+                    deferred,
+                    next_resource_defer_log_at,
+                ) = _browser_claim_deferred(
+                    runner_profile,
+                    capacity=capacity,
                     inflight=len(inflight),
-                    max_inflight=capacity.max_inflight,
-                    available_slots=capacity.available_slots,
+                    next_log_at=next_resource_defer_log_at,
                 )
-            except Exception:
-                resource_snapshot = None
-            if should_defer_browser_claim(resource_snapshot):
-                now_loop = asyncio.get_event_loop().time()
-                if now_loop >= next_resource_defer_log_at:
-                    admission = (
-                        resource_snapshot.get("admission", {})
-                        if isinstance(resource_snapshot, dict)
-                        else {}
-                    )
-                    memory = (
-                        resource_snapshot.get("memory", {})
-                        if isinstance(resource_snapshot, dict)
-                        else {}
+                if deferred:
+                    await asyncio.sleep(poll_interval_ms / 1000)
+                    continue
+
+            if bulk_claim_enabled:
+                bulk_dispatched = await _claim_and_dispatch_ready_batch(
+                    tasks_store=tasks_store,
+                    runner_id=runner_id,
+                    redis_queue=redis_queue,
+                    ready_queues=ready_queues,
+                    queue_cycle=queue_cycle,
+                    runner_profile=runner_profile,
+                    capacity=capacity,
+                    dep_checker=dep_checker,
+                    lock_ttl_seconds=lock_ttl_seconds,
+                    scan_limit=db_budget.apply_claim_scan_limit(playbook_fair_scan_limit),
+                    db_recovery_backoff=db_recovery_backoff,
+                )
+                if bulk_dispatched:
+                    inflight.update(bulk_dispatched)
+                    continue
+
+            task_id = None
+            task_queue = None
+            route_drain_wait = False
+            profile_filter_wait = False
+            if is_browser_runner:
+                task_id, task_queue, route_drain_wait = (
+                    await _dequeue_by_browser_fair_candidate_policy(
+                        queue_cycle,
+                        tasks_store=tasks_store,
+                        runner_profile=runner_profile,
+                        visibility_timeout_sec=visibility_timeout_sec,
+                        scan_limit=db_budget.apply_claim_scan_limit(playbook_fair_scan_limit),
                     )
+                )
+            else:
+                active_pack_ids = {
+                    str(getattr(task, "_mindscape_pack_id", "") or "")
+                    for task in inflight
+                    if str(getattr(task, "_mindscape_pack_id", "") or "").strip()
+                }
+                (
+                    task_id,
+                    task_queue,
+                    route_drain_wait,
+                    profile_filter_wait,
+                ) = await _dequeue_by_route_gate_policy(
+                    queue_cycle,
+                    runner_profile=runner_profile,
+                    visibility_timeout_sec=visibility_timeout_sec,
+                    scan_limit=db_budget.apply_claim_scan_limit(playbook_fair_scan_limit),
+                    active_pack_ids=active_pack_ids,
+                    scan_offsets=route_scan_offsets,
+                    tasks_store=tasks_store,
+                )
+            if route_drain_wait:
+                route_drain_gate = _route_drain_after_current_status()
+                now_loop = asyncio.get_event_loop().time()
+                if now_loop >= next_route_drain_gate_log_at:
                     logger.warning(
-                        "Browser runner resource admission deferred "
-                        "profile=%s state=%s reasons=%s memory_working_set_ratio=%s",
+                        "Runner route drain gate waiting profile=%s reservation_ids=%s inflight=%s",
                         runner_profile.profile_code,
-                        admission.get("state"),
-                        admission.get("reasons"),
-                        memory.get("working_set_ratio"),
+                        ",".join(route_drain_gate.get("reservation_ids") or []),
+                        len(inflight),
                     )
-                    next_resource_defer_log_at = now_loop + 30.0
+                    next_route_drain_gate_log_at = now_loop + 30.0
                 await asyncio.sleep(poll_interval_ms / 1000)
                 continue
+            if profile_filter_wait:
+                await queue_wakeup.wait(poll_interval_ms / 1000)
+                continue
 
-        task_id = None
-        task_queue = None
-        route_drain_wait = False
-        profile_filter_wait = False
-        if is_browser_runner:
-            task_id, task_queue, route_drain_wait = (
-                await _dequeue_by_browser_fair_candidate_policy(
+            # Wakeup-driven (or blocking) pop from pending replaces DB polling.
+            if not task_id or not task_queue:
+                task_id, task_queue, queue_cursor = await _dequeue_from_ready_queues(
                     queue_cycle,
-                    tasks_store=tasks_store,
-                    runner_profile=runner_profile,
+                    cursor=queue_cursor,
                     visibility_timeout_sec=visibility_timeout_sec,
-                    scan_limit=db_budget.apply_claim_scan_limit(playbook_fair_scan_limit),
+                    block_timeout_sec=idle_wait_seconds,
+                    wakeup=queue_wakeup,
                 )
-            )
-        else:
-            active_pack_ids = {
-                str(getattr(task, "_mindscape_pack_id", "") or "")
-                for task in inflight
-                if str(getattr(task, "_mindscape_pack_id", "") or "").strip()
-            }
-            (
+
+            if not task_id or not task_queue:
+                continue
+
+            dispatch_task = await _dispatch_claimed_task(
                 task_id,
                 task_queue,
-                route_drain_wait,
-                profile_filter_wait,
-            ) = await _dequeue_by_route_gate_policy(
-                queue_cycle,
-                runner_profile=runner_profile,
-                visibility_timeout_sec=visibility_timeout_sec,
-                scan_limit=db_budget.apply_claim_scan_limit(playbook_fair_scan_limit),
-                active_pack_ids=active_pack_ids,
-                scan_offsets=route_scan_offsets,
                 tasks_store=tasks_store,
-            )
-        if route_drain_wait:
-            route_drain_gate = _route_drain_after_current_status()
-            now_loop = asyncio.get_event_loop().time()
-            if now_loop >= next_route_drain_gate_log_at:
-                logger.warning(
-                    "Runner route drain gate waiting profile=%s reservation_ids=%s inflight=%s",
-                    runner_profile.profile_code,
-                    ",".join(route_drain_gate.get("reservation_ids") or []),
-                    len(inflight),
-                )
-                next_route_drain_gate_log_at = now_loop + 30.0
-            await asyncio.sleep(poll_interval_ms / 1000)
-            continue
-        if profile_filter_wait:
-            await asyncio.sleep(poll_interval_ms / 1000)
-            continue
-
-        # Blocking pop from pending to processing replaces DB polling.
-        if not task_id or not task_queue:
-            task_id, task_queue, queue_cursor = await _dequeue_from_ready_queues(
-                queue_cycle,
-                cursor=queue_cursor,
+                runner_id=runner_id,
+                redis_queue=redis_queue,
+                runner_profile=runner_profile,
+                db_budget=db_budget,
+                resource_snapshot=resource_snapshot,
+                capacity=capacity,
+                dep_checker=dep_checker,
                 visibility_timeout_sec=visibility_timeout_sec,
-                block_timeout_sec=2,
+                lock_ttl_seconds=lock_ttl_seconds,
+                db_recovery_backoff=db_recovery_backoff,
+                post_claim_start_delay_ms=claim_start_delays.peek_ms(),
             )
-
-        if not task_id or not task_queue:
-            continue
-
-        dispatch_task = await _dispatch_claimed_task(
-            task_id,
-            task_queue,
-            tasks_store=tasks_store,
-            runner_id=runner_id,
-            redis_queue=redis_queue,
-            runner_profile=runner_profile,
-            db_budget=db_budget,
-            resource_snapshot=resource_snapshot,
-            capacity=capacity,
-            dep_checker=dep_checker,
-            visibility_timeout_sec=visibility_timeout_sec,
-            lock_ttl_seconds=lock_ttl_seconds,
-            db_recovery_backoff=db_recovery_backoff,
-            post_claim_start_delay_ms=claim_start_delays.peek_ms(),
-        )
-        if dispatch_task is not None:
-            claim_start_delays.commit()
-            inflight.add(dispatch_task)
+            if dispatch_task is not None:
+                claim_start_delays.commit()
+                inflight.add(dispatch_task)
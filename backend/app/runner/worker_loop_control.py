@@ -22,7 +22,10 @@ from backend.app.runner.db_pool_pressure import (
     check_db_pool_pressure,
     should_write_postgres_heartbeat,
 )
-from backend.app.runner.resource_pressure import build_runner_resource_snapshot
+from backend.app.runner.resource_pressure import (
+    build_runner_resource_snapshot,
+    should_defer_browser_claim,
+)
 from backend.app.runner.restart import _check_restart_sentinel
 from backend.app.runner.restart import _RESTART_DRAIN_TIMEOUT_SECONDS
 from backend.app.runner.worker_db_budget import (
@@ -60,6 +63,49 @@ def _build_initial_resource_snapshot(runner_profile, *, inflight: int, max_infli
         return None
 
 
+def _browser_claim_deferred(
+    runner_profile,
+    *,
+    capacity,
+    inflight: int,
+    next_log_at: float,
+) -> tuple[dict | None, bool, float]:
+    """Refresh a browser runner's snapshot; return (snapshot, deferred, next_log_at)."""
+    try:
+        resource_snapshot = build_runner_resource_snapshot(
+            profile_code=runner_profile.profile_code,
+            inflight=inflight,
+            max_inflight=capacity.max_inflight,
+            available_slots=capacity.available_slots,
+        )
+    except Exception:
+        resource_snapshot = None
+    if not should_defer_browser_claim(resource_snapshot):
+        return resource_snapshot, False, next_log_at
+    now_loop = asyncio.get_event_loop().time()
+    if now_loop >= next_log_at:
+        admission = (
+            resource_snapshot.get("admission", {})
+            if isinstance(resource_snapshot, dict)
+            else {}
+        )
+        memory = (
+            resource_snapshot.get("memory", {})
+            if isinstance(resource_snapshot, dict)
+            else {}
+        )
+        logger.warning(
+            "Browser runner resource admission deferred "
+            "profile=%s state=%s reasons=%s memory_working_set_ratio=%s",
+            runner_profile.profile_code,
+            admission.get("state"),
+            admission.get("reasons"),
+            memory.get("working_set_ratio"),
+        )
+        next_log_at = now_loop + 30.0
+    return resource_snapshot, True, next_log_at
+
+
 async def _resolve_loop_claim_budget(
     redis_queue,
     *,
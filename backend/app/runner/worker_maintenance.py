@@ -219,6 +219,8 @@ async def _run_maintenance_cycle(
             watcher_id=f"runner_maintenance:{runner_id}",
         )
     for shard_name, queue_store in partition_leader_queues:
+        if hasattr(queue_store, "migrate_legacy_pending"):
+            await queue_store.migrate_legacy_pending()
         await _facade_attr("_reap_redis_queues", _reap_redis_queues)(
             tasks_store,
             queue_store,
@@ -350,9 +350,9 @@ async def _purge_task_ids_from_transport(
             if not client:
                 continue
             pipe = client.pipeline()
-            for task_id in normalized_ids:
-                pipe.lrem(queue_store.q_pending, 0, task_id)
-                if hasattr(queue_store, "q_temp"):
+            pipe.zrem(queue_store.q_pending, *normalized_ids)
+            if hasattr(queue_store, "q_temp"):
+                for task_id in normalized_ids:
                     pipe.lrem(queue_store.q_temp, 0, task_id)
             pipe.zrem(queue_store.q_processing, *normalized_ids)
             pipe.zrem(queue_store.q_delayed, *normalized_ids)
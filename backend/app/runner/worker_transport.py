@@ -94,7 +94,7 @@ async def _collect_transport_members(
         client = await queue_store._get_client()
         if not client:
             continue
-        pending_members = await client.lrange(queue_store.q_pending, 0, -1)
+        pending_members = await client.zrange(queue_store.q_pending, 0, -1)
         temp_members = await client.lrange(queue_store.q_temp, 0, -1)
         processing_members = await client.zrange(queue_store.q_processing, 0, -1)
         delayed_members = await client.zrange(queue_store.q_delayed, 0, -1)
@@ -110,7 +110,8 @@ async def _dequeue_from_ready_queues(
     *,
     cursor: int,
     visibility_timeout_sec: int,
-    block_timeout_sec: int,
+    block_timeout_sec: float,
+    wakeup=None,
 ) -> tuple[Optional[str], Optional[RedisRunnerQueueStore], int]:
     if not queue_cycle:
         await asyncio.sleep(block_timeout_sec)
@@ -118,14 +119,29 @@ async def _dequeue_from_ready_queues(
 
     cycle_len = len(queue_cycle)
 
-    for offset in range(cycle_len):
-        queue_store = queue_cycle[(cursor + offset) % cycle_len]
-        task_id = await queue_store.dequeue_task_nowait(
-            visibility_timeout_sec=visibility_timeout_sec
-        )
-        if task_id:
-            next_cursor = (cursor + offset + 1) % cycle_len
-            return task_id, queue_store, next_cursor
+    async def _scan_nowait() -> tuple[Optional[str], Optional[RedisRunnerQueueStore], int]:
+        for offset in range(cycle_len):
+            queue_store = queue_cycle[(cursor + offset) % cycle_len]
+            task_id = await queue_store.dequeue_task_nowait(
+                visibility_timeout_sec=visibility_timeout_sec
+            )
+            if task_id:
+                return task_id, queue_store, (cursor + offset + 1) % cycle_len
+        return None, None, cursor
+
+    if wakeup is not None and wakeup.active:
+        # Clear before scanning so a publish racing the scan still wakes us.
+        wakeup.clear()
+        found = await _scan_nowait()
+        if found[0]:
+            return found
+        if not await wakeup.wait(block_timeout_sec):
+            return None, None, (cursor + 1) % cycle_len
+        return await _scan_nowait()
+
+    found = await _scan_nowait()
+    if found[0]:
+        return found
 
     queue_store = queue_cycle[cursor % cycle_len]
     task_id = await queue_store.dequeue_task_blocking(
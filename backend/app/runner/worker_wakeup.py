@@ -0,0 +1,144 @@
+"""Runner worker push wakeup over the per-partition queue Pub/Sub channels."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, Optional
+
+from backend.app.services.cache.async_redis import get_async_redis_client
+from backend.app.services.stores.redis.runner_queue_store import RedisRunnerQueueStore
+
+logger = logging.getLogger("backend.app.runner.worker")
+
+_RESUBSCRIBE_DELAY_SECONDS = 5.0
+_LISTEN_READ_TIMEOUT_SECONDS = 1.0
+
+
+class RunnerQueueWakeup:
+    """
+    Wake the claim loop as soon as work is enqueued on an accepted partition.
+
+    ``RedisRunnerQueueStore.enqueue_task`` and the reaper's re-queues publish
+    on the partition's wakeup channel. A single subscriber per runner turns
+    those messages into an ``asyncio.Event`` the loop waits on; the poll
+    interval only remains as the wait timeout for work that becomes eligible
+    without a publish (delayed retries). While the subscription is down,
+    ``wait`` is a plain sleep so the loop degrades to fixed-interval polling.
+    """
+
+    def __init__(
+        self,
+        queue_stores: Iterable[RedisRunnerQueueStore],
+        *,
+        client_factory=get_async_redis_client,
+    ):
+        self._channels = sorted({queue_store.q_wakeup for queue_store in queue_stores})
+        self._client_factory = client_factory
+        self._event = asyncio.Event()
+        self._subscribed = False
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        return self._subscribed
+
+    def start(self) -> None:
+        if self._listener is None and self._channels:
+            self._listener = asyncio.create_task(self._listen_forever())
+
+    async def close(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+        self._subscribed = False
+
+    def clear(self) -> None:
+        """Forget earlier wakeups; call before re-checking the queues."""
+        self._event.clear()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a wakeup or ``timeout``; returns True when woken by a publish."""
+        if not self._subscribed:
+            await asyncio.sleep(timeout)
+            return False
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    async def _listen_forever(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                client = await self._client_factory()
+                if not client:
+                    await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
+                    continue
+                pubsub = client.pubsub()
+                await pubsub.subscribe(*self._channels)
+                self._subscribed = True
+                # Anything published before the subscription landed is only
+                # visible to the next queue scan, so force one.
+                self._event.set()
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=_LISTEN_READ_TIMEOUT_SECONDS,
+                    )
+                    if message and message.get("type") == "message":
+                        self._event.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "Runner queue wakeup subscription lost channels=%s: %s",
+                    ",".join(self._channels),
+                    exc,
+                )
+            finally:
+                self._subscribed = False
+                self._event.set()
+                if pubsub is not None:
+                    try:
+                        await pubsub.unsubscribe(*self._channels)
+                        await pubsub.close()
+                    except Exception:
+                        pass
+            await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
+
+
+@asynccontextmanager
+async def runner_queue_wakeup(
+    queue_stores: Iterable[RedisRunnerQueueStore],
+    *,
+    enabled: bool = True,
+    client_factory=get_async_redis_client,
+) -> AsyncIterator[RunnerQueueWakeup]:
+    """Run the wakeup listener for the duration of the claim loop.
+
+    A disabled wakeup never subscribes, so ``wait`` is a plain sleep and the
+    loop polls at its fixed interval.
+    """
+    wakeup = RunnerQueueWakeup(queue_stores, client_factory=client_factory)
+    if enabled:
+        wakeup.start()
+    try:
+        yield wakeup
+    finally:
+        await wakeup.close()
+
+
+async def _wait_for_inflight_slot(inflight: set, *, timeout: float) -> None:
+    """Sleep until an inflight task finishes or ``timeout`` elapses."""
+    pending = {task for task in inflight if not task.done()}
+    if not pending:
+        await asyncio.sleep(timeout)
+        return
+    await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
@@ -5,7 +5,18 @@ Provides caching functionality for tool registry and other services.
 """
 
 from backend.app.services.cache.redis_cache import RedisCacheService
+from backend.app.services.cache.result_cache import (
+    LruTtlCache,
+    RedisResultTier,
+    ResultCache,
+)
 from backend.app.services.cache.tool_registry_cache import ToolRegistryCache
 
-__all__ = ["RedisCacheService", "ToolRegistryCache"]
+__all__ = [
+    "LruTtlCache",
+    "RedisCacheService",
+    "RedisResultTier",
+    "ResultCache",
+    "ToolRegistryCache",
+]
 
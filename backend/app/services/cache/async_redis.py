@@ -104,6 +104,11 @@ async def publish_meeting_chunk(
         return False
 
 
+def execution_progress_channel(execution_id: str) -> str:
+    """Return the Redis Pub/Sub channel name for one execution's progress."""
+    return f"execution:{execution_id}:progress"
+
+
 async def subscribe_workspace_stream(workspace_id: str):
     """Subscribe to workspace activity stream via Redis Pub/Sub.
 
@@ -0,0 +1,174 @@
+"""
+Per-process listener for runner-pushed execution progress.
+
+Runners publish heartbeats and status transitions to
+``execution:{execution_id}:progress``. One ``PSUBSCRIBE`` connection per
+backend process wakes the execution stream pollers that are watching those
+ids, so open execution pages refresh on change instead of re-reading the
+task on a fixed short interval.
+"""
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from backend.app.services.cache.async_redis import (
+    execution_progress_channel,
+    get_async_redis_client,
+)
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_PROGRESS_PATTERN = execution_progress_channel("*")
+
+_CHANNEL_PREFIX, _CHANNEL_SUFFIX = EXECUTION_PROGRESS_PATTERN.split("*", 1)
+_RESUBSCRIBE_DELAY_SECONDS = 5.0
+_LISTEN_READ_TIMEOUT_SECONDS = 1.0
+_MAX_PENDING_EVENTS = 32
+
+
+def execution_id_from_channel(channel: Any) -> Optional[str]:
+    channel = str(channel or "")
+    if not (channel.startswith(_CHANNEL_PREFIX) and channel.endswith(_CHANNEL_SUFFIX)):
+        return None
+    execution_id = channel[len(_CHANNEL_PREFIX) : len(channel) - len(_CHANNEL_SUFFIX)]
+    return execution_id or None
+
+
+class ExecutionProgressWatch:
+    """Collects pushed events for one execution until the poller drains them."""
+
+    def __init__(self, execution_id: str):
+        self.execution_id = execution_id
+        self._signal = asyncio.Event()
+        self._pending: List[Dict[str, Any]] = []
+
+    def _offer(self, event: Dict[str, Any]) -> None:
+        if len(self._pending) >= _MAX_PENDING_EVENTS:
+            del self._pending[0]
+        self._pending.append(event)
+        self._signal.set()
+
+    async def wait(self, timeout: float) -> List[Dict[str, Any]]:
+        """Return events pushed since the last call; empty on timeout."""
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._signal.wait(), timeout=max(0.0, timeout))
+            except asyncio.TimeoutError:
+                return []
+        events, self._pending = self._pending, []
+        self._signal.clear()
+        return events
+
+
+class ExecutionProgressHub:
+    """Share one Redis pattern subscription across execution stream pollers."""
+
+    def __init__(self, *, client_factory=get_async_redis_client):
+        self._client_factory = client_factory
+        self._watches: Dict[str, Set[ExecutionProgressWatch]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = False
+        self._events_received = 0
+
+    @property
+    def active(self) -> bool:
+        """True while pushed events can be relied on to wake watchers."""
+        return self._subscribed
+
+    @asynccontextmanager
+    async def watch(self, execution_id: str) -> AsyncIterator[ExecutionProgressWatch]:
+        watch = ExecutionProgressWatch(execution_id)
+        self._watches.setdefault(execution_id, set()).add(watch)
+        self._ensure_listener()
+        try:
+            yield watch
+        finally:
+            watches = self._watches.get(execution_id)
+            if watches is not None:
+                watches.discard(watch)
+                if not watches:
+                    self._watches.pop(execution_id, None)
+
+    def publish_local(self, execution_id: str, raw_payload: Any) -> int:
+        """Hand a raw channel payload to local watchers; returns deliveries."""
+        self._events_received += 1
+        watches = self._watches.get(execution_id)
+        if not watches:
+            return 0
+        try:
+            event = json.loads(raw_payload)
+        except (json.JSONDecodeError, TypeError):
+            return 0
+        if not isinstance(event, dict):
+            return 0
+        for watch in list(watches):
+            watch._offer(event)
+        return len(watches)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "subscribed": self._subscribed,
+            "executions": len(self._watches),
+            "events_received": self._events_received,
+        }
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen_forever())
+
+    async def _listen_forever(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                client = await self._client_factory()
+                if client:
+                    pubsub = client.pubsub()
+                    await pubsub.psubscribe(EXECUTION_PROGRESS_PATTERN)
+                    self._subscribed = True
+                    logger.info("[ExecutionProgressHub] Subscribed to %s", EXECUTION_PROGRESS_PATTERN)
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True,
+                            timeout=_LISTEN_READ_TIMEOUT_SECONDS,
+                        )
+                        if not message or message.get("type") != "pmessage":
+                            continue
+                        execution_id = execution_id_from_channel(message.get("channel"))
+                        if execution_id:
+                            self.publish_local(execution_id, message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("[ExecutionProgressHub] Subscription error, retrying: %s", exc)
+            finally:
+                self._subscribed = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.punsubscribe(EXECUTION_PROGRESS_PATTERN)
+                        await pubsub.close()
+                    except Exception:
+                        pass
+            await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
+
+
+_hub: Optional[ExecutionProgressHub] = None
+
+
+def get_execution_progress_hub() -> ExecutionProgressHub:
+    """Return the process-wide execution progress hub."""
+    global _hub
+    if _hub is None:
+        _hub = ExecutionProgressHub()
+    return _hub
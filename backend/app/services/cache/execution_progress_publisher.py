@@ -0,0 +1,261 @@
+"""
+Progress snapshots for execution streams.
+
+Task writes that touch ``execution_context`` publish the progress fields an
+execution stream renders to ``execution:{execution_id}:progress``, so open
+execution pages update from the event itself instead of re-reading the task.
+The stream's DB refresh builds the same fields with
+``execution_progress_fields`` so both paths emit identical payloads.
+
+Task writes only queue the snapshot; one worker thread publishes it through
+the shared cache client, so a slow or unreachable Redis never delays a write.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.app.services.cache.async_redis import execution_progress_channel
+from backend.app.services.cache.redis_cache import get_cache_service
+
+logger = logging.getLogger(__name__)
+
+
+def _normalized_status(status: Any) -> str:
+    return str(getattr(status, "value", status) or "").lower().replace(" ", "_")
+
+
+def build_admission_state(task_obj: Any, ctx: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    blocked_reason = getattr(task_obj, "blocked_reason", None)
+    if blocked_reason != "admission_deferred":
+        return None
+
+    admission_ctx = ctx.get("admission") if isinstance(ctx.get("admission"), dict) else {}
+    blocked_payload = (
+        getattr(task_obj, "blocked_payload", None)
+        if isinstance(getattr(task_obj, "blocked_payload", None), dict)
+        else {}
+    )
+    return {
+        "state": "deferred",
+        "reason": admission_ctx.get("reason") or blocked_payload.get("reason"),
+        "defer_until": admission_ctx.get("defer_until")
+        or blocked_payload.get("defer_until")
+        or (
+            task_obj.next_eligible_at.isoformat()
+            if getattr(task_obj, "next_eligible_at", None)
+            else None
+        ),
+        "visibility": admission_ctx.get("visibility")
+        or blocked_payload.get("visibility"),
+        "producer_kind": admission_ctx.get("producer_kind")
+        or blocked_payload.get("producer_kind"),
+        "queue_shard": admission_ctx.get("queue_shard")
+        or blocked_payload.get("queue_shard")
+        or getattr(task_obj, "queue_shard", None),
+    }
+
+
+def execution_progress_fields(task_obj: Any) -> Dict[str, Any]:
+    """Return the task-derived fields of an execution stream progress payload."""
+    ctx = task_obj.execution_context if isinstance(task_obj.execution_context, dict) else {}
+    progress = ctx.get("progress")
+    status = getattr(task_obj.status, "value", task_obj.status)
+    running = _normalized_status(status) == "running"
+    next_eligible_at = getattr(task_obj, "next_eligible_at", None)
+    heartbeat_at = getattr(task_obj, "heartbeat_at", None)
+    return {
+        "status": status,
+        "progress": progress if isinstance(progress, dict) else None,
+        "blocked_reason": getattr(task_obj, "blocked_reason", None),
+        "blocked_payload": getattr(task_obj, "blocked_payload", None),
+        "frontier_state": getattr(task_obj, "frontier_state", None),
+        "next_eligible_at": next_eligible_at.isoformat() if next_eligible_at else None,
+        "admission_state": build_admission_state(task_obj, ctx),
+        "dependency_hold": ctx.get("dependency_hold"),
+        "heartbeat_at": (
+            heartbeat_at.isoformat()
+            if heartbeat_at
+            else (ctx.get("heartbeat_at") if running else None)
+        ),
+        "runner_id": getattr(task_obj, "runner_id", None)
+        or (ctx.get("runner_id") if running else None),
+    }
+
+
+def apply_execution_progress_events(
+    payload_obj: Dict[str, Any], events: List[Dict[str, Any]]
+) -> bool:
+    """Fold pushed events into the last stream payload.
+
+    Returns False when an event cannot be rendered on its own (terminal or
+    status changes, events without a snapshot) and the task must be re-read.
+    """
+    for event in events:
+        if event.get("terminal"):
+            return False
+        if _normalized_status(event.get("status")) != _normalized_status(
+            payload_obj.get("status")
+        ):
+            return False
+        snapshot = event.get("snapshot")
+        if isinstance(snapshot, dict):
+            progress = snapshot.get("progress") or payload_obj.get("progress")
+            payload_obj.update(snapshot)
+            payload_obj["progress"] = progress
+        elif event.get("type") == "heartbeat":
+            for key in ("heartbeat_at", "runner_id"):
+                if event.get(key):
+                    payload_obj[key] = event[key]
+        else:
+            return False
+    return True
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except (TypeError, ValueError):
+        return default
+
+
+class ExecutionProgressPublisher:
+    """
+    Publish progress snapshots from one background thread.
+
+    Producers never block: when the queue is full the snapshot is dropped and
+    counted, and the stream picks the state up on its next DB refresh. Each
+    drained batch keeps only the newest snapshot per execution and goes out
+    in one pipelined ``publish_many``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self._queue: "queue.Queue[Tuple[str, str]]" = queue.Queue(
+            maxsize=max_size or _env_int("EXECUTION_PROGRESS_QUEUE_SIZE", 1000)
+        )
+        self._batch_size = batch_size or _env_int(
+            "EXECUTION_PROGRESS_BATCH_SIZE", 64
+        )
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._dropped = 0
+
+    def submit(self, channel: str, message: str) -> bool:
+        """Queue one message; returns False when the queue is full."""
+        try:
+            self._queue.put_nowait((channel, message))
+        except queue.Full:
+            self._dropped += 1
+            logger.debug(
+                "Execution progress queue full; dropped snapshot for %s "
+                "(total dropped %s)",
+                channel,
+                self._dropped,
+            )
+            return False
+        self._ensure_worker()
+        return True
+
+    def join(self) -> None:
+        """Block until every queued snapshot has been handed to Redis."""
+        self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="execution-progress-publisher",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _next_batch(self) -> List[Tuple[str, str]]:
+        batch = [self._queue.get()]
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                latest = dict(batch)
+                get_cache_service().publish_many(list(latest.items()))
+            except Exception as exc:
+                logger.debug(
+                    "Failed to publish %s execution progress snapshots: %s",
+                    len(batch),
+                    exc,
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+_publisher_instance: Optional[ExecutionProgressPublisher] = None
+_publisher_lock = threading.Lock()
+
+
+def get_execution_progress_publisher() -> ExecutionProgressPublisher:
+    """Return the process-wide execution progress publisher."""
+    global _publisher_instance
+    if _publisher_instance is None:
+        with _publisher_lock:
+            if _publisher_instance is None:
+                _publisher_instance = ExecutionProgressPublisher()
+    return _publisher_instance
+
+
+def publish_execution_progress_snapshot(task_obj: Any) -> bool:
+    """Queue the task's current progress fields for its execution stream.
+
+    Best effort: streams fall back to a slow DB refresh when nothing arrives.
+    """
+    if task_obj is None:
+        return False
+    execution_id = getattr(task_obj, "execution_id", None) or task_obj.id
+    try:
+        message = json.dumps(
+            {
+                "type": "progress",
+                "task_id": task_obj.id,
+                "execution_id": execution_id,
+                "status": getattr(task_obj.status, "value", task_obj.status),
+                "terminal": False,
+                "snapshot": execution_progress_fields(task_obj),
+            },
+            default=str,
+        )
+    except Exception as encode_error:
+        logger.debug(
+            "Failed to encode progress snapshot for task %s (%s): %s",
+            task_obj.id,
+            execution_id,
+            encode_error,
+        )
+        return False
+    return get_execution_progress_publisher().submit(
+        execution_progress_channel(execution_id), message
+    )
+
+
+__all__ = [
+    "ExecutionProgressPublisher",
+    "apply_execution_progress_events",
+    "build_admission_state",
+    "execution_progress_fields",
+    "get_execution_progress_publisher",
+    "publish_execution_progress_snapshot",
+]
@@ -7,7 +7,7 @@ Provides Redis-based caching for tool registry and other services.
 import json
 import os
 import logging
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List, Tuple
 import redis
 from redis.exceptions import ConnectionError, TimeoutError
 
@@ -238,6 +238,32 @@ class RedisCacheService:
             logger.warning("Redis publish failed for %s: %s", channel, exc)
             return False
 
+    def publish_many(self, messages: List[Tuple[str, str]]) -> int:
+        """Publish several fan-out messages in one pipelined round trip.
+
+        Returns:
+            Number of messages sent (0 when Redis is unavailable)
+        """
+        if not messages or not self.enabled:
+            return 0
+        if not self._available or not self._client:
+            try:
+                self._connect()
+            except Exception:
+                return 0
+        if not self._client:
+            return 0
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for channel, payload in messages:
+                pipe.publish(channel, payload)
+            pipe.execute()
+            return len(messages)
+        except Exception as exc:
+            self._available = False
+            logger.warning("Redis pipelined publish of %s messages failed: %s", len(messages), exc)
+            return 0
+
     def delete_pattern(self, pattern: str) -> int:
         """
         Delete all keys matching pattern.
@@ -0,0 +1,434 @@
+"""Generational LRU/TTL result cache with an optional shared Redis tier.
+
+``LruTtlCache`` is the in-process tier: true LRU order, per-entry expiry and
+hit/miss/eviction counters. ``ResultCache`` adds three things on top:
+- scope generations, so one scope (for example a workspace) can be
+  invalidated without dropping the rest;
+- an optional Redis tier, so processes sharing a Redis reuse each other's
+  results;
+- an optional near-duplicate mode that reuses a cached result when the query
+  embedding is within ``semantic_epsilon`` cosine distance of a cached one.
+
+An invalidation bumps the scope's shared generation in Redis. Until that
+bump is acknowledged, this process skips the Redis tier for the scope, so it
+never reads or writes the old generation's shared entries. Memory entries
+another process made stale live until their TTL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = "*"
+
+
+class LruTtlCache:
+    """Thread-safe LRU with per-entry TTL. ``None`` values are not cacheable."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, *, record: bool = True) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() >= entry[0]:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                if record:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if record:
+                self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        if self.max_entries <= 0 or value is None:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else float(ttl_seconds)
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class SemanticKeyIndex:
+    """Query embeddings behind cached keys, grouped by partition."""
+
+    def __init__(self, max_entries: int, epsilon: float):
+        self.max_entries = max(1, int(max_entries))
+        self.epsilon = float(epsilon)
+        self._partitions: Dict[str, "OrderedDict[str, np.ndarray]"] = {}
+        self._lock = threading.Lock()
+
+    def remember(self, partition: str, key: str, embedding: Sequence[float]) -> None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return
+        with self._lock:
+            entries = self._partitions.setdefault(partition, OrderedDict())
+            entries[key] = vector / norm
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def find(self, partition: str, embedding: Sequence[float]) -> Optional[str]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        with self._lock:
+            entries = self._partitions.get(partition)
+            if not entries or norm == 0.0:
+                return None
+            keys = list(entries)
+            matrix = np.stack([entries[key] for key in keys])
+        if matrix.shape[1] != vector.shape[0]:
+            return None
+        similarities = matrix @ (vector / norm)
+        best = int(np.argmax(similarities))
+        if 1.0 - float(similarities[best]) > self.epsilon:
+            return None
+        return keys[best]
+
+    def discard(self, partition: str, key: str) -> None:
+        with self._lock:
+            entries = self._partitions.get(partition)
+            if entries is not None:
+                entries.pop(key, None)
+
+    def drop_scope(self, scope: Optional[str]) -> None:
+        with self._lock:
+            if scope is None:
+                self._partitions.clear()
+                return
+            prefix = f"{scope}|"
+            for partition in [p for p in self._partitions if p.startswith(prefix)]:
+                del self._partitions[partition]
+
+
+class RedisResultTier:
+    """JSON values in Redis; any Redis failure degrades to a miss."""
+
+    def __init__(
+        self,
+        client_factory: Optional[Callable[[], Awaitable[Any]]] = None,
+        *,
+        retry_after_seconds: float = 30.0,
+    ):
+        self._client_factory = client_factory
+        self.retry_after_seconds = retry_after_seconds
+        self._disabled_until = 0.0
+
+    async def _client(self) -> Any:
+        if time.monotonic() < self._disabled_until:
+            return None
+        factory = self._client_factory
+        if factory is None:
+            from backend.app.services.cache.async_redis import get_async_redis_client
+
+            factory = get_async_redis_client
+        client = await factory()
+        if client is None:
+            self._back_off()
+        return client
+
+    def _back_off(self) -> None:
+        self._disabled_until = time.monotonic() + self.retry_after_seconds
+
+    async def generations(self, keys: List[str]) -> Optional[List[int]]:
+        client = await self._client()
+        if client is None:
+            return None
+        try:
+            values = await client.mget(keys)
+        except Exception as exc:
+            logger.debug("Redis result tier mget failed: %s", exc)
+            self._back_off()
+            return None
+        return [int(value or 0) for value in values]
+
+    async def get(self, key: str) -> Optional[Any]:
+        client = await self._client()
+        if client is None:
+            return None
+        try:
+            payload = await client.get(key)
+        except Exception as exc:
+            logger.debug("Redis result tier get failed: %s", exc)
+            self._back_off()
+            return None
+        return json.loads(payload) if payload is not None else None
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        client = await self._client()
+        if client is None:
+            return
+        try:
+            await client.set(
+                key,
+                json.dumps(value, ensure_ascii=False, default=str),
+                ex=max(1, int(ttl_seconds)),
+            )
+        except Exception as exc:
+            logger.debug("Redis result tier set failed: %s", exc)
+            self._back_off()
+
+    async def incr(self, key: str) -> bool:
+        client = await self._client()
+        if client is None:
+            return False
+        try:
+            await client.incr(key)
+        except Exception as exc:
+            logger.debug("Redis result tier incr failed: %s", exc)
+            self._back_off()
+            return False
+        return True
+
+
+class ResultCache:
+    """Scoped, generational result cache: memory LRU/TTL, then Redis."""
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = 60.0,
+        shared_tier: Optional[RedisResultTier] = None,
+        semantic_epsilon: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = float(ttl_seconds)
+        self.memory = LruTtlCache(max_entries, ttl_seconds, clock=clock)
+        self.shared = shared_tier
+        self.semantic = (
+            SemanticKeyIndex(max_entries, semantic_epsilon)
+            if semantic_epsilon > 0
+            else None
+        )
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.shared_hits = 0
+        self.semantic_hits = 0
+        self._pending: set[asyncio.Task] = set()
+        # Generation bumps not yet acknowledged by Redis, per scope.
+        self._unacked_bumps: Dict[str, int] = {}
+        # Bumps made outside an event loop, sent by the next async call.
+        self._unsent_bumps: List[str] = []
+
+    def _generation_token(self, scope: str) -> str:
+        with self._lock:
+            return (
+                f"{self._generations.get(GLOBAL_SCOPE, 0)}."
+                f"{self._generations.get(scope, 0)}"
+            )
+
+    def _memory_key(self, scope: str, key: str) -> str:
+        return f"{scope}|{self._generation_token(scope)}|{key}"
+
+    def _semantic_partition(self, scope: str, partition: str) -> str:
+        return f"{scope}|{self._generation_token(scope)}|{partition}"
+
+    def _shared_generation_key(self, scope: str) -> str:
+        return f"{self.namespace}:generation:{scope}"
+
+    async def _shared_key(self, scope: str, key: str) -> Optional[str]:
+        generations = await self.shared.generations(
+            [
+                self._shared_generation_key(GLOBAL_SCOPE),
+                self._shared_generation_key(scope),
+            ]
+        )
+        if generations is None:
+            return None
+        return f"{self.namespace}:{scope}:{generations[0]}.{generations[1]}:{key}"
+
+    async def _use_shared(self, scope: str) -> bool:
+        """Whether the Redis tier is current for *scope* in this process."""
+        if self.shared is None:
+            return False
+        with self._lock:
+            unsent, self._unsent_bumps = self._unsent_bumps, []
+        for target in unsent:
+            await self._send_bump(target)
+        with self._lock:
+            return not (
+                self._unacked_bumps.get(scope) or self._unacked_bumps.get(GLOBAL_SCOPE)
+            )
+
+    async def get(self, key: str, *, scope: str = "") -> Optional[Any]:
+        """Return the cached value for *key* in *scope*, or None."""
+        with self._lock:
+            self.lookups += 1
+        memory_key = self._memory_key(scope, key)
+        value = self.memory.get(memory_key)
+        if value is not None or not await self._use_shared(scope):
+            return value
+        shared_key = await self._shared_key(scope, key)
+        if shared_key is None:
+            return None
+        value = await self.shared.get(shared_key)
+        if value is not None:
+            self.memory.set(memory_key, value)
+            with self._lock:
+                self.shared_hits += 1
+        return value
+
+    def get_similar(
+        self,
+        embedding: Sequence[float],
+        *,
+        scope: str = "",
+        partition: str = "",
+    ) -> Optional[Any]:
+        """Return a cached value whose query embedding is within epsilon."""
+        if self.semantic is None:
+            return None
+        semantic_partition = self._semantic_partition(scope, partition)
+        memory_key = self.semantic.find(semantic_partition, embedding)
+        if memory_key is None:
+            return None
+        value = self.memory.get(memory_key, record=False)
+        if value is None:
+            self.semantic.discard(semantic_partition, memory_key)
+            return None
+        with self._lock:
+            self.semantic_hits += 1
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        scope: str = "",
+        embedding: Optional[Sequence[float]] = None,
+        partition: str = "",
+    ) -> None:
+        """Cache *value*; *embedding* enables near-duplicate reuse of it."""
+        memory_key = self._memory_key(scope, key)
+        self.memory.set(memory_key, value)
+        if self.semantic is not None and embedding is not None:
+            self.semantic.remember(
+                self._semantic_partition(scope, partition), memory_key, embedding
+            )
+        if await self._use_shared(scope):
+            shared_key = await self._shared_key(scope, key)
+            if shared_key is not None:
+                await self.shared.set(shared_key, value, self.ttl_seconds)
+
+    def invalidate(self, scope: Optional[str] = None) -> None:
+        """Start a new generation for *scope*, or for every scope when None."""
+        target = GLOBAL_SCOPE if scope is None else scope
+        with self._lock:
+            self._generations[target] = self._generations.get(target, 0) + 1
+        if scope is None:
+            self.memory.clear()
+        if self.semantic is not None:
+            self.semantic.drop_scope(scope)
+        if self.shared is None:
+            return
+        with self._lock:
+            self._unacked_bumps[target] = self._unacked_bumps.get(target, 0) + 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            with self._lock:
+                self._unsent_bumps.append(target)
+            return
+        task = loop.create_task(self._send_bump(target))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _send_bump(self, target: str) -> None:
+        sent = False
+        try:
+            sent = await self.shared.incr(self._shared_generation_key(target))
+        finally:
+            with self._lock:
+                if not sent:
+                    # Retried by the next lookup; the scope stays off Redis.
+                    self._unsent_bumps.append(target)
+                elif self._unacked_bumps.get(target, 0) > 1:
+                    self._unacked_bumps[target] -= 1
+                else:
+                    self._unacked_bumps.pop(target, None)
+
+    def stats(self) -> Dict[str, float]:
+        memory = self.memory.stats()
+        with self._lock:
+            hits = memory["hits"] + self.shared_hits + self.semantic_hits
+            return {
+                "lookups": self.lookups,
+                "memory_entries": memory["entries"],
+                "memory_hits": memory["hits"],
+                "shared_hits": self.shared_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": max(0, self.lookups - hits),
+                "memory_expirations": memory["expirations"],
+                "memory_evictions": memory["evictions"],
+                "hit_ratio": round(hits / self.lookups, 4) if self.lookups else 0.0,
+            }
+
+
+__all__ = [
+    "GLOBAL_SCOPE",
+    "LruTtlCache",
+    "RedisResultTier",
+    "ResultCache",
+    "SemanticKeyIndex",
+]
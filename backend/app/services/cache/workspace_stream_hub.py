@@ -0,0 +1,314 @@
+"""
+Per-process fan-out hub for workspace activity streams.
+
+One ``PSUBSCRIBE workspace:*:stream`` connection per backend process feeds
+every SSE client and relay in that process. Each event is decoded and
+serialized once, then handed to subscribers through bounded in-memory
+queues, so Redis connection count no longer grows with open browser tabs.
+
+Slow consumers are handled by ``WORKSPACE_STREAM_SLOW_CONSUMER_POLICY``:
+
+- ``drop_oldest`` (default): discard the oldest queued event to make room
+- ``drop_newest``: discard the incoming event
+- ``disconnect``: close the subscription; the SSE client reconnects
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Set
+
+from backend.app.services.cache.async_redis import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+WORKSPACE_STREAM_PATTERN = "workspace:*:stream"
+
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+_RESUBSCRIBE_DELAY_SECONDS = 5.0
+_LISTEN_READ_TIMEOUT_SECONDS = 1.0
+_LATENCY_SAMPLE_WINDOW = 512
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _slow_consumer_policy_from_env() -> str:
+    policy = os.getenv("WORKSPACE_STREAM_SLOW_CONSUMER_POLICY", "drop_oldest").strip().lower()
+    return policy if policy in SLOW_CONSUMER_POLICIES else "drop_oldest"
+
+
+@dataclass(frozen=True)
+class WorkspaceStreamEvent:
+    """One decoded stream event, shared by every subscriber."""
+
+    workspace_id: str
+    data: Dict[str, Any]
+    sse_frame: str
+
+
+_CLOSED = object()
+
+
+class WorkspaceStreamSubscription:
+    """A bounded queue of events for one consumer."""
+
+    def __init__(self, workspace_id: Optional[str], *, max_queue: int, policy: str):
+        self.workspace_id = workspace_id
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_queue))
+
+    def _offer(self, event: WorkspaceStreamEvent) -> tuple[bool, bool]:
+        """Queue ``event`` per the slow-consumer policy.
+
+        Returns:
+            ``(queued, dropped)``; ``dropped`` is True when this event or an
+            older queued one was discarded
+        """
+        if self.closed:
+            return False, False
+        try:
+            self._queue.put_nowait(event)
+            return True, False
+        except asyncio.QueueFull:
+            pass
+        self.dropped += 1
+        if self.policy == "drop_newest":
+            return False, True
+        if self.policy == "disconnect":
+            self.close()
+            return False, True
+        try:
+            self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        self._queue.put_nowait(event)
+        return True, True
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        while True:
+            try:
+                self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        self._queue.put_nowait(_CLOSED)
+
+    async def next_event(self, timeout: Optional[float] = None) -> Optional[WorkspaceStreamEvent]:
+        """Return the next event, or None on timeout.
+
+        Raises:
+            StopAsyncIteration: the subscription was closed
+        """
+        try:
+            item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        return item
+
+    def __aiter__(self) -> "WorkspaceStreamSubscription":
+        return self
+
+    async def __anext__(self) -> WorkspaceStreamEvent:
+        event = await self.next_event()
+        assert event is not None
+        return event
+
+
+class WorkspaceStreamHub:
+    """Share one Redis pattern subscription across all stream consumers."""
+
+    def __init__(
+        self,
+        *,
+        client_factory=get_async_redis_client,
+        max_queue: Optional[int] = None,
+        policy: Optional[str] = None,
+    ):
+        self._client_factory = client_factory
+        self._max_queue = max_queue or _env_int("WORKSPACE_STREAM_SUBSCRIBER_QUEUE_SIZE", 256)
+        self._policy = policy if policy in SLOW_CONSUMER_POLICIES else _slow_consumer_policy_from_env()
+        self._by_workspace: Dict[str, Set[WorkspaceStreamSubscription]] = {}
+        self._all_workspaces: Set[WorkspaceStreamSubscription] = set()
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = False
+        self._events_received = 0
+        self._events_delivered = 0
+        self._events_dropped = 0
+        self._malformed = 0
+        self._slow_disconnects = 0
+        self._fanout_latency_ms: Deque[float] = deque(maxlen=_LATENCY_SAMPLE_WINDOW)
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._by_workspace.values()) + len(self._all_workspaces)
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        workspace_id: Optional[str],
+        *,
+        max_queue: Optional[int] = None,
+        policy: Optional[str] = None,
+    ) -> AsyncIterator[WorkspaceStreamSubscription]:
+        """Register a consumer for one workspace, or for all when ``workspace_id`` is None."""
+        subscription = WorkspaceStreamSubscription(
+            workspace_id,
+            max_queue=max_queue or self._max_queue,
+            policy=policy if policy in SLOW_CONSUMER_POLICIES else self._policy,
+        )
+        if workspace_id is None:
+            self._all_workspaces.add(subscription)
+        else:
+            self._by_workspace.setdefault(workspace_id, set()).add(subscription)
+        self._ensure_listener()
+        try:
+            yield subscription
+        finally:
+            subscription.closed = True
+            if workspace_id is None:
+                self._all_workspaces.discard(subscription)
+            else:
+                subs = self._by_workspace.get(workspace_id)
+                if subs is not None:
+                    subs.discard(subscription)
+                    if not subs:
+                        self._by_workspace.pop(workspace_id, None)
+
+    def publish_local(self, workspace_id: str, raw_payload: str) -> int:
+        """Fan a raw channel payload out to local subscribers; returns deliveries."""
+        started = time.perf_counter()
+        self._events_received += 1
+        targets = list(self._by_workspace.get(workspace_id, ())) + list(self._all_workspaces)
+        if not targets:
+            return 0
+        try:
+            data = json.loads(raw_payload)
+        except (json.JSONDecodeError, TypeError):
+            self._malformed += 1
+            return 0
+        event = WorkspaceStreamEvent(
+            workspace_id=workspace_id,
+            data=data,
+            sse_frame=f"data: {json.dumps(data, ensure_ascii=False)}\n\n",
+        )
+        delivered = 0
+        for subscription in targets:
+            queued, dropped = subscription._offer(event)
+            delivered += int(queued)
+            if not dropped:
+                continue
+            self._events_dropped += 1
+            if subscription.closed:
+                self._slow_disconnects += 1
+                logger.info(
+                    "[StreamHub] Disconnected slow subscriber workspace=%s dropped=%s",
+                    subscription.workspace_id,
+                    subscription.dropped,
+                )
+        self._events_delivered += delivered
+        self._fanout_latency_ms.append((time.perf_counter() - started) * 1000.0)
+        return delivered
+
+    def metrics(self) -> Dict[str, Any]:
+        samples = sorted(self._fanout_latency_ms)
+
+        def _pct(pct: float) -> float:
+            if not samples:
+                return 0.0
+            index = min(len(samples) - 1, max(0, int(round(pct / 100.0 * len(samples))) - 1))
+            return round(samples[index], 3)
+
+        return {
+            "subscribed": self._subscribed,
+            "policy": self._policy,
+            "max_queue": self._max_queue,
+            "subscribers": self.subscriber_count,
+            "workspaces": len(self._by_workspace),
+            "events_received": self._events_received,
+            "events_delivered": self._events_delivered,
+            "events_dropped": self._events_dropped,
+            "events_malformed": self._malformed,
+            "slow_disconnects": self._slow_disconnects,
+            "fanout_latency_ms": {
+                "p50": _pct(50),
+                "p99": _pct(99),
+                "max": round(samples[-1], 3) if samples else 0.0,
+            },
+        }
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        for subscription in [*self._all_workspaces, *(s for subs in self._by_workspace.values() for s in subs)]:
+            subscription.close()
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen_forever())
+
+    async def _listen_forever(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                client = await self._client_factory()
+                if client:
+                    pubsub = client.pubsub()
+                    await pubsub.psubscribe(WORKSPACE_STREAM_PATTERN)
+                    self._subscribed = True
+                    logger.info("[StreamHub] Subscribed to %s", WORKSPACE_STREAM_PATTERN)
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True,
+                            timeout=_LISTEN_READ_TIMEOUT_SECONDS,
+                        )
+                        if not message or message.get("type") != "pmessage":
+                            continue
+                        parts = str(message.get("channel") or "").split(":")
+                        if len(parts) >= 3:
+                            self.publish_local(parts[1], message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("[StreamHub] Subscription error, retrying: %s", exc)
+            finally:
+                self._subscribed = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.punsubscribe(WORKSPACE_STREAM_PATTERN)
+                        await pubsub.close()
+                    except Exception:
+                        pass
+            await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
+
+
+_hub: Optional[WorkspaceStreamHub] = None
+
+
+def get_workspace_stream_hub() -> WorkspaceStreamHub:
+    """Return the process-wide stream hub."""
+    global _hub
+    if _hub is None:
+        _hub = WorkspaceStreamHub()
+    return _hub
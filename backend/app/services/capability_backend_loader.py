@@ -47,12 +47,12 @@ def _load_unpacked_pack_module(
     return module
 
 
-def resolve_capability_backend_callable(
+def import_capability_backend_module(
     *,
     backend_path: str,
     capability_dir: Optional[Path],
-) -> Callable[..., Any]:
-    """Resolve one manifest backend target through the canonical import path."""
+) -> tuple[Any, str]:
+    """Import the module behind one manifest backend target and return both."""
 
     if capability_dir is not None:
         prepend_import_paths(
@@ -76,7 +76,20 @@ def resolve_capability_backend_callable(
         )
         if module is None:
             raise import_error
+    return module, target
+
+
+def resolve_capability_backend_callable(
+    *,
+    backend_path: str,
+    capability_dir: Optional[Path],
+) -> Callable[..., Any]:
+    """Resolve one manifest backend target through the canonical import path."""
 
+    module, target = import_capability_backend_module(
+        backend_path=backend_path,
+        capability_dir=capability_dir,
+    )
     if "." not in target:
         return getattr(module, target)
     class_name, method_name = target.rsplit(".", 1)
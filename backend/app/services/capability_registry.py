@@ -11,13 +11,11 @@ from typing import Dict, Optional, Callable, Any, List
 import logging
 import threading
 from app.services.runtime_pack_hygiene import is_ignored_runtime_pack_dir
-from app.services.capability_backend_loader import (
-    resolve_capability_backend_callable,
-)
-from app.services.capability_tool_invocation import (
-    invoke_capability_tool,
-    invoke_capability_tool_async,
+from app.services.capability_tool_dispatch import (
+    CompiledCapabilityTool,
+    compile_capability_tool,
 )
+from app.services.tool_catalog_generation import bump_tool_catalog_generation
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +37,7 @@ class CapabilityRegistry:
     def __init__(self):
         self.capabilities: Dict[str, Dict] = {}
         self.tools: Dict[str, Dict] = {}
+        self.compiled_tools: Dict[str, CompiledCapabilityTool] = {}
 
     def load_from_directory(self, capabilities_dir: Path):
         """Scan capabilities directory on startup, load all manifest.yaml files"""
@@ -87,6 +86,7 @@ class CapabilityRegistry:
             ]
             for tool_name in stale_tools:
                 self.tools.pop(tool_name, None)
+            self.invalidate_compiled_tools(capability_code)
             self.capabilities[capability_code] = {
                 "manifest": manifest,
                 "directory": capability_dir,
@@ -134,6 +134,41 @@ class CapabilityRegistry:
         """Get tool definition by tool name"""
         return self.tools.get(tool_name)
 
+    def get_compiled_tool(self, tool_name: str) -> Optional[CompiledCapabilityTool]:
+        """Return the dispatch entry for a tool, compiling it on first use.
+
+        An entry is only reused while it was compiled from the tool definition
+        currently registered, so a reloaded manifest never dispatches to a
+        stale callable or instance.
+        """
+        tool_info = self.tools.get(tool_name)
+        if tool_info is None:
+            return None
+        compiled = self.compiled_tools.get(tool_name)
+        if compiled is not None and compiled.tool_info is tool_info:
+            return compiled
+        capability_info = self.capabilities.get(tool_info.get("capability"))
+        capability_dir = capability_info.get("directory") if capability_info else None
+        compiled = compile_capability_tool(
+            tool_name=tool_name,
+            tool_info=tool_info,
+            capability_dir=Path(capability_dir) if capability_dir else None,
+        )
+        self.compiled_tools[tool_name] = compiled
+        return compiled
+
+    def invalidate_compiled_tools(self, capability_code: Optional[str] = None) -> None:
+        """Drop dispatch entries, and their shared instances, for one or all packs."""
+        if capability_code is None:
+            self.compiled_tools.clear()
+            return
+        for tool_name in [
+            tool_name
+            for tool_name, compiled in self.compiled_tools.items()
+            if compiled.tool_info.get("capability") == capability_code
+        ]:
+            self.compiled_tools.pop(tool_name, None)
+
     def list_tools(self) -> list[str]:
         """List all available tool names"""
         return list(self.tools.keys())
@@ -231,6 +266,7 @@ def load_capabilities(capabilities_dir: Optional[Path] = None, reset: bool = Fal
 
             _registry.capabilities.clear()
             _registry.tools.clear()
+            _registry.invalidate_compiled_tools()
             CAPABILITY_REGISTRY.clear()
             TOOL_REGISTRY.clear()
             reset_knowledge_projection_registry()
@@ -238,6 +274,7 @@ def load_capabilities(capabilities_dir: Optional[Path] = None, reset: bool = Fal
         _registry.load_from_directory(capabilities_dir)
         CAPABILITY_REGISTRY.update(_registry.capabilities)
         TOOL_REGISTRY.update(_registry.tools)
+        bump_tool_catalog_generation()
     logger.info(f"Loaded {len(_registry.capabilities)} capabilities, {len(_registry.tools)} tools")
 
 
@@ -275,6 +312,7 @@ def reload_capability(
                 if tool_info.get("capability") == normalized_code
             }
         )
+        bump_tool_catalog_generation()
     return True
 
 
@@ -315,20 +353,9 @@ def call_tool(
     if not backend_path:
         raise ValueError(f"Tool {tool_name} has no backend defined")
 
-    capability_info = _registry.get_capability(capability)
-    capability_dir = capability_info.get("directory") if capability_info else None
-
     try:
-        func = resolve_capability_backend_callable(
-            backend_path=backend_path,
-            capability_dir=Path(capability_dir) if capability_dir else None,
-        )
-
-        return invoke_capability_tool(
-            func,
-            kwargs,
-            execution_context=_execution_context,
-        )
+        compiled = _registry.get_compiled_tool(tool_name)
+        return compiled.invoke(kwargs, execution_context=_execution_context)
     except Exception as e:
         error_msg = f"Failed to call tool {tool_name} (backend: {backend_path}): {str(e)}"
         logger.error(error_msg)
@@ -355,16 +382,9 @@ async def call_tool_async(
     if not backend_path:
         raise ValueError(f"Tool {tool_name} has no backend defined")
 
-    capability_info = _registry.get_capability(capability)
-    capability_dir = capability_info.get("directory") if capability_info else None
-
     try:
-        func = resolve_capability_backend_callable(
-            backend_path=backend_path,
-            capability_dir=Path(capability_dir) if capability_dir else None,
-        )
-        return await invoke_capability_tool_async(
-            func,
+        compiled = _registry.get_compiled_tool(tool_name)
+        return await compiled.invoke_async(
             kwargs,
             execution_context=_execution_context,
         )
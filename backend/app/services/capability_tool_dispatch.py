@@ -0,0 +1,142 @@
+"""Compiled dispatch entries for capability registry tool calls.
+
+Resolving a manifest backend imports its module, prepends runtime import roots
+and, for ``Class.method`` targets, constructs the owning class. A compiled
+entry does that once per registered tool and keeps the callable, the
+signature shape and the sync/async flag until the capability is reloaded.
+"""
+
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+
+from app.services.capability_backend_loader import (
+    import_capability_backend_module,
+)
+from app.services.capability_tool_invocation import (
+    CapabilityExecutionContext,
+    invoke_capability_tool,
+    invoke_capability_tool_async,
+    uses_standard_tool_signature,
+)
+
+# ``per_call`` (the default): a fresh instance for every call, so state kept
+# on ``self`` never crosses calls or threads.
+# ``capability``: one instance per tool shared by concurrent calls, dropped
+# when the capability reloads; packs opt in for stateless backend classes.
+INSTANCE_LIFECYCLE_CAPABILITY = "capability"
+INSTANCE_LIFECYCLE_PER_CALL = "per_call"
+_INSTANCE_LIFECYCLES = frozenset(
+    {INSTANCE_LIFECYCLE_CAPABILITY, INSTANCE_LIFECYCLE_PER_CALL}
+)
+
+
+@dataclass(frozen=True)
+class CompiledCapabilityTool:
+    """Resolved callable and binding plan for one registered capability tool."""
+
+    tool_name: str
+    backend_path: str
+    tool_info: Mapping[str, Any]
+    target: Callable[..., Any]
+    standard_signature: bool
+    is_async: bool
+    instance_lifecycle: str
+    instance_factory: Optional[Callable[[], Any]] = None
+    method_name: Optional[str] = None
+
+    def resolve(self) -> Callable[..., Any]:
+        if self.instance_factory is None:
+            return self.target
+        return getattr(self.instance_factory(), self.method_name)
+
+    def invoke(
+        self,
+        arguments: Mapping[str, Any],
+        *,
+        execution_context: CapabilityExecutionContext | None = None,
+    ) -> Any:
+        return invoke_capability_tool(
+            self.resolve(),
+            arguments,
+            execution_context=execution_context,
+            standard_signature=self.standard_signature,
+        )
+
+    async def invoke_async(
+        self,
+        arguments: Mapping[str, Any],
+        *,
+        execution_context: CapabilityExecutionContext | None = None,
+    ) -> Any:
+        if self.is_async:
+            return await self.invoke(arguments, execution_context=execution_context)
+        return await invoke_capability_tool_async(
+            self.resolve(),
+            arguments,
+            execution_context=execution_context,
+            standard_signature=self.standard_signature,
+        )
+
+
+def compile_capability_tool(
+    *,
+    tool_name: str,
+    tool_info: Mapping[str, Any],
+    capability_dir: Optional[Path],
+) -> CompiledCapabilityTool:
+    """Resolve one registered tool backend into a reusable dispatch entry."""
+
+    backend_path = str(tool_info.get("backend") or "")
+    if not backend_path:
+        raise ValueError(f"Tool {tool_name} has no backend defined")
+    manifest_entry = tool_info.get("tool_info") or {}
+    instance_lifecycle = str(
+        manifest_entry.get("instance_lifecycle") or INSTANCE_LIFECYCLE_PER_CALL
+    )
+    if instance_lifecycle not in _INSTANCE_LIFECYCLES:
+        raise ValueError(
+            f"Tool {tool_name} has unknown instance_lifecycle: {instance_lifecycle}"
+        )
+
+    module, target_name = import_capability_backend_module(
+        backend_path=backend_path,
+        capability_dir=capability_dir,
+    )
+    instance_factory = None
+    method_name = None
+    if "." not in target_name:
+        target = getattr(module, target_name)
+        signature_source = target
+    else:
+        class_name, method_name = target_name.rsplit(".", 1)
+        owner = getattr(module, class_name)
+        signature_source = getattr(owner, method_name)
+        if instance_lifecycle == INSTANCE_LIFECYCLE_PER_CALL:
+            instance_factory = owner
+            target = signature_source
+        else:
+            target = getattr(owner(), method_name)
+
+    return CompiledCapabilityTool(
+        tool_name=tool_name,
+        backend_path=backend_path,
+        tool_info=tool_info,
+        target=target,
+        standard_signature=uses_standard_tool_signature(signature_source),
+        is_async=inspect.iscoroutinefunction(signature_source),
+        instance_lifecycle=instance_lifecycle,
+        instance_factory=instance_factory,
+        method_name=method_name,
+    )
+
+
+__all__ = [
+    "CompiledCapabilityTool",
+    "INSTANCE_LIFECYCLE_CAPABILITY",
+    "INSTANCE_LIFECYCLE_PER_CALL",
+    "compile_capability_tool",
+]
@@ -134,10 +134,17 @@ def invoke_capability_tool(
     arguments: Mapping[str, Any],
     *,
     execution_context: CapabilityExecutionContext | None = None,
+    standard_signature: bool | None = None,
 ) -> Any:
-    """Invoke a standard tool through `(inputs, ctx)` or preserve legacy kwargs."""
+    """Invoke a standard tool through `(inputs, ctx)` or preserve legacy kwargs.
+
+    Callers that already know the signature shape pass `standard_signature`
+    so the per-call `inspect.signature` lookup is skipped.
+    """
     copied_arguments = dict(arguments)
-    if uses_standard_tool_signature(func):
+    if standard_signature is None:
+        standard_signature = uses_standard_tool_signature(func)
+    if standard_signature:
         return func(
             inputs=copied_arguments,
             ctx=execution_context
@@ -151,12 +158,14 @@ async def invoke_capability_tool_async(
     arguments: Mapping[str, Any],
     *,
     execution_context: CapabilityExecutionContext | None = None,
+    standard_signature: bool | None = None,
 ) -> Any:
     """Await either standard or legacy capability tool results."""
     result = invoke_capability_tool(
         func,
         arguments,
         execution_context=execution_context,
+        standard_signature=standard_signature,
     )
     if inspect.isawaitable(result):
         return await result
@@ -19,12 +19,15 @@ from websockets.client import WebSocketClientProtocol
 
 logger = logging.getLogger(__name__)
 
+_RELAY_QUEUE_SIZE = 1024
+
 
 class ActivityRelay:
     """Relay workspace activity events from Redis to Cloud WS.
 
-    Uses Redis ``PSUBSCRIBE workspace:*:stream`` to capture events from
-    all workspaces. Each event is forwarded as a JSON WS message with
+    Consumes the process-wide ``WorkspaceStreamHub`` (a single Redis
+    ``PSUBSCRIBE workspace:*:stream``) to capture events from all
+    workspaces. Each event is forwarded as a JSON WS message with
     ``type: "activity_event"``.
 
     Non-fatal: if Redis is unavailable or WS send fails, the relay
@@ -61,17 +64,18 @@ class ActivityRelay:
         """Subscribe to Redis and forward events over WS."""
         while self._running:
             try:
-                from backend.app.services.cache.async_redis import (
-                    psubscribe_all_workspace_streams,
+                from backend.app.services.cache.workspace_stream_hub import (
+                    get_workspace_stream_hub,
                 )
 
-                async for (
-                    workspace_id,
-                    event_data,
-                ) in psubscribe_all_workspace_streams():
-                    if not self._running:
-                        break
-                    await self._forward(workspace_id, event_data)
+                # Shares the process-wide pattern subscription with SSE clients.
+                async with get_workspace_stream_hub().subscribe(
+                    None, max_queue=_RELAY_QUEUE_SIZE
+                ) as subscription:
+                    async for event in subscription:
+                        if not self._running:
+                            break
+                        await self._forward(event.workspace_id, event.data)
 
             except asyncio.CancelledError:
                 return
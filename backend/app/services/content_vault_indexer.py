@@ -4,13 +4,23 @@ Content Vault Indexer Service
 Provides vector indexing for Content Vault documents to enable semantic search.
 """
 
+import asyncio
 import os
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import AbstractSet, Any, AsyncIterator, Dict, List, Optional, Sequence
 import yaml
 import re
 
+from backend.app.services.incremental_file_index import (
+    FILE_SKIPPED,
+    FileChange,
+    FileManifest,
+    default_manifest_path,
+    embed_documents,
+    embedding_model_signature,
+    stream_incremental_index,
+)
 from backend.app.services.vector_search import VectorSearchService
 from backend.app.services.knowledge_authorization import RetrievalAccessContext
 from backend.app.services.knowledge_projection.legacy_document_facade import (
@@ -96,26 +106,33 @@ class ContentVaultIndexer:
         for post_file in posts_dir.glob("*.md"):
             try:
                 content = post_file.read_text(encoding='utf-8')
-                frontmatter, body = self._parse_frontmatter(content)
-
-                if frontmatter.get('series_id') == series_id:
-                    posts.append({
-                        'id': post_file.stem,
-                        'series_id': series_id,
-                        'arc_id': frontmatter.get('arc_id'),
-                        'sequence': frontmatter.get('sequence'),
-                        'text': body.strip(),
-                        'title': frontmatter.get('title', post_file.stem),
-                        'status': frontmatter.get('status', 'draft'),
-                        'file_path': str(post_file.relative_to(vault_path)),
-                        'frontmatter': frontmatter,
-                    })
+                post = self._post_from_content(vault_path, post_file, content)
+
+                if post['series_id'] == series_id:
+                    posts.append(post)
             except Exception as e:
                 logger.error(f"Failed to load post {post_file}: {e}")
 
         posts.sort(key=lambda p: p.get('sequence', 0))
         return posts
 
+    def _post_from_content(
+        self, vault_path: Path, post_file: Path, content: str
+    ) -> Dict[str, Any]:
+        """Build the post dictionary for one post file"""
+        frontmatter, body = self._parse_frontmatter(content)
+        return {
+            'id': post_file.stem,
+            'series_id': frontmatter.get('series_id'),
+            'arc_id': frontmatter.get('arc_id'),
+            'sequence': frontmatter.get('sequence'),
+            'text': body.strip(),
+            'title': frontmatter.get('title', post_file.stem),
+            'status': frontmatter.get('status', 'draft'),
+            'file_path': str(post_file.relative_to(vault_path)),
+            'frontmatter': frontmatter,
+        }
+
     def _chunk_post(self, post: Dict[str, Any], max_len: int = 500) -> List[Dict[str, Any]]:
         """
         Chunk post text if it exceeds max length
@@ -200,105 +217,245 @@ class ContentVaultIndexer:
                 'chunks_indexed': 0
             }
 
-        indexed_count = 0
-        failed_count = 0
         if self.workspace_id is None or self.access_context is None:
             raise PermissionError("content_vault_authorized_scope_required")
-        for post in posts:
-            try:
-                chunks = self._chunk_post(post)
-                await self.projection_facade.replace_document(
-                    access_context=self.access_context,
-                    workspace_id=self.workspace_id,
-                    owner_capability_code="content_vault",
-                    source_app="content-vault",
-                    source_id=f"{series_id}:{post['id']}",
-                    doc_type="content_vault_post",
-                    source_revision=canonical_sha256(
-                        {
-                            "post": post,
-                            "chunks": [chunk["text"] for chunk in chunks],
-                        }
-                    ),
-                    chunks=tuple(
-                        LegacyDocumentChunk(
-                            content=chunk["text"],
-                            title=chunk.get("title", "Untitled"),
-                            metadata={
-                                "series_id": series_id,
-                                "arc_id": chunk.get("arc_id"),
-                                "sequence": chunk.get("sequence"),
-                                "file_path": chunk.get("file_path"),
-                                "post_id": chunk.get("id"),
-                                "chunk_index": chunk.get("chunk_index", 0),
-                                "status": chunk.get("status", "draft"),
-                            },
-                        )
-                        for chunk in chunks
-                    ),
-                )
-                indexed_count += len(chunks)
-            except Exception as e:
-                logger.error(f"Failed to index chunk: {e}")
-                failed_count += 1
+
+        # A throwaway manifest: every post of the series is re-indexed, but
+        # through the same batched, bounded pipeline as index_all_series.
+        posts_dir = vault_path / "posts" / "instagram"
+        indexed_count = 0
+
+        async def index_batch(changes: Sequence[FileChange]) -> List[Optional[str]]:
+            nonlocal indexed_count
+            chunks_saved, errors = await self._index_post_changes(
+                vault_path, changes, {series_id}
+            )
+            indexed_count += chunks_saved
+            return errors
+
+        summary: Dict[str, Any] = {}
+        async for event in stream_incremental_index(
+            posts_dir,
+            [vault_path / post['file_path'] for post in posts],
+            FileManifest(None),
+            index_batch=index_batch,
+        ):
+            if event["type"] == "file_failed":
+                logger.error(f"Failed to index post {event['path']}: {event['error']}")
+            elif event["type"] == "complete":
+                summary = event
 
         return {
             'status': 'success',
             'series_id': series_id,
             'posts_indexed': len(posts),
             'chunks_indexed': indexed_count,
-            'failed': failed_count
+            'failed': summary.get("files_failed", 0)
         }
 
+    async def _index_post_changes(
+        self,
+        vault_path: Path,
+        changes: Sequence[FileChange],
+        series_ids: AbstractSet[str],
+    ) -> tuple[int, List[Optional[str]]]:
+        """Chunk, batch-embed and save changed post files; return (chunks, errors).
+
+        Posts outside ``series_ids`` are answered with ``FILE_SKIPPED`` so they
+        stay out of the manifest, and a post that moved out of the selected
+        series has its previously indexed source revoked.
+        """
+        errors: List[Optional[str]] = [None] * len(changes)
+        prepared = []
+        for index, change in enumerate(changes):
+            try:
+                post = self._post_from_content(vault_path, change.path, change.content)
+            except Exception as e:
+                errors[index] = str(e)
+                continue
+            if post['series_id'] not in series_ids:
+                errors[index] = FILE_SKIPPED
+                continue
+            change.annotations["source_id"] = f"{post['series_id']}:{post['id']}"
+            prepared.append((index, post, self._chunk_post(post)))
+
+        receipts = await embed_documents(
+            self.vector_service,
+            [chunk["text"] for _, _, chunks in prepared for chunk in chunks],
+        )
+
+        saved = 0
+        offset = 0
+        for index, post, chunks in prepared:
+            post_receipts = receipts[offset : offset + len(chunks)]
+            offset += len(chunks)
+            try:
+                await self._replace_post(post, chunks, post_receipts)
+                saved += len(chunks)
+            except Exception as e:
+                logger.error(f"Failed to index chunk: {e}")
+                errors[index] = str(e)
+        return saved, errors
+
+    async def _replace_post(
+        self,
+        post: Dict[str, Any],
+        chunks: List[Dict[str, Any]],
+        receipts: Sequence[Any],
+    ) -> None:
+        series_id = post['series_id']
+        padded = list(receipts) + [None] * (len(chunks) - len(receipts))
+        await self.projection_facade.replace_document(
+            access_context=self.access_context,
+            workspace_id=self.workspace_id,
+            owner_capability_code="content_vault",
+            source_app="content-vault",
+            source_id=f"{series_id}:{post['id']}",
+            doc_type="content_vault_post",
+            source_revision=canonical_sha256(
+                {
+                    "post": post,
+                    "chunks": [chunk["text"] for chunk in chunks],
+                }
+            ),
+            chunks=tuple(
+                LegacyDocumentChunk(
+                    content=chunk["text"],
+                    title=chunk.get("title", "Untitled"),
+                    metadata={
+                        "series_id": series_id,
+                        "arc_id": chunk.get("arc_id"),
+                        "sequence": chunk.get("sequence"),
+                        "file_path": chunk.get("file_path"),
+                        "post_id": chunk.get("id"),
+                        "chunk_index": chunk.get("chunk_index", 0),
+                        "status": chunk.get("status", "draft"),
+                        **(
+                            {"embedding_model": receipt.model}
+                            if receipt is not None
+                            else {}
+                        ),
+                    },
+                    embedding=receipt.embedding if receipt is not None else (),
+                )
+                for chunk, receipt in zip(chunks, padded)
+            ),
+        )
+
     async def index_all_series(
         self,
         vault_path: str,
+        *,
+        incremental: bool = True,
     ) -> Dict[str, Any]:
         """
         Index all series in the vault
 
+        Only posts changed since the last run are re-embedded; posts whose
+        file was deleted are revoked from the index.
+
         Args:
             vault_path: Path to content vault
-            user_id: User ID for indexing
+            incremental: False re-indexes every post
 
         Returns:
             Dictionary with indexing results
         """
+        summary: Dict[str, Any] = {}
+        async for event in self.index_all_series_stream(
+            vault_path, incremental=incremental
+        ):
+            if event["type"] == "file_failed":
+                logger.error(f"Failed to index post {event['path']}: {event['error']}")
+            elif event["type"] == "complete":
+                summary = event
+
+        return {
+            'status': 'success',
+            'series_indexed': summary.get("series_indexed", 0),
+            'total_posts': summary.get("files_indexed", 0),
+            'total_chunks': summary.get("chunks_indexed", 0),
+            'posts_unchanged': summary.get("files_unchanged", 0),
+            'posts_removed': summary.get("files_removed", 0),
+            'failed': summary.get("files_failed", 0),
+        }
+
+    async def index_all_series_stream(
+        self,
+        vault_path: str,
+        *,
+        incremental: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Index every series post and yield ``incremental_file_index`` progress events
+        """
         vault_path = Path(vault_path).expanduser().resolve()
         series_dir = vault_path / "series"
+        posts_dir = vault_path / "posts" / "instagram"
 
         if not series_dir.exists():
             logger.warning(f"Series directory not found: {series_dir}")
-            return {
-                'status': 'success',
-                'series_indexed': 0,
-                'total_posts': 0,
-                'total_chunks': 0
-            }
+            yield {"type": "complete", "series_indexed": 0}
+            return
 
-        series_files = list(series_dir.glob("*.md"))
-        total_posts = 0
-        total_chunks = 0
+        if self.workspace_id is None or self.access_context is None:
+            raise PermissionError("content_vault_authorized_scope_required")
 
-        for series_file in series_files:
+        series_ids = await asyncio.to_thread(self._load_series_ids, series_dir)
+        post_files = (
+            await asyncio.to_thread(lambda: sorted(posts_dir.glob("*.md")))
+            if posts_dir.exists()
+            else []
+        )
+        manifest = FileManifest(
+            default_manifest_path("content_vault", posts_dir, self.workspace_id)
+            if incremental
+            else None
+        )
+        chunk_count = 0
+
+        async def index_batch(changes: Sequence[FileChange]) -> List[Optional[str]]:
+            nonlocal chunk_count
+            chunks_saved, errors = await self._index_post_changes(
+                vault_path, changes, series_ids
+            )
+            chunk_count += chunks_saved
+            return errors
+
+        async def remove(rel_path: str, annotations: Dict[str, str]) -> None:
+            source_id = annotations.get("source_id")
+            if not source_id:
+                return
+            await asyncio.to_thread(
+                self.projection_facade.revoke_document,
+                access_context=self.access_context,
+                workspace_id=self.workspace_id,
+                owner_capability_code="content_vault",
+                source_app="content-vault",
+                source_id=source_id,
+            )
+
+        async for event in stream_incremental_index(
+            posts_dir,
+            post_files,
+            manifest,
+            index_batch=index_batch,
+            remove=remove,
+            embedding_model=await embedding_model_signature(self.vector_service),
+        ):
+            if event["type"] == "complete":
+                event["series_indexed"] = len(series_ids)
+                event["chunks_indexed"] = chunk_count
+            yield event
+
+    def _load_series_ids(self, series_dir: Path) -> set:
+        """Collect the series ids declared under ``series/``"""
+        series_ids = set()
+        for series_file in series_dir.glob("*.md"):
             try:
                 content = series_file.read_text(encoding='utf-8')
                 frontmatter, _ = self._parse_frontmatter(content)
-                series_id = frontmatter.get('series_id') or series_file.stem
-
-                result = await self.index_series(vault_path, series_id)
-                total_posts += result.get('posts_indexed', 0)
-                total_chunks += result.get('chunks_indexed', 0)
+                series_ids.add(frontmatter.get('series_id') or series_file.stem)
             except Exception as e:
                 logger.error(f"Failed to index series {series_file}: {e}")
-
-        return {
-            'status': 'success',
-            'series_indexed': len(series_files),
-            'total_posts': total_posts,
-            'total_chunks': total_chunks
-        }
-
-
-
-
+        return series_ids
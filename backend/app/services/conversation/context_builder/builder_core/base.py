@@ -1,7 +1,7 @@
 """Shared initialization for context builder composition."""
 
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from backend.app.services.model_context_presets import get_context_preset
 
@@ -30,6 +30,7 @@ class ContextBuilderBase:
         """
         self.store = store
         self.timeline_items_store = timeline_items_store
+        self.last_qa_context_timings: Dict[str, float] = {}
 
         if not model_name or model_name.strip() == "":
             raise ValueError(
@@ -1,5 +1,6 @@
 """Section builders used by QA and planning context assembly."""
 
+import asyncio
 import logging
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
@@ -140,6 +141,11 @@ class ContextSectionsMixin:
         self, profile_id: Optional[str]
     ) -> List[str]:
         """Build active intents context."""
+        return await asyncio.to_thread(self._collect_active_intents_context, profile_id)
+
+    def _collect_active_intents_context(
+        self, profile_id: Optional[str]
+    ) -> List[str]:
         context_parts = []
         if profile_id and self.store:
             try:
@@ -170,6 +176,13 @@ class ContextSectionsMixin:
         self, workspace_id: str, thread_id: Optional[str]
     ) -> List[str]:
         """Build current tasks context."""
+        return await asyncio.to_thread(
+            self._collect_current_tasks_context, workspace_id, thread_id
+        )
+
+    def _collect_current_tasks_context(
+        self, workspace_id: str, thread_id: Optional[str]
+    ) -> List[str]:
         context_parts = []
         if self.store:
             try:
@@ -240,6 +253,9 @@ class ContextSectionsMixin:
 
     async def _build_recent_files_context(self, workspace_id: str) -> List[str]:
         """Build recent files context from file analysis events."""
+        return await asyncio.to_thread(self._collect_recent_files_context, workspace_id)
+
+    def _collect_recent_files_context(self, workspace_id: str) -> List[str]:
         context_parts = []
         try:
             if self.store:
@@ -289,6 +305,13 @@ class ContextSectionsMixin:
         self, workspace_id: str, thread_id: Optional[str]
     ) -> List[str]:
         """Build timeline context."""
+        return await asyncio.to_thread(
+            self._collect_timeline_context, workspace_id, thread_id
+        )
+
+    def _collect_timeline_context(
+        self, workspace_id: str, thread_id: Optional[str]
+    ) -> List[str]:
         context_parts = []
         try:
             if self.timeline_items_store:
@@ -325,6 +348,13 @@ class ContextSectionsMixin:
         self, workspace_id: str, thread_id: Optional[str]
     ) -> List[str]:
         """Build thread references context."""
+        return await asyncio.to_thread(
+            self._collect_thread_references_context, workspace_id, thread_id
+        )
+
+    def _collect_thread_references_context(
+        self, workspace_id: str, thread_id: Optional[str]
+    ) -> List[str]:
         context_parts = []
         try:
             if thread_id and self.store:
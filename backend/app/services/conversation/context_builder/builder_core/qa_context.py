@@ -1,12 +1,37 @@
 """QA context assembly for ContextBuilder."""
 
+import asyncio
 import logging
-from typing import Any, Optional, Tuple
+import os
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
 from ..tool_context import build_tool_context_section
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_SECTION_TIMEOUT_SECONDS = 3.0
+
+# Conversation history may generate a summary with an LLM call, and dropping
+# it hurts the answer more than waiting, so it gets a larger budget.
+_SECTION_TIMEOUT_SECONDS = {
+    "conversation_history": 20.0,
+}
+
+
+def _section_timeout_seconds(name: str) -> float:
+    if name in _SECTION_TIMEOUT_SECONDS:
+        return _SECTION_TIMEOUT_SECONDS[name]
+    try:
+        return float(
+            os.getenv(
+                "QA_CONTEXT_SECTION_TIMEOUT_SECONDS",
+                str(_DEFAULT_SECTION_TIMEOUT_SECONDS),
+            )
+        )
+    except (TypeError, ValueError):
+        return _DEFAULT_SECTION_TIMEOUT_SECONDS
+
 
 class QAContextMixin:
     """Build QA context strings from workspace runtime data."""
@@ -25,6 +50,12 @@ class QAContextMixin:
         """
         Build context string for QA mode LLM prompts.
 
+        Sections are fetched concurrently, each within its own time budget,
+        and assembled in a fixed order. Layered memory waits for the
+        governance packet and the side-chain waits for conversation history.
+        Per-section timings of the last call are kept in
+        ``last_qa_context_timings``.
+
         Args:
             workspace_id: Workspace ID.
             message: User message.
@@ -38,14 +69,126 @@ class QAContextMixin:
         Returns:
             Context string to inject into LLM prompt.
         """
-        context_parts = []
-        governance_packet = await self._load_governance_context_packet(
-            workspace_id=workspace_id,
-            profile_id=profile_id,
-            workspace=workspace,
-            project_id=project_id,
+        timings: Dict[str, float] = {}
+        self.last_qa_context_timings = timings
+
+        async def governance_and_layered_memory():
+            governance_packet = await self._timed_section(
+                "governance_packet",
+                self._load_governance_context_packet(
+                    workspace_id=workspace_id,
+                    profile_id=profile_id,
+                    workspace=workspace,
+                    project_id=project_id,
+                ),
+                None,
+                timings,
+            )
+            if governance_packet:
+                return governance_packet, []
+            # Layered memory is the fallback when there is no governance packet.
+            layered_memory = await self._timed_section(
+                "layered_memory",
+                self._build_layered_memory_context(
+                    workspace_id, profile_id, project_id
+                ),
+                [],
+                timings,
+            )
+            return None, layered_memory
+
+        async def conversation_and_side_chain():
+            history = await self._timed_section(
+                "conversation_history",
+                self._load_qa_conversation_history(workspace_id, thread_id),
+                ([], None),
+                timings,
+            )
+            side_chain = await self._timed_section(
+                "side_chain",
+                asyncio.to_thread(
+                    self._build_qa_side_chain_context,
+                    workspace_id,
+                    message,
+                    thread_id,
+                    side_chain_mode,
+                    len(history[0]),
+                ),
+                [],
+                timings,
+            )
+            return history, side_chain
+
+        (
+            (governance_packet, layered_memory),
+            active_intents,
+            current_tasks,
+            recent_files,
+            timeline,
+            thread_references,
+            ((conversation_context, summary_context), side_chain),
+            long_term_memory,
+            tool_context,
+        ) = await asyncio.gather(
+            governance_and_layered_memory(),
+            self._timed_section(
+                "active_intents",
+                self._build_active_intents_context(profile_id),
+                [],
+                timings,
+            ),
+            self._timed_section(
+                "current_tasks",
+                self._build_current_tasks_context(workspace_id, thread_id),
+                [],
+                timings,
+            ),
+            self._timed_section(
+                "recent_files",
+                self._build_recent_files_context(workspace_id),
+                [],
+                timings,
+            ),
+            self._timed_section(
+                "timeline",
+                self._build_timeline_context(workspace_id, thread_id),
+                [],
+                timings,
+            ),
+            self._timed_section(
+                "thread_references",
+                self._build_thread_references_context(workspace_id, thread_id),
+                [],
+                timings,
+            ),
+            conversation_and_side_chain(),
+            self._timed_section(
+                "long_term_memory",
+                self.memory_retriever.get_long_term_memory_context(
+                    workspace_id=workspace_id, message=message, profile_id=profile_id
+                ),
+                None,
+                timings,
+            ),
+            self._timed_section(
+                "tool_context",
+                build_tool_context_section(message=message, workspace_id=workspace_id),
+                [],
+                timings,
+            ),
         )
 
+        logger.info(
+            "QA context section timings (ms): %s",
+            ", ".join(
+                f"{name}={elapsed}"
+                for name, elapsed in sorted(
+                    timings.items(), key=lambda item: item[1], reverse=True
+                )
+            ),
+        )
+
+        context_parts = []
         if governance_packet:
             compiled_packet = self.memory_packet_compiler.compile_for_context(
                 governance_packet
@@ -58,107 +201,118 @@ class QAContextMixin:
                     self.memory_packet_compiler.build_route_plan(governance_packet),
                 )
 
-        if not governance_packet:
-            context_parts.extend(
-                await self._build_layered_memory_context(
-                    workspace_id, profile_id, project_id
-                )
-            )
-
+        context_parts.extend(layered_memory)
         context_parts.extend(
             self._build_workspace_metadata_context(workspace, workspace_id)
         )
-        context_parts.extend(await self._build_active_intents_context(profile_id))
-        context_parts.extend(
-            await self._build_current_tasks_context(workspace_id, thread_id)
-        )
-        context_parts.extend(await self._build_recent_files_context(workspace_id))
-        context_parts.extend(
-            await self._build_timeline_context(workspace_id, thread_id)
-        )
-        context_parts.extend(
-            await self._build_thread_references_context(workspace_id, thread_id)
-        )
+        context_parts.extend(active_intents)
+        context_parts.extend(current_tasks)
+        context_parts.extend(recent_files)
+        context_parts.extend(timeline)
+        context_parts.extend(thread_references)
 
-        thread_context_count = 0
-        try:
-            if self.store:
-                max_events = self.preset["MAX_EVENTS_FOR_QUERY"]
-                max_messages = self.preset["MAX_HISTORY_MESSAGES"]
-                max_chars = self.preset["MAX_MESSAGE_CHARS"]
-
-                conversation_context, summary_context = (
-                    await self.conversation_history_manager.get_conversation_history_with_summary(
-                        workspace_id=workspace_id,
-                        max_events=max_events,
-                        max_messages=max_messages,
-                        max_chars=max_chars,
-                        thread_id=thread_id,
-                    )
-                )
+        if summary_context:
+            context_parts.append("\n## Conversation Summary (Earlier Context):")
+            context_parts.append(summary_context)
+            logger.info("Injected conversation summary into QA context")
 
-                if summary_context:
-                    context_parts.append("\n## Conversation Summary (Earlier Context):")
-                    context_parts.append(summary_context)
-                    logger.info("Injected conversation summary into QA context")
-
-                if conversation_context:
-                    context_parts.append("\n## Recent Conversation:")
-                    context_parts.extend(conversation_context)
-                    thread_context_count = len(conversation_context)
-                    logger.info(
-                        f"Injected {len(conversation_context)} conversation messages into QA context"
-                    )
-        except Exception as e:
-            logger.error(f"Failed to get conversation context: {e}", exc_info=True)
+        if conversation_context:
+            context_parts.append("\n## Recent Conversation:")
+            context_parts.extend(conversation_context)
+            logger.info(
+                f"Injected {len(conversation_context)} conversation messages into QA context"
+            )
 
-        try:
-            if self.side_chain_handler.should_include_side_chain(
-                side_chain_mode=side_chain_mode,
-                thread_id=thread_id,
-                message=message,
-                thread_context_count=thread_context_count,
-            ):
-                side_chain_parts = (
-                    self.side_chain_handler.build_workspace_side_chain_context(
-                        workspace_id=workspace_id
-                    )
+        context_parts.extend(side_chain)
+
+        if long_term_memory:
+            if governance_packet:
+                context_parts.append("\n## Semantic Memory Hits:")
+                context_parts.append(long_term_memory)
+                logger.info(
+                    "Injected semantic memory tail into QA context (route=%s)",
+                    self.memory_packet_compiler.build_route_plan(
+                        governance_packet, include_semantic_hits=True
+                    ),
                 )
-                if side_chain_parts:
-                    context_parts.extend(side_chain_parts)
-                    logger.info("Injected workspace side-chain into QA context")
-        except Exception as e:
-            logger.warning(f"Failed to build workspace side-chain context: {e}")
+            else:
+                context_parts.append("\n## Long-term Knowledge:")
+                context_parts.append(long_term_memory)
+                logger.info("Injected long-term memory context into QA context")
+
+        context_parts.extend(tool_context)
+
+        return "\n".join(context_parts) if context_parts else ""
 
+    async def _timed_section(
+        self,
+        name: str,
+        awaitable: Awaitable[Any],
+        default: Any,
+        timings: Dict[str, float],
+    ) -> Any:
+        """
+        Await one context section within its time budget.
+
+        A section that fails or runs past its budget degrades to ``default``
+        so it cannot hold up the turn. The elapsed time is recorded in
+        ``timings`` either way.
+        """
+        timeout = _section_timeout_seconds(name)
+        started = time.perf_counter()
         try:
-            long_term_memory = await self.memory_retriever.get_long_term_memory_context(
-                workspace_id=workspace_id, message=message, profile_id=profile_id
+            return await asyncio.wait_for(awaitable, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "QA context section %s exceeded its %.1fs budget; skipping it",
+                name,
+                timeout,
             )
-            if long_term_memory:
-                if governance_packet:
-                    context_parts.append("\n## Semantic Memory Hits:")
-                    context_parts.append(long_term_memory)
-                    logger.info(
-                        "Injected semantic memory tail into QA context (route=%s)",
-                        self.memory_packet_compiler.build_route_plan(
-                            governance_packet, include_semantic_hits=True
-                        ),
-                    )
-                else:
-                    context_parts.append("\n## Long-term Knowledge:")
-                    context_parts.append(long_term_memory)
-                    logger.info("Injected long-term memory context into QA context")
         except Exception as e:
-            logger.debug(f"Failed to get long-term memory context: {e}")
+            logger.warning(f"Failed to build QA context section {name}: {e}")
+        finally:
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+        return default
 
-        context_parts.extend(
-            await build_tool_context_section(
-                message=message,
+    async def _load_qa_conversation_history(
+        self, workspace_id: str, thread_id: Optional[str]
+    ) -> Tuple[List[str], Optional[str]]:
+        """Load recent conversation messages and the earlier-context summary."""
+        if not self.store:
+            return [], None
+        conversation_context, summary_context = (
+            await self.conversation_history_manager.get_conversation_history_with_summary(
                 workspace_id=workspace_id,
+                max_events=self.preset["MAX_EVENTS_FOR_QUERY"],
+                max_messages=self.preset["MAX_HISTORY_MESSAGES"],
+                max_chars=self.preset["MAX_MESSAGE_CHARS"],
+                thread_id=thread_id,
             )
         )
+        return conversation_context or [], summary_context
 
-        return "\n".join(context_parts) if context_parts else ""
+    def _build_qa_side_chain_context(
+        self,
+        workspace_id: str,
+        message: str,
+        thread_id: Optional[str],
+        side_chain_mode: str,
+        thread_context_count: int,
+    ) -> List[str]:
+        """Build the workspace side-chain when the policy asks for it."""
+        if not self.side_chain_handler.should_include_side_chain(
+            side_chain_mode=side_chain_mode,
+            thread_id=thread_id,
+            message=message,
+            thread_context_count=thread_context_count,
+        ):
+            return []
+        side_chain_parts = self.side_chain_handler.build_workspace_side_chain_context(
+            workspace_id=workspace_id
+        )
+        if side_chain_parts:
+            logger.info("Injected workspace side-chain into QA context")
+        return side_chain_parts or []
 
     async def build_qa_context_with_token_count(
         self,
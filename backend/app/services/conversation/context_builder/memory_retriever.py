@@ -81,7 +81,7 @@ class MemoryRetriever:
 
             # Check if vector DB is available
             search_service = VectorSearchService()
-            if not await search_service.check_connection():
+            if not search_service.is_available():
                 return None
 
             # Build query from current message + active intent titles
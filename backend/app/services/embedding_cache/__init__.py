@@ -0,0 +1,23 @@
+"""Content-addressed embedding cache in front of VectorEmbeddingGenerator."""
+
+from .cache import (
+    CachedEmbedding,
+    EmbeddingCache,
+    embedding_cache_stats,
+    get_embedding_cache,
+)
+from .keys import embedding_cache_key, embedding_role, normalize_embedding_text
+from .memory_tier import EmbeddingMemoryTier
+from .store import EmbeddingCacheStore
+
+__all__ = [
+    "CachedEmbedding",
+    "EmbeddingCache",
+    "EmbeddingCacheStore",
+    "EmbeddingMemoryTier",
+    "embedding_cache_key",
+    "embedding_cache_stats",
+    "embedding_role",
+    "get_embedding_cache",
+    "normalize_embedding_text",
+]
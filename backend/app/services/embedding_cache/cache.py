@@ -0,0 +1,204 @@
+"""Two-tier content-addressed embedding cache."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from backend.app.services.system_settings_cache import add_setting_change_listener
+from backend.app.services.vector_search_executor import run_vector_query
+
+from .keys import embedding_cache_key, embedding_role
+from .memory_tier import EmbeddingMemoryTier
+from .store import EmbeddingCacheStore
+
+
+def _env_flag(name: str, default: str = "true") -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class CachedEmbedding:
+    embedding: tuple[float, ...]
+    provider: str
+    model: str
+
+
+class EmbeddingCache:
+    """
+    Cache embeddings by sha256(model, role, normalized text).
+
+    Lookups go memory LRU first, then the Postgres tier; store hits are
+    promoted into memory. The memory tier is dropped whenever
+    ``OLLAMA_EMBED_MODEL`` or the ``embedding_model`` setting changes;
+    persisted rows stay valid because the model is part of the key.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_tier: Optional[EmbeddingMemoryTier] = None,
+        store: Optional[EmbeddingCacheStore] = None,
+    ):
+        self.memory = memory_tier or EmbeddingMemoryTier(
+            _env_int("EMBEDDING_CACHE_MEMORY_ENTRIES", 4096)
+        )
+        self.store = store
+        self._lock = threading.Lock()
+        self._model_env = os.getenv("OLLAMA_EMBED_MODEL", "")
+        self.generation = 0
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def invalidate(self, _reason: str = "") -> None:
+        """Drop the memory tier and start a new generation."""
+        self.memory.clear()
+        with self._lock:
+            self.generation += 1
+
+    def _check_model_env(self) -> None:
+        current = os.getenv("OLLAMA_EMBED_MODEL", "")
+        if current != self._model_env:
+            self._model_env = current
+            self.invalidate("OLLAMA_EMBED_MODEL")
+
+    async def get_many(
+        self,
+        model: str,
+        texts: Sequence[str],
+        *,
+        is_query: bool,
+    ) -> List[Optional[CachedEmbedding]]:
+        """Return one cached embedding (or None) per text, in order."""
+        self._check_model_env()
+        role = embedding_role(model, is_query=is_query)
+        keys = [embedding_cache_key(model, role, text) for text in texts]
+        results: List[Optional[CachedEmbedding]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}
+        for index, key in enumerate(keys):
+            entry = self.memory.get(key)
+            if entry is None:
+                missing.setdefault(key, []).append(index)
+                continue
+            results[index] = CachedEmbedding(entry[1], entry[0], model)
+
+        memory_hits = len(texts) - sum(len(indexes) for indexes in missing.values())
+        store_hits = 0
+        if missing and self.store is not None and self.store.available:
+            found = await run_vector_query(self.store.get_many, list(missing))
+            if found:
+                self.memory.put_many(found)
+                for key, (provider, embedding) in found.items():
+                    for index in missing.pop(key):
+                        results[index] = CachedEmbedding(embedding, provider, model)
+                        store_hits += 1
+                self._schedule_touch(list(found))
+
+        with self._lock:
+            self.memory_hits += memory_hits
+            self.store_hits += store_hits
+            self.misses += sum(len(indexes) for indexes in missing.values())
+        return results
+
+    async def put_many(
+        self,
+        model: str,
+        items: Iterable[tuple[str, Sequence[float], str]],
+        *,
+        is_query: bool,
+    ) -> None:
+        """Cache ``(text, embedding, provider)`` items produced by ``model``."""
+        role = embedding_role(model, is_query=is_query)
+        memory_entries = {}
+        store_entries = {}
+        for text, embedding, provider in items:
+            if not embedding:
+                continue
+            key = embedding_cache_key(model, role, text)
+            memory_entries[key] = (provider, embedding)
+            store_entries[key] = {
+                "model": model,
+                "role": role,
+                "provider": provider,
+                "embedding": embedding,
+            }
+        if not memory_entries:
+            return
+        self.memory.put_many(memory_entries)
+        with self._lock:
+            self.writes += len(memory_entries)
+        if self.store is not None and self.store.available:
+            await run_vector_query(self.store.put_many, store_entries)
+
+    def _schedule_touch(self, keys: List[str]) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(run_vector_query(self.store.touch, keys))
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.memory_hits + self.store_hits + self.misses
+            return {
+                "generation": self.generation,
+                "memory_entries": len(self.memory),
+                "memory_hits": self.memory_hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "memory_evictions": self.memory.evictions,
+                "store_evictions": self.store.evictions if self.store else 0,
+                "hit_ratio": (
+                    round((self.memory_hits + self.store_hits) / lookups, 4)
+                    if lookups
+                    else 0.0
+                ),
+            }
+
+
+_DEFAULT_CACHE: Optional[EmbeddingCache] = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Return the process-wide cache, or None when ``EMBEDDING_CACHE_ENABLED`` is off."""
+    global _DEFAULT_CACHE
+    if not _env_flag("EMBEDDING_CACHE_ENABLED"):
+        return None
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            store = None
+            if _env_flag("EMBEDDING_CACHE_STORE_ENABLED"):
+                store = EmbeddingCacheStore(
+                    max_rows=_env_int("EMBEDDING_CACHE_MAX_ROWS", 200_000)
+                )
+            _DEFAULT_CACHE = EmbeddingCache(store=store)
+            add_setting_change_listener("embedding_model", _DEFAULT_CACHE.invalidate)
+        return _DEFAULT_CACHE
+
+
+def embedding_cache_stats() -> Dict[str, float]:
+    cache = _DEFAULT_CACHE
+    return cache.stats() if cache is not None else {}
+
+
+__all__ = [
+    "CachedEmbedding",
+    "EmbeddingCache",
+    "embedding_cache_stats",
+    "get_embedding_cache",
+]
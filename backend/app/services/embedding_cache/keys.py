@@ -0,0 +1,51 @@
+"""Deterministic identities for cached embeddings."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+
+from backend.app.services.tool_embedding_service_core.constants import NOMIC_MODELS
+
+_WHITESPACE = re.compile(r"\s+")
+
+ROLE_QUERY = "query"
+ROLE_DOCUMENT = "document"
+ROLE_SYMMETRIC = "symmetric"
+
+
+def normalize_embedding_text(text: str) -> str:
+    """NFC-normalize and collapse whitespace; case is preserved."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def embedding_role(model: str, *, is_query: bool) -> str:
+    """Return the role component of the key.
+
+    Only models that receive a task prefix (nomic) embed queries and
+    documents differently; every other model shares one symmetric entry.
+    """
+    base_model = (model or "").split(":")[0].lower()
+    if base_model in NOMIC_MODELS:
+        return ROLE_QUERY if is_query else ROLE_DOCUMENT
+    return ROLE_SYMMETRIC
+
+
+def embedding_cache_key(model: str, role: str, text: str) -> str:
+    normalized = normalize_embedding_text(text)
+    digest = hashlib.sha256()
+    for part in (model or "", role, normalized):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+__all__ = [
+    "ROLE_DOCUMENT",
+    "ROLE_QUERY",
+    "ROLE_SYMMETRIC",
+    "embedding_cache_key",
+    "embedding_role",
+    "normalize_embedding_text",
+]
@@ -0,0 +1,50 @@
+"""Bounded in-process LRU tier for cached embeddings."""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Iterable, Mapping, Optional
+
+
+class EmbeddingMemoryTier:
+    """Thread-safe LRU keyed by cache key; vectors stored as packed float32."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(0, int(max_entries))
+        self._entries: "OrderedDict[str, tuple[str, array]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[tuple[str, tuple[float, ...]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        provider, packed = entry
+        return provider, tuple(packed)
+
+    def put_many(
+        self, entries: Mapping[str, tuple[str, Iterable[float]]]
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            for key, (provider, embedding) in entries.items():
+                self._entries[key] = (provider, array("f", embedding))
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+__all__ = ["EmbeddingMemoryTier"]
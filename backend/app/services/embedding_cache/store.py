@@ -0,0 +1,169 @@
+"""Postgres tier for cached embeddings (vector database)."""
+
+from __future__ import annotations
+
+import logging
+import time
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+ConnectionFactory = Callable[[], Any]
+
+_TABLE = "embedding_cache_entries"
+_UNAVAILABLE_BACKOFF_SECONDS = 60.0
+
+
+def pack_embedding(embedding: Iterable[float]) -> bytes:
+    return array("f", embedding).tobytes()
+
+
+def unpack_embedding(payload: Any) -> tuple[float, ...]:
+    packed = array("f")
+    packed.frombytes(bytes(payload))
+    return tuple(packed)
+
+
+class EmbeddingCacheStore:
+    """Read/write ``embedding_cache_entries`` with size-bounded eviction.
+
+    Failures never propagate: the store backs off for a minute and the
+    cache degrades to its memory tier.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Optional[ConnectionFactory] = None,
+        *,
+        max_rows: int = 200_000,
+        evict_every_writes: int = 500,
+    ):
+        self._connection_factory = connection_factory
+        self.max_rows = max(1, int(max_rows))
+        self.evict_every_writes = max(1, int(evict_every_writes))
+        self._writes_since_evict = 0
+        self._unavailable_until = 0.0
+        self.evictions = 0
+
+    def _connect(self):
+        if self._connection_factory is not None:
+            return self._connection_factory()
+        from backend.app.database.vector_connection import get_vector_dbapi_connection
+
+        return get_vector_dbapi_connection()
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._unavailable_until
+
+    def _mark_unavailable(self, operation: str, exc: Exception) -> None:
+        self._unavailable_until = time.monotonic() + _UNAVAILABLE_BACKOFF_SECONDS
+        logger.warning("embedding_cache_store_%s_failed: %s", operation, exc)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, tuple[str, tuple[float, ...]]]:
+        if not keys or not self.available:
+            return {}
+        try:
+            conn = self._connect()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"""
+                        SELECT cache_key, provider, embedding
+                        FROM {_TABLE}
+                        WHERE cache_key = ANY(%s)
+                        """,
+                        (list(keys),),
+                    )
+                    rows = cur.fetchall()
+            finally:
+                conn.close()
+        except Exception as exc:
+            self._mark_unavailable("read", exc)
+            return {}
+        return {
+            str(row[0]): (str(row[1]), unpack_embedding(row[2])) for row in rows
+        }
+
+    def touch(self, keys: Sequence[str]) -> None:
+        """Refresh recency for keys promoted from this tier into memory."""
+        if not keys or not self.available:
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"""
+                        UPDATE {_TABLE}
+                        SET last_hit_at = NOW(), hit_count = hit_count + 1
+                        WHERE cache_key = ANY(%s)
+                        """,
+                        (list(keys),),
+                    )
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as exc:
+            self._mark_unavailable("touch", exc)
+
+    def put_many(self, entries: Mapping[str, Mapping[str, Any]]) -> None:
+        """Insert entries keyed by cache key; values carry model/role/provider/embedding."""
+        if not entries or not self.available:
+            return
+        rows: List[tuple] = [
+            (
+                key,
+                str(entry["model"]),
+                str(entry["role"]),
+                str(entry["provider"]),
+                len(entry["embedding"]),
+                pack_embedding(entry["embedding"]),
+            )
+            for key, entry in entries.items()
+        ]
+        try:
+            from psycopg2 import Binary
+            from psycopg2.extras import execute_values
+
+            conn = self._connect()
+            try:
+                with conn.cursor() as cur:
+                    execute_values(
+                        cur,
+                        f"""
+                        INSERT INTO {_TABLE}
+                            (cache_key, model, role, provider, dimension, embedding)
+                        VALUES %s
+                        ON CONFLICT (cache_key) DO NOTHING
+                        """,
+                        [row[:5] + (Binary(row[5]),) for row in rows],
+                        page_size=200,
+                    )
+                    self._writes_since_evict += len(rows)
+                    if self._writes_since_evict >= self.evict_every_writes:
+                        self._writes_since_evict = 0
+                        self._evict_overflow(cur)
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as exc:
+            self._mark_unavailable("write", exc)
+
+    def _evict_overflow(self, cur) -> None:
+        cur.execute(
+            f"""
+            DELETE FROM {_TABLE}
+            WHERE last_hit_at < (
+                SELECT last_hit_at FROM {_TABLE}
+                ORDER BY last_hit_at DESC
+                OFFSET %s LIMIT 1
+            )
+            """,
+            (self.max_rows - 1,),
+        )
+        self.evictions += max(0, int(cur.rowcount or 0))
+
+
+__all__ = ["EmbeddingCacheStore", "pack_embedding", "unpack_embedding"]
@@ -1,13 +1,12 @@
 import asyncio
 import json
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence, Tuple
 
-from psycopg2.extras import Json
+from psycopg2.extras import Json, execute_values
 
 from backend.app.models.embedding_migration import (
     EmbeddingMigration,
-    EmbeddingMigrationItem,
     MigrationStrategy,
 )
 
@@ -36,55 +35,55 @@ def build_migrated_metadata(
     return metadata
 
 
+def migrated_embedding_id(
+    migration: EmbeddingMigration, embedding_record: Dict[str, Any]
+) -> str:
+    """Stable id for the copy a PRESERVE/DEPRECATE migration writes.
+
+    A page re-applied after a crash, before its checkpoint was saved,
+    then collides on the id instead of inserting a second copy.
+    """
+    return str(uuid.uuid5(migration.id, f"target:{embedding_record['id']}"))
+
+
 def migration_timestamp() -> str:
     from datetime import datetime, timezone
 
     return datetime.now(timezone.utc).isoformat()
 
 
-async def apply_migration_strategy(
+async def apply_migration_batch(
     get_connection,
-    store,
     migration: EmbeddingMigration,
-    embedding_record: Dict[str, Any],
-    new_embedding: List[float],
-    migration_item: EmbeddingMigrationItem,
-) -> None:
+    records: Sequence[Tuple[Dict[str, Any], List[float]]],
+    *,
+    page_size: int = 100,
+) -> List[str]:
+    """Apply the strategy to ``(record, new_embedding)`` pairs in one transaction.
+
+    Returns the target embedding id for each pair, in order.
+    """
+    if not records:
+        return []
+
     def _apply_sync():
         conn = get_connection()
         cursor = None
         try:
             cursor = conn.cursor()
-
             if migration.strategy == MigrationStrategy.REPLACE:
-                _apply_replace(
-                    cursor,
-                    store,
-                    migration,
-                    embedding_record,
-                    new_embedding,
-                    migration_item,
-                )
+                target_ids = _bulk_replace(cursor, migration, records, page_size)
             elif migration.strategy == MigrationStrategy.PRESERVE:
-                _apply_preserve(
-                    cursor,
-                    store,
-                    migration,
-                    embedding_record,
-                    new_embedding,
-                    migration_item,
-                )
+                target_ids = _bulk_preserve(cursor, migration, records, page_size)
             elif migration.strategy == MigrationStrategy.DEPRECATE:
-                _apply_deprecate(
-                    cursor,
-                    store,
-                    migration,
-                    embedding_record,
-                    new_embedding,
-                    migration_item,
-                )
-
+                target_ids = _bulk_deprecate(cursor, migration, records, page_size)
+            else:
+                raise ValueError(f"Unsupported migration strategy: {migration.strategy}")
             conn.commit()
+            return target_ids
+        except Exception:
+            conn.rollback()
+            raise
         finally:
             try:
                 if cursor is not None:
@@ -92,127 +91,125 @@ async def apply_migration_strategy(
             finally:
                 conn.close()
 
-    await asyncio.to_thread(_apply_sync)
+    return await asyncio.to_thread(_apply_sync)
 
 
-def _apply_replace(
-    cursor,
-    store,
-    migration: EmbeddingMigration,
-    embedding_record: Dict[str, Any],
-    new_embedding: List[float],
-    migration_item: EmbeddingMigrationItem,
-) -> None:
-    metadata = build_migrated_metadata(
-        normalize_metadata(embedding_record.get("metadata", {})),
-        migration,
-        new_embedding,
-    )
+def _bulk_replace(cursor, migration, records, page_size) -> List[str]:
+    rows = []
+    for record, new_embedding in records:
+        metadata = build_migrated_metadata(
+            normalize_metadata(record.get("metadata", {})),
+            migration,
+            new_embedding,
+        )
+        rows.append((str(record["id"]), new_embedding, Json(metadata)))
 
-    cursor.execute(
+    execute_values(
+        cursor,
         """
-        UPDATE mindscape_personal
-        SET embedding = %s::vector,
-            metadata = %s,
+        UPDATE mindscape_personal AS target
+        SET embedding = source.embedding,
+            metadata = source.metadata,
             updated_at = NOW()
-        WHERE id = %s
+        FROM (VALUES %s) AS source (id, embedding, metadata)
+        WHERE target.id = source.id
     """,
-        (new_embedding, Json(metadata), embedding_record["id"]),
+        rows,
+        template="(%s::uuid, %s::vector, %s::jsonb)",
+        page_size=page_size,
     )
-
-    migration_item.target_embedding_id = str(embedding_record["id"])
-    store.update_migration_item(migration_item)
+    return [row[0] for row in rows]
 
 
-def _apply_preserve(
-    cursor,
-    store,
-    migration: EmbeddingMigration,
-    embedding_record: Dict[str, Any],
-    new_embedding: List[float],
-    migration_item: EmbeddingMigrationItem,
-) -> None:
-    new_id = str(uuid.uuid4())
-    metadata = build_migrated_metadata(
-        normalize_metadata(embedding_record.get("metadata", {})),
-        migration,
-        new_embedding,
-    )
-    metadata["original_id"] = str(embedding_record["id"])
-
-    _insert_migrated_embedding(cursor, embedding_record, metadata, new_embedding, new_id)
-    migration_item.target_embedding_id = new_id
-    store.update_migration_item(migration_item)
-
-
-def _apply_deprecate(
-    cursor,
-    store,
-    migration: EmbeddingMigration,
-    embedding_record: Dict[str, Any],
-    new_embedding: List[float],
-    migration_item: EmbeddingMigrationItem,
-) -> None:
-    old_metadata = normalize_metadata(embedding_record.get("metadata", {}))
-    old_metadata["deprecated"] = True
-    old_metadata["deprecated_at"] = migration_timestamp()
-    old_metadata["deprecated_by"] = str(migration.id)
-
-    cursor.execute(
+def _bulk_preserve(cursor, migration, records, page_size) -> List[str]:
+    rows = []
+    for record, new_embedding in records:
+        metadata = build_migrated_metadata(
+            normalize_metadata(record.get("metadata", {})),
+            migration,
+            new_embedding,
+        )
+        metadata["original_id"] = str(record["id"])
+        rows.append(_migrated_row(record, metadata, new_embedding, migrated_embedding_id(migration, record)))
+
+    _bulk_insert_migrated(cursor, rows, page_size)
+    return [row[0] for row in rows]
+
+
+def _bulk_deprecate(cursor, migration, records, page_size) -> List[str]:
+    deprecated_at = migration_timestamp()
+    updates = []
+    inserts = []
+    for record, new_embedding in records:
+        old_metadata = normalize_metadata(record.get("metadata", {}))
+        old_metadata["deprecated"] = True
+        old_metadata["deprecated_at"] = deprecated_at
+        old_metadata["deprecated_by"] = str(migration.id)
+        updates.append((str(record["id"]), Json(old_metadata)))
+
+        new_metadata = build_migrated_metadata(old_metadata, migration, new_embedding)
+        new_metadata.pop("deprecated", None)
+        new_metadata.pop("deprecated_at", None)
+        new_metadata.pop("deprecated_by", None)
+        inserts.append(
+            _migrated_row(record, new_metadata, new_embedding, migrated_embedding_id(migration, record))
+        )
+
+    execute_values(
+        cursor,
         """
-        UPDATE mindscape_personal
-        SET metadata = %s,
+        UPDATE mindscape_personal AS target
+        SET metadata = source.metadata,
             updated_at = NOW()
-        WHERE id = %s
+        FROM (VALUES %s) AS source (id, metadata)
+        WHERE target.id = source.id
     """,
-        (Json(old_metadata), embedding_record["id"]),
+        updates,
+        template="(%s::uuid, %s::jsonb)",
+        page_size=page_size,
     )
+    _bulk_insert_migrated(cursor, inserts, page_size)
+    return [row[0] for row in inserts]
 
-    new_id = str(uuid.uuid4())
-    new_metadata = build_migrated_metadata(old_metadata, migration, new_embedding)
-    new_metadata.pop("deprecated", None)
-    new_metadata.pop("deprecated_at", None)
-    new_metadata.pop("deprecated_by", None)
 
-    _insert_migrated_embedding(
-        cursor,
-        embedding_record,
-        new_metadata,
-        new_embedding,
-        new_id,
-    )
-    migration_item.target_embedding_id = new_id
-    store.update_migration_item(migration_item)
-
-
-def _insert_migrated_embedding(
-    cursor,
+def _migrated_row(
     embedding_record: Dict[str, Any],
     metadata: Dict[str, Any],
     new_embedding: List[float],
     new_id: str,
-) -> None:
-    cursor.execute(
+) -> Tuple[Any, ...]:
+    return (
+        new_id,
+        embedding_record.get("user_id"),
+        embedding_record.get("source_type"),
+        embedding_record.get("content"),
+        Json(metadata),
+        embedding_record.get("confidence", 1.0),
+        embedding_record.get("weight", 1.0),
+        new_embedding,
+        embedding_record.get("scope"),
+        embedding_record.get("workspace_id"),
+        embedding_record.get("intent_id"),
+        embedding_record.get("importance", 0.5),
+        embedding_record.get("tags", []),
+    )
+
+
+def _bulk_insert_migrated(cursor, rows: List[Tuple[Any, ...]], page_size: int) -> None:
+    execute_values(
+        cursor,
         """
         INSERT INTO mindscape_personal
         (id, user_id, source_type, content, metadata, confidence, weight,
          embedding, scope, workspace_id, intent_id, importance, tags,
          created_at, updated_at, last_used_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s::vector, %s, %s, %s, %s, %s, NOW(), NOW(), NOW())
+        VALUES %s
+        ON CONFLICT (id) DO NOTHING
     """,
-        (
-            new_id,
-            embedding_record.get("user_id"),
-            embedding_record.get("source_type"),
-            embedding_record.get("content"),
-            Json(metadata),
-            embedding_record.get("confidence", 1.0),
-            embedding_record.get("weight", 1.0),
-            new_embedding,
-            embedding_record.get("scope"),
-            embedding_record.get("workspace_id"),
-            embedding_record.get("intent_id"),
-            embedding_record.get("importance", 0.5),
-            embedding_record.get("tags", []),
+        rows,
+        template=(
+            "(%s, %s, %s, %s, %s, %s, %s, %s::vector, %s, %s, %s, %s, %s,"
+            " NOW(), NOW(), NOW())"
         ),
+        page_size=page_size,
     )
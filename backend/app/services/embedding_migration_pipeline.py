@@ -0,0 +1,378 @@
+"""
+Embedding Migration Pipeline
+
+Streaming executor behind EmbeddingMigrationService. Source rows are read in
+keyset-ordered pages through a bounded queue, re-embedded in concurrent
+provider batches, and written back with one bulk statement per page. The
+page's items, the counters and the ``(created_at, id)`` of its last row are
+then saved in one transaction, so an interrupted migration resumes where it
+stopped. Failed rows stay recorded as failed items and are retried, up to
+``max_retries`` times each, at the start of the next run.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID, uuid5
+
+from backend.app.models.embedding_migration import (
+    EmbeddingMigration,
+    EmbeddingMigrationItem,
+    EmbeddingMigrationProgress,
+    ItemStatus,
+    MigrationStatus,
+)
+from backend.app.services.embedding_migration_apply import apply_migration_batch
+from backend.app.services.embedding_migration_queries import (
+    fetch_embedding_page,
+    fetch_embeddings_by_ids,
+)
+from backend.app.services.embedding_migration_text import extract_source_text
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_METADATA_KEY = "pipeline"
+
+EmbedBatch = Callable[[List[str]], Awaitable[List[Optional[List[float]]]]]
+Checkpoint = Tuple[str, str]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class MigrationPipelineConfig:
+    page_size: int = 256
+    batch_size: int = 32
+    concurrency: int = 4
+    prefetch_pages: int = 2
+    max_retries: int = 3
+
+    @classmethod
+    def from_env(cls) -> "MigrationPipelineConfig":
+        return cls(
+            page_size=_env_int("EMBEDDING_MIGRATION_PAGE_SIZE", cls.page_size),
+            batch_size=_env_int("EMBEDDING_MIGRATION_BATCH_SIZE", cls.batch_size),
+            concurrency=_env_int("EMBEDDING_MIGRATION_CONCURRENCY", cls.concurrency),
+            prefetch_pages=_env_int(
+                "EMBEDDING_MIGRATION_PREFETCH_PAGES", cls.prefetch_pages
+            ),
+            max_retries=_env_int("EMBEDDING_MIGRATION_MAX_RETRIES", cls.max_retries),
+        )
+
+
+def migration_item_id(migration_id: UUID, source_embedding_id: str) -> UUID:
+    """Stable item id so a resumed page upserts instead of duplicating items."""
+    return uuid5(migration_id, source_embedding_id)
+
+
+def read_checkpoint(migration: EmbeddingMigration) -> Optional[Checkpoint]:
+    state = (migration.metadata or {}).get(PIPELINE_METADATA_KEY) or {}
+    checkpoint = state.get("checkpoint") or {}
+    if checkpoint.get("created_at") and checkpoint.get("id"):
+        return checkpoint["created_at"], checkpoint["id"]
+    return None
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def is_stale(migration: EmbeddingMigration, stale_after_seconds: float) -> bool:
+    """True when an in-progress migration has not checkpointed recently."""
+    updated_at = _as_utc(migration.updated_at)
+    if updated_at is None:
+        return True
+    age = datetime.now(timezone.utc) - updated_at
+    return age.total_seconds() > stale_after_seconds
+
+
+def migration_progress(migration: EmbeddingMigration) -> EmbeddingMigrationProgress:
+    """Progress view including the throughput recorded by the last page."""
+    state = (migration.metadata or {}).get(PIPELINE_METADATA_KEY) or {}
+    done = migration.processed_count + migration.failed_count
+    percentage = (
+        migration.processed_count / migration.total_count * 100
+        if migration.total_count > 0
+        else 0
+    )
+    rows_per_second = state.get("rows_per_second")
+    eta_seconds = state.get("eta_seconds")
+    estimated_completion = None
+    measured_at = state.get("measured_at")
+    if (
+        migration.status == MigrationStatus.IN_PROGRESS
+        and eta_seconds is not None
+        and measured_at
+    ):
+        estimated_completion = datetime.fromisoformat(measured_at) + timedelta(
+            seconds=eta_seconds
+        )
+    return EmbeddingMigrationProgress(
+        migration_id=migration.id,
+        total_count=migration.total_count,
+        processed_count=migration.processed_count,
+        failed_count=migration.failed_count,
+        progress_percentage=percentage,
+        status=migration.status,
+        estimated_completion=estimated_completion,
+        rows_per_second=rows_per_second,
+        eta_seconds=eta_seconds if done < migration.total_count else 0.0,
+    )
+
+
+class _ThroughputMeter:
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self.rows = 0
+
+    def record(self, rows: int) -> None:
+        self.rows += rows
+
+    def rows_per_second(self) -> float:
+        elapsed = time.monotonic() - self._started
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def eta_seconds(self, remaining: int) -> Optional[float]:
+        rate = self.rows_per_second()
+        if remaining <= 0:
+            return 0.0
+        return remaining / rate if rate > 0 else None
+
+
+class EmbeddingMigrationPipeline:
+    """Run one migration from its checkpoint to the end of the source rows."""
+
+    def __init__(
+        self,
+        *,
+        get_connection,
+        store,
+        embed_batch: EmbedBatch,
+        config: Optional[MigrationPipelineConfig] = None,
+    ):
+        self.get_connection = get_connection
+        self.store = store
+        self.embed_batch = embed_batch
+        self.config = config or MigrationPipelineConfig.from_env()
+
+    async def run(self, migration: EmbeddingMigration) -> bool:
+        """Process every remaining page. Returns False if the migration was cancelled."""
+        meter = _ThroughputMeter()
+        if not await self._retry_failed(migration, meter):
+            logger.info(f"Migration {migration.id} was cancelled")
+            return False
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self.config.prefetch_pages)
+        producer = asyncio.create_task(
+            self._produce_pages(migration, read_checkpoint(migration), pages)
+        )
+        try:
+            while True:
+                page = await pages.get()
+                if isinstance(page, BaseException):
+                    raise page
+                if page is None:
+                    return True
+                items = await self._process_page(migration, page)
+                meter.record(len(page))
+                if not await self._save_progress(migration, items, meter, page[-1]):
+                    logger.info(f"Migration {migration.id} was cancelled")
+                    return False
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _retry_failed(
+        self, migration: EmbeddingMigration, meter: _ThroughputMeter
+    ) -> bool:
+        """Re-run rows recorded as failed items; the checkpoint does not move."""
+        failed_ids = await asyncio.to_thread(
+            self.store.list_retryable_failed_source_ids,
+            migration.id,
+            max_retries=self.config.max_retries,
+        )
+        size = self.config.page_size
+        for start in range(0, len(failed_ids), size):
+            ids = failed_ids[start : start + size]
+            page = await fetch_embeddings_by_ids(self.get_connection, migration, ids)
+            migration.failed_count = max(0, migration.failed_count - len(ids))
+            items = await self._process_page(migration, page) if page else []
+            found = {str(record["id"]) for record in page}
+            missing = [source_id for source_id in ids if source_id not in found]
+            for source_id in missing:
+                items.append(
+                    self._item_for(
+                        migration,
+                        {"id": source_id},
+                        None,
+                        f"Embedding {source_id} no longer matches the migration source",
+                    )
+                )
+            migration.failed_count += len(missing)
+            meter.record(len(ids))
+            if not await self._save_progress(migration, items, meter):
+                return False
+        return True
+
+    async def _produce_pages(
+        self,
+        migration: EmbeddingMigration,
+        after: Optional[Checkpoint],
+        pages: asyncio.Queue,
+    ) -> None:
+        try:
+            while True:
+                page = await fetch_embedding_page(
+                    self.get_connection,
+                    migration,
+                    after=after,
+                    limit=self.config.page_size,
+                )
+                if not page:
+                    break
+                await pages.put(page)
+                after = _checkpoint_of(page[-1])
+            await pages.put(None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            await pages.put(exc)
+
+    async def _process_page(
+        self, migration: EmbeddingMigration, page: List[Dict[str, Any]]
+    ) -> List[EmbeddingMigrationItem]:
+        errors: Dict[int, str] = {}
+        texts: Dict[int, str] = {}
+        for index, record in enumerate(page):
+            text = extract_source_text(record)
+            if text:
+                texts[index] = text
+            else:
+                errors[index] = f"Could not extract text from embedding {record['id']}"
+
+        vectors = await self._embed(texts)
+        ready: List[Tuple[int, Tuple[Dict[str, Any], List[float]]]] = []
+        for index in texts:
+            vector = vectors.get(index)
+            if vector:
+                ready.append((index, (page[index], vector)))
+            else:
+                errors[index] = f"Failed to regenerate embedding for {page[index]['id']}"
+
+        target_ids: Dict[int, str] = {}
+        if ready:
+            try:
+                applied = await apply_migration_batch(
+                    self.get_connection, migration, [pair for _, pair in ready]
+                )
+                target_ids = {index: target for (index, _), target in zip(ready, applied)}
+            except Exception as exc:
+                logger.error(
+                    f"Failed to apply migration page for {migration.id}: {exc}",
+                    exc_info=True,
+                )
+                for index, _ in ready:
+                    errors[index] = str(exc)
+
+        items = [
+            self._item_for(migration, record, target_ids.get(index), errors.get(index))
+            for index, record in enumerate(page)
+        ]
+        migration.processed_count += len(target_ids)
+        migration.failed_count += len(page) - len(target_ids)
+        return items
+
+    async def _embed(self, texts: Dict[int, str]) -> Dict[int, List[float]]:
+        indexes = list(texts)
+        size = self.config.batch_size
+        batches = [indexes[start : start + size] for start in range(0, len(indexes), size)]
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+
+        async def run_batch(batch: Sequence[int]) -> List[Optional[List[float]]]:
+            async with semaphore:
+                return await self.embed_batch([texts[index] for index in batch])
+
+        results = await asyncio.gather(*(run_batch(batch) for batch in batches))
+        vectors: Dict[int, List[float]] = {}
+        for batch, embeddings in zip(batches, results):
+            for index, vector in zip(batch, embeddings):
+                if vector:
+                    vectors[index] = vector
+        return vectors
+
+    @staticmethod
+    def _item_for(
+        migration: EmbeddingMigration,
+        record: Dict[str, Any],
+        target_id: Optional[str],
+        error: Optional[str],
+    ) -> EmbeddingMigrationItem:
+        source_id = str(record["id"])
+        return EmbeddingMigrationItem(
+            id=migration_item_id(migration.id, source_id),
+            migration_id=migration.id,
+            source_embedding_id=source_id,
+            target_embedding_id=target_id,
+            source_table="mindscape_personal",
+            status=ItemStatus.COMPLETED if target_id else ItemStatus.FAILED,
+            error_message=None if target_id else error,
+        )
+
+    async def _save_progress(
+        self,
+        migration: EmbeddingMigration,
+        items: List[EmbeddingMigrationItem],
+        meter: _ThroughputMeter,
+        last_record: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Commit the page's items with the counters and checkpoint.
+
+        Returns False when the migration was cancelled meanwhile.
+        """
+        remaining = migration.total_count - (
+            migration.processed_count + migration.failed_count
+        )
+        rows_per_second = meter.rows_per_second()
+        eta_seconds = meter.eta_seconds(remaining)
+        metadata = dict(migration.metadata or {})
+        state = dict(metadata.get(PIPELINE_METADATA_KEY) or {})
+        if last_record is not None:
+            created_at, record_id = _checkpoint_of(last_record)
+            state["checkpoint"] = {"created_at": created_at, "id": record_id}
+        state.update(
+            rows_per_second=round(rows_per_second, 3),
+            eta_seconds=round(eta_seconds, 1) if eta_seconds is not None else None,
+            measured_at=datetime.now(timezone.utc).isoformat(),
+        )
+        metadata[PIPELINE_METADATA_KEY] = state
+        migration.metadata = metadata
+        return await asyncio.to_thread(
+            self.store.save_migration_page, migration, items
+        )
+
+
+def _checkpoint_of(record: Dict[str, Any]) -> Checkpoint:
+    created_at = record.get("created_at")
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    return str(created_at), str(record["id"])
+
+
+__all__ = [
+    "EmbeddingMigrationPipeline",
+    "MigrationPipelineConfig",
+    "is_stale",
+    "migration_item_id",
+    "migration_progress",
+    "read_checkpoint",
+]
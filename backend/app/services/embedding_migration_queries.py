@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from psycopg2.extras import RealDictCursor
 
@@ -74,10 +74,15 @@ async def count_embeddings_to_migrate(
     return await asyncio.to_thread(_count_sync)
 
 
-async def fetch_embeddings_to_migrate(
+async def fetch_embedding_page(
     get_connection,
     migration: EmbeddingMigration,
+    *,
+    after: Optional[Tuple[str, str]] = None,
+    limit: int = 256,
 ) -> List[Dict[str, Any]]:
+    """Fetch the next ``limit`` rows after the ``(created_at, id)`` keyset cursor."""
+
     def _fetch_sync():
         conn = get_connection()
         cursor = None
@@ -90,17 +95,61 @@ async def fetch_embeddings_to_migrate(
                 intent_id=migration.intent_id,
                 scope=migration.scope,
             )
+            if after is not None:
+                where_sql += " AND (created_at, id) > (%s, %s::uuid)"
+                params = params + [after[0], after[1]]
             cursor.execute(
                 f"""
                     SELECT *
                     FROM mindscape_personal
                     {where_sql}
-                    ORDER BY created_at
+                    ORDER BY created_at, id
+                    LIMIT %s
                 """,
-                params,
+                params + [limit],
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        finally:
+            try:
+                if cursor is not None:
+                    cursor.close()
+            finally:
+                conn.close()
+
+    return await asyncio.to_thread(_fetch_sync)
+
+
+async def fetch_embeddings_by_ids(
+    get_connection,
+    migration: EmbeddingMigration,
+    embedding_ids: Sequence[str],
+) -> List[Dict[str, Any]]:
+    """Fetch the listed rows that still match the migration's source filter."""
+    if not embedding_ids:
+        return []
+
+    def _fetch_sync():
+        conn = get_connection()
+        cursor = None
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            where_sql, params = build_embedding_filter(
+                source_model=migration.source_model,
+                source_provider=migration.source_provider,
+                workspace_id=migration.workspace_id,
+                intent_id=migration.intent_id,
+                scope=migration.scope,
+            )
+            cursor.execute(
+                f"""
+                    SELECT *
+                    FROM mindscape_personal
+                    {where_sql} AND id = ANY(%s::uuid[])
+                    ORDER BY created_at, id
+                """,
+                params + [list(embedding_ids)],
             )
-            results = cursor.fetchall()
-            return [dict(row) for row in results]
+            return [dict(row) for row in cursor.fetchall()]
         finally:
             try:
                 if cursor is not None:
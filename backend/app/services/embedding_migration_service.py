@@ -7,6 +7,7 @@ Handles batch processing, error recovery, and progress tracking.
 
 import logging
 import asyncio
+import os
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 
@@ -21,23 +22,32 @@ from backend.app.database.vector_connection import get_vector_dbapi_connection
 
 from backend.app.models.embedding_migration import (
     EmbeddingMigration,
-    EmbeddingMigrationItem,
     EmbeddingMigrationCreate,
+    EmbeddingMigrationProgress,
     MigrationStatus,
-    MigrationStrategy,
-    ItemStatus,
 )
 from backend.app.services.embedding_migration_store import EmbeddingMigrationStore
-from backend.app.services.embedding_migration_apply import apply_migration_strategy
-from backend.app.services.embedding_migration_providers import regenerate_embedding
-from backend.app.services.embedding_migration_queries import (
-    count_embeddings_to_migrate,
-    fetch_embeddings_to_migrate,
+from backend.app.services.embedding_migration_pipeline import (
+    EmbeddingMigrationPipeline,
+    is_stale,
+    migration_progress,
 )
+from backend.app.services.embedding_migration_providers import regenerate_embeddings
+from backend.app.services.embedding_migration_queries import count_embeddings_to_migrate
 from backend.app.services.embedding_migration_text import extract_source_text
 
 logger = logging.getLogger(__name__)
 
+# Shared across service instances: routes build a new service per request.
+_ACTIVE_MIGRATIONS: Dict[UUID, asyncio.Task] = {}
+
+
+def _stale_after_seconds() -> float:
+    try:
+        return float(os.getenv("EMBEDDING_MIGRATION_STALE_SECONDS", "300"))
+    except ValueError:
+        return 300.0
+
 
 class EmbeddingMigrationService:
     """Service for managing embedding migrations"""
@@ -50,7 +60,7 @@ class EmbeddingMigrationService:
             store: EmbeddingMigrationStore instance (optional, will create if not provided)
         """
         self.store = store or EmbeddingMigrationStore()
-        self._active_migrations: Dict[UUID, asyncio.Task] = {}
+        self._active_migrations = _ACTIVE_MIGRATIONS
 
     def _get_connection(self):
         """Get PostgreSQL connection"""
@@ -145,6 +155,21 @@ class EmbeddingMigrationService:
         """
         return self.store.get_migration(migration_id)
 
+    async def get_migration_progress(
+        self, migration_id: UUID
+    ) -> Optional[EmbeddingMigrationProgress]:
+        """
+        Get migration progress including rows/s and ETA
+
+        Args:
+            migration_id: Migration task ID
+
+        Returns:
+            Progress snapshot or None if not found
+        """
+        migration = self.store.get_migration(migration_id)
+        return migration_progress(migration) if migration else None
+
     async def list_migrations(
         self,
         user_id: Optional[str] = None,
@@ -172,6 +197,9 @@ class EmbeddingMigrationService:
         """
         Execute migration task asynchronously
 
+        Failed, cancelled and stalled in-progress migrations resume from their
+        last checkpoint; failed rows of earlier runs are retried first.
+
         Args:
             migration_id: Migration task ID
         """
@@ -179,7 +207,8 @@ class EmbeddingMigrationService:
         if not migration:
             raise ValueError(f"Migration {migration_id} not found")
 
-        if migration.status in [MigrationStatus.IN_PROGRESS, MigrationStatus.COMPLETED]:
+        # A completed migration is re-run only to retry its failed rows.
+        if migration.status == MigrationStatus.COMPLETED and not migration.failed_count:
             logger.warning(f"Migration {migration_id} is already {migration.status}")
             return
 
@@ -188,9 +217,17 @@ class EmbeddingMigrationService:
             logger.warning(f"Migration {migration_id} is already running")
             return
 
+        if migration.status == MigrationStatus.IN_PROGRESS and not is_stale(
+            migration, _stale_after_seconds()
+        ):
+            logger.warning(f"Migration {migration_id} is already {migration.status}")
+            return
+
         # Update status to in_progress
         migration.status = MigrationStatus.IN_PROGRESS
-        migration.started_at = _utc_now()
+        migration.started_at = migration.started_at or _utc_now()
+        migration.completed_at = None
+        migration.error_message = None
         self.store.update_migration(migration)
 
         # Start migration task
@@ -207,26 +244,17 @@ class EmbeddingMigrationService:
             migration: Migration task to execute
         """
         try:
-            # Fetch embeddings to migrate
-            embeddings = await self._fetch_embeddings_to_migrate(migration)
-
-            # Create migration items
-            await self._create_migration_items(migration, embeddings)
-
-            # Process embeddings in batches
-            batch_size = 10
-            for i in range(0, len(embeddings), batch_size):
-                batch = embeddings[i : i + batch_size]
-                await self._process_batch(migration, batch)
-
-                # Check for cancellation
-                current_migration = self.store.get_migration(migration.id)
-                if (
-                    current_migration
-                    and current_migration.status == MigrationStatus.CANCELLED
-                ):
-                    logger.info(f"Migration {migration.id} was cancelled")
-                    return
+            pipeline = EmbeddingMigrationPipeline(
+                get_connection=self._get_connection,
+                store=self.store,
+                embed_batch=lambda texts: self._regenerate_embeddings(
+                    texts,
+                    target_model=migration.target_model,
+                    target_provider=migration.target_provider,
+                ),
+            )
+            if not await pipeline.run(migration):
+                return
 
             # Mark migration as completed
             migration.status = MigrationStatus.COMPLETED
@@ -247,137 +275,6 @@ class EmbeddingMigrationService:
             if migration.id in self._active_migrations:
                 del self._active_migrations[migration.id]
 
-    async def _fetch_embeddings_to_migrate(
-        self, migration: EmbeddingMigration
-    ) -> List[Dict[str, Any]]:
-        """
-        Fetch embeddings that need to be migrated
-
-        Args:
-            migration: Migration task
-
-        Returns:
-            List of embedding records
-        """
-
-        return await fetch_embeddings_to_migrate(
-            get_connection=self._get_connection,
-            migration=migration,
-        )
-
-    async def _create_migration_items(
-        self, migration: EmbeddingMigration, embeddings: List[Dict[str, Any]]
-    ) -> None:
-        """
-        Create migration items for all embeddings
-
-        Args:
-            migration: Migration task
-            embeddings: List of embedding records
-        """
-        for embedding_record in embeddings:
-            item = EmbeddingMigrationItem(
-                migration_id=migration.id,
-                source_embedding_id=str(embedding_record["id"]),
-                source_table="mindscape_personal",
-                status=ItemStatus.PENDING,
-            )
-            self.store.create_migration_item(item)
-
-    async def _process_batch(
-        self, migration: EmbeddingMigration, batch: List[Dict[str, Any]]
-    ) -> None:
-        """
-        Process a batch of embeddings
-
-        Args:
-            migration: Migration task
-            batch: List of embedding records to process
-        """
-        for embedding_record in batch:
-            try:
-                await self._migrate_single_embedding(migration, embedding_record)
-            except Exception as e:
-                logger.error(
-                    f"Failed to migrate embedding {embedding_record['id']}: {e}",
-                    exc_info=True,
-                )
-                # Update migration item status
-                items = self.store.get_migration_items(migration.id)
-                for item in items:
-                    if item.source_embedding_id == str(embedding_record["id"]):
-                        item.status = ItemStatus.FAILED
-                        item.error_message = str(e)
-                        self.store.update_migration_item(item)
-                        break
-
-                # Update migration failed count
-                migration.failed_count += 1
-                self.store.update_migration(migration)
-
-    async def _migrate_single_embedding(
-        self, migration: EmbeddingMigration, embedding_record: Dict[str, Any]
-    ) -> None:
-        """
-        Migrate a single embedding
-
-        Args:
-            migration: Migration task
-            embedding_record: Embedding record to migrate
-        """
-        # Get migration item
-        items = self.store.get_migration_items(migration.id)
-        migration_item = None
-        for item in items:
-            if item.source_embedding_id == str(embedding_record["id"]):
-                migration_item = item
-                break
-
-        if not migration_item:
-            logger.warning(
-                f"Migration item not found for embedding {embedding_record['id']}"
-            )
-            return
-
-        # Update item status to in_progress
-        migration_item.status = ItemStatus.IN_PROGRESS
-        self.store.update_migration_item(migration_item)
-
-        # Extract source text
-        source_text = self._extract_source_text(embedding_record)
-        if not source_text:
-            raise ValueError(
-                f"Could not extract text from embedding {embedding_record['id']}"
-            )
-
-        # Regenerate embedding with target model
-        new_embedding = await self._regenerate_embedding(
-            source_text=source_text,
-            target_model=migration.target_model,
-            target_provider=migration.target_provider,
-        )
-
-        if not new_embedding:
-            raise ValueError(
-                f"Failed to regenerate embedding for {embedding_record['id']}"
-            )
-
-        # Apply migration strategy
-        await self._apply_migration_strategy(
-            migration=migration,
-            embedding_record=embedding_record,
-            new_embedding=new_embedding,
-            migration_item=migration_item,
-        )
-
-        # Update item status to completed
-        migration_item.status = ItemStatus.COMPLETED
-        self.store.update_migration_item(migration_item)
-
-        # Update migration progress
-        migration.processed_count += 1
-        self.store.update_migration(migration)
-
     def _extract_source_text(self, embedding_record: Dict[str, Any]) -> Optional[str]:
         """
         Extract source text from embedding record
@@ -390,52 +287,26 @@ class EmbeddingMigrationService:
         """
         return extract_source_text(embedding_record)
 
-    async def _regenerate_embedding(
-        self, source_text: str, target_model: str, target_provider: str
-    ) -> Optional[List[float]]:
+    async def _regenerate_embeddings(
+        self, texts: List[str], target_model: str, target_provider: str
+    ) -> List[Optional[List[float]]]:
         """
-        Regenerate embedding with target model
+        Regenerate a batch of embeddings with one provider request
 
         Args:
-            source_text: Source text to embed
+            texts: Source texts to embed
             target_model: Target embedding model name
             target_provider: Target provider name
 
         Returns:
-            New embedding vector or None if failed
+            One vector (or None) per text
         """
-        return await regenerate_embedding(
-            source_text=source_text,
+        return await regenerate_embeddings(
+            texts,
             target_model=target_model,
             target_provider=target_provider,
         )
 
-    async def _apply_migration_strategy(
-        self,
-        migration: EmbeddingMigration,
-        embedding_record: Dict[str, Any],
-        new_embedding: List[float],
-        migration_item: EmbeddingMigrationItem,
-    ) -> None:
-        """
-        Apply migration strategy to update embedding
-
-        Args:
-            migration: Migration task
-            embedding_record: Original embedding record
-            new_embedding: New embedding vector
-            migration_item: Migration item
-        """
-
-        await apply_migration_strategy(
-            get_connection=self._get_connection,
-            store=self.store,
-            migration=migration,
-            embedding_record=embedding_record,
-            new_embedding=new_embedding,
-            migration_item=migration_item,
-        )
-
     async def cancel_migration(self, migration_id: UUID) -> bool:
         """
         Cancel an in-progress migration
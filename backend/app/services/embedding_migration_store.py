@@ -119,43 +119,70 @@ class EmbeddingMigrationStore(PostgresStoreBase):
     def update_migration(self, migration: EmbeddingMigration) -> EmbeddingMigration:
         """Update migration task"""
         with self.transaction() as conn:
-            migration.updated_at = _utc_now()
+            self._update_migration_row(conn, migration)
+            return migration
 
-            conn.execute(
+    def save_migration_page(
+        self, migration: EmbeddingMigration, items: List[EmbeddingMigrationItem]
+    ) -> bool:
+        """Record a page's items, counts and checkpoint in one transaction.
+
+        The migration row is locked first so a concurrent cancel is seen;
+        returns False (and marks ``migration`` cancelled) when it was.
+        """
+        with self.transaction() as conn:
+            row = conn.execute(
                 text(
-                    """
-                    UPDATE embedding_migrations
-                    SET source_model = :source_model, target_model = :target_model, source_provider = :source_provider, target_provider = :target_provider,
-                        user_id = :user_id, workspace_id = :workspace_id, intent_id = :intent_id, scope = :scope, strategy = :strategy,
-                        total_count = :total_count, processed_count = :processed_count, failed_count = :failed_count, status = :status,
-                        started_at = :started_at, completed_at = :completed_at, error_message = :error_message, metadata = :metadata,
-                        updated_at = :updated_at
-                    WHERE id = :id
-                """
+                    "SELECT status, completed_at FROM embedding_migrations "
+                    "WHERE id = :id FOR UPDATE"
                 ),
-                {
-                    "id": str(migration.id),
-                    "source_model": migration.source_model,
-                    "target_model": migration.target_model,
-                    "source_provider": migration.source_provider,
-                    "target_provider": migration.target_provider,
-                    "user_id": migration.user_id,
-                    "workspace_id": migration.workspace_id,
-                    "intent_id": migration.intent_id,
-                    "scope": migration.scope,
-                    "strategy": migration.strategy,
-                    "total_count": migration.total_count,
-                    "processed_count": migration.processed_count,
-                    "failed_count": migration.failed_count,
-                    "status": migration.status,
-                    "started_at": migration.started_at,
-                    "completed_at": migration.completed_at,
-                    "error_message": migration.error_message,
-                    "metadata": json.dumps(migration.metadata) if migration.metadata else None,
-                    "updated_at": migration.updated_at,
-                },
-            )
-            return migration
+                {"id": str(migration.id)},
+            ).fetchone()
+            cancelled = bool(row and row.status == MigrationStatus.CANCELLED.value)
+            if cancelled:
+                migration.status = MigrationStatus.CANCELLED
+                migration.completed_at = row.completed_at
+            self._upsert_migration_item_rows(conn, items)
+            self._update_migration_row(conn, migration)
+        return not cancelled
+
+    def _update_migration_row(self, conn, migration: EmbeddingMigration) -> None:
+        migration.updated_at = _utc_now()
+
+        conn.execute(
+            text(
+                """
+                UPDATE embedding_migrations
+                SET source_model = :source_model, target_model = :target_model, source_provider = :source_provider, target_provider = :target_provider,
+                    user_id = :user_id, workspace_id = :workspace_id, intent_id = :intent_id, scope = :scope, strategy = :strategy,
+                    total_count = :total_count, processed_count = :processed_count, failed_count = :failed_count, status = :status,
+                    started_at = :started_at, completed_at = :completed_at, error_message = :error_message, metadata = :metadata,
+                    updated_at = :updated_at
+                WHERE id = :id
+            """
+            ),
+            {
+                "id": str(migration.id),
+                "source_model": migration.source_model,
+                "target_model": migration.target_model,
+                "source_provider": migration.source_provider,
+                "target_provider": migration.target_provider,
+                "user_id": migration.user_id,
+                "workspace_id": migration.workspace_id,
+                "intent_id": migration.intent_id,
+                "scope": migration.scope,
+                "strategy": migration.strategy,
+                "total_count": migration.total_count,
+                "processed_count": migration.processed_count,
+                "failed_count": migration.failed_count,
+                "status": migration.status,
+                "started_at": migration.started_at,
+                "completed_at": migration.completed_at,
+                "error_message": migration.error_message,
+                "metadata": json.dumps(migration.metadata) if migration.metadata else None,
+                "updated_at": migration.updated_at,
+            },
+        )
 
     def delete_migration(self, migration_id: UUID) -> bool:
         """Delete migration task and its items"""
@@ -197,6 +224,87 @@ class EmbeddingMigrationStore(PostgresStoreBase):
             )
             return item
 
+    def upsert_migration_items(
+        self, items: List[EmbeddingMigrationItem]
+    ) -> List[EmbeddingMigrationItem]:
+        """Insert or update many migration items in one executemany round trip"""
+        if not items:
+            return items
+        with self.transaction() as conn:
+            self._upsert_migration_item_rows(conn, items)
+        return items
+
+    def _upsert_migration_item_rows(
+        self, conn, items: List[EmbeddingMigrationItem]
+    ) -> None:
+        if not items:
+            return
+        now = _utc_now()
+        params = []
+        for item in items:
+            item.updated_at = now
+            params.append(
+                {
+                    "id": str(item.id),
+                    "migration_id": str(item.migration_id),
+                    "source_embedding_id": item.source_embedding_id,
+                    "target_embedding_id": item.target_embedding_id,
+                    "source_table": item.source_table,
+                    "status": item.status,
+                    "error_message": item.error_message,
+                    "retry_count": item.retry_count,
+                    "created_at": item.created_at,
+                    "updated_at": item.updated_at,
+                }
+            )
+        conn.execute(
+            text(
+                """
+                INSERT INTO embedding_migration_items
+                (id, migration_id, source_embedding_id, target_embedding_id,
+                 source_table, status, error_message, retry_count,
+                 created_at, updated_at)
+                VALUES
+                (:id, :migration_id, :source_embedding_id, :target_embedding_id,
+                 :source_table, :status, :error_message, :retry_count,
+                 :created_at, :updated_at)
+                ON CONFLICT (id) DO UPDATE SET
+                    target_embedding_id = EXCLUDED.target_embedding_id,
+                    status = EXCLUDED.status,
+                    error_message = EXCLUDED.error_message,
+                    retry_count = embedding_migration_items.retry_count + 1,
+                    updated_at = EXCLUDED.updated_at
+            """
+            ),
+            params,
+        )
+
+    def list_retryable_failed_source_ids(
+        self, migration_id: UUID, *, max_retries: int, limit: int = 10000
+    ) -> List[str]:
+        """Source ids of failed items that have retries left, oldest first"""
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                text(
+                    """
+                    SELECT source_embedding_id
+                    FROM embedding_migration_items
+                    WHERE migration_id = :migration_id
+                      AND status = :failed_status
+                      AND retry_count < :max_retries
+                    ORDER BY created_at, id
+                    LIMIT :limit
+                """
+                ),
+                {
+                    "migration_id": str(migration_id),
+                    "failed_status": ItemStatus.FAILED.value,
+                    "max_retries": max_retries,
+                    "limit": limit,
+                },
+            ).fetchall()
+            return [str(row.source_embedding_id) for row in rows]
+
     def get_migration_items(
         self,
         migration_id: UUID,
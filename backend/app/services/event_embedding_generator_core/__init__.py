@@ -1,4 +1,10 @@
+from .batch_queue import EventEmbeddingQueue, get_event_embedding_queue
 from .clock import _utc_now
 from .service import EventEmbeddingGenerator
 
-__all__ = ["EventEmbeddingGenerator", "_utc_now"]
+__all__ = [
+    "EventEmbeddingGenerator",
+    "EventEmbeddingQueue",
+    "_utc_now",
+    "get_event_embedding_queue",
+]
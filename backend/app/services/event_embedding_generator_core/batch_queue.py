@@ -0,0 +1,143 @@
+"""Bounded background queue that embeds committed events in batches."""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from backend.app.models.mindscape import MindEvent
+
+logger = logging.getLogger("backend.app.services.event_embedding_generator")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except (TypeError, ValueError):
+        return default
+
+
+class EventEmbeddingQueue:
+    """
+    Hand events to one worker thread that embeds them in provider batches.
+
+    Producers never block: when the queue is full the event is dropped and
+    counted, so a burst of writes cannot pile up unbounded embedding work.
+    The worker owns its own event loop, which keeps sync callers from
+    spinning up ``asyncio.run`` per event.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        generator_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self._queue: "queue.Queue[MindEvent]" = queue.Queue(
+            maxsize=max_size or _env_int("EVENT_EMBEDDING_QUEUE_SIZE", 1000)
+        )
+        self._batch_size = batch_size or _env_int("EVENT_EMBEDDING_BATCH_SIZE", 64)
+        self._generator_factory = generator_factory
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._submitted = 0
+        self._dropped = 0
+        self._batches = 0
+
+    def submit(self, events: Iterable[MindEvent]) -> int:
+        """Queue events for embedding; returns how many were accepted."""
+        accepted = 0
+        dropped = 0
+        for event in events:
+            try:
+                self._queue.put_nowait(event)
+                accepted += 1
+            except queue.Full:
+                dropped += 1
+        self._submitted += accepted
+        if dropped:
+            self._dropped += dropped
+            logger.warning(
+                "Event embedding queue full; dropped %s events (total dropped %s)",
+                dropped,
+                self._dropped,
+            )
+        if accepted:
+            self._ensure_worker()
+        return accepted
+
+    def join(self) -> None:
+        """Block until every accepted event has been processed."""
+        self._queue.join()
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "submitted": self._submitted,
+            "dropped": self._dropped,
+            "batches": self._batches,
+        }
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="event-embedding-queue",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _next_batch(self) -> List[MindEvent]:
+        batch = [self._queue.get()]
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        generator = None
+        try:
+            while True:
+                batch = self._next_batch()
+                try:
+                    if generator is None:
+                        if self._generator_factory is not None:
+                            generator = self._generator_factory()
+                        else:
+                            from backend.app.services.event_embedding_generator_core.service import (
+                                EventEmbeddingGenerator,
+                            )
+
+                            generator = EventEmbeddingGenerator()
+                    loop.run_until_complete(generator.generate_embeddings_for_events(batch))
+                    self._batches += 1
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to embed batch of %s events: %s", len(batch), exc
+                    )
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            loop.close()
+
+
+_queue_instance: Optional[EventEmbeddingQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_event_embedding_queue() -> EventEmbeddingQueue:
+    """Return the process-wide event embedding queue."""
+    global _queue_instance
+    if _queue_instance is None:
+        with _queue_lock:
+            if _queue_instance is None:
+                _queue_instance = EventEmbeddingQueue()
+    return _queue_instance
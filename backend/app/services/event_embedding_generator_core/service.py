@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from backend.app.models.mindscape import MindEvent
 from backend.app.services.event_embedding_generator_core.eligibility import (
@@ -12,6 +12,7 @@ from backend.app.services.event_embedding_generator_core.extraction import (
 from backend.app.services.event_embedding_generator_core.providers import (
     generate_embedding,
     generate_embedding_openai,
+    generate_embeddings,
     generate_embedding_vertex_ai,
 )
 from backend.app.services.event_embedding_generator_core.storage import (
@@ -85,6 +86,62 @@ class EventEmbeddingGenerator:
             )
             return None
 
+    async def generate_embeddings_for_events(
+        self, events: Sequence[MindEvent]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Generate embeddings for a batch of events with one provider call.
+
+        Returns a mapping of event ID to seed ID (None when skipped or failed).
+        """
+        results: Dict[str, Optional[str]] = {}
+        pending: List[tuple[MindEvent, str]] = []
+        for event in events:
+            results[event.id] = None
+            try:
+                if not self.should_generate_embedding(event):
+                    continue
+                text_content = self._extract_text_from_event(event)
+                if not text_content:
+                    continue
+                existing = self._check_existing_embedding(event)
+                if existing:
+                    results[event.id] = existing
+                    continue
+                pending.append((event, text_content))
+            except Exception as exc:
+                logger.error(
+                    "Failed to prepare embedding for event %s: %s",
+                    event.id,
+                    exc,
+                    exc_info=True,
+                )
+
+        if not pending:
+            return results
+
+        embeddings = await self._generate_embeddings([text for _, text in pending])
+        for (event, text_content), embedding in zip(pending, embeddings):
+            if not embedding:
+                logger.warning("Failed to generate embedding for event %s", event.id)
+                continue
+            try:
+                results[event.id] = self._store_embedding(event, text_content, embedding)
+            except Exception as exc:
+                logger.error(
+                    "Failed to store embedding for event %s: %s",
+                    event.id,
+                    exc,
+                    exc_info=True,
+                )
+
+        logger.info(
+            "Generated %s embeddings for %s events",
+            sum(1 for event, _ in pending if results.get(event.id)),
+            len(results),
+        )
+        return results
+
     def _extract_text_from_event(self, event: MindEvent) -> Optional[str]:
         return extract_text_from_event(event)
 
@@ -94,6 +151,11 @@ class EventEmbeddingGenerator:
     async def _generate_embedding(self, text: str) -> Optional[List[float]]:
         return await generate_embedding(text)
 
+    async def _generate_embeddings(
+        self, texts: List[str]
+    ) -> List[Optional[List[float]]]:
+        return await generate_embeddings(texts)
+
     async def _generate_embedding_openai(
         self, model_name: str, text: str
     ) -> Optional[List[float]]:
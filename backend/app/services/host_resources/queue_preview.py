@@ -44,7 +44,7 @@ async def _pending_task_ids(queue_store: Any, *, scan_limit: int) -> list[str]:
     client = await queue_store._get_client()
     if not client:
         return []
-    raw_ids = await client.lrange(queue_store.q_pending, 0, max(0, scan_limit - 1))
+    raw_ids = await client.zrange(queue_store.q_pending, 0, max(0, scan_limit - 1))
     return [_normalize_task_id(raw).strip() for raw in raw_ids if _normalize_task_id(raw).strip()]
 
 
@@ -31,7 +31,7 @@ async def pending_task_ids(queue_store: Any, *, scan_limit: int) -> list[str]:
     client = await queue_store._get_client()
     if not client:
         return []
-    raw_ids = await client.lrange(queue_store.q_pending, 0, max(0, scan_limit - 1))
+    raw_ids = await client.zrange(queue_store.q_pending, 0, max(0, scan_limit - 1))
     return [
         _normalize_task_id(raw).strip()
         for raw in raw_ids
@@ -48,7 +48,7 @@ async def queue_depths(queue_store: Any) -> dict[str, int]:
             "delayed": 0,
             "deadletter": 0,
         }
-    pending = await client.llen(queue_store.q_pending)
+    pending = await client.zcard(queue_store.q_pending)
     processing = await client.zcard(queue_store.q_processing)
     delayed = await client.zcard(queue_store.q_delayed)
     deadletter = await client.llen(queue_store.q_deadletter)
@@ -0,0 +1,494 @@
+"""
+Incremental File Index Engine
+
+Change detection and bounded parallel processing shared by the local folder,
+Content Vault and Obsidian indexers.
+
+A manifest records ``(path, mtime, size, content hash, embedding model)`` for
+every file seen under one root. A rescan only reads files whose stat changed,
+only hands files whose content hash or embedding model changed to the
+indexer, and tombstones manifest entries whose file disappeared so the caller
+can revoke them. Tombstones are pruned once they are older than
+``INCREMENTAL_INDEX_TOMBSTONE_RETENTION_DAYS`` (default 30).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+_DEFAULT_TOMBSTONE_RETENTION_DAYS = 30
+
+# Returned by ``index_batch`` for a file it deliberately leaves out of the index.
+FILE_SKIPPED = "incremental_index:skipped"
+
+ContentHasher = Callable[[str], str]
+IndexBatch = Callable[[Sequence["FileChange"]], Awaitable[Sequence[Optional[str]]]]
+RemoveFile = Callable[[str, Dict[str, str]], Awaitable[None]]
+
+
+def sha256_text(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def default_manifest_path(namespace: str, root: Path, workspace_id: Optional[str]) -> Path:
+    """Manifest location under ``DATA_DIR`` for one (namespace, workspace, root)."""
+    key = sha256_text(f"{workspace_id or ''}\n{Path(root).resolve()}")[:24]
+    data_dir = Path(os.getenv("DATA_DIR", "./data")).expanduser()
+    return data_dir / "index_manifests" / namespace / f"{key}.json"
+
+
+@dataclass
+class ManifestEntry:
+    mtime_ns: int
+    size: int
+    content_hash: str
+    indexed_at: str = field(default_factory=_utc_now_iso)
+    tombstoned_at: Optional[str] = None
+    annotations: Dict[str, str] = field(default_factory=dict)
+    # Signature of the embedding models the file's vectors were built with.
+    embedding_model: Optional[str] = None
+
+    @property
+    def live(self) -> bool:
+        return self.tombstoned_at is None
+
+
+class FileManifest:
+    """JSON manifest of the files indexed from one root, keyed by relative path."""
+
+    def __init__(self, path: Optional[Path]):
+        self.path = Path(path) if path is not None else None
+        self.entries: Dict[str, ManifestEntry] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            for rel_path, raw in (payload.get("files") or {}).items():
+                self.entries[rel_path] = ManifestEntry(**raw)
+        except Exception as e:
+            logger.warning(f"Failed to load index manifest {self.path}: {e}")
+            self.entries = {}
+
+    def get(self, rel_path: str) -> Optional[ManifestEntry]:
+        return self.entries.get(rel_path)
+
+    def live_paths(self) -> List[str]:
+        return [rel_path for rel_path, entry in self.entries.items() if entry.live]
+
+    def record(
+        self,
+        rel_path: str,
+        *,
+        mtime_ns: int,
+        size: int,
+        content_hash: str,
+        annotations: Optional[Dict[str, str]] = None,
+        embedding_model: Optional[str] = None,
+    ) -> None:
+        previous = self.entries.get(rel_path)
+        if annotations is None:
+            annotations = previous.annotations if previous is not None else {}
+        if embedding_model is None and previous is not None:
+            embedding_model = previous.embedding_model
+        self.entries[rel_path] = ManifestEntry(
+            mtime_ns=mtime_ns,
+            size=size,
+            content_hash=content_hash,
+            annotations=dict(annotations),
+            embedding_model=embedding_model,
+        )
+        self._dirty = True
+
+    def tombstone(self, rel_path: str) -> None:
+        entry = self.entries.get(rel_path)
+        if entry is not None and entry.live:
+            entry.tombstoned_at = _utc_now_iso()
+            self._dirty = True
+
+    def prune_tombstones(self, retention: Optional[timedelta] = None) -> int:
+        """Drop tombstones older than ``retention``; return how many were dropped."""
+        if retention is None:
+            days = _env_int(
+                "INCREMENTAL_INDEX_TOMBSTONE_RETENTION_DAYS",
+                _DEFAULT_TOMBSTONE_RETENTION_DAYS,
+            )
+            retention = timedelta(days=days)
+        cutoff = (datetime.now(timezone.utc) - retention).isoformat()
+        expired = [
+            rel_path
+            for rel_path, entry in self.entries.items()
+            if entry.tombstoned_at is not None and entry.tombstoned_at < cutoff
+        ]
+        for rel_path in expired:
+            del self.entries[rel_path]
+        if expired:
+            self._dirty = True
+        return len(expired)
+
+    def save(self) -> None:
+        """Prune expired tombstones, then write atomically if anything changed."""
+        self.prune_tombstones()
+        if self.path is None or not self._dirty:
+            return
+        payload = {
+            "version": MANIFEST_VERSION,
+            "files": {rel_path: asdict(entry) for rel_path, entry in self.entries.items()},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Failed to save index manifest {self.path}: {e}")
+
+
+@dataclass(frozen=True)
+class FileChange:
+    rel_path: str
+    path: Path
+    content: str
+    content_hash: str
+    mtime_ns: int
+    size: int
+    is_new: bool
+    # Filled by the indexer (e.g. the source id it wrote) and kept in the
+    # manifest so ``remove`` can find the indexed document after deletion.
+    annotations: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ChangeSet:
+    changes: List[FileChange]
+    deleted: List[str]
+    unchanged: int
+    unreadable: List[str]
+
+    @property
+    def files_found(self) -> int:
+        return len(self.changes) + self.unchanged + len(self.unreadable)
+
+
+def _read_text(path: Path) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except Exception as e:
+        logger.warning(f"Failed to read file {path}: {e}")
+        return None
+
+
+def _same_model(entry: ManifestEntry, embedding_model: Optional[str]) -> bool:
+    return embedding_model is None or entry.embedding_model == embedding_model
+
+
+def detect_changes(
+    root: Path,
+    files: Iterable[Path],
+    manifest: FileManifest,
+    *,
+    workers: Optional[int] = None,
+    hasher: ContentHasher = sha256_text,
+    embedding_model: Optional[str] = None,
+) -> ChangeSet:
+    """
+    Compare ``files`` under ``root`` with ``manifest``.
+
+    Files whose mtime and size match a live entry are skipped without being
+    read. The rest are read and hashed on a bounded thread pool; a file whose
+    hash still matches only has its stat refreshed in the manifest. When
+    ``embedding_model`` is given, entries indexed with another model count
+    as changed whatever their stat and hash.
+    """
+    root = Path(root)
+    candidates = []
+    seen = set()
+    unchanged = 0
+    for path in files:
+        rel_path = path.relative_to(root).as_posix()
+        seen.add(rel_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entry = manifest.get(rel_path)
+        if (
+            entry is not None
+            and entry.live
+            and _same_model(entry, embedding_model)
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.size == stat.st_size
+        ):
+            unchanged += 1
+            continue
+        candidates.append((rel_path, path, stat, entry))
+
+    def _load(candidate):
+        rel_path, path, stat, entry = candidate
+        content = _read_text(path)
+        return candidate, content, hasher(content) if content is not None else None
+
+    pool_size = workers or _env_int("INCREMENTAL_INDEX_READ_WORKERS", 8)
+    changes: List[FileChange] = []
+    unreadable: List[str] = []
+    if candidates:
+        with ThreadPoolExecutor(
+            max_workers=min(pool_size, len(candidates)),
+            thread_name_prefix="index-scan",
+        ) as pool:
+            loaded = list(pool.map(_load, candidates))
+        for (rel_path, path, stat, entry), content, content_hash in loaded:
+            if content is None:
+                unreadable.append(rel_path)
+                continue
+            if (
+                entry is not None
+                and entry.live
+                and _same_model(entry, embedding_model)
+                and entry.content_hash == content_hash
+            ):
+                manifest.record(
+                    rel_path,
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    content_hash=content_hash,
+                )
+                unchanged += 1
+                continue
+            changes.append(
+                FileChange(
+                    rel_path=rel_path,
+                    path=path,
+                    content=content,
+                    content_hash=content_hash,
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    is_new=entry is None or not entry.live,
+                )
+            )
+
+    deleted = [rel_path for rel_path in manifest.live_paths() if rel_path not in seen]
+    return ChangeSet(
+        changes=changes,
+        deleted=deleted,
+        unchanged=unchanged,
+        unreadable=unreadable,
+    )
+
+
+async def stream_incremental_index(
+    root: Path,
+    files: Iterable[Path],
+    manifest: FileManifest,
+    *,
+    index_batch: IndexBatch,
+    remove: Optional[RemoveFile] = None,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    hasher: ContentHasher = sha256_text,
+    embedding_model: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Index the changed files under ``root`` and yield progress events.
+
+    ``index_batch`` receives up to ``batch_size`` changed files and returns
+    one error message (or None on success) per file; at most ``workers``
+    batches run at once. A file it answers with ``FILE_SKIPPED`` is not
+    recorded, so it is offered again on the next run; if it was indexed
+    before, it is removed like a deleted file. ``remove`` is awaited with the
+    relative path and stored annotations of every deleted file before it is
+    tombstoned. The
+    manifest is saved after every completed batch, so an interrupted run only
+    redoes unfinished batches. Indexed files are recorded with
+    ``embedding_model`` so a model change re-indexes them.
+
+    Events: ``scan``, ``file_indexed``, ``file_skipped``, ``file_failed``,
+    ``file_removed`` and a final ``complete`` carrying the totals.
+    """
+    batch_size = batch_size or _env_int("INCREMENTAL_INDEX_BATCH_FILES", 16)
+    workers = workers or _env_int("INCREMENTAL_INDEX_WORKERS", 4)
+    change_set = await asyncio.to_thread(
+        detect_changes,
+        root,
+        list(files),
+        manifest,
+        hasher=hasher,
+        embedding_model=embedding_model,
+    )
+    totals = {
+        "files_found": change_set.files_found,
+        "files_changed": len(change_set.changes),
+        "files_unchanged": change_set.unchanged,
+        "files_deleted": len(change_set.deleted),
+        "files_indexed": 0,
+        "files_skipped": 0,
+        "files_failed": len(change_set.unreadable),
+        "files_removed": 0,
+    }
+    yield {"type": "scan", **totals}
+    for rel_path in change_set.unreadable:
+        yield {"type": "file_failed", "path": rel_path, "error": "unreadable"}
+
+    for rel_path in change_set.deleted:
+        try:
+            if remove is not None:
+                await remove(rel_path, manifest.get(rel_path).annotations)
+        except Exception as e:
+            logger.error(f"Failed to remove indexed file {rel_path}: {e}")
+            totals["files_failed"] += 1
+            yield {"type": "file_failed", "path": rel_path, "error": str(e)}
+            continue
+        manifest.tombstone(rel_path)
+        totals["files_removed"] += 1
+        yield {"type": "file_removed", "path": rel_path}
+
+    semaphore = asyncio.Semaphore(workers)
+    changes = change_set.changes
+
+    async def run_batch(batch: Sequence[FileChange]):
+        async with semaphore:
+            try:
+                errors = list(await index_batch(batch))
+            except Exception as e:
+                errors = [str(e)] * len(batch)
+            return batch, errors
+
+    tasks = [
+        asyncio.create_task(run_batch(changes[start : start + batch_size]))
+        for start in range(0, len(changes), batch_size)
+    ]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            batch, errors = await finished
+            for change, error in zip(batch, errors):
+                if error == FILE_SKIPPED:
+                    entry = manifest.get(change.rel_path)
+                    if entry is not None and entry.live:
+                        try:
+                            if remove is not None:
+                                await remove(change.rel_path, entry.annotations)
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to remove indexed file {change.rel_path}: {e}"
+                            )
+                            totals["files_failed"] += 1
+                            yield {
+                                "type": "file_failed",
+                                "path": change.rel_path,
+                                "error": str(e),
+                            }
+                            continue
+                        manifest.tombstone(change.rel_path)
+                        totals["files_removed"] += 1
+                    totals["files_skipped"] += 1
+                    yield {"type": "file_skipped", "path": change.rel_path}
+                    continue
+                if error:
+                    totals["files_failed"] += 1
+                    yield {"type": "file_failed", "path": change.rel_path, "error": error}
+                    continue
+                manifest.record(
+                    change.rel_path,
+                    mtime_ns=change.mtime_ns,
+                    size=change.size,
+                    content_hash=change.content_hash,
+                    annotations=change.annotations,
+                    embedding_model=embedding_model,
+                )
+                totals["files_indexed"] += 1
+                yield {
+                    "type": "file_indexed",
+                    "path": change.rel_path,
+                    "is_new": change.is_new,
+                }
+            await asyncio.to_thread(manifest.save)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.to_thread(manifest.save)
+
+    yield {"type": "complete", **totals}
+
+
+async def embedding_model_signature(vector_service) -> Optional[str]:
+    """Signature of the models ``embed_documents`` would use, or None if unknown."""
+    generator = getattr(vector_service, "embedding_generator", None)
+    resolve = getattr(generator, "embedding_model_signature", None)
+    if resolve is None:
+        return None
+    try:
+        return await resolve()
+    except Exception as e:
+        logger.warning(f"Failed to resolve the embedding model signature: {e}")
+        return None
+
+
+async def embed_documents(vector_service, texts: Sequence[str]) -> List[Any]:
+    """
+    Embed document texts with the provider batch endpoint.
+
+    Returns one receipt (or None) per text; None entries are left for the
+    projection facade to embed one at a time.
+    """
+    generator = getattr(vector_service, "embedding_generator", None)
+    if not texts or generator is None:
+        return [None] * len(texts)
+    try:
+        return list(await generator.generate_embeddings_batch(texts, is_query=False))
+    except Exception as e:
+        logger.warning(f"Batched document embedding failed, falling back per chunk: {e}")
+        return [None] * len(texts)
+
+
+__all__ = [
+    "FILE_SKIPPED",
+    "ChangeSet",
+    "FileChange",
+    "FileManifest",
+    "ManifestEntry",
+    "default_manifest_path",
+    "detect_changes",
+    "embed_documents",
+    "embedding_model_signature",
+    "sha256_text",
+    "stream_incremental_index",
+]
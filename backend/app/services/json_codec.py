@@ -0,0 +1,149 @@
+"""JSON codec for PostgreSQL text/jsonb columns.
+
+Both directions keep the ``json_safety`` guarantee that real NUL codepoints
+never reach or leave the database, but only pay for it when a NUL is present:
+an encoder escapes NUL as ``\\u0000``, so one substring scan of the encoded
+text decides whether the value needs ``replace_json_nul_codepoints``. The
+rare hit is confirmed with a regex that skips escaped backslashes, so literal
+``\\u0000`` text does not force a copy.
+
+Encoding always goes through ``json.dumps``: orjson writes NaN/Infinity as
+``null`` and accepts types (UUID, Enum) the stdlib rejects, so it would change
+what is stored. ``orjson`` is only used, when installed, to decode and to
+scan for NUL, with the standard library as the fallback for anything it
+rejects. ``register_psycopg2_json_typecasters`` installs ``loads_json`` as
+the psycopg2 ``json``/``jsonb`` typecaster, so rows are decoded once and
+already NUL-free.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from typing import Any
+
+from .json_safety import replace_json_nul_codepoints
+
+try:  # Optional C-accelerated codec.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_ESCAPED_NUL = "\\u0000"
+_ESCAPED_NUL_BYTES = b"\\u0000"
+# A ``\u0000`` escape whose own backslash is not escaped.
+_NUL_ESCAPE_RE = re.compile(r"(?<!\\)(?:\\\\)*\\u0000")
+_NUL_ESCAPE_BYTES_RE = re.compile(rb"(?<!\\)(?:\\\\)*\\u0000")
+
+# Only used for the NUL scan; datetimes and dataclasses are handed back to the
+# stdlib fallback, which stringifies them.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+_registration_lock = threading.Lock()
+_typecasters_registered = False
+
+
+def fast_json_available() -> bool:
+    return orjson is not None
+
+
+def _has_nul_escape(encoded: str) -> bool:
+    return _ESCAPED_NUL in encoded and _NUL_ESCAPE_RE.search(encoded) is not None
+
+
+def _decode(text: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals and big ints are accepted by the stdlib.
+            pass
+    return json.loads(text)
+
+
+def dumps_json(data: Any) -> str:
+    """Encode *data*, replacing real NUL codepoints only when there are any."""
+    encoded = json.dumps(data)
+    if _has_nul_escape(encoded):
+        encoded = json.dumps(replace_json_nul_codepoints(data))
+    return encoded
+
+
+def loads_json(text: Any) -> Any:
+    """Decode JSON text; raises ``json.JSONDecodeError`` like ``json.loads``."""
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        text = bytes(text).decode("utf-8")
+    value = _decode(text)
+    if _has_nul_escape(text):
+        value = replace_json_nul_codepoints(value)
+    return value
+
+
+def contains_json_nul(value: Any) -> bool:
+    """True when *value* holds a real NUL codepoint in any key or string."""
+    if isinstance(value, str):
+        return "\x00" in value
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(value, option=_ORJSON_OPTIONS)
+            return (
+                _ESCAPED_NUL_BYTES in encoded
+                and _NUL_ESCAPE_BYTES_RE.search(encoded) is not None
+            )
+        except TypeError:
+            pass
+    try:
+        return _has_nul_escape(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return True
+
+
+def without_json_nul(value: Any) -> Any:
+    """Return *value* unchanged when it is NUL-free, else a cleaned copy."""
+    if contains_json_nul(value):
+        return replace_json_nul_codepoints(value)
+    return value
+
+
+def register_psycopg2_json_typecasters() -> bool:
+    """Decode psycopg2 ``json``/``jsonb`` columns with ``loads_json``.
+
+    Registration is process-wide and idempotent. Returns False when psycopg2
+    is not installed.
+    """
+    global _typecasters_registered
+    with _registration_lock:
+        if _typecasters_registered:
+            return True
+        try:
+            from psycopg2 import extras
+        except ImportError:
+            return False
+        try:
+            extras.register_default_json(globally=True, loads=loads_json)
+            extras.register_default_jsonb(globally=True, loads=loads_json)
+        except Exception as exc:
+            logger.warning("Failed to register psycopg2 JSON typecasters: %s", exc)
+            return False
+        _typecasters_registered = True
+        return True
+
+
+__all__ = [
+    "contains_json_nul",
+    "dumps_json",
+    "fast_json_available",
+    "loads_json",
+    "register_psycopg2_json_typecasters",
+    "without_json_nul",
+]
@@ -1,7 +1,10 @@
 """Authorization-inheriting graph materialization and query components."""
 
 from .authorization_binding import bind_graph_visibility
-from .community import build_visibility_partitioned_communities
+from .community import (
+    build_visibility_partitioned_communities,
+    update_visibility_partitioned_communities,
+)
 from .contracts import (
     GraphCommunityReportWrite,
     GraphEntityWrite,
@@ -20,6 +23,7 @@ __all__ = [
     "bind_graph_visibility",
     "build_visibility_partitioned_communities",
     "canonical_entity_key",
+    "update_visibility_partitioned_communities",
 ]
 """Pack-neutral GraphRAG leaves.
 
@@ -1,26 +1,25 @@
-"""Deterministic visibility-partitioned community decomposition baseline."""
+"""Deterministic visibility-partitioned hierarchical community decomposition."""
 
 from __future__ import annotations
 
-import hashlib
-import json
+import threading
+from collections import OrderedDict
 from typing import Iterable
 
+from .community_engine import (
+    COMMUNITY_ALGORITHM_REVISION,
+    VisibilityPartitionCommunityEngine,
+)
 from .contracts import (
     GraphCommunityWrite,
     GraphEntityWrite,
     GraphRelationWrite,
 )
 
-
-def _hash(value) -> str:
-    return hashlib.sha256(
-        json.dumps(
-            value,
-            sort_keys=True,
-            separators=(",", ":"),
-        ).encode("utf-8")
-    ).hexdigest()
+# Engines kept between compiles of the same graph, most recently used last.
+_MAX_PERSISTENT_ENGINES = 256
+_engines: "OrderedDict[str, VisibilityPartitionCommunityEngine]" = OrderedDict()
+_engines_lock = threading.Lock()
 
 
 def build_visibility_partitioned_communities(
@@ -29,62 +28,58 @@ def build_visibility_partitioned_communities(
     relations: Iterable[GraphRelationWrite],
     visibility_partition_hash: str,
 ) -> tuple[GraphCommunityWrite, ...]:
-    """Build deterministic connected communities without crossing one ACL cohort."""
+    """Build nested communities without crossing one ACL cohort.
+
+    Level 0 is each connected component; deeper levels are its modularity
+    communities. Parents always precede their children.
+    """
+
+    return VisibilityPartitionCommunityEngine(
+        visibility_partition_hash=visibility_partition_hash,
+        entities=entities,
+        relations=relations,
+    ).communities()
+
+
+def update_visibility_partitioned_communities(
+    *,
+    graph_key: str,
+    entities: Iterable[GraphEntityWrite],
+    relations: Iterable[GraphRelationWrite],
+    visibility_partition_hash: str,
+) -> tuple[GraphCommunityWrite, ...]:
+    """Recompile the communities of a graph that is rebuilt repeatedly.
+
+    The engine of *graph_key* persists across calls and only the components
+    the change touches are re-clustered; the result equals
+    :func:`build_visibility_partitioned_communities` on the same input.
+    """
 
-    entity_keys = sorted({entity.canonical_key for entity in entities})
-    relation_rows = tuple(relations)
-    adjacency = {key: set() for key in entity_keys}
-    for relation in relation_rows:
-        adjacency.setdefault(relation.source_entity_key, set()).add(
-            relation.target_entity_key
-        )
-        adjacency.setdefault(relation.target_entity_key, set()).add(
-            relation.source_entity_key
-        )
-    communities: list[GraphCommunityWrite] = []
-    visited: set[str] = set()
-    for seed in sorted(adjacency):
-        if seed in visited:
-            continue
-        stack = [seed]
-        members: set[str] = set()
-        while stack:
-            current = stack.pop()
-            if current in visited:
-                continue
-            visited.add(current)
-            members.add(current)
-            stack.extend(sorted(adjacency[current] - visited, reverse=True))
-        member_tuple = tuple(sorted(members))
-        relation_keys = tuple(
-            sorted(
-                {
-                    relation.relation_key
-                    for relation in relation_rows
-                    if relation.source_entity_key in members
-                    and relation.target_entity_key in members
-                }
+    with _engines_lock:
+        engine = _engines.pop(graph_key, None)
+        if (
+            engine is None
+            or engine.visibility_partition_hash != visibility_partition_hash
+        ):
+            engine = VisibilityPartitionCommunityEngine(
+                visibility_partition_hash=visibility_partition_hash,
+                entities=entities,
+                relations=relations,
             )
-        )
-        generation_payload = {
-            "visibility_partition_hash": visibility_partition_hash,
-            "entities": member_tuple,
-            "relations": relation_keys,
-            "algorithm": "connected_components.v1",
-        }
-        digest = _hash(generation_payload)
-        communities.append(
-            GraphCommunityWrite(
-                community_key=f"community:{digest}",
-                level=0,
-                parent_community_key=None,
-                entity_keys=member_tuple,
-                relation_keys=relation_keys,
-                affected_subgraph_hash=digest,
-                full_rebuild_hash=digest,
+            communities = engine.communities()
+        else:
+            communities = engine.apply_snapshot(
+                entities=entities,
+                relations=relations,
             )
-        )
-    return tuple(communities)
+        _engines[graph_key] = engine
+        while len(_engines) > _MAX_PERSISTENT_ENGINES:
+            _engines.popitem(last=False)
+        return communities
 
 
-__all__ = ["build_visibility_partitioned_communities"]
+__all__ = [
+    "COMMUNITY_ALGORITHM_REVISION",
+    "build_visibility_partitioned_communities",
+    "update_visibility_partitioned_communities",
+]
@@ -0,0 +1,470 @@
+"""Hierarchical, incremental community engine for one visibility partition.
+
+Level 0 is the connected component. Deeper levels come from a deterministic
+Louvain modularity pass over CSR adjacency, so each child community nests
+inside its parent. Components are clustered independently and cached by
+content digest: an incremental update re-clusters only the components an
+added or revoked entity or relation touches, and yields exactly what a full
+rebuild of the same input would.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+from .contracts import (
+    GraphCommunityWrite,
+    GraphEntityWrite,
+    GraphRelationWrite,
+)
+
+
+COMMUNITY_ALGORITHM_REVISION = "louvain_hierarchy.v1"
+
+_MAX_LOCAL_PASSES = 32
+_MAX_LEVELS = 8
+_MIN_GAIN = 1e-12
+
+
+def _hash(value) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            value,
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+@dataclass(frozen=True)
+class CSRGraph:
+    """Symmetric weighted adjacency; self loops are kept apart in ``loops``."""
+
+    indptr: array
+    indices: array
+    weights: array
+    loops: array
+
+    @property
+    def node_count(self) -> int:
+        return len(self.indptr) - 1
+
+    def degrees(self) -> list[float]:
+        weights = self.weights
+        indptr = self.indptr
+        return [
+            sum(weights[indptr[node] : indptr[node + 1]]) + 2.0 * self.loops[node]
+            for node in range(self.node_count)
+        ]
+
+
+def build_csr(
+    node_count: int,
+    edges: Iterable[tuple[int, int, float]],
+) -> CSRGraph:
+    """Merge parallel edges and lay adjacency out as sorted CSR rows."""
+
+    rows: list[dict[int, float]] = [{} for _ in range(node_count)]
+    loops = array("d", [0.0] * node_count)
+    for source, target, weight in edges:
+        if source == target:
+            loops[source] += weight
+            continue
+        rows[source][target] = rows[source].get(target, 0.0) + weight
+        rows[target][source] = rows[target].get(source, 0.0) + weight
+    indptr = array("q", [0])
+    indices = array("q")
+    weights = array("d")
+    for row in rows:
+        for target in sorted(row):
+            indices.append(target)
+            weights.append(row[target])
+        indptr.append(len(indices))
+    return CSRGraph(indptr=indptr, indices=indices, weights=weights, loops=loops)
+
+
+def _local_moving(graph: CSRGraph) -> list[int] | None:
+    """Run Louvain local moves; return community per node, or None if none moved."""
+
+    degrees = graph.degrees()
+    total_weight = sum(degrees)
+    if total_weight <= 0.0:
+        return None
+    node_count = graph.node_count
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    community = list(range(node_count))
+    community_degree = list(degrees)
+    moved_any = False
+    for _ in range(_MAX_LOCAL_PASSES):
+        moved = 0
+        for node in range(node_count):
+            current = community[node]
+            degree = degrees[node]
+            neighbor_weight: dict[int, float] = {current: 0.0}
+            for offset in range(indptr[node], indptr[node + 1]):
+                candidate = community[indices[offset]]
+                neighbor_weight[candidate] = (
+                    neighbor_weight.get(candidate, 0.0) + weights[offset]
+                )
+            community_degree[current] -= degree
+            scale = degree / total_weight
+            best = current
+            best_gain = neighbor_weight[current] - community_degree[current] * scale
+            for candidate, weight in neighbor_weight.items():
+                gain = weight - community_degree[candidate] * scale
+                if gain > best_gain + _MIN_GAIN:
+                    best, best_gain = candidate, gain
+            community_degree[best] += degree
+            if best != current:
+                community[node] = best
+                moved += 1
+        if not moved:
+            break
+        moved_any = True
+    if not moved_any:
+        return None
+    renumbered: dict[int, int] = {}
+    return [renumbered.setdefault(label, len(renumbered)) for label in community]
+
+
+def _aggregate(graph: CSRGraph, community: Sequence[int]) -> CSRGraph:
+    """Collapse each community into one node, keeping internal weight as a loop."""
+
+    community_count = max(community) + 1
+    edges: list[tuple[int, int, float]] = []
+    for node in range(graph.node_count):
+        source = community[node]
+        if graph.loops[node]:
+            edges.append((source, source, graph.loops[node]))
+        for offset in range(graph.indptr[node], graph.indptr[node + 1]):
+            neighbor = graph.indices[offset]
+            if neighbor < node:
+                continue
+            edges.append((source, community[neighbor], graph.weights[offset]))
+    return build_csr(community_count, edges)
+
+
+def louvain_levels(graph: CSRGraph) -> list[list[int]]:
+    """Return node-to-community assignments from the finest level upward."""
+
+    levels: list[list[int]] = []
+    assignment = list(range(graph.node_count))
+    current = graph
+    for _ in range(_MAX_LEVELS):
+        community = _local_moving(current)
+        if community is None:
+            break
+        assignment = [community[label] for label in assignment]
+        levels.append(assignment)
+        if max(community) + 1 == current.node_count:
+            break
+        current = _aggregate(current, community)
+    return levels
+
+
+def _component_relation_payload(
+    relations: Sequence[GraphRelationWrite],
+) -> list[list]:
+    return sorted(
+        [
+            relation.relation_key,
+            relation.source_entity_key,
+            relation.target_entity_key,
+            relation.confidence,
+        ]
+        for relation in relations
+    )
+
+
+def _cluster_component(
+    *,
+    members: tuple[str, ...],
+    relations: Sequence[GraphRelationWrite],
+    visibility_partition_hash: str,
+    component_hash: str,
+) -> tuple[GraphCommunityWrite, ...]:
+    position = {key: index for index, key in enumerate(members)}
+    endpoints = [
+        (
+            position[relation.source_entity_key],
+            position[relation.target_entity_key],
+            relation.relation_key,
+        )
+        for relation in relations
+    ]
+    graph = build_csr(
+        len(members),
+        (
+            (source, target, float(relation.confidence))
+            for (source, target, _), relation in zip(endpoints, relations)
+        ),
+    )
+    communities: list[GraphCommunityWrite] = []
+
+    def _emit(
+        member_indexes: Sequence[int],
+        relation_keys: Iterable[str],
+        *,
+        level: int,
+        parent_community_key: str | None,
+    ) -> str:
+        entity_keys = tuple(members[index] for index in member_indexes)
+        sorted_relations = tuple(sorted(relation_keys))
+        digest = _hash(
+            {
+                "visibility_partition_hash": visibility_partition_hash,
+                "entities": entity_keys,
+                "relations": sorted_relations,
+                "level": level,
+                "parent_community_key": parent_community_key,
+                "algorithm": COMMUNITY_ALGORITHM_REVISION,
+            }
+        )
+        community_key = f"community:{digest}"
+        communities.append(
+            GraphCommunityWrite(
+                community_key=community_key,
+                level=level,
+                parent_community_key=parent_community_key,
+                entity_keys=entity_keys,
+                relation_keys=sorted_relations,
+                affected_subgraph_hash=component_hash,
+                full_rebuild_hash=digest,
+            )
+        )
+        return community_key
+
+    root_key = _emit(
+        range(len(members)),
+        (key for _, _, key in endpoints),
+        level=0,
+        parent_community_key=None,
+    )
+    frontier: list[tuple[str, int, list[int]]] = [
+        (root_key, 0, list(range(len(members))))
+    ]
+    for assignment in reversed(louvain_levels(graph)):
+        internal: dict[int, list[str]] = {}
+        for source, target, key in endpoints:
+            if assignment[source] == assignment[target]:
+                internal.setdefault(assignment[source], []).append(key)
+        next_frontier: list[tuple[str, int, list[int]]] = []
+        for parent_key, parent_level, member_indexes in frontier:
+            buckets: dict[int, list[int]] = {}
+            for index in member_indexes:
+                buckets.setdefault(assignment[index], []).append(index)
+            if len(buckets) == 1:
+                next_frontier.append((parent_key, parent_level, member_indexes))
+                continue
+            for label, bucket in buckets.items():
+                # Singletons stay represented by their parent community.
+                if len(bucket) < 2:
+                    continue
+                child_key = _emit(
+                    bucket,
+                    internal.get(label, ()),
+                    level=parent_level + 1,
+                    parent_community_key=parent_key,
+                )
+                next_frontier.append((child_key, parent_level + 1, bucket))
+        frontier = next_frontier
+    return tuple(communities)
+
+
+class VisibilityPartitionCommunityEngine:
+    """Maintain hierarchical communities for one ACL cohort across updates."""
+
+    def __init__(
+        self,
+        *,
+        visibility_partition_hash: str,
+        entities: Iterable[GraphEntityWrite] = (),
+        relations: Iterable[GraphRelationWrite] = (),
+    ) -> None:
+        self.visibility_partition_hash = visibility_partition_hash
+        self._entity_keys: set[str] = set()
+        self._relations: dict[str, GraphRelationWrite] = {}
+        self._relations_by_entity: dict[str, set[str]] = {}
+        self._component_of: dict[str, str] = {}
+        self._components: dict[str, tuple[str, ...]] = {}
+        self._clustered: dict[str, tuple[GraphCommunityWrite, ...]] = {}
+        for entity in entities:
+            self._add_entity_key(entity.canonical_key)
+        for relation in relations:
+            self._add_relation(relation)
+        self._rebuild_components(set(self._entity_keys))
+
+    def communities(self) -> tuple[GraphCommunityWrite, ...]:
+        """Return every community, components ordered by their first entity key."""
+
+        ordered = sorted(
+            self._components.items(),
+            key=lambda item: item[1][0],
+        )
+        return tuple(
+            community
+            for component_hash, _ in ordered
+            for community in self._clustered[component_hash]
+        )
+
+    def apply_delta(
+        self,
+        *,
+        added_entities: Iterable[GraphEntityWrite] = (),
+        removed_entity_keys: Iterable[str] = (),
+        added_relations: Iterable[GraphRelationWrite] = (),
+        removed_relation_keys: Iterable[str] = (),
+    ) -> tuple[GraphCommunityWrite, ...]:
+        """Apply projection changes and re-cluster only the touched components."""
+
+        touched: set[str] = set()
+        for relation_key in removed_relation_keys:
+            relation = self._relations.pop(relation_key, None)
+            if relation is None:
+                continue
+            for endpoint in (relation.source_entity_key, relation.target_entity_key):
+                self._relations_by_entity[endpoint].discard(relation_key)
+                touched.add(endpoint)
+        for entity_key in removed_entity_keys:
+            if entity_key not in self._entity_keys:
+                continue
+            for relation_key in sorted(self._relations_by_entity.pop(entity_key)):
+                relation = self._relations.pop(relation_key)
+                for endpoint in (
+                    relation.source_entity_key,
+                    relation.target_entity_key,
+                ):
+                    if endpoint != entity_key:
+                        self._relations_by_entity[endpoint].discard(relation_key)
+                        touched.add(endpoint)
+            self._entity_keys.discard(entity_key)
+            touched.add(entity_key)
+        for entity in added_entities:
+            self._add_entity_key(entity.canonical_key)
+            touched.add(entity.canonical_key)
+        for relation in added_relations:
+            replaced = self._relations.pop(relation.relation_key, None)
+            if replaced is not None:
+                for endpoint in (
+                    replaced.source_entity_key,
+                    replaced.target_entity_key,
+                ):
+                    self._relations_by_entity[endpoint].discard(
+                        replaced.relation_key
+                    )
+                    touched.add(endpoint)
+            self._add_relation(relation)
+            touched.update((relation.source_entity_key, relation.target_entity_key))
+
+        dirty: set[str] = set()
+        for entity_key in touched:
+            component_hash = self._component_of.get(entity_key)
+            if component_hash is None:
+                dirty.add(entity_key)
+                continue
+            dirty.update(self._drop_component(component_hash))
+        self._rebuild_components(
+            {entity_key for entity_key in dirty if entity_key in self._entity_keys}
+        )
+        return self.communities()
+
+    def apply_snapshot(
+        self,
+        *,
+        entities: Iterable[GraphEntityWrite],
+        relations: Iterable[GraphRelationWrite],
+    ) -> tuple[GraphCommunityWrite, ...]:
+        """Move to a full graph snapshot by applying only its difference."""
+
+        entities = tuple(entities)
+        relations = {relation.relation_key: relation for relation in relations}
+        kept_keys = {entity.canonical_key for entity in entities}
+        for relation in relations.values():
+            kept_keys.update((relation.source_entity_key, relation.target_entity_key))
+        return self.apply_delta(
+            added_entities=[
+                entity
+                for entity in entities
+                if entity.canonical_key not in self._entity_keys
+            ],
+            removed_entity_keys=sorted(self._entity_keys - kept_keys),
+            added_relations=[
+                relation
+                for key, relation in sorted(relations.items())
+                if self._relations.get(key) != relation
+            ],
+            removed_relation_keys=sorted(set(self._relations) - set(relations)),
+        )
+
+    def _add_entity_key(self, entity_key: str) -> None:
+        self._entity_keys.add(entity_key)
+        self._relations_by_entity.setdefault(entity_key, set())
+
+    def _add_relation(self, relation: GraphRelationWrite) -> None:
+        self._relations[relation.relation_key] = relation
+        for endpoint in (relation.source_entity_key, relation.target_entity_key):
+            self._add_entity_key(endpoint)
+            self._relations_by_entity[endpoint].add(relation.relation_key)
+
+    def _drop_component(self, component_hash: str) -> tuple[str, ...]:
+        members = self._components.pop(component_hash, ())
+        self._clustered.pop(component_hash, None)
+        for member in members:
+            self._component_of.pop(member, None)
+        return members
+
+    def _rebuild_components(self, entity_keys: set[str]) -> None:
+        visited: set[str] = set()
+        for seed in sorted(entity_keys):
+            if seed in visited:
+                continue
+            stack = [seed]
+            members: set[str] = set()
+            relation_keys: set[str] = set()
+            while stack:
+                current = stack.pop()
+                if current in visited:
+                    continue
+                visited.add(current)
+                members.add(current)
+                for relation_key in self._relations_by_entity[current]:
+                    relation_keys.add(relation_key)
+                    relation = self._relations[relation_key]
+                    for endpoint in (
+                        relation.source_entity_key,
+                        relation.target_entity_key,
+                    ):
+                        if endpoint not in visited:
+                            stack.append(endpoint)
+            member_tuple = tuple(sorted(members))
+            relations = [self._relations[key] for key in sorted(relation_keys)]
+            component_hash = _hash(
+                {
+                    "visibility_partition_hash": self.visibility_partition_hash,
+                    "entities": member_tuple,
+                    "relations": _component_relation_payload(relations),
+                    "algorithm": COMMUNITY_ALGORITHM_REVISION,
+                }
+            )
+            self._components[component_hash] = member_tuple
+            for member in member_tuple:
+                self._component_of[member] = component_hash
+            self._clustered[component_hash] = _cluster_component(
+                members=member_tuple,
+                relations=relations,
+                visibility_partition_hash=self.visibility_partition_hash,
+                component_hash=component_hash,
+            )
+
+
+__all__ = [
+    "COMMUNITY_ALGORITHM_REVISION",
+    "CSRGraph",
+    "VisibilityPartitionCommunityEngine",
+    "build_csr",
+    "louvain_levels",
+]
@@ -25,6 +25,131 @@ from .query_store_common import (
 )
 
 
+def search_document_sql(column: str) -> str:
+    """Lexical document of ``column``; must match the seed search index expressions."""
+    return (
+        "to_tsvector('simple'::regconfig, "
+        f"{column} || ' ' || public.knowledge_cjk_bigram_text({column}))"
+    )
+
+
+# Every seed predicate probes one table through its own index: expression
+# GIN indexes on ``search_document_sql`` and trigram indexes on the graph
+# tables, and the title/content and CJK bigram expression indexes on
+# ``external_docs``.
+GRAPH_SEED_SQL = AUTHORIZED_PROJECTIONS_CTE + f"""
+, graph_query AS (
+    SELECT CASE
+        WHEN %s = '' THEN
+            websearch_to_tsquery('simple', %s)
+        ELSE
+            websearch_to_tsquery('simple', %s)
+            || to_tsquery('simple', %s)
+    END AS value
+)
+, seed_mentions AS (
+    SELECT mention.mention_id
+    FROM knowledge_graph_entities AS entity
+    JOIN knowledge_graph_mentions AS mention
+      ON mention.entity_id = entity.entity_id
+    WHERE {search_document_sql("entity.canonical_key")} @@ (
+        SELECT graph_query.value FROM graph_query
+    )
+       OR entity.canonical_key ILIKE %s
+    UNION
+    SELECT mention.mention_id
+    FROM knowledge_graph_mentions AS mention
+    WHERE {search_document_sql("mention.surface_text")} @@ (
+        SELECT graph_query.value FROM graph_query
+    )
+       OR mention.surface_text ILIKE %s
+    UNION
+    SELECT mention.mention_id
+    FROM knowledge_projection_records AS record
+    JOIN knowledge_graph_mentions AS mention
+      ON mention.projection_record_id =
+         record.projection_record_id
+     AND mention.projection_revision_id =
+         record.projection_revision_id
+    WHERE {search_document_sql("record.search_text")} @@ (
+        SELECT graph_query.value FROM graph_query
+    )
+    UNION
+    SELECT mention.mention_id
+    FROM external_docs AS document
+    JOIN knowledge_evidence_units AS evidence
+      ON evidence.projection_revision_id =
+         document.projection_revision_id
+     AND (
+         document.metadata->>'chunk_id' = evidence.unit_key
+         OR document.source_id = evidence.unit_key
+     )
+    JOIN knowledge_graph_mentions AS mention
+      ON mention.evidence_unit_row_id =
+         evidence.evidence_unit_row_id
+     AND mention.projection_revision_id =
+         document.projection_revision_id
+     AND mention.knowledge_resource_id =
+         document.knowledge_resource_id
+    WHERE (
+        setweight(
+            to_tsvector(
+                'simple'::regconfig,
+                COALESCE(document.title, '')
+            ),
+            'A'
+        )
+        ||
+        setweight(
+            to_tsvector(
+                'simple'::regconfig,
+                COALESCE(document.content, '')
+            ),
+            'D'
+        )
+    ) @@ (SELECT graph_query.value FROM graph_query)
+       OR to_tsvector(
+              'simple'::regconfig,
+              public.knowledge_cjk_bigram_text(
+                  COALESCE(document.title, '')
+                  || ' '
+                  || COALESCE(document.content, '')
+              )
+          ) @@ (SELECT graph_query.value FROM graph_query)
+)
+SELECT
+    entity.entity_id,
+    entity.canonical_key,
+    MAX(mention.confidence) AS seed_score
+FROM authorized_projections AS authorized
+JOIN knowledge_graph_mentions AS mention
+  ON mention.projection_revision_id =
+     authorized.projection_revision_id
+ AND mention.knowledge_resource_id =
+     authorized.knowledge_resource_id
+ AND mention.security_label_id =
+     authorized.security_label_id
+JOIN seed_mentions AS seed
+  ON seed.mention_id = mention.mention_id
+JOIN knowledge_graph_entities AS entity
+  ON entity.entity_id = mention.entity_id
+WHERE %s::text IS NULL
+   OR EXISTS (
+       SELECT 1
+       FROM knowledge_embedding_channel_receipts AS channel
+       WHERE channel.projection_revision_id =
+             authorized.projection_revision_id
+         AND channel.evidence_unit_row_id =
+             mention.evidence_unit_row_id
+         AND channel.modality = %s
+         AND channel.state = 'active'
+   )
+GROUP BY entity.entity_id, entity.canonical_key
+ORDER BY seed_score DESC, entity.entity_id
+LIMIT %s
+"""
+
+
 class AuthorizationAwareKnowledgeGraphNeighborhoodMixin:
     def fetch_neighborhood_candidates(
         self,
@@ -80,97 +205,7 @@ class AuthorizationAwareKnowledgeGraphNeighborhoodMixin:
                 modality_filter=modality_filter,
             )
             cursor.execute(
-                AUTHORIZED_PROJECTIONS_CTE
-                + """
-                , graph_query AS (
-                    SELECT CASE
-                        WHEN %s = '' THEN
-                            websearch_to_tsquery('simple', %s)
-                        ELSE
-                            websearch_to_tsquery('simple', %s)
-                            || to_tsquery('simple', %s)
-                    END AS value
-                )
-                SELECT
-                    entity.entity_id,
-                    entity.canonical_key,
-                    MAX(mention.confidence) AS seed_score
-                FROM authorized_projections AS authorized
-                JOIN knowledge_graph_mentions AS mention
-                  ON mention.projection_revision_id =
-                     authorized.projection_revision_id
-                 AND mention.knowledge_resource_id =
-                     authorized.knowledge_resource_id
-                 AND mention.security_label_id =
-                     authorized.security_label_id
-                JOIN knowledge_graph_entities AS entity
-                  ON entity.entity_id = mention.entity_id
-                LEFT JOIN knowledge_evidence_units AS evidence
-                  ON evidence.evidence_unit_row_id =
-                     mention.evidence_unit_row_id
-                 AND evidence.projection_revision_id =
-                     authorized.projection_revision_id
-                LEFT JOIN external_docs AS document
-                  ON document.projection_revision_id =
-                     authorized.projection_revision_id
-                 AND document.knowledge_resource_id =
-                     authorized.knowledge_resource_id
-                 AND (
-                     document.metadata->>'chunk_id' = evidence.unit_key
-                     OR document.source_id = evidence.unit_key
-                 )
-                LEFT JOIN knowledge_projection_records AS record
-                  ON record.projection_record_id =
-                     mention.projection_record_id
-                 AND record.projection_revision_id =
-                     authorized.projection_revision_id
-                CROSS JOIN graph_query
-                WHERE (
-                    entity.canonical_key ILIKE %s
-                    OR mention.surface_text ILIKE %s
-                    OR to_tsvector(
-                        'simple',
-                        entity.canonical_key || ' ' || mention.surface_text
-                    ) @@ graph_query.value
-                    OR (
-                        setweight(
-                            to_tsvector(
-                                'simple',
-                                COALESCE(document.title, '')
-                            ),
-                            'A'
-                        )
-                        ||
-                        setweight(
-                            to_tsvector(
-                                'simple',
-                                COALESCE(document.content, '')
-                            ),
-                            'D'
-                        )
-                    ) @@ graph_query.value
-                    OR to_tsvector(
-                        'simple',
-                        COALESCE(record.search_text, '')
-                    ) @@ graph_query.value
-                )
-                  AND (
-                      %s::text IS NULL
-                      OR EXISTS (
-                          SELECT 1
-                          FROM knowledge_embedding_channel_receipts AS channel
-                          WHERE channel.projection_revision_id =
-                                authorized.projection_revision_id
-                            AND channel.evidence_unit_row_id =
-                                mention.evidence_unit_row_id
-                            AND channel.modality = %s
-                            AND channel.state = 'active'
-                      )
-                  )
-                GROUP BY entity.entity_id, entity.canonical_key
-                ORDER BY seed_score DESC, entity.entity_id
-                LIMIT %s
-                """,
+                GRAPH_SEED_SQL,
                 (
                     *common,
                     cjk_prefix_query,
@@ -363,4 +398,7 @@ class AuthorizationAwareKnowledgeGraphNeighborhoodMixin:
             connection.close()
 
 
-__all__ = ["AuthorizationAwareKnowledgeGraphNeighborhoodMixin"]
+__all__ = [
+    "AuthorizationAwareKnowledgeGraphNeighborhoodMixin",
+    "GRAPH_SEED_SQL",
+]
@@ -13,7 +13,8 @@ from backend.app.services.knowledge_authorization import (
     visibility_partition_hash_for_grants,
 )
 from backend.app.services.knowledge_graph.community import (
-    build_visibility_partitioned_communities,
+    COMMUNITY_ALGORITHM_REVISION,
+    update_visibility_partitioned_communities,
 )
 from backend.app.services.knowledge_graph.contracts import (
     GraphCommunityReportWrite,
@@ -273,7 +274,9 @@ async def compile_owner_object_projection(
             ),
         )
         visibility_hash = visibility_partition_hash_for_grants(grants)
-        communities = build_visibility_partitioned_communities(
+        # Recompiles of one object re-cluster only what its graph changed.
+        communities = update_visibility_partitioned_communities(
+            graph_key=f"{payload.workspace_id}:{source.source_ref}",
             entities=tuple(entities.values()),
             relations=tuple(relations),
             visibility_partition_hash=visibility_hash,
@@ -305,7 +308,7 @@ async def compile_owner_object_projection(
             for community in communities
         )
         graph = GraphProjectionWrite(
-            algorithm_revision="connected_components.v1",
+            algorithm_revision=COMMUNITY_ALGORITHM_REVISION,
             resolver_revision="owner_object_ref.v1",
             visibility_partition_hash=visibility_hash,
             entities=tuple(entities.values()),
@@ -0,0 +1,149 @@
+"""
+Versioned cache for EffectiveLensResolver.
+
+The graph, preset and workspace-override write paths bump in-process
+revision counters. A resolved lens is reused while the revisions it was
+built at still match, so the hot path is a few dictionary lookups. Entries
+also expire after a short TTL because writes made by another worker process
+do not bump this process's counters.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Optional, Tuple
+
+from app.models.graph import GraphNode, LensNodeState
+from app.models.lens_kernel import EffectiveLens
+
+_DEFAULT_TTL_SECONDS = 30.0
+_DEFAULT_MAX_ENTRIES = 512
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass
+class ResolvedLensEntry:
+    """Global preset merged with workspace overrides, without session layer."""
+
+    revisions: Tuple[int, int, int]
+    lens: EffectiveLens
+    graph_nodes: Dict[str, GraphNode]
+    node_index: Dict[str, int]
+    global_states: Dict[str, LensNodeState]
+    workspace_states: Dict[str, LensNodeState]
+    created_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class SessionLensEntry:
+    """A base entry with one session's overrides applied on top."""
+
+    base: ResolvedLensEntry
+    session_states: Dict[str, LensNodeState]
+    lens: EffectiveLens
+
+
+class EffectiveLensCache:
+    """Revision counters plus bounded LRU maps of resolved lenses."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.ttl_seconds = (
+            _env_float("LENS_RESOLVE_CACHE_TTL_SECONDS", _DEFAULT_TTL_SECONDS)
+            if ttl_seconds is None
+            else ttl_seconds
+        )
+        self.max_entries = max_entries or _DEFAULT_MAX_ENTRIES
+        self._lock = threading.Lock()
+        self._graph_revisions: Dict[str, int] = {}
+        self._preset_revision = 0
+        self._workspace_revisions: Dict[str, int] = {}
+        self._bases: "OrderedDict[Hashable, ResolvedLensEntry]" = OrderedDict()
+        self._sessions: "OrderedDict[Hashable, SessionLensEntry]" = OrderedDict()
+
+    def graph_changed(self, profile_id: str) -> None:
+        """A graph node of the profile was created, updated or deleted."""
+        with self._lock:
+            self._graph_revisions[profile_id] = self._graph_revisions.get(profile_id, 0) + 1
+
+    def presets_changed(self) -> None:
+        """A preset, its profile nodes or a workspace binding changed."""
+        with self._lock:
+            self._preset_revision += 1
+
+    def workspace_override_changed(self, workspace_id: str) -> None:
+        with self._lock:
+            self._workspace_revisions[workspace_id] = (
+                self._workspace_revisions.get(workspace_id, 0) + 1
+            )
+
+    def session_override_changed(self, session_id: str) -> None:
+        """Drop session entries; the next resolve re-applies the session layer."""
+        with self._lock:
+            for key in [key for key in self._sessions if key[2] == session_id]:
+                del self._sessions[key]
+
+    def revisions(
+        self, profile_id: str, workspace_id: Optional[str]
+    ) -> Tuple[int, int, int]:
+        return (
+            self._graph_revisions.get(profile_id, 0),
+            self._preset_revision,
+            self._workspace_revisions.get(workspace_id, 0) if workspace_id else 0,
+        )
+
+    def is_fresh(self, entry: ResolvedLensEntry) -> bool:
+        return time.monotonic() - entry.created_at <= self.ttl_seconds
+
+    def get_base(self, key: Hashable) -> Optional[ResolvedLensEntry]:
+        with self._lock:
+            entry = self._bases.get(key)
+            if entry is not None:
+                self._bases.move_to_end(key)
+            return entry
+
+    def put_base(self, key: Hashable, entry: ResolvedLensEntry) -> None:
+        with self._lock:
+            self._bases[key] = entry
+            self._bases.move_to_end(key)
+            while len(self._bases) > self.max_entries:
+                self._bases.popitem(last=False)
+
+    def get_session(self, key: Hashable) -> Optional[SessionLensEntry]:
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is not None:
+                self._sessions.move_to_end(key)
+            return entry
+
+    def put_session(self, key: Hashable, entry: SessionLensEntry) -> None:
+        with self._lock:
+            self._sessions[key] = entry
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.max_entries:
+                self._sessions.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bases.clear()
+            self._sessions.clear()
+
+
+_cache = EffectiveLensCache()
+
+
+def get_effective_lens_cache() -> EffectiveLensCache:
+    """Return the process-wide effective lens cache."""
+    return _cache
@@ -6,27 +6,39 @@ Resolves effective lens by merging:
 2. Workspace Override (workspace_lens_overrides)
 3. Session Override (session_override_store)
 """
-from typing import Optional, Dict, Literal
+from typing import Optional, Dict, Literal, Set, Tuple
 from datetime import datetime, timezone
 
 from app.services.stores.graph_store import GraphStore
 from app.services.lens.session_override_store import SessionOverrideStore
+from app.services.lens.effective_lens_cache import (
+    EffectiveLensCache,
+    ResolvedLensEntry,
+    SessionLensEntry,
+    get_effective_lens_cache,
+)
 from app.models.graph import GraphNode, LensNodeState
 from app.models.lens_kernel import (
     EffectiveLens, LensNode, compute_lens_hash
 )
 
 
+def _is_workspace_override(node: LensNode) -> bool:
+    return node.overridden_from == "global" and node.effective_scope == "workspace"
+
+
 class EffectiveLensResolver:
     """Resolve effective lens from three-layer stacking"""
 
     def __init__(
         self,
         graph_store: GraphStore,
-        session_store: SessionOverrideStore
+        session_store: SessionOverrideStore,
+        cache: Optional[EffectiveLensCache] = None
     ):
         self.graph_store = graph_store
         self.session_store = session_store
+        self.cache = cache or get_effective_lens_cache()
 
     def resolve(
         self,
@@ -37,6 +49,11 @@ class EffectiveLensResolver:
         """
         Resolve effective lens
 
+        The global and workspace layers are memoized per (profile, workspace)
+        and reused while the graph, preset and workspace override revisions
+        are unchanged. A workspace-only change re-merges just the overridden
+        nodes; the session layer is applied on top the same way.
+
         Args:
             profile_id: User profile ID
             workspace_id: Optional workspace ID
@@ -45,6 +62,59 @@ class EffectiveLensResolver:
         Returns:
             EffectiveLens with three-layer merged nodes
         """
+        revisions = self.cache.revisions(profile_id, workspace_id)
+        base_key = (profile_id, workspace_id)
+        base = self.cache.get_base(base_key)
+        if (
+            base is None
+            or not self.cache.is_fresh(base)
+            or base.revisions[:2] != revisions[:2]
+        ):
+            base = self._resolve_base(profile_id, workspace_id, revisions)
+            self.cache.put_base(base_key, base)
+        elif base.revisions != revisions:
+            base = self._refresh_workspace_layer(base, workspace_id, revisions)
+            self.cache.put_base(base_key, base)
+
+        session_states: Dict[str, LensNodeState] = {}
+        if session_id:
+            session_override = self.session_store.get(session_id)
+            if session_override:
+                session_states = dict(session_override)
+        if not session_states:
+            return self._copy_lens(base.lens, session_id)
+
+        session_key = (profile_id, workspace_id, session_id)
+        entry = self.cache.get_session(session_key)
+        if entry is not None and entry.base is base:
+            if entry.session_states == session_states:
+                return self._copy_lens(entry.lens, session_id)
+            start = entry.lens
+            changed = {
+                node_id
+                for node_id in set(entry.session_states) | set(session_states)
+                if entry.session_states.get(node_id) != session_states.get(node_id)
+            }
+        else:
+            start = base.lens
+            changed = set(session_states)
+
+        lens = self._remerge(
+            start, changed, base, base.workspace_states, session_states, session_id
+        )
+        self.cache.put_session(
+            session_key,
+            SessionLensEntry(base=base, session_states=session_states, lens=lens),
+        )
+        return self._copy_lens(lens, session_id)
+
+    def _resolve_base(
+        self,
+        profile_id: str,
+        workspace_id: Optional[str],
+        revisions: Tuple[int, int, int]
+    ) -> ResolvedLensEntry:
+        """Merge the global and workspace layers from the stores."""
         all_nodes = self.graph_store.list_nodes(profile_id=profile_id, is_active=True, limit=10000)
 
         global_preset = self.graph_store.get_active_lens(profile_id, workspace_id)
@@ -56,50 +126,118 @@ class EffectiveLensResolver:
             pn.node_id: pn.state for pn in global_profile_nodes
         }
 
-        workspace_states: Dict[str, LensNodeState] = {}
-        if workspace_id:
-            workspace_override = self.graph_store.get_workspace_override(workspace_id)
-            if workspace_override:
-                workspace_states = workspace_override
-
-        session_states: Dict[str, LensNodeState] = {}
-        if session_id:
-            session_override = self.session_store.get(session_id)
-            if session_override:
-                session_states = session_override
+        workspace_states = self._get_workspace_states(workspace_id)
 
         effective_nodes = []
         ws_override_count = 0
-        session_override_count = 0
 
         for node in all_nodes:
             result = self._merge_node_state(
                 node,
                 global_states.get(node.id),
                 workspace_states.get(node.id),
-                session_states.get(node.id)
+                None
             )
             effective_nodes.append(result)
+            ws_override_count += _is_workspace_override(result)
 
-            if result.overridden_from == "global" and result.effective_scope == "workspace":
-                ws_override_count += 1
-            if result.effective_scope == "session":
-                session_override_count += 1
-
-        lens_hash = compute_lens_hash(effective_nodes)
-
-        return EffectiveLens(
+        lens = EffectiveLens(
             profile_id=profile_id,
             workspace_id=workspace_id,
-            session_id=session_id,
+            session_id=None,
             nodes=effective_nodes,
             global_preset_id=global_preset.id,
             global_preset_name=global_preset.name,
             workspace_override_count=ws_override_count,
-            session_override_count=session_override_count,
-            hash=lens_hash,
+            session_override_count=0,
+            hash=compute_lens_hash(effective_nodes),
             computed_at=datetime.now(timezone.utc)
         )
+        return ResolvedLensEntry(
+            revisions=revisions,
+            lens=lens,
+            graph_nodes={node.id: node for node in all_nodes},
+            node_index={node.id: index for index, node in enumerate(all_nodes)},
+            global_states=global_states,
+            workspace_states=workspace_states,
+        )
+
+    def _refresh_workspace_layer(
+        self,
+        base: ResolvedLensEntry,
+        workspace_id: Optional[str],
+        revisions: Tuple[int, int, int]
+    ) -> ResolvedLensEntry:
+        """Re-merge only the nodes whose workspace override changed."""
+        workspace_states = self._get_workspace_states(workspace_id)
+        changed = {
+            node_id
+            for node_id in set(base.workspace_states) | set(workspace_states)
+            if base.workspace_states.get(node_id) != workspace_states.get(node_id)
+        }
+        lens = self._remerge(base.lens, changed, base, workspace_states, {}, None)
+        return ResolvedLensEntry(
+            revisions=revisions,
+            lens=lens,
+            graph_nodes=base.graph_nodes,
+            node_index=base.node_index,
+            global_states=base.global_states,
+            workspace_states=workspace_states,
+            # Keep the full-resolve time so the TTL still bounds staleness.
+            created_at=base.created_at,
+        )
+
+    def _get_workspace_states(self, workspace_id: Optional[str]) -> Dict[str, LensNodeState]:
+        if workspace_id:
+            workspace_override = self.graph_store.get_workspace_override(workspace_id)
+            if workspace_override:
+                return dict(workspace_override)
+        return {}
+
+    def _remerge(
+        self,
+        lens: EffectiveLens,
+        changed: Set[str],
+        base: ResolvedLensEntry,
+        workspace_states: Dict[str, LensNodeState],
+        session_states: Dict[str, LensNodeState],
+        session_id: Optional[str]
+    ) -> EffectiveLens:
+        """Copy ``lens`` with the ``changed`` node ids merged again."""
+        nodes = list(lens.nodes)
+        ws_override_count = lens.workspace_override_count
+        session_override_count = lens.session_override_count
+
+        for node_id in changed:
+            index = base.node_index.get(node_id)
+            if index is None:
+                continue
+            previous = nodes[index]
+            result = self._merge_node_state(
+                base.graph_nodes[node_id],
+                base.global_states.get(node_id),
+                workspace_states.get(node_id),
+                session_states.get(node_id)
+            )
+            nodes[index] = result
+            ws_override_count += _is_workspace_override(result) - _is_workspace_override(previous)
+            session_override_count += (
+                (result.effective_scope == "session") - (previous.effective_scope == "session")
+            )
+
+        return lens.model_copy(update={
+            "session_id": session_id,
+            "nodes": nodes,
+            "workspace_override_count": ws_override_count,
+            "session_override_count": session_override_count,
+            "hash": compute_lens_hash(nodes),
+            "computed_at": datetime.now(timezone.utc),
+        })
+
+    @staticmethod
+    def _copy_lens(lens: EffectiveLens, session_id: Optional[str]) -> EffectiveLens:
+        """Hand out a copy so callers never share a cached node list."""
+        return lens.model_copy(update={"session_id": session_id, "nodes": list(lens.nodes)})
 
     def _merge_node_state(
         self,
@@ -9,6 +9,7 @@ Session Override Store is pluggable to support different storage backends:
 from abc import ABC, abstractmethod
 from typing import Optional, Dict
 from app.models.graph import LensNodeState
+from app.services.lens.effective_lens_cache import get_effective_lens_cache
 
 
 class SessionOverrideStore(ABC):
@@ -53,14 +54,17 @@ class InMemorySessionStore(SessionOverrideStore):
     def set(self, session_id: str, overrides: Dict[str, LensNodeState]) -> None:
         """Set all session overrides (replace existing)"""
         self._cache[session_id] = overrides
+        get_effective_lens_cache().session_override_changed(session_id)
 
     def update(self, session_id: str, node_id: str, state: LensNodeState) -> None:
         """Update single node override"""
         if session_id not in self._cache:
             self._cache[session_id] = {}
         self._cache[session_id][node_id] = state
+        get_effective_lens_cache().session_override_changed(session_id)
 
     def clear(self, session_id: str) -> None:
         """Clear all session overrides"""
         self._cache.pop(session_id, None)
+        get_effective_lens_cache().session_override_changed(session_id)
 
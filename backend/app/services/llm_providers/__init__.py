@@ -11,6 +11,7 @@ from .vertex import VertexAIProvider
 from .ollama import OllamaProvider
 from .llama_cpp import LlamaCppProvider
 from .manager import LLMProviderManager
+from .client_pool import LLMClientRegistry, get_llm_client_registry
 
 __all__ = [
     "LLMProvider",
@@ -20,4 +21,6 @@ __all__ = [
     "OllamaProvider",
     "LlamaCppProvider",
     "LLMProviderManager",
+    "LLMClientRegistry",
+    "get_llm_client_registry",
 ]
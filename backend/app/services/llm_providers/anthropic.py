@@ -2,14 +2,28 @@
 Anthropic Claude LLM Provider
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from .base import LLMProvider
+from .client_pool import get_llm_client_registry
 
 logger = logging.getLogger(__name__)
 
 
+def _split_system_message(
+    messages: List[Dict[str, str]],
+) -> Tuple[str, List[Dict[str, str]]]:
+    system_message = ""
+    conversation_messages = []
+    for msg in messages:
+        if msg["role"] == "system":
+            system_message = msg["content"]
+        else:
+            conversation_messages.append(msg)
+    return system_message, conversation_messages
+
+
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude API provider"""
 
@@ -17,18 +31,8 @@ class AnthropicProvider(LLMProvider):
         self, messages: List[Dict[str, str]], model: str = ""
     ) -> str:
         try:
-            import anthropic
-
-            client = anthropic.AsyncAnthropic(api_key=self.api_key)
-
-            system_message = ""
-            conversation_messages = []
-
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_message = msg["content"]
-                else:
-                    conversation_messages.append(msg)
+            client = get_llm_client_registry().get_anthropic_client(self.api_key)
+            system_message, conversation_messages = _split_system_message(messages)
 
             response = await client.messages.create(
                 model=model,
@@ -45,3 +49,37 @@ class AnthropicProvider(LLMProvider):
         except Exception as e:
             logger.error(f"Anthropic API error: {e}")
             raise
+
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        max_completion_tokens: Optional[int] = None,
+    ):
+        """
+        Streaming chat completion - yields text deltas as they arrive
+        """
+        try:
+            client = get_llm_client_registry().get_anthropic_client(self.api_key)
+            system_message, conversation_messages = _split_system_message(messages)
+
+            stream = await client.messages.create(
+                model=model,
+                max_tokens=max_tokens or 2000,
+                temperature=temperature,
+                system=system_message,
+                messages=conversation_messages,
+                stream=True,
+            )
+            async for event in stream:
+                if event.type == "content_block_delta":
+                    text = getattr(event.delta, "text", None)
+                    if text:
+                        yield text
+        except ImportError:
+            raise Exception("Anthropic package not installed")
+        except Exception as e:
+            logger.error(f"Anthropic streaming API error: {e}", exc_info=True)
+            raise
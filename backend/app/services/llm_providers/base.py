@@ -2,12 +2,29 @@
 LLM Provider Base Class
 """
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+async def iter_chat_deltas(stream: Any) -> AsyncIterator[str]:
+    """Yield the text deltas of an OpenAI-compatible chat completion stream."""
+    async for chunk in stream:
+        if chunk.choices and len(chunk.choices) > 0:
+            content = getattr(chunk.choices[0].delta, "content", None)
+            if content:
+                yield content
+
+
+async def collect_stream(chunks: AsyncIterator[str]) -> str:
+    """Join streamed text chunks once instead of growing a string per chunk."""
+    parts: List[str] = []
+    async for chunk in chunks:
+        parts.append(chunk)
+    return "".join(parts)
+
+
 class LLMProvider:
     """Base class for LLM providers"""
 
@@ -0,0 +1,144 @@
+"""
+Process-wide registry of pooled LLM SDK clients.
+
+Providers used to build a new SDK client, and with it a new HTTP connection
+pool, on every call, so each request paid a fresh TCP/TLS handshake. Clients
+here are created once per (event loop, SDK, base URL, API key) and keep their
+connections alive between requests. Each base URL gets its own pool and
+limits. HTTP/2 is used for https endpoints when the optional ``h2`` package
+is installed.
+
+An httpx connection pool cannot be shared across loops, and its keep-alive
+connections hold the loop alive, so clients are only pooled on loops that
+were bound with ``bind_running_loop`` (the API server's main loop). Calls on
+any other loop, such as the short-lived ``asyncio.run`` loops of runner
+children and loaders, get an unpooled client that is dropped with the call.
+``aclose`` closes a bound loop's clients and unbinds it.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_CONNECTIONS = 100
+_DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+_DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_http_limits() -> Any:
+    """Connection limits applied to each base URL's pool."""
+    import httpx
+
+    return httpx.Limits(
+        max_connections=int(
+            _env_number("LLM_HTTP_MAX_CONNECTIONS", _DEFAULT_MAX_CONNECTIONS)
+        ),
+        max_keepalive_connections=int(
+            _env_number(
+                "LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS", _DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            )
+        ),
+        keepalive_expiry=_env_number(
+            "LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS", _DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+        ),
+    )
+
+
+def _use_http2(base_url: Optional[str]) -> bool:
+    # Providers without a base URL talk to the vendor's https API.
+    secure = base_url is None or base_url.startswith("https://")
+    return secure and http2_available()
+
+
+class LLMClientRegistry:
+    """Cache SDK clients per bound event loop and endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: Dict[asyncio.AbstractEventLoop, Dict[Hashable, Any]] = {}
+
+    def bind_running_loop(self) -> None:
+        """Pool clients on the running loop until ``aclose`` is awaited on it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._clients.setdefault(loop, {})
+
+    def _get_or_create(self, key: Tuple[Hashable, ...], factory) -> Any:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.get(loop)
+            if clients is not None:
+                client = clients.get(key)
+                if client is None:
+                    client = factory()
+                    clients[key] = client
+                    logger.debug("Created pooled LLM client for %s", key[:2])
+                return client
+        # Unbound loop: an unpooled client that goes away with the call.
+        return factory()
+
+    def get_openai_client(self, api_key: str, base_url: Optional[str] = None) -> Any:
+        """Return the pooled ``openai.AsyncOpenAI`` client for an endpoint."""
+        import openai
+
+        def _create():
+            client_kwargs: Dict[str, Any] = {
+                "api_key": api_key,
+                "http_client": openai.DefaultAsyncHttpxClient(
+                    limits=build_http_limits(), http2=_use_http2(base_url)
+                ),
+            }
+            if base_url:
+                client_kwargs["base_url"] = base_url
+            return openai.AsyncOpenAI(**client_kwargs)
+
+        return self._get_or_create(("openai", base_url, api_key), _create)
+
+    def get_anthropic_client(self, api_key: str) -> Any:
+        """Return the pooled ``anthropic.AsyncAnthropic`` client."""
+        import anthropic
+
+        def _create():
+            return anthropic.AsyncAnthropic(
+                api_key=api_key,
+                http_client=anthropic.DefaultAsyncHttpxClient(
+                    limits=build_http_limits(), http2=_use_http2(None)
+                ),
+            )
+
+        return self._get_or_create(("anthropic", None, api_key), _create)
+
+    async def aclose(self) -> None:
+        """Close the clients pooled on the running loop and unbind it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.pop(loop, {})
+        for client in clients.values():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close pooled LLM client: {e}")
+
+
+_registry = LLMClientRegistry()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """Return the process-wide LLM client registry."""
+    return _registry
@@ -5,7 +5,8 @@ Ollama LLM Provider (via OpenAI-compatible API)
 from typing import Dict, List, Optional
 import logging
 
-from .base import LLMProvider
+from .base import LLMProvider, collect_stream, iter_chat_deltas
+from .client_pool import get_llm_client_registry
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +33,9 @@ class OllamaProvider(LLMProvider):
         stream: bool = False,
     ) -> str:
         try:
-            import openai
-
-            client = openai.AsyncOpenAI(base_url=self.base_url, api_key=self.api_key)
+            client = get_llm_client_registry().get_openai_client(
+                self.api_key, base_url=self.base_url
+            )
 
             # Build request parameters
             request_params = {
@@ -51,12 +52,7 @@ class OllamaProvider(LLMProvider):
                 request_params["stream"] = True
                 stream = await client.chat.completions.create(**request_params)
 
-                full_text = ""
-                async for chunk in stream:
-                    if chunk.choices and len(chunk.choices) > 0:
-                        delta = chunk.choices[0].delta
-                        if hasattr(delta, "content") and delta.content:
-                            full_text += delta.content
+                full_text = await collect_stream(iter_chat_deltas(stream))
 
                 logger.info(
                     f"Ollama streaming response received: {len(full_text)} chars"
@@ -91,9 +87,9 @@ class OllamaProvider(LLMProvider):
         Streaming chat completion - returns stream object for SSE
         """
         try:
-            import openai
-
-            client = openai.AsyncOpenAI(base_url=self.base_url, api_key=self.api_key)
+            client = get_llm_client_registry().get_openai_client(
+                self.api_key, base_url=self.base_url
+            )
 
             request_params = {
                 "model": model,
@@ -106,11 +102,8 @@ class OllamaProvider(LLMProvider):
                 request_params["max_tokens"] = max_tokens
 
             stream = await client.chat.completions.create(**request_params)
-            async for chunk in stream:
-                if chunk.choices and len(chunk.choices) > 0:
-                    delta = chunk.choices[0].delta
-                    if hasattr(delta, "content") and delta.content:
-                        yield delta.content
+            async for content in iter_chat_deltas(stream):
+                yield content
         except ImportError:
             raise Exception("OpenAI package not installed (required for Ollama client)")
         except Exception as e:
@@ -5,7 +5,8 @@ OpenAI LLM Provider
 from typing import Dict, List, Optional
 import logging
 
-from .base import LLMProvider
+from .base import LLMProvider, collect_stream, iter_chat_deltas
+from .client_pool import get_llm_client_registry
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,9 @@ class OpenAIProvider(LLMProvider):
         stream: bool = False,
     ) -> str:
         try:
-            import openai
-
-            client_kwargs = {"api_key": self.api_key}
-            if getattr(self, "base_url", None):
-                client_kwargs["base_url"] = self.base_url
-            client = openai.AsyncOpenAI(**client_kwargs)
+            client = get_llm_client_registry().get_openai_client(
+                self.api_key, base_url=getattr(self, "base_url", None) or None
+            )
 
             # Build request parameters
             request_params = {
@@ -88,12 +86,7 @@ class OpenAIProvider(LLMProvider):
                 request_params["stream"] = True
                 stream = await client.chat.completions.create(**request_params)
 
-                full_text = ""
-                async for chunk in stream:
-                    if chunk.choices and len(chunk.choices) > 0:
-                        delta = chunk.choices[0].delta
-                        if hasattr(delta, "content") and delta.content:
-                            full_text += delta.content
+                full_text = await collect_stream(iter_chat_deltas(stream))
 
                 logger.info(f"LLM streaming response received: {len(full_text)} chars")
                 return full_text
@@ -158,12 +151,9 @@ class OpenAIProvider(LLMProvider):
             AsyncGenerator that yields chunks from OpenAI stream
         """
         try:
-            import openai
-
-            client_kwargs = {"api_key": self.api_key}
-            if getattr(self, "base_url", None):
-                client_kwargs["base_url"] = self.base_url
-            client = openai.AsyncOpenAI(**client_kwargs)
+            client = get_llm_client_registry().get_openai_client(
+                self.api_key, base_url=getattr(self, "base_url", None) or None
+            )
 
             # Build request parameters
             request_params = {
@@ -203,11 +193,8 @@ class OpenAIProvider(LLMProvider):
 
             # Create and return stream
             stream = await client.chat.completions.create(**request_params)
-            async for chunk in stream:
-                if chunk.choices and len(chunk.choices) > 0:
-                    delta = chunk.choices[0].delta
-                    if hasattr(delta, "content") and delta.content:
-                        yield delta.content
+            async for content in iter_chat_deltas(stream):
+                yield content
         except ImportError:
             raise Exception("OpenAI package not installed")
         except Exception as e:
@@ -5,12 +5,21 @@ Indexes local folder content into vector database for RAG retrieval.
 Supports markdown, text, and structured data files.
 """
 
+import asyncio
 import os
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 import hashlib
 
+from backend.app.services.incremental_file_index import (
+    FileChange,
+    FileManifest,
+    default_manifest_path,
+    embed_documents,
+    embedding_model_signature,
+    stream_incremental_index,
+)
 from backend.app.services.vector_search import VectorSearchService
 from backend.app.services.knowledge_authorization import RetrievalAccessContext
 from backend.app.services.knowledge_projection.legacy_document_facade import (
@@ -52,85 +61,157 @@ class LocalFolderIndexer:
             vector_service=self.vector_service
         )
 
-    async def index_folder(self, folder_path: str) -> Dict[str, Any]:
+    async def index_folder(
+        self, folder_path: str, *, incremental: bool = True
+    ) -> Dict[str, Any]:
         """
         Index all supported files in a folder
 
         Args:
             folder_path: Path to folder to index
-            user_id: User ID for indexing
+            incremental: Skip files unchanged since the last run with the
+                same embedding model and revoke deleted ones; False
+                re-indexes every file
 
         Returns:
             Dictionary with indexing results
         """
+        result: Dict[str, Any] = {"success": False, "files_indexed": 0}
+        errors = []
+        async for event in self.index_folder_stream(
+            folder_path, incremental=incremental
+        ):
+            if event["type"] == "error":
+                return {
+                    "success": False,
+                    "error": event["error"],
+                    "files_indexed": 0,
+                }
+            if event["type"] == "file_failed":
+                errors.append(f"Failed to index {event['path']}: {event['error']}")
+            elif event["type"] == "complete":
+                result = {
+                    "success": True,
+                    "folder_path": str(folder_path),
+                    "files_found": event["files_found"],
+                    "files_indexed": event["files_indexed"],
+                    "files_unchanged": event["files_unchanged"],
+                    "files_removed": event["files_removed"],
+                    "chunks_created": event["chunks_created"],
+                    "workspace_id": self.workspace_id,
+                }
+
+        if errors:
+            result["errors"] = errors
+
+        logger.info(
+            f"Indexing complete: {result.get('files_indexed', 0)} files, "
+            f"{result.get('chunks_created', 0)} chunks"
+        )
+        return result
+
+    async def index_folder_stream(
+        self, folder_path: str, *, incremental: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Index a folder and yield progress events as files complete
+
+        Yields the ``incremental_file_index`` events (``scan``,
+        ``file_indexed``, ``file_failed``, ``file_removed``, ``complete``),
+        or a single ``error`` event when the folder is unusable.
+        """
         folder = Path(folder_path)
 
         if not folder.exists():
             logger.error(f"Folder does not exist: {folder_path}")
-            return {
-                "success": False,
-                "error": f"Folder does not exist: {folder_path}",
-                "files_indexed": 0,
-            }
+            yield {"type": "error", "error": f"Folder does not exist: {folder_path}"}
+            return
 
         if not folder.is_dir():
             logger.error(f"Path is not a directory: {folder_path}")
-            return {
-                "success": False,
-                "error": f"Path is not a directory: {folder_path}",
-                "files_indexed": 0,
-            }
+            yield {"type": "error", "error": f"Path is not a directory: {folder_path}"}
+            return
+
+        if self.workspace_id is None or self.access_context is None:
+            raise PermissionError("local_folder_authorized_scope_required")
 
         # Scan for supported files
-        files = self._scan_files(folder)
+        files = await asyncio.to_thread(self._scan_files, folder)
         logger.info(f"Found {len(files)} supported files in {folder_path}")
 
-        indexed_count = 0
+        manifest = FileManifest(
+            default_manifest_path("local_folder", folder, self.workspace_id)
+            if incremental
+            else None
+        )
         chunk_count = 0
-        errors = []
 
-        for file_path in files:
+        async def index_batch(changes: Sequence[FileChange]) -> List[Optional[str]]:
+            nonlocal chunk_count
+            saved, errors = await self._index_changes(changes)
+            chunk_count += saved
+            return errors
+
+        async def remove(rel_path: str, annotations: Dict[str, str]) -> None:
+            await self._revoke_file(folder / rel_path)
+
+        async for event in stream_incremental_index(
+            folder,
+            files,
+            manifest,
+            index_batch=index_batch,
+            remove=remove,
+            embedding_model=await embedding_model_signature(self.vector_service),
+        ):
+            if event["type"] == "complete":
+                event["chunks_created"] = chunk_count
+            yield event
+
+    async def _index_changes(
+        self, changes: Sequence[FileChange]
+    ) -> tuple[int, List[Optional[str]]]:
+        """Chunk, batch-embed and save changed files; return (chunks, errors)."""
+        file_chunks = [self._chunk_content(change.content, max_len=500) for change in changes]
+        receipts = await embed_documents(
+            self.vector_service,
+            [chunk for chunks in file_chunks for chunk in chunks],
+        )
+
+        saved = 0
+        errors: List[Optional[str]] = []
+        offset = 0
+        for change, chunks in zip(changes, file_chunks):
+            file_receipts = receipts[offset : offset + len(chunks)]
+            offset += len(chunks)
             try:
-                # Read file content
-                content = self._read_file_content(file_path)
-                if not content:
+                if not chunks:
+                    # An emptied file keeps no chunks from its previous content.
+                    await self._revoke_file(change.path)
+                    errors.append(None)
                     continue
-
-                # Chunk content
-                chunks = self._chunk_content(content, max_len=500)
-
-                # Generate file hash for deduplication
-                file_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-
                 await self._save_file(
                     chunks=chunks,
-                    file_path=file_path,
-                    file_hash=file_hash,
+                    file_path=change.path,
+                    file_hash=change.content_hash,
+                    receipts=file_receipts,
                 )
-                chunk_count += len(chunks)
-
-                indexed_count += 1
-                logger.info(f"Indexed file: {file_path.name} ({len(chunks)} chunks)")
-
+                saved += len(chunks)
+                errors.append(None)
+                logger.info(f"Indexed file: {change.path.name} ({len(chunks)} chunks)")
             except Exception as e:
-                error_msg = f"Failed to index {file_path.name}: {str(e)}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-
-        result = {
-            "success": True,
-            "folder_path": str(folder_path),
-            "files_found": len(files),
-            "files_indexed": indexed_count,
-            "chunks_created": chunk_count,
-            "workspace_id": self.workspace_id,
-        }
+                logger.error(f"Failed to index {change.path.name}: {str(e)}")
+                errors.append(str(e))
+        return saved, errors
 
-        if errors:
-            result["errors"] = errors
-
-        logger.info(f"Indexing complete: {indexed_count} files, {chunk_count} chunks")
-        return result
+    async def _revoke_file(self, file_path: Path) -> None:
+        await asyncio.to_thread(
+            self.projection_facade.revoke_document,
+            access_context=self.access_context,
+            workspace_id=self.workspace_id,
+            owner_capability_code="local_folder",
+            source_app="local_folder",
+            source_id=str(file_path.resolve()),
+        )
 
     def _scan_files(self, folder: Path) -> List[Path]:
         """
@@ -152,23 +233,6 @@ class LocalFolderIndexer:
 
         return sorted(files)
 
-    def _read_file_content(self, file_path: Path) -> Optional[str]:
-        """
-        Read file content
-
-        Args:
-            file_path: Path to file
-
-        Returns:
-            File content as string or None if read fails
-        """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except Exception as e:
-            logger.warning(f"Failed to read file {file_path}: {e}")
-            return None
-
     def _chunk_content(
         self, content: str, max_len: int = 500, overlap: int = 50
     ) -> List[str]:
@@ -231,9 +295,11 @@ class LocalFolderIndexer:
         chunks: List[str],
         file_path: Path,
         file_hash: str,
+        receipts: Sequence[Any] = (),
     ) -> None:
         if self.workspace_id is None or self.access_context is None:
             raise PermissionError("local_folder_authorized_scope_required")
+        padded = list(receipts) + [None] * (len(chunks) - len(receipts))
         await self.projection_facade.replace_document(
             access_context=self.access_context,
             workspace_id=self.workspace_id,
@@ -254,9 +320,15 @@ class LocalFolderIndexer:
                         "file_hash": file_hash,
                         "chunk_index": index,
                         "total_chunks": len(chunks),
+                        **(
+                            {"embedding_model": receipt.model}
+                            if receipt is not None
+                            else {}
+                        ),
                     },
+                    embedding=receipt.embedding if receipt is not None else (),
                 )
-                for index, chunk in enumerate(chunks)
+                for index, (chunk, receipt) in enumerate(zip(chunks, padded))
             ),
         )
 
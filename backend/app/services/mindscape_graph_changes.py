@@ -0,0 +1,103 @@
+"""
+Change tracking for materialized mindscape graph fragments.
+
+Store writes record which timeline item or task changed in a per-workspace
+Redis set and bump a per-workspace version counter in the same pipeline.
+Graph reads compare the counter with the stored fragment and re-derive only
+the recorded sources. Recording is best effort; a missed change is healed
+when the fragment ages out and is re-derived in full.
+"""
+
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+from backend.app.services.cache.redis_cache import get_cache_service
+
+logger = logging.getLogger(__name__)
+
+GRAPH_CHANGE_TIMELINE = "timeline"
+GRAPH_CHANGE_TASK = "task"
+
+
+def graph_version_key(workspace_id: str) -> str:
+    return f"mindscape:graph:version:{workspace_id}"
+
+
+def graph_changes_key(workspace_id: str) -> str:
+    return f"mindscape:graph:changes:{workspace_id}"
+
+
+def record_graph_change(
+    workspace_id: Optional[str], kind: str, source_id: Optional[str]
+) -> bool:
+    """Mark a timeline item or task as changed for its workspace graph."""
+    if not workspace_id or not source_id:
+        return False
+    try:
+        cache = get_cache_service()
+        if not cache._ensure_connected() or not cache._client:
+            return False
+        pipe = cache._client.pipeline()
+        pipe.sadd(graph_changes_key(workspace_id), f"{kind}:{source_id}")
+        pipe.incr(graph_version_key(workspace_id))
+        pipe.execute()
+        return True
+    except Exception as exc:
+        logger.debug(
+            "Failed to record mindscape graph change %s:%s for %s: %s",
+            kind,
+            source_id,
+            workspace_id,
+            exc,
+        )
+        return False
+
+
+def read_graph_changes(workspace_id: str) -> Optional[Tuple[int, List[str]]]:
+    """
+    Return the workspace version and pending change members.
+
+    Returns None when Redis is unavailable, in which case callers cannot
+    trust a stored fragment and should derive from the stores.
+    """
+    try:
+        cache = get_cache_service()
+        if not cache._ensure_connected() or not cache._client:
+            return None
+        pipe = cache._client.pipeline(transaction=True)
+        pipe.get(graph_version_key(workspace_id))
+        pipe.smembers(graph_changes_key(workspace_id))
+        raw_version, members = pipe.execute()
+    except Exception as exc:
+        logger.debug("Failed to read mindscape graph changes for %s: %s", workspace_id, exc)
+        return None
+    return int(raw_version or 0), sorted(str(member) for member in members or ())
+
+
+def ack_graph_changes(workspace_id: str, members: Iterable[str]) -> None:
+    """Remove change members that a saved fragment already reflects."""
+    members = list(members)
+    if not members:
+        return
+    try:
+        cache = get_cache_service()
+        if not cache._ensure_connected() or not cache._client:
+            return
+        cache._client.srem(graph_changes_key(workspace_id), *members)
+    except Exception as exc:
+        logger.debug("Failed to ack mindscape graph changes for %s: %s", workspace_id, exc)
+
+
+def split_graph_changes(members: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Split change members into (timeline item ids, task ids)."""
+    timeline_ids: List[str] = []
+    task_ids: List[str] = []
+    for member in members:
+        kind, _, source_id = str(member).partition(":")
+        if not source_id:
+            continue
+        if kind == GRAPH_CHANGE_TIMELINE:
+            timeline_ids.append(source_id)
+        elif kind == GRAPH_CHANGE_TASK:
+            task_ids.append(source_id)
+    return timeline_ids, task_ids
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from backend.app.services.mindscape_graph_models import (
     EdgeOrigin,
@@ -18,28 +19,30 @@ from backend.app.services.mindscape_graph_models import (
     generate_node_id,
 )
 
+# Latest timeline items and tasks each workspace contributes to its graph.
+DERIVED_NODE_LIMIT = 500
+
 
 async def derive_graph(service: Any, scope_type: str, scope_id: str) -> MindscapeGraph:
     """
     Derive graph from existing data sources.
 
-    This generates the derived layer from timeline items, tasks, and artifacts.
+    Intent and execution nodes come from the materialized per-workspace
+    fragments, which are patched from recorded timeline and task changes;
+    edges are rebuilt over the combined node set. ``last_event_seq`` carries
+    the scope version so callers can tell whether anything changed.
     """
-    graph = MindscapeGraph(scope_type=scope_type, scope_id=scope_id)
-
-    from app.services.stores.postgres.timeline_items_store import (
-        PostgresTimelineItemsStore,
+    from backend.app.services.mindscape_graph_materialized import (
+        get_graph_materializer,
     )
-    from app.services.stores.tasks_store import TasksStore
-
-    timeline_store = PostgresTimelineItemsStore()
-    tasks_store = TasksStore()
 
+    graph = MindscapeGraph(scope_type=scope_type, scope_id=scope_id)
     workspace_ids = await get_workspace_ids(scope_type, scope_id)
 
+    nodes, version = await get_graph_materializer().load_scope_nodes(workspace_ids)
+    graph.nodes.extend(nodes)
+    graph.last_event_seq = version
     for workspace_id in workspace_ids:
-        await derive_from_timeline(graph, workspace_id, timeline_store, tasks_store)
-        await derive_from_executions(graph, workspace_id, tasks_store)
         await derive_from_artifacts(graph, workspace_id)
 
     derive_edges(graph)
@@ -54,7 +57,9 @@ async def get_workspace_ids(scope_type: str, scope_id: str) -> List[str]:
 
     from backend.app.services.workspace_groups.facade import WorkspaceGroupFacade
 
-    group = WorkspaceGroupFacade().get_explicit_topology(scope_id)
+    group = await asyncio.to_thread(
+        WorkspaceGroupFacade().get_explicit_topology, scope_id
+    )
     return [member.workspace_id for member in group.members] if group else []
 
 
@@ -62,119 +67,145 @@ async def derive_from_timeline(
     graph: MindscapeGraph, workspace_id: str, timeline_store: Any, tasks_store: Any
 ) -> None:
     """Derive intent nodes from timeline items with playbook associations."""
-    items = timeline_store.list_timeline_items_by_workspace(
-        workspace_id=workspace_id, limit=500
-    )
-    task_cache: Dict[str, Any] = {}
-
-    for item in items:
-        linked_playbook_codes: List[str] = []
-
-        if item.task_id:
-            if item.task_id not in task_cache:
-                task = tasks_store.get_task(item.task_id)
-                task_cache[item.task_id] = task
-            else:
-                task = task_cache[item.task_id]
-
-            if task:
-                if task.execution_context:
-                    playbook_code = task.execution_context.get("playbook_code")
-                    if playbook_code:
-                        linked_playbook_codes.append(playbook_code)
-
-                if task.params and not linked_playbook_codes:
-                    playbook_code = task.params.get("playbook_code")
-                    if playbook_code:
-                        linked_playbook_codes.append(playbook_code)
-
-        if item.data:
-            intent_analysis = item.data.get("intent_analysis", {})
-            if isinstance(intent_analysis, dict):
-                playbook_code = intent_analysis.get("playbook_code")
-                if playbook_code and playbook_code not in linked_playbook_codes:
-                    linked_playbook_codes.append(playbook_code)
-
-        project_id = None
-        if item.task_id and task_cache.get(item.task_id):
-            cached_task = task_cache[item.task_id]
-            project_id = getattr(cached_task, "project_id", None)
-
-        thread_id = None
-        if item.data and isinstance(item.data, dict):
-            thread_id = item.data.get("thread_id")
-
-        node = MindscapeNode(
-            id=generate_node_id(NodeIdPrefix.INTENT, item.id),
-            type="intent",
-            label=item.title or item.summary or "Untitled",
-            status=NodeStatus.SUGGESTED,
-            metadata={
-                "timeline_item_id": item.id,
-                "timeline_type": item.type.value if item.type else None,
-                "message_id": item.message_id,
-                "task_id": item.task_id,
-                "project_id": project_id,
-                "thread_id": thread_id,
-                "linked_playbook_codes": linked_playbook_codes,
-            },
-            created_at=item.created_at,
-        )
-        graph.nodes.append(node)
+    graph.nodes.extend(list_timeline_nodes(workspace_id, timeline_store, tasks_store))
 
 
 async def derive_from_executions(
     graph: MindscapeGraph, workspace_id: str, tasks_store: Any
 ) -> None:
     """Derive execution nodes from tasks with execution summary."""
-    tasks = tasks_store.list_tasks_by_workspace(workspace_id=workspace_id, limit=500)
+    graph.nodes.extend(list_execution_nodes(workspace_id, tasks_store))
+
+
+def list_timeline_nodes(
+    workspace_id: str, timeline_store: Any, tasks_store: Any
+) -> List[MindscapeNode]:
+    """Build intent nodes for the latest timeline items of a workspace."""
+    items = timeline_store.list_timeline_items_by_workspace(
+        workspace_id=workspace_id, limit=DERIVED_NODE_LIMIT
+    )
+    tasks_by_id = fetch_tasks_by_id(
+        tasks_store, [item.task_id for item in items if item.task_id]
+    )
+    return [build_intent_node(item, tasks_by_id.get(item.task_id)) for item in items]
+
+
+def list_execution_nodes(workspace_id: str, tasks_store: Any) -> List[MindscapeNode]:
+    """Build execution nodes for the latest tasks of a workspace."""
+    tasks = tasks_store.list_tasks_by_workspace(
+        workspace_id=workspace_id, limit=DERIVED_NODE_LIMIT
+    )
+    nodes = [build_execution_node(task) for task in tasks]
+    return [node for node in nodes if node is not None]
 
-    for task in tasks:
-        if not task.execution_id:
-            continue
 
-        run_number = 1
-        result_summary = None
-        artifact_count = 0
-        if task.result and isinstance(task.result, dict):
-            result_summary = task.result.get("summary") or task.result.get("message")
-            artifacts = task.result.get("artifacts", [])
-            artifact_count = len(artifacts) if isinstance(artifacts, list) else 0
+def fetch_tasks_by_id(tasks_store: Any, task_ids: List[str]) -> Dict[str, Any]:
+    """Load the given tasks with one batched store query."""
+    unique_ids = list(dict.fromkeys(task_ids))
+    if not unique_ids:
+        return {}
+    return {task.id: task for task in tasks_store.get_tasks_by_ids(unique_ids)}
 
-        playbook_code = None
+
+def build_intent_node(item: Any, task: Any = None) -> MindscapeNode:
+    """Build the intent node for a timeline item and its linked task."""
+    linked_playbook_codes: List[str] = []
+
+    if task:
         if task.execution_context:
             playbook_code = task.execution_context.get("playbook_code")
-        if not playbook_code and task.params:
+            if playbook_code:
+                linked_playbook_codes.append(playbook_code)
+
+        if task.params and not linked_playbook_codes:
             playbook_code = task.params.get("playbook_code")
+            if playbook_code:
+                linked_playbook_codes.append(playbook_code)
+
+    if item.data:
+        intent_analysis = item.data.get("intent_analysis", {})
+        if isinstance(intent_analysis, dict):
+            playbook_code = intent_analysis.get("playbook_code")
+            if playbook_code and playbook_code not in linked_playbook_codes:
+                linked_playbook_codes.append(playbook_code)
+
+    project_id = getattr(task, "project_id", None) if task else None
+
+    thread_id = None
+    if item.data and isinstance(item.data, dict):
+        thread_id = item.data.get("thread_id")
+
+    return MindscapeNode(
+        id=generate_node_id(NodeIdPrefix.INTENT, item.id),
+        type="intent",
+        label=item.title or item.summary or "Untitled",
+        status=NodeStatus.SUGGESTED,
+        metadata={
+            "timeline_item_id": item.id,
+            "timeline_type": item.type.value if item.type else None,
+            "message_id": item.message_id,
+            "task_id": item.task_id,
+            "project_id": project_id,
+            "thread_id": thread_id,
+            "linked_playbook_codes": linked_playbook_codes,
+        },
+        created_at=item.created_at,
+    )
 
-        node = MindscapeNode(
-            id=generate_node_id(NodeIdPrefix.EXECUTION, task.execution_id),
-            type="execution",
-            label=f"{task.pack_id}:{task.task_type}" if task.pack_id else task.task_type,
-            status=(
-                NodeStatus.ACCEPTED
-                if task.status.value == "succeeded"
-                else NodeStatus.SUGGESTED
-            ),
-            metadata={
-                "task_id": task.id,
-                "execution_id": task.execution_id,
-                "project_id": getattr(task, "project_id", None),
-                "pack_id": task.pack_id,
-                "task_type": task.task_type,
-                "status": task.status.value,
-                "run_number": run_number,
-                "playbook_code": playbook_code,
-                "result_summary": result_summary,
-                "artifact_count": artifact_count,
-                "completed_at": task.completed_at.isoformat()
-                if task.completed_at
-                else None,
-                "error": task.error,
-            },
-            created_at=task.created_at,
-        )
-        graph.nodes.append(node)
+
+def build_execution_node(task: Any) -> Optional[MindscapeNode]:
+    """Build the execution node for a task, or None if it never executed."""
+    if not task.execution_id:
+        return None
+
+    # Workspace task listings strip these payloads from "execution" tasks;
+    # ignore them here too so patched nodes match fully derived ones.
+    task_result = task.result if task.task_type != "execution" else None
+    execution_context = (
+        task.execution_context if task.task_type != "execution" else None
+    )
+
+    run_number = 1
+    result_summary = None
+    artifact_count = 0
+    if task_result and isinstance(task_result, dict):
+        result_summary = task_result.get("summary") or task_result.get("message")
+        artifacts = task_result.get("artifacts", [])
+        artifact_count = len(artifacts) if isinstance(artifacts, list) else 0
+
+    playbook_code = None
+    if execution_context:
+        playbook_code = execution_context.get("playbook_code")
+    if not playbook_code and task.params:
+        playbook_code = task.params.get("playbook_code")
+
+    return MindscapeNode(
+        id=generate_node_id(NodeIdPrefix.EXECUTION, task.execution_id),
+        type="execution",
+        label=f"{task.pack_id}:{task.task_type}" if task.pack_id else task.task_type,
+        status=(
+            NodeStatus.ACCEPTED
+            if task.status.value == "succeeded"
+            else NodeStatus.SUGGESTED
+        ),
+        metadata={
+            "task_id": task.id,
+            "execution_id": task.execution_id,
+            "project_id": getattr(task, "project_id", None),
+            "pack_id": task.pack_id,
+            "task_type": task.task_type,
+            "status": task.status.value,
+            "run_number": run_number,
+            "playbook_code": playbook_code,
+            "result_summary": result_summary,
+            "artifact_count": artifact_count,
+            "completed_at": task.completed_at.isoformat()
+            if task.completed_at
+            else None,
+            "error": task.error,
+        },
+        created_at=task.created_at,
+    )
 
 
 async def derive_from_artifacts(graph: MindscapeGraph, workspace_id: str) -> None:
@@ -268,24 +299,24 @@ def derive_edges(graph: MindscapeGraph) -> None:
                 )
             )
 
+    executions_by_task: Dict[str, List[MindscapeNode]] = {}
+    for node in graph.nodes:
+        if node.type == "execution" and node.metadata.get("task_id"):
+            executions_by_task.setdefault(node.metadata["task_id"], []).append(node)
+
     for node in graph.nodes:
         if node.type != "intent" or not node.metadata.get("task_id"):
             continue
-        task_id = node.metadata["task_id"]
-        for execution_node in graph.nodes:
-            if (
-                execution_node.type == "execution"
-                and execution_node.metadata.get("task_id") == task_id
-            ):
-                graph.edges.append(
-                    MindscapeEdge(
-                        id=generate_edge_id(
-                            node.id, execution_node.id, EdgeType.SPAWNS.value
-                        ),
-                        from_id=node.id,
-                        to_id=execution_node.id,
-                        type=EdgeType.SPAWNS,
-                        origin=EdgeOrigin.DERIVED,
-                        confidence=1.0,
-                    )
+        for execution_node in executions_by_task.get(node.metadata["task_id"], ()):
+            graph.edges.append(
+                MindscapeEdge(
+                    id=generate_edge_id(
+                        node.id, execution_node.id, EdgeType.SPAWNS.value
+                    ),
+                    from_id=node.id,
+                    to_id=execution_node.id,
+                    type=EdgeType.SPAWNS,
+                    origin=EdgeOrigin.DERIVED,
+                    confidence=1.0,
                 )
+            )
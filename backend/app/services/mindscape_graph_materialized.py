@@ -0,0 +1,316 @@
+"""
+Materialized per-workspace node fragments for the mindscape graph.
+
+Each workspace keeps its derived intent and execution nodes in
+``mindscape_graph_fragments`` together with the change-counter version they
+reflect (see ``mindscape_graph_changes``). A read serves the fragment as is
+when the version has not moved, re-derives only the recorded timeline items
+and tasks when it has, and falls back to a full derivation when there is no
+fragment, it is older than the max age, or Redis is unavailable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.app.services.mindscape_graph_changes import (
+    ack_graph_changes,
+    read_graph_changes,
+    split_graph_changes,
+)
+from backend.app.services.mindscape_graph_derivation import (
+    DERIVED_NODE_LIMIT,
+    build_execution_node,
+    build_intent_node,
+    fetch_tasks_by_id,
+    list_execution_nodes,
+    list_timeline_nodes,
+)
+from backend.app.services.mindscape_graph_models import (
+    MindscapeNode,
+    NodeIdPrefix,
+    NodeStatus,
+    _normalize_datetime,
+    generate_node_id,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_FRAGMENT_MAX_AGE_SECONDS = 900
+
+
+def _fragment_max_age_seconds() -> float:
+    try:
+        return float(
+            os.getenv(
+                "MINDSCAPE_GRAPH_FRAGMENT_MAX_AGE_SECONDS",
+                str(_DEFAULT_FRAGMENT_MAX_AGE_SECONDS),
+            )
+        )
+    except (TypeError, ValueError):
+        return float(_DEFAULT_FRAGMENT_MAX_AGE_SECONDS)
+
+
+def node_to_dict(node: MindscapeNode) -> Dict[str, Any]:
+    return {
+        "id": node.id,
+        "type": node.type,
+        "label": node.label,
+        "status": node.status.value,
+        "metadata": node.metadata,
+        "created_at": node.created_at.isoformat() if node.created_at else None,
+    }
+
+
+def node_from_dict(data: Dict[str, Any]) -> MindscapeNode:
+    created_at = data.get("created_at")
+    return MindscapeNode(
+        id=data["id"],
+        type=data["type"],
+        label=data.get("label") or "",
+        status=NodeStatus(data.get("status") or NodeStatus.SUGGESTED.value),
+        metadata=data.get("metadata") or {},
+        created_at=(
+            datetime.fromisoformat(created_at)
+            if created_at
+            else datetime.min.replace(tzinfo=timezone.utc)
+        ),
+    )
+
+
+def _newest(nodes: Iterable[MindscapeNode], node_type: str) -> List[MindscapeNode]:
+    typed = [node for node in nodes if node.type == node_type]
+    typed.sort(key=lambda node: _normalize_datetime(node.created_at), reverse=True)
+    return typed[:DERIVED_NODE_LIMIT]
+
+
+class MindscapeGraphMaterializer:
+    """Serve and incrementally maintain per-workspace graph fragments."""
+
+    def __init__(
+        self,
+        *,
+        fragment_store: Any = None,
+        timeline_store: Any = None,
+        tasks_store: Any = None,
+        max_age_seconds: Optional[float] = None,
+    ):
+        self._fragment_store = fragment_store
+        self._timeline_store = timeline_store
+        self._tasks_store = tasks_store
+        self._max_age_seconds = max_age_seconds
+
+    @property
+    def fragment_store(self) -> Any:
+        if self._fragment_store is None:
+            from backend.app.services.stores.mindscape_graph_fragment_store import (
+                MindscapeGraphFragmentStore,
+            )
+
+            self._fragment_store = MindscapeGraphFragmentStore()
+        return self._fragment_store
+
+    @property
+    def timeline_store(self) -> Any:
+        if self._timeline_store is None:
+            from app.services.stores.postgres.timeline_items_store import (
+                PostgresTimelineItemsStore,
+            )
+
+            self._timeline_store = PostgresTimelineItemsStore()
+        return self._timeline_store
+
+    @property
+    def tasks_store(self) -> Any:
+        if self._tasks_store is None:
+            from app.services.stores.tasks_store import TasksStore
+
+            self._tasks_store = TasksStore()
+        return self._tasks_store
+
+    async def load_scope_nodes(
+        self, workspace_ids: List[str]
+    ) -> Tuple[List[MindscapeNode], int]:
+        """
+        Load derived nodes for every workspace in a scope.
+
+        Workspaces are loaded concurrently off the event loop. Returns the
+        nodes in workspace order and the summed workspace versions, which
+        only grows as changes are recorded.
+        """
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self.load_workspace_nodes, workspace_id)
+                for workspace_id in workspace_ids
+            )
+        )
+        nodes: List[MindscapeNode] = []
+        version = 0
+        for workspace_nodes, workspace_version in results:
+            nodes.extend(workspace_nodes)
+            version += workspace_version
+        return nodes, version
+
+    def load_workspace_nodes(self, workspace_id: str) -> Tuple[List[MindscapeNode], int]:
+        """Return the current derived nodes and version for one workspace."""
+        changes = read_graph_changes(workspace_id)
+        if changes is None:
+            return self.derive_workspace_nodes(workspace_id), 0
+        version, members = changes
+
+        fragment = self._get_fragment(workspace_id)
+        if fragment is not None and fragment.version == version and not members:
+            return [node_from_dict(data) for data in fragment.nodes], version
+
+        if (
+            fragment is None
+            or fragment.version > version
+            or (fragment.version < version and not members)
+            or self._is_expired(fragment)
+        ):
+            derived_at = datetime.now(timezone.utc)
+            nodes = self.derive_workspace_nodes(workspace_id)
+        else:
+            # Patches keep the full derivation time so the fragment still
+            # ages out and heals any change that failed to record.
+            derived_at = fragment.derived_at
+            nodes = self.patch_workspace_nodes(
+                workspace_id,
+                [node_from_dict(data) for data in fragment.nodes],
+                members,
+            )
+
+        if self._save_fragment(workspace_id, version, nodes, derived_at):
+            ack_graph_changes(workspace_id, members)
+        return nodes, version
+
+    def derive_workspace_nodes(self, workspace_id: str) -> List[MindscapeNode]:
+        """Derive a workspace's nodes from the stores from scratch."""
+        return list_timeline_nodes(
+            workspace_id, self.timeline_store, self.tasks_store
+        ) + list_execution_nodes(workspace_id, self.tasks_store)
+
+    def patch_workspace_nodes(
+        self,
+        workspace_id: str,
+        nodes: List[MindscapeNode],
+        members: Iterable[str],
+    ) -> List[MindscapeNode]:
+        """Re-derive only the nodes touched by the recorded changes."""
+        timeline_ids, task_ids = split_graph_changes(members)
+        changed_timeline_ids: Set[str] = set(timeline_ids)
+        changed_task_ids: Set[str] = set(task_ids)
+        nodes_by_id: Dict[str, MindscapeNode] = {node.id: node for node in nodes}
+
+        tasks_by_id: Dict[str, Any] = {}
+        if changed_task_ids:
+            tasks_by_id = fetch_tasks_by_id(self.tasks_store, sorted(changed_task_ids))
+            for node in list(nodes_by_id.values()):
+                task_id = node.metadata.get("task_id")
+                if task_id not in changed_task_ids:
+                    continue
+                if node.type == "execution":
+                    del nodes_by_id[node.id]
+                elif node.type == "intent" and node.metadata.get("timeline_item_id"):
+                    # Intent nodes copy playbook and project from their task.
+                    changed_timeline_ids.add(node.metadata["timeline_item_id"])
+            for task in tasks_by_id.values():
+                if task.workspace_id != workspace_id:
+                    continue
+                execution_node = build_execution_node(task)
+                if execution_node is not None:
+                    nodes_by_id[execution_node.id] = execution_node
+
+        if changed_timeline_ids:
+            items = self.timeline_store.list_timeline_items_by_ids(
+                sorted(changed_timeline_ids)
+            )
+            tasks_by_id.update(
+                fetch_tasks_by_id(
+                    self.tasks_store,
+                    sorted(
+                        {
+                            item.task_id
+                            for item in items
+                            if item.task_id and item.task_id not in tasks_by_id
+                        }
+                    ),
+                )
+            )
+            for item_id in changed_timeline_ids:
+                nodes_by_id.pop(generate_node_id(NodeIdPrefix.INTENT, item_id), None)
+            for item in items:
+                if item.workspace_id != workspace_id:
+                    continue
+                intent_node = build_intent_node(item, tasks_by_id.get(item.task_id))
+                nodes_by_id[intent_node.id] = intent_node
+
+        return _newest(nodes_by_id.values(), "intent") + _newest(
+            nodes_by_id.values(), "execution"
+        )
+
+    def _is_expired(self, fragment: Any) -> bool:
+        max_age = (
+            self._max_age_seconds
+            if self._max_age_seconds is not None
+            else _fragment_max_age_seconds()
+        )
+        if max_age <= 0 or fragment.derived_at is None:
+            return True
+        age = datetime.now(timezone.utc) - _normalize_datetime(fragment.derived_at)
+        return age.total_seconds() > max_age
+
+    def _get_fragment(self, workspace_id: str) -> Any:
+        try:
+            return self.fragment_store.get_fragment(workspace_id)
+        except Exception as exc:
+            logger.warning(
+                "Failed to load mindscape graph fragment for %s: %s", workspace_id, exc
+            )
+            return None
+
+    def _save_fragment(
+        self,
+        workspace_id: str,
+        version: int,
+        nodes: List[MindscapeNode],
+        derived_at: datetime,
+    ) -> bool:
+        from backend.app.services.stores.mindscape_graph_fragment_store import (
+            GraphFragment,
+        )
+
+        try:
+            self.fragment_store.save_fragment(
+                GraphFragment(
+                    workspace_id=workspace_id,
+                    version=version,
+                    nodes=[node_to_dict(node) for node in nodes],
+                    derived_at=derived_at,
+                )
+            )
+            return True
+        except Exception as exc:
+            logger.warning(
+                "Failed to save mindscape graph fragment for %s: %s", workspace_id, exc
+            )
+            return False
+
+
+_materializer: Optional[MindscapeGraphMaterializer] = None
+_materializer_lock = threading.Lock()
+
+
+def get_graph_materializer() -> MindscapeGraphMaterializer:
+    """Return the process-wide graph materializer."""
+    global _materializer
+    if _materializer is None:
+        with _materializer_lock:
+            if _materializer is None:
+                _materializer = MindscapeGraphMaterializer()
+    return _materializer
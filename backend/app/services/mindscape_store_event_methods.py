@@ -38,6 +38,27 @@ class MindscapeStoreEventMixin:
         """
         return self.events.create_event(event, generate_embedding=generate_embedding)
 
+    def create_events(
+        self, events: List[MindEvent], generate_embedding: bool = False
+    ) -> List[MindEvent]:
+        """
+        Create a burst of mindspace events in one write
+
+        Args:
+            events: MindEvents to create
+            generate_embedding: Whether to generate embeddings for these events
+
+        Returns:
+            Created MindEvents
+        """
+        create_events = getattr(self.events, "create_events", None)
+        if create_events is None:
+            return [
+                self.events.create_event(event, generate_embedding=generate_embedding)
+                for event in events
+            ]
+        return create_events(events, generate_embedding=generate_embedding)
+
     def get_event(self, event_id: str) -> Optional[MindEvent]:
         """
         Get a single event by ID
@@ -0,0 +1,102 @@
+"""In-process content-hash cache of executable composition graph node outputs."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+_DEFAULT_MAX_ENTRIES = 256
+
+
+def _max_entries() -> int:
+    try:
+        return max(0, int(os.getenv("COMPOSITION_GRAPH_NODE_OUTPUT_CACHE_SIZE", "")))
+    except (TypeError, ValueError):
+        return _DEFAULT_MAX_ENTRIES
+
+
+def node_output_cache_key(
+    *,
+    workspace_id: str,
+    node_type: str,
+    executor_backend: str,
+    payload: Dict[str, Any],
+    input_values: Dict[str, Any],
+) -> str:
+    """Hash everything a node executor sees that decides its outputs."""
+    content = json.dumps(
+        jsonable_encoder(
+            {
+                "workspace_id": workspace_id,
+                "node_type": node_type,
+                "executor": executor_backend,
+                "payload": payload,
+                "input_values": input_values,
+            }
+        ),
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class CompositionGraphNodeOutputCache:
+    """
+    Bounded LRU of succeeded node results.
+
+    Only providers that opt in with ``metadata.cacheable = true`` use it. A
+    rerun of an unchanged subgraph of such nodes hashes to the same keys, so
+    they replay the stored outputs instead of calling the pack executor
+    again. Downstream nodes of a changed node see new input values and miss.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None) -> None:
+        self._max_entries = _max_entries() if max_entries is None else max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry)
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = copy.deepcopy(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_NODE_OUTPUT_CACHE = CompositionGraphNodeOutputCache()
+
+
+def get_node_output_cache() -> CompositionGraphNodeOutputCache:
+    """Return the process-wide node output cache."""
+    return _NODE_OUTPUT_CACHE
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict, deque
-from typing import Any, Dict, Iterable, List, Sequence
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from backend.app.models.object_runtime import (
     CompositionGraphDiagnostic,
@@ -18,11 +19,18 @@ from backend.app.services.object_runtime.common import _invoke_backend_callable
 from backend.app.services.object_runtime.composition_graph_node_registry import (
     render_runtime_lock_key,
 )
+from backend.app.services.object_runtime.composition_graph_output_cache import (
+    CompositionGraphNodeOutputCache,
+    get_node_output_cache,
+    node_output_cache_key,
+)
 from backend.app.services.object_runtime.composition_graph_run_store import (
     CompositionGraphRunStore,
     utc_iso,
 )
 
+logger = logging.getLogger(__name__)
+
 CORE_OBJECT_REFERENCE_NODE_TYPE = "object_reference"
 _RUNTIME_LOCKS: Dict[str, asyncio.Semaphore] = {}
 
@@ -35,10 +43,15 @@ class CompositionGraphRunner:
         *,
         run_store: CompositionGraphRunStore,
         provider_nodes: Dict[str, CompositionGraphNodeProviderNode],
+        output_cache: Optional[CompositionGraphNodeOutputCache] = None,
     ) -> None:
         self.run_store = run_store
         self.provider_nodes = provider_nodes
+        self.output_cache = (
+            output_cache if output_cache is not None else get_node_output_cache()
+        )
         self._state_lock = asyncio.Lock()
+        self._flush_handle: Optional[asyncio.Handle] = None
 
     async def run(self, run: CompositionGraphRun) -> CompositionGraphRun:
         self._run = self.run_store.update_run(
@@ -53,6 +66,7 @@ class CompositionGraphRunner:
         try:
             await self._run_dag()
         except Exception as exc:
+            self._cancel_flush()
             diagnostic = self._diagnostic(
                 "graph_run_failed",
                 f"Composition graph run failed: {exc}",
@@ -72,22 +86,39 @@ class CompositionGraphRunner:
         node_by_id = {node.id: node for node in self._run.nodes}
         node_order = [node.id for node in self._run.nodes]
         incoming, outgoing, in_degree = self._build_graph(self._run.nodes, self._run.edges)
-        ready = deque([node_id for node_id in node_order if in_degree[node_id] == 0])
+        running: Dict[asyncio.Task, str] = {}
         completed: set[str] = set()
 
-        while ready:
-            batch = list(ready)
-            ready.clear()
-            await asyncio.gather(
-                *(self._execute_node(node_by_id[node_id], incoming[node_id]) for node_id in batch)
+        def start(node_id: str) -> None:
+            task = asyncio.create_task(
+                self._execute_node(node_by_id[node_id], incoming[node_id])
+            )
+            running[task] = node_id
+
+        # Start each node as soon as its own upstream nodes are done instead
+        # of waiting for the slowest node of a whole level.
+        for node_id in node_order:
+            if in_degree[node_id] == 0:
+                start(node_id)
+
+        while running:
+            done, _ = await asyncio.wait(
+                running.keys(), return_when=asyncio.FIRST_COMPLETED
             )
-            for node_id in batch:
+            for task in done:
+                node_id = running.pop(task)
+                if task.exception() is not None:
+                    for other in running:
+                        other.cancel()
+                    await asyncio.gather(*running, return_exceptions=True)
+                    raise task.exception()
                 completed.add(node_id)
                 for target_id in outgoing[node_id]:
                     in_degree[target_id] -= 1
                     if in_degree[target_id] == 0:
-                        ready.append(target_id)
+                        start(target_id)
 
+        self._cancel_flush()
         if len(completed) != len(node_by_id):
             diagnostic = self._diagnostic(
                 "graph_cycle_detected",
@@ -177,6 +208,31 @@ class CompositionGraphRunner:
             )
             return
 
+        cache_key = None
+        # Only providers that declare themselves pure are memoized; media and
+        # generation nodes, or outputs pointing at artifacts, must re-execute.
+        if provider.metadata.get("cacheable") is True:
+            cache_key = node_output_cache_key(
+                workspace_id=self._run.workspace_id,
+                node_type=node.type,
+                executor_backend=provider.executor.backend,
+                payload=node.payload,
+                input_values=input_values,
+            )
+            cached = self.output_cache.get(cache_key)
+            if cached is not None:
+                await self._set_node_state(
+                    node.id,
+                    status="succeeded",
+                    input_values=input_values,
+                    outputs=cached["outputs"],
+                    diagnostics=[],
+                    metadata={**cached["metadata"], "output_cache": "hit"},
+                    started=True,
+                    completed=True,
+                )
+                return
+
         lock_key = None
         if provider.runtime_lock is not None:
             lock_key = render_runtime_lock_key(
@@ -186,17 +242,18 @@ class CompositionGraphRunner:
             )
         semaphore = _RUNTIME_LOCKS.setdefault(lock_key, asyncio.Semaphore(1)) if lock_key else None
         if semaphore is None:
-            await self._invoke_provider_node(node, provider, input_values)
+            await self._invoke_provider_node(node, provider, input_values, cache_key)
             return
 
         async with semaphore:
-            await self._invoke_provider_node(node, provider, input_values)
+            await self._invoke_provider_node(node, provider, input_values, cache_key)
 
     async def _invoke_provider_node(
         self,
         node: CompositionGraphNode,
         provider: CompositionGraphNodeProviderNode,
         input_values: Dict[str, Any],
+        cache_key: Optional[str] = None,
     ) -> None:
         await self._set_node_state(
             node.id,
@@ -234,6 +291,14 @@ class CompositionGraphRunner:
                 ],
                 "metadata": {},
             }
+        if cache_key is not None and normalized["status"] == "succeeded":
+            self.output_cache.put(
+                cache_key,
+                {
+                    "outputs": self._sanitize_outputs(normalized["outputs"]),
+                    "metadata": normalized["metadata"],
+                },
+            )
         await self._set_node_state(
             node.id,
             status=normalized["status"],
@@ -271,7 +336,31 @@ class CompositionGraphRunner:
             if completed:
                 update["completed_at"] = utc_iso()
             self._run.node_states[node_id] = state.model_copy(update=update)
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Persist node-state changes once per loop tick instead of per change."""
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(
+                self._flush_node_states
+            )
+
+    def _cancel_flush(self) -> None:
+        """Drop a pending flush; the caller is about to write the full run."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    def _flush_node_states(self) -> None:
+        self._flush_handle = None
+        try:
             self._run = self.run_store.update_run(self._run)
+        except Exception as exc:
+            logger.warning(
+                "Failed to persist composition graph run %s node states: %s",
+                self._run.id,
+                exc,
+            )
 
     def _input_values(self, incoming_edges: Sequence[CompositionGraphEdge]) -> Dict[str, Any]:
         values: Dict[str, Any] = {}
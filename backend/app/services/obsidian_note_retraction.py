@@ -0,0 +1,145 @@
+"""
+Retraction of Obsidian notes deleted from a vault.
+
+Every synced note revision is stored as an ``obsidian_note_updated`` row in
+``mind_events`` and may carry an embedding in the vector DB
+(``memory_embeddings``, or ``mindscape_personal`` after an embedding
+migration). When a note disappears from the vault, its embeddings are revoked
+so retrieval stops returning it, and an ``obsidian_note_deleted`` tombstone
+event is appended. The revision history itself is kept. A failure before the
+tombstone is written raises, so the next sync retries the whole note.
+"""
+
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import List, Sequence
+
+from sqlalchemy import text
+
+from backend.app.models.mindscape import EventActor, EventType, MindEvent
+
+logger = logging.getLogger(__name__)
+
+
+def find_note_event_ids(
+    events_store, vault_path: str, note_paths: Sequence[str]
+) -> List[str]:
+    """Return the ids of every synced revision of ``note_paths``."""
+    if not note_paths:
+        return []
+    with events_store.get_connection() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT id FROM mind_events
+                WHERE event_type = :event_type
+                  AND payload->>'vault_path' = :vault_path
+                  AND payload->>'note_path' = ANY(:note_paths)
+                """
+            ),
+            {
+                "event_type": EventType.OBSIDIAN_NOTE_UPDATED.value,
+                "vault_path": vault_path,
+                "note_paths": list(note_paths),
+            },
+        ).fetchall()
+    return [str(row[0]) for row in rows]
+
+
+def delete_event_embeddings(event_ids: Sequence[str]) -> int:
+    """Delete the vector DB embeddings generated for ``event_ids``."""
+    if not event_ids:
+        return 0
+    from backend.app.database.vector_connection import get_vector_dbapi_connection
+
+    conn = get_vector_dbapi_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                DELETE FROM memory_embeddings
+                WHERE source_type = 'mind_event' AND source_id = ANY(%s)
+                """,
+                (list(event_ids),),
+            )
+            deleted = cursor.rowcount or 0
+            cursor.execute(
+                """
+                DELETE FROM mindscape_personal
+                WHERE source_type = 'mind_event'
+                  AND metadata->>'source_id' = ANY(%s)
+                """,
+                (list(event_ids),),
+            )
+            deleted += cursor.rowcount or 0
+        conn.commit()
+        return deleted
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def build_note_deleted_events(
+    vault_path: str,
+    note_paths: Sequence[str],
+    *,
+    profile_id: str = "default-user",
+) -> List[MindEvent]:
+    """Build one tombstone event per note removed from ``vault_path``."""
+    deleted_at = datetime.now(timezone.utc)
+    return [
+        MindEvent(
+            id=str(uuid.uuid4()),
+            timestamp=deleted_at,
+            actor=EventActor.SYSTEM,
+            channel="obsidian_sync",
+            profile_id=profile_id,
+            event_type=EventType.OBSIDIAN_NOTE_DELETED,
+            payload={"note_path": note_path, "vault_path": vault_path},
+            metadata={"source": "obsidian_vault", "vault_path": vault_path},
+        )
+        for note_path in note_paths
+    ]
+
+
+def retract_deleted_notes(
+    events_store,
+    vault_path: str,
+    note_paths: Sequence[str],
+    *,
+    profile_id: str = "default-user",
+) -> int:
+    """
+    Revoke the embeddings of notes removed from ``vault_path`` and tombstone them.
+
+    The notes' ``mind_events`` history is kept. Returns the number of note
+    revisions whose embeddings were revoked. Raises on failure so the caller
+    can keep the notes in its manifest and retry on the next sync.
+    """
+    if not note_paths:
+        return 0
+    event_ids = find_note_event_ids(events_store, vault_path, note_paths)
+    embeddings = delete_event_embeddings(event_ids)
+    events_store.create_events(
+        build_note_deleted_events(vault_path, note_paths, profile_id=profile_id),
+        generate_embedding=False,
+    )
+    logger.info(
+        "Revoked %d embeddings of %d revisions and tombstoned %d deleted notes in %s",
+        embeddings,
+        len(event_ids),
+        len(note_paths),
+        vault_path,
+    )
+    return len(event_ids)
+
+
+__all__ = [
+    "build_note_deleted_events",
+    "delete_event_embeddings",
+    "find_note_event_ids",
+    "retract_deleted_notes",
+]
@@ -11,6 +11,12 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from backend.app.services.incremental_file_index import (
+    FileManifest,
+    ManifestEntry,
+    detect_changes,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +27,8 @@ class ObsidianScanner:
     Features:
     - Detects new/updated notes
     - Filters by folder/tag criteria
-    - Hash-based change detection
+    - Manifest-based change detection (stat first, then content hash)
+    - Tombstones notes deleted from the vault
     - Emits events for embedding pipeline
     """
 
@@ -36,29 +43,30 @@ class ObsidianScanner:
         self.include_folders = include_folders or []
         self.exclude_folders = exclude_folders or [".obsidian", "Templates"]
         self.include_tags = include_tags or ["research", "paper", "project"]
-        self._note_hashes: Dict[str, str] = {}
-        self._load_hash_cache()
+        self.manifest = FileManifest(self.vault_path / ".mindscape_manifest.json")
+        self.deleted_notes: List[str] = []
+        self._seed_from_hash_cache()
 
-    def _load_hash_cache(self):
-        """Load hash cache from disk (optional, for persistence)"""
-        cache_file = self.vault_path / ".mindscape_hashes.json"
-        if cache_file.exists():
-            try:
-                import json
-                with open(cache_file, "r") as f:
-                    self._note_hashes = json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load hash cache: {e}")
+    def _seed_from_hash_cache(self):
+        """Adopt hashes from the legacy ``.mindscape_hashes.json`` cache.
 
-    def _save_hash_cache(self):
-        """Save hash cache to disk"""
+        Seeded entries carry no stat, so the first scan re-hashes each note
+        once but only emits events for notes whose content really changed.
+        """
         cache_file = self.vault_path / ".mindscape_hashes.json"
+        if self.manifest.entries or not cache_file.exists():
+            return
         try:
             import json
-            with open(cache_file, "w") as f:
-                json.dump(self._note_hashes, f, indent=2)
+            with open(cache_file, "r") as f:
+                note_hashes = json.load(f)
         except Exception as e:
-            logger.warning(f"Failed to save hash cache: {e}")
+            logger.warning(f"Failed to load hash cache: {e}")
+            return
+        for rel_path, content_hash in note_hashes.items():
+            self.manifest.entries[rel_path] = ManifestEntry(
+                mtime_ns=-1, size=-1, content_hash=content_hash
+            )
 
     def _should_process_note(self, note_path: Path, tags: List[str]) -> bool:
         """Check if note should be processed for embedding"""
@@ -92,63 +100,70 @@ class ObsidianScanner:
         """
         from backend.app.services.tools.obsidian.obsidian_tools import parse_frontmatter, extract_tags
 
-        events = []
-
-        for md_file in self.vault_path.rglob("*.md"):
-            if ".obsidian" in md_file.parts:
-                continue
+        notes = [
+            md_file
+            for md_file in self.vault_path.rglob("*.md")
+            if ".obsidian" not in md_file.parts
+        ]
+        change_set = detect_changes(
+            self.vault_path, notes, self.manifest, hasher=_md5_text
+        )
 
+        events = []
+        for change in change_set.changes:
             try:
-                with open(md_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                _, body = parse_frontmatter(content)
-                tags = extract_tags(content)
-
-                if not self._should_process_note(md_file, tags):
+                frontmatter, body = parse_frontmatter(change.content)
+                tags = extract_tags(change.content)
+                # Filtered-out notes are still recorded so they are not re-read.
+                self.manifest.record(
+                    change.rel_path,
+                    mtime_ns=change.mtime_ns,
+                    size=change.size,
+                    content_hash=change.content_hash,
+                )
+
+                if not self._should_process_note(change.path, tags):
                     continue
 
-                content_hash = hashlib.md5(content.encode()).hexdigest()
-                rel_path = str(md_file.relative_to(self.vault_path)).replace("\\", "/")
-
-                previous_hash = self._note_hashes.get(rel_path)
-
-                if previous_hash != content_hash:
-                    frontmatter, body = parse_frontmatter(content)
-                    title = frontmatter.get("title") or md_file.stem
-
-                    should_embed = True
-                    if self.include_folders:
-                        path_parts = rel_path.parts
-                        should_embed = any(include in path_parts for include in self.include_folders)
-                    if self.include_tags and should_embed:
-                        should_embed = any(tag in tags for tag in self.include_tags)
-
-                    event = {
-                        "event_type": "OBSIDIAN_NOTE_UPDATED",
-                        "note_path": rel_path,
-                        "vault_path": str(self.vault_path),
-                        "title": title,
-                        "content": body,
-                        "hash": content_hash,
-                        "tags": tags,
-                        "size": md_file.stat().st_size,
-                        "modified": datetime.fromtimestamp(md_file.stat().st_mtime).isoformat(),
-                        "is_new": previous_hash is None,
-                        "should_embed": should_embed
-                    }
-                    events.append(event)
-                    self._note_hashes[rel_path] = content_hash
+                should_embed = True
+                if self.include_folders:
+                    path_parts = Path(change.rel_path).parts
+                    should_embed = any(include in path_parts for include in self.include_folders)
+                if self.include_tags and should_embed:
+                    should_embed = any(tag in tags for tag in self.include_tags)
+
+                events.append({
+                    "event_type": "OBSIDIAN_NOTE_UPDATED",
+                    "note_path": change.rel_path,
+                    "vault_path": str(self.vault_path),
+                    "title": frontmatter.get("title") or change.path.stem,
+                    "content": body,
+                    "hash": change.content_hash,
+                    "tags": tags,
+                    "size": change.size,
+                    "modified": datetime.fromtimestamp(change.mtime_ns / 1e9).isoformat(),
+                    "is_new": change.is_new,
+                    "should_embed": should_embed
+                })
 
             except Exception as e:
-                logger.warning(f"Error scanning note {md_file}: {e}")
+                logger.warning(f"Error scanning note {change.path}: {e}")
                 continue
 
-        if events:
-            self._save_hash_cache()
+        # Deleted notes stay live in the manifest until their events are
+        # retracted, so a failed retraction is reported again next scan.
+        self.deleted_notes = change_set.deleted
+
+        self.manifest.save()
 
         return events
 
+    def tombstone_notes(self, note_paths: List[str]):
+        """Tombstone retracted notes and persist the manifest"""
+        for rel_path in note_paths:
+            self.manifest.tombstone(rel_path)
+        self.manifest.save()
+
     def get_note_for_embedding(self, note_path: str) -> Optional[Dict[str, Any]]:
         """
         Get note content for embedding
@@ -185,5 +200,6 @@ class ObsidianScanner:
             return None
 
 
-
-
+def _md5_text(content: str) -> str:
+    # md5 keeps manifest hashes compatible with the legacy hash cache.
+    return hashlib.md5(content.encode()).hexdigest()
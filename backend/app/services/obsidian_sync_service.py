@@ -7,11 +7,12 @@ Integrates with event system and embedding pipeline.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import uuid
 
 from backend.app.models.mindscape import MindEvent, EventType, EventActor
+from backend.app.services.obsidian_note_retraction import retract_deleted_notes
 from backend.app.services.obsidian_scanner import ObsidianScanner
 from backend.app.services.stores.postgres.events_store import PostgresEventsStore
 from backend.app.services.system_settings_store import SystemSettingsStore
@@ -88,52 +89,96 @@ class ObsidianSyncService:
             try:
                 events = scanner.scan_vault()
 
-                for event_data in events:
-                    await self._create_event_from_scan(
-                        event_data, profile_id, vault_path
-                    )
+                await self._create_events_from_scan(events, profile_id, vault_path)
 
                 if events:
                     logger.info(
                         f"Synced {len(events)} note changes from vault {vault_path}"
                     )
+                if scanner.deleted_notes:
+                    await self._retract_deleted_notes(scanner, vault_path, profile_id)
             except Exception as e:
                 logger.error(f"Error syncing vault {vault_path}: {e}")
 
-    async def _create_event_from_scan(
-        self, event_data: Dict[str, Any], profile_id: str, vault_path: str
+    async def _retract_deleted_notes(
+        self, scanner: ObsidianScanner, vault_path: str, profile_id: str
     ):
-        """Create MindEvent from scanner event data"""
+        """Revoke embeddings of notes removed from the vault and tombstone them"""
+        deleted_notes = list(scanner.deleted_notes)
         try:
-            event = MindEvent(
-                id=str(uuid.uuid4()),
-                timestamp=datetime.fromisoformat(event_data["modified"]),
-                actor=EventActor.SYSTEM,
-                channel="obsidian_sync",
+            await asyncio.to_thread(
+                retract_deleted_notes,
+                self.events_store,
+                vault_path,
+                deleted_notes,
                 profile_id=profile_id,
-                event_type=EventType.OBSIDIAN_NOTE_UPDATED,
-                payload={
-                    "note_path": event_data["note_path"],
-                    "vault_path": vault_path,
-                    "title": event_data.get("title", ""),
-                    "content": event_data.get("content", ""),
-                    "body": event_data.get("content", ""),
-                    "tags": event_data.get("tags", []),
-                    "hash": event_data.get("hash"),
-                    "is_new": event_data.get("is_new", False),
-                },
-                metadata={
-                    "should_embed": event_data.get("should_embed", False),
-                    "source": "obsidian_vault",
-                    "vault_path": vault_path,
-                },
             )
+        except Exception as e:
+            # The notes stay live in the manifest and are retried next sync.
+            logger.error(
+                f"Failed to retract {len(deleted_notes)} deleted notes "
+                f"from vault {vault_path}: {e}"
+            )
+            return
+        scanner.tombstone_notes(deleted_notes)
+        logger.info(
+            f"Retracted {len(deleted_notes)} deleted notes from vault {vault_path}"
+        )
+
+    async def _create_events_from_scan(
+        self, events_data: List[Dict[str, Any]], profile_id: str, vault_path: str
+    ):
+        """Write one vault scan's note changes as batched MindEvents"""
+        batches: Dict[bool, List[MindEvent]] = {True: [], False: []}
+        for event_data in events_data:
+            try:
+                event = self._build_event_from_scan(event_data, profile_id, vault_path)
+            except Exception as e:
+                logger.error(f"Failed to create event from scan: {e}")
+                continue
+            batches[bool(event_data.get("should_embed", False))].append(event)
 
-            should_embed = event_data.get("should_embed", False)
-            self.events_store.create_event(event, generate_embedding=should_embed)
+        for should_embed, events in batches.items():
+            if not events:
+                continue
+            try:
+                await asyncio.to_thread(
+                    self.events_store.create_events,
+                    events,
+                    generate_embedding=should_embed,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to create {len(events)} events from scan of {vault_path}: {e}"
+                )
 
-        except Exception as e:
-            logger.error(f"Failed to create event from scan: {e}")
+    def _build_event_from_scan(
+        self, event_data: Dict[str, Any], profile_id: str, vault_path: str
+    ) -> MindEvent:
+        """Build a MindEvent from scanner event data"""
+        return MindEvent(
+            id=str(uuid.uuid4()),
+            timestamp=datetime.fromisoformat(event_data["modified"]),
+            actor=EventActor.SYSTEM,
+            channel="obsidian_sync",
+            profile_id=profile_id,
+            event_type=EventType.OBSIDIAN_NOTE_UPDATED,
+            payload={
+                "note_path": event_data["note_path"],
+                "vault_path": vault_path,
+                "title": event_data.get("title", ""),
+                "content": event_data.get("content", ""),
+                "body": event_data.get("content", ""),
+                "tags": event_data.get("tags", []),
+                "hash": event_data.get("hash"),
+                "is_new": event_data.get("is_new", False),
+            },
+            metadata={
+                "should_embed": event_data.get("should_embed", False),
+                "source": "obsidian_vault",
+                "vault_path": vault_path,
+            },
+        )
 
     async def start_background_sync(self, interval_seconds: int = 300):
         """
@@ -37,6 +37,7 @@ class RunnerProfile:
     runtime_id: Optional[str] = None
     max_inflight: int = 1
     enabled: bool = True
+    bulk_claim_enabled: bool = False
 
 
 def _normalize_tokens(values: Iterable[str]) -> tuple[str, ...]:
@@ -103,6 +104,7 @@ def _build_profile(
     runtime_id: Optional[str] = None,
     max_inflight: int = 1,
     enabled: bool = True,
+    bulk_claim_enabled: bool = False,
 ) -> RunnerProfile:
     normalized_partitions = _normalize_queue_partitions(accepted_queue_partitions)
     if not normalized_partitions:
@@ -123,6 +125,7 @@ def _build_profile(
         runtime_id=(runtime_id or "").strip() or None,
         max_inflight=max(1, int(max_inflight or 1)),
         enabled=bool(enabled),
+        bulk_claim_enabled=bool(bulk_claim_enabled),
     )
 
 
@@ -222,4 +225,8 @@ def resolve_runner_profile_from_env(
         ),
         max_inflight=_env_int("LOCAL_CORE_RUNNER_MAX_INFLIGHT", base_profile.max_inflight),
         enabled=_env_bool("LOCAL_CORE_RUNNER_ENABLED", base_profile.enabled),
+        bulk_claim_enabled=_env_bool(
+            "LOCAL_CORE_RUNNER_BULK_CLAIM_ENABLED",
+            base_profile.bulk_claim_enabled,
+        ),
     )
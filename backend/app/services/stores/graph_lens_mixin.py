@@ -11,6 +11,7 @@ from app.models.graph import (
     MindLensProfileCreate,
     WorkspaceLensOverride,
 )
+from app.services.lens.effective_lens_cache import get_effective_lens_cache
 from app.services.stores.base import StoreValidationError
 from app.services.stores.graph_projection import (
     row_data,
@@ -86,6 +87,7 @@ class GraphLensMixin:
                         },
                     )
 
+        get_effective_lens_cache().presets_changed()
         return self.get_lens_profile(lens_id)
 
     def get_lens_profile(self, lens_id: str) -> Optional[MindLensProfile]:
@@ -213,7 +215,8 @@ class GraphLensMixin:
                 {"lens_id": lens_id, "workspace_id": workspace_id, "created_at": now},
             )
 
-            return True
+        get_effective_lens_cache().presets_changed()
+        return True
 
     def unbind_lens_from_workspace(
         self,
@@ -228,7 +231,9 @@ class GraphLensMixin:
                 ),
                 {"workspace_id": workspace_id},
             )
-            return result.rowcount > 0
+
+        get_effective_lens_cache().presets_changed()
+        return result.rowcount > 0
 
     def upsert_lens_profile_node(
         self,
@@ -264,7 +269,9 @@ class GraphLensMixin:
                 ),
                 {"preset_id": preset_id, "node_id": node_id},
             ).fetchone()
-            return self._row_to_lens_profile_node(row)
+
+        get_effective_lens_cache().presets_changed()
+        return self._row_to_lens_profile_node(row)
 
     def get_lens_profile_nodes(self, preset_id: str) -> List[LensProfileNode]:
         """Get all lens profile nodes for a preset"""
@@ -301,7 +308,9 @@ class GraphLensMixin:
                 ),
                 {"preset_id": preset_id, "node_id": node_id},
             )
-            return result.rowcount > 0
+
+        get_effective_lens_cache().presets_changed()
+        return result.rowcount > 0
 
     def count_lens_profile_nodes(
         self,
@@ -390,7 +399,9 @@ class GraphLensMixin:
                 ),
                 {"workspace_id": workspace_id, "node_id": node_id},
             ).fetchone()
-            return self._row_to_workspace_override(row)
+
+        get_effective_lens_cache().workspace_override_changed(workspace_id)
+        return self._row_to_workspace_override(row)
 
     def remove_workspace_override(self, workspace_id: str, node_id: str) -> bool:
         """Remove workspace lens override"""
@@ -401,7 +412,9 @@ class GraphLensMixin:
                 ),
                 {"workspace_id": workspace_id, "node_id": node_id},
             )
-            return result.rowcount > 0
+
+        get_effective_lens_cache().workspace_override_changed(workspace_id)
+        return result.rowcount > 0
 
     def _row_to_workspace_override(self, row) -> WorkspaceLensOverride:
         """Convert database row to WorkspaceLensOverride"""
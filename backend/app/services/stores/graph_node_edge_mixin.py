@@ -14,6 +14,7 @@ from app.models.graph import (
     GraphNodeUpdate,
     GraphRelationType,
 )
+from app.services.lens.effective_lens_cache import get_effective_lens_cache
 from app.services.stores.base import StoreValidationError
 from app.services.stores.graph_projection import row_data, row_to_edge, row_to_node
 
@@ -63,6 +64,7 @@ class GraphNodeEdgeMixin:
             }
             conn.execute(query, params)
 
+        get_effective_lens_cache().graph_changed(profile_id)
         return self.get_node(node_id)
 
     def get_node(self, node_id: str) -> Optional[GraphNode]:
@@ -175,6 +177,7 @@ class GraphNodeEdgeMixin:
         with self.transaction() as conn:
             conn.execute(query, params)
 
+        get_effective_lens_cache().graph_changed(profile_id)
         return self.get_node(node_id)
 
     def delete_node(
@@ -200,7 +203,9 @@ class GraphNodeEdgeMixin:
                 text("DELETE FROM graph_nodes WHERE id = :node_id AND profile_id = :profile_id"),
                 {"node_id": node_id, "profile_id": profile_id},
             )
-            return result.rowcount > 0
+
+        get_effective_lens_cache().graph_changed(profile_id)
+        return result.rowcount > 0
 
     def _row_to_node(self, row) -> GraphNode:
         """Convert database row to GraphNode"""
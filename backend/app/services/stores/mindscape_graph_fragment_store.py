@@ -0,0 +1,99 @@
+"""
+Mindscape Graph Fragment Store
+
+Persists the materialized derived nodes of each workspace so the graph
+service can patch them incrementally instead of re-deriving every read.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from backend.app.services.stores.postgres_base import PostgresStoreBase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GraphFragment:
+    """Derived nodes of one workspace at a change-counter version."""
+
+    workspace_id: str
+    version: int
+    nodes: List[Dict[str, Any]]
+    derived_at: datetime
+
+
+class MindscapeGraphFragmentStore(PostgresStoreBase):
+    """
+    Store for materialized per-workspace graph fragments.
+
+    Schema:
+    - mindscape_graph_fragments: one row of serialized nodes per workspace
+    """
+
+    def get_fragment(self, workspace_id: str) -> Optional[GraphFragment]:
+        """Return the stored fragment for a workspace, if any."""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    SELECT workspace_id, version, nodes, derived_at
+                    FROM mindscape_graph_fragments
+                    WHERE workspace_id = :workspace_id
+                """
+                ),
+                {"workspace_id": workspace_id},
+            ).fetchone()
+        if not row:
+            return None
+        derived_at = row.derived_at
+        if isinstance(derived_at, str):
+            derived_at = datetime.fromisoformat(derived_at)
+        if derived_at is not None and derived_at.tzinfo is None:
+            derived_at = derived_at.replace(tzinfo=timezone.utc)
+        return GraphFragment(
+            workspace_id=row.workspace_id,
+            version=int(row.version or 0),
+            nodes=self.deserialize_json(row.nodes, default=[]) or [],
+            derived_at=derived_at,
+        )
+
+    def save_fragment(self, fragment: GraphFragment) -> None:
+        """Insert or replace the fragment for its workspace."""
+        with self.transaction() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO mindscape_graph_fragments
+                        (workspace_id, version, nodes, derived_at, updated_at)
+                    VALUES (:workspace_id, :version, :nodes, :derived_at, :updated_at)
+                    ON CONFLICT (workspace_id) DO UPDATE SET
+                        version = excluded.version,
+                        nodes = excluded.nodes,
+                        derived_at = excluded.derived_at,
+                        updated_at = excluded.updated_at
+                """
+                ),
+                {
+                    "workspace_id": fragment.workspace_id,
+                    "version": fragment.version,
+                    "nodes": self.serialize_json(fragment.nodes),
+                    "derived_at": fragment.derived_at,
+                    "updated_at": datetime.now(timezone.utc),
+                },
+            )
+
+    def delete_fragment(self, workspace_id: str) -> bool:
+        """Drop the fragment so the next read re-derives from scratch."""
+        with self.transaction() as conn:
+            result = conn.execute(
+                text(
+                    "DELETE FROM mindscape_graph_fragments WHERE workspace_id = :workspace_id"
+                ),
+                {"workspace_id": workspace_id},
+            )
+            return result.rowcount > 0
@@ -0,0 +1,119 @@
+"""Bulk event ingestion for PostgresEventsStore.
+
+Bursty producers (vault syncs, imports, meeting rounds) write events with
+``create_events``: multi-row INSERTs inside one transaction, one pipelined
+Redis publish of the committed envelopes, and one embedding request on the
+bounded event embedding queue instead of one generator task per event.
+"""
+
+import logging
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import text
+
+from backend.app.models.mindscape import MindEvent
+from backend.app.services.workspace_event_lifecycle import (
+    publish_committed_workspace_events,
+)
+
+logger = logging.getLogger(__name__)
+
+EVENT_INSERT_COLUMNS = (
+    "id",
+    "timestamp",
+    "actor",
+    "channel",
+    "profile_id",
+    "project_id",
+    "workspace_id",
+    "thread_id",
+    "event_type",
+    "payload",
+    "entity_ids",
+    "metadata",
+)
+# 12 bind params per row keeps each statement well under PostgreSQL's
+# 65535-parameter limit.
+EVENT_INSERT_CHUNK_ROWS = 500
+
+
+class PostgresEventsBulkInsertMixin:
+    """Batched ``mind_events`` writes; expects a PostgresStoreBase host."""
+
+    def create_events(
+        self, events: Sequence[MindEvent], generate_embedding: bool = False
+    ) -> List[MindEvent]:
+        """Create a burst of events in one transaction.
+
+        Rows go in as multi-row INSERTs of up to ``EVENT_INSERT_CHUNK_ROWS``,
+        committed events fan out through one pipelined Redis publish, and
+        embeddings are requested as one batch on the bounded embedding queue.
+        """
+        events = list(events)
+        if not events:
+            return []
+
+        with self.transaction() as conn:
+            for start in range(0, len(events), EVENT_INSERT_CHUNK_ROWS):
+                chunk = events[start : start + EVENT_INSERT_CHUNK_ROWS]
+                values_sql = []
+                params: Dict[str, Any] = {}
+                for index, event in enumerate(chunk):
+                    values_sql.append(
+                        "("
+                        + ", ".join(
+                            f":{column}_{index}" for column in EVENT_INSERT_COLUMNS
+                        )
+                        + ")"
+                    )
+                    for column, value in self._event_insert_params(event).items():
+                        params[f"{column}_{index}"] = value
+                conn.execute(
+                    text(
+                        f"INSERT INTO mind_events ({', '.join(EVENT_INSERT_COLUMNS)}) "
+                        f"VALUES {', '.join(values_sql)}"
+                    ),
+                    params,
+                )
+
+        # Same contract as create_event: Redis only sees committed events.
+        publish_committed_workspace_events(events)
+
+        if generate_embedding:
+            self._queue_event_embeddings(events)
+
+        return events
+
+    def _event_insert_params(self, event: MindEvent) -> Dict[str, Any]:
+        return {
+            "id": event.id,
+            "timestamp": event.timestamp,
+            "actor": event.actor.value,
+            "channel": event.channel,
+            "profile_id": event.profile_id,
+            "project_id": event.project_id,
+            "workspace_id": event.workspace_id,
+            "thread_id": event.thread_id,
+            "event_type": event.event_type.value,
+            "payload": self.serialize_json(event.payload),
+            "entity_ids": self.serialize_json(event.entity_ids),
+            "metadata": self.serialize_json(event.metadata),
+        }
+
+    def _queue_event_embeddings(self, events: List[MindEvent]) -> None:
+        """Queue embedding generation on the shared bounded worker"""
+        try:
+            from backend.app.services.event_embedding_generator_core import (
+                get_event_embedding_queue,
+            )
+
+            get_event_embedding_queue().submit(events)
+        except Exception as e:
+            logger.warning(f"Failed to queue embeddings for {len(events)} events: {e}")
+
+
+__all__ = [
+    "EVENT_INSERT_CHUNK_ROWS",
+    "EVENT_INSERT_COLUMNS",
+    "PostgresEventsBulkInsertMixin",
+]
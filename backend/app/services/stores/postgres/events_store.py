@@ -2,17 +2,17 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy import text
 from backend.app.services.stores.postgres_base import PostgresStoreBase
+from backend.app.services.stores.postgres.events_bulk_insert import PostgresEventsBulkInsertMixin
 from backend.app.models.mindscape import MindEvent, EventType, EventActor
 from backend.app.services.workspace_event_lifecycle import (
     publish_committed_workspace_event,
 )
 import logging
-import asyncio
 
 logger = logging.getLogger(__name__)
 
 
-class PostgresEventsStore(PostgresStoreBase):
+class PostgresEventsStore(PostgresEventsBulkInsertMixin, PostgresStoreBase):
     """Postgres implementation of EventsStore."""
 
     def create_event(
@@ -59,21 +59,7 @@ class PostgresEventsStore(PostgresStoreBase):
 
     def _trigger_embedding_generation(self, event: MindEvent):
         """Trigger async embedding generation safely"""
-        try:
-            from backend.app.services.event_embedding_generator import EventEmbeddingGenerator
-
-            generator = EventEmbeddingGenerator()
-            # Fire and forget
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    asyncio.create_task(generator.generate_embedding_for_event(event))
-                else:
-                    asyncio.run(generator.generate_embedding_for_event(event))
-            except RuntimeError:
-                asyncio.run(generator.generate_embedding_for_event(event))
-        except Exception as e:
-            logger.warning(f"Failed to trigger embedding for event {event.id}: {e}")
+        self._queue_event_embeddings([event])
 
     def get_event(self, event_id: str) -> Optional[MindEvent]:
         """Get a single event by ID"""
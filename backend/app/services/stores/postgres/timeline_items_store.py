@@ -4,6 +4,10 @@ import logging
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from sqlalchemy import text
+from backend.app.services.mindscape_graph_changes import (
+    GRAPH_CHANGE_TIMELINE,
+    record_graph_change,
+)
 from backend.app.services.stores.postgres_base import PostgresStoreBase
 from backend.app.models.workspace import TimelineItem, TimelineItemType
 
@@ -40,6 +44,7 @@ class PostgresTimelineItemsStore(PostgresStoreBase):
         }
         with self.transaction() as conn:
             conn.execute(query, params)
+        record_graph_change(item.workspace_id, GRAPH_CHANGE_TIMELINE, item.id)
         logger.info(
             f"Created timeline item: {item.id} "
             f"(workspace: {item.workspace_id}, type: {item.type.value})"
@@ -56,6 +61,18 @@ class PostgresTimelineItemsStore(PostgresStoreBase):
                 return None
             return self._row_to_timeline_item(row)
 
+    def list_timeline_items_by_ids(self, item_ids: List[str]) -> List[TimelineItem]:
+        """Get timeline items by ID in one query; missing IDs are skipped."""
+        ordered_ids = list(dict.fromkeys(item_id for item_id in item_ids if item_id))
+        if not ordered_ids:
+            return []
+        params = {f"item_id_{index}": item_id for index, item_id in enumerate(ordered_ids)}
+        placeholders = ", ".join(f":{key}" for key in params)
+        query = text(f"SELECT * FROM timeline_items WHERE id IN ({placeholders})")
+        with self.get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+            return [self._row_to_timeline_item(row) for row in rows]
+
     def list_timeline_items_by_workspace(
         self,
         workspace_id: str,
@@ -141,11 +158,15 @@ class PostgresTimelineItemsStore(PostgresStoreBase):
 
             if updates:
                 query = text(
-                    f"UPDATE timeline_items SET {', '.join(updates)} WHERE id = :id"
+                    f"UPDATE timeline_items SET {', '.join(updates)} "
+                    "WHERE id = :id RETURNING workspace_id"
                 )
                 with self.transaction() as conn:
-                    result = conn.execute(query, params)
-                    return result.rowcount > 0
+                    row = conn.execute(query, params).fetchone()
+                if row is None:
+                    return False
+                record_graph_change(row.workspace_id, GRAPH_CHANGE_TIMELINE, item_id)
+                return True
             return False
         except Exception as e:
             logger.error(f"Failed to update timeline item {item_id}: {e}")
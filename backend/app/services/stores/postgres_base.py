@@ -5,7 +5,12 @@ from datetime import datetime
 from typing import Optional, Any
 from sqlalchemy import text
 from app.database.connection_factory import ConnectionFactory
-from ..json_safety import replace_json_nul_codepoints
+from ..json_codec import (
+    dumps_json,
+    loads_json,
+    register_psycopg2_json_typecasters,
+    without_json_nul,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +26,7 @@ class PostgresStoreBase:
         # Postgres connections are pooled globally, so we don't store a 'db_path'
         self.db_role = db_role
         self.factory = ConnectionFactory()
+        register_psycopg2_json_typecasters()
 
     @contextmanager
     def get_connection(self):
@@ -67,7 +73,7 @@ class PostgresStoreBase:
         if data is None:
             return None
         try:
-            return json.dumps(replace_json_nul_codepoints(data))
+            return dumps_json(data)
         except (TypeError, ValueError) as e:
             logger.error(f"Failed to serialize JSON: {e}")
             raise ValueError(f"Invalid JSON data: {e}")
@@ -81,15 +87,16 @@ class PostgresStoreBase:
         if data is None:
             return default if default is not None else {}
 
-        # If already a dict/list (from JSONB), return as is
+        # Decoded values may come from the driver or from in-memory callers,
+        # so they are scanned once and copied only if they hold a NUL.
         if isinstance(data, (dict, list)):
-            return replace_json_nul_codepoints(data)
+            return without_json_nul(data)
 
         if isinstance(data, str):
             if not data.strip():
                 return default if default is not None else {}
             try:
-                return replace_json_nul_codepoints(json.loads(data))
+                return loads_json(data)
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to deserialize JSON string: {e}")
                 return default if default is not None else {}
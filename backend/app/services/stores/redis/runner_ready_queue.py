@@ -0,0 +1,380 @@
+"""Ready (pending) queue half of the runner queue store.
+
+The pending queue is a ZSET scored by enqueue time (lowest pops first), so
+targeted removal and reroute are O(log n) instead of an LREM list scan.
+Enqueues and reaper re-queues publish on the partition wakeup channel so
+waiting runners claim new work without polling. Tasks still sitting in the
+pre-ZSET pending/temp LISTs are drained by ``migrate_legacy_pending``.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from backend.app.services.host_resources.route_identity_projection import (
+    ROUTE_IDENTITY_TTL_SECONDS,
+    route_identity_key,
+    serialize_route_identity_projection,
+)
+from backend.app.services.cache.redis_cache import get_cache_service
+
+logger = logging.getLogger(__name__)
+
+LUA_POP_PENDING_TO_PROCESSING = """
+local popped = redis.call("zpopmin", KEYS[1])
+if #popped == 0 then
+    return false
+end
+redis.call("zadd", KEYS[2], ARGV[1], popped[1])
+return popped[1]
+"""
+
+LUA_REMOVE_PENDING_AND_PROCESS = """
+local removed = redis.call("zrem", KEYS[1], ARGV[1])
+if removed > 0 then
+    redis.call("zadd", KEYS[2], ARGV[2], ARGV[1])
+    return 1
+else
+    return 0
+end
+"""
+
+LUA_REROUTE_PENDING = """
+local removed = 0
+local score = nil
+for index = 2, #KEYS do
+    local current = redis.call("zscore", KEYS[index], ARGV[1])
+    if current then
+        if not score or tonumber(current) < score then
+            score = tonumber(current)
+        end
+        removed = removed + redis.call("zrem", KEYS[index], ARGV[1])
+    end
+end
+if removed <= 0 then
+    return {0, 0}
+end
+redis.call("setex", KEYS[1], ARGV[3], ARGV[2])
+redis.call("zadd", KEYS[2], score, ARGV[1])
+return {removed, 1}
+"""
+
+# Drain one chunk of a pre-ZSET pending/temp LIST into the pending ZSET,
+# oldest (right end) first. Scores start at ARGV[2] so migrated work sorts
+# ahead of anything enqueued with a wall-clock score after the upgrade.
+LUA_MIGRATE_LEGACY_PENDING = """
+if redis.call("type", KEYS[1]).ok ~= "list" then
+    return 0
+end
+local next_score = tonumber(ARGV[2])
+local moved = 0
+for _ = 1, tonumber(ARGV[1]) do
+    local task_id = redis.call("rpop", KEYS[1])
+    if not task_id then
+        break
+    end
+    redis.call("zadd", KEYS[2], "NX", next_score, task_id)
+    next_score = next_score + 1
+    moved = moved + 1
+end
+return moved
+"""
+
+LEGACY_MIGRATION_CHUNK_SIZE = 1000
+
+
+def pending_enqueue_score(now: Optional[float] = None) -> float:
+    """Score for a normal enqueue: FIFO by wall-clock enqueue time."""
+    return now if now is not None else datetime.now(timezone.utc).timestamp()
+
+
+def pending_front_score(now: Optional[float] = None) -> float:
+    """Score that pops ahead of normal enqueues (the old RPUSH-to-front).
+
+    Later front pushes pop first, matching the LIFO order RPUSH gave.
+    """
+    return -pending_enqueue_score(now)
+
+
+def runner_queue_wakeup_channel(pack_id: str) -> str:
+    """Return the Pub/Sub channel that announces new pending work for a partition."""
+    return f"mindscape:queue:wakeup:{pack_id}"
+
+
+def runner_ready_queue_key(pack_id: str) -> str:
+    """Return the pending ZSET key for a queue partition."""
+    return f"mindscape:queue:ready:{pack_id}"
+
+
+class RunnerReadyQueueMixin:
+    """Enqueue, claim and reroute on the pending ZSET of ``self.pack_id``."""
+
+    async def enqueue_task(
+        self,
+        task_id: str,
+        *,
+        route_identity: dict | None = None,
+    ) -> bool:
+        """Push a task to the pending queue."""
+        client = await self._get_client()
+        if not client:
+            return False
+        
+        try:
+            pipe = client.pipeline()
+            pipe.setex(
+                route_identity_key(task_id),
+                ROUTE_IDENTITY_TTL_SECONDS,
+                serialize_route_identity_projection(task_id, route_identity),
+            )
+            pipe.zadd(self.q_pending, {task_id: pending_enqueue_score()}, nx=True)
+            pipe.publish(self.q_wakeup, task_id)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"[Redis Queue] Failed to enqueue {task_id}: {e}")
+            return False
+
+    def enqueue_task_sync(
+        self,
+        task_id: str,
+        *,
+        route_identity: dict | None = None,
+    ) -> bool:
+        """Synchronous enqueue for use inside SQLAlchemy commits."""
+        cache = get_cache_service()
+        if not cache._ensure_connected() or not cache._client:
+            return False
+        
+        try:
+            pipe = cache._client.pipeline()
+            pipe.setex(
+                route_identity_key(task_id),
+                ROUTE_IDENTITY_TTL_SECONDS,
+                serialize_route_identity_projection(task_id, route_identity),
+            )
+            pipe.zadd(self.q_pending, {task_id: pending_enqueue_score()}, nx=True)
+            pipe.publish(self.q_wakeup, task_id)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"[Redis Queue] Failed sync enqueue {task_id}: {e}")
+            return False
+
+    async def _pop_pending_to_processing(
+        self, client, visibility_timeout_sec: int
+    ) -> Optional[str]:
+        deadline = self._utc_now_timestamp() + visibility_timeout_sec
+        item = await client.eval(
+            LUA_POP_PENDING_TO_PROCESSING,
+            2,
+            self.q_pending,
+            self.q_processing,
+            deadline,
+        )
+        return item or None
+
+    async def dequeue_task_blocking(self, timeout: int = 2, visibility_timeout_sec: int = 180) -> Optional[str]:
+        """Fetch the oldest pending task, waiting up to ``timeout`` for one.
+
+        The wait listens on the partition wakeup channel and never pops, so
+        every claim goes through the atomic pending-to-processing script and
+        a crash cannot leave a task outside both sets.
+        """
+        client = await self._get_client()
+        if not client:
+            await asyncio.sleep(timeout)
+            return None
+
+        pubsub = None
+        try:
+            pubsub = client.pubsub()
+            # Subscribe before the first pop so an enqueue racing it still wakes us.
+            await pubsub.subscribe(self.q_wakeup)
+            task_id = await self._pop_pending_to_processing(client, visibility_timeout_sec)
+            if task_id:
+                return task_id
+            deadline = asyncio.get_running_loop().time() + timeout
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    return None
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                )
+                if message and message.get("type") == "message":
+                    return await self._pop_pending_to_processing(
+                        client, visibility_timeout_sec
+                    )
+
+        except Exception as e:
+            logger.error(f"[Redis Queue] Failed dequeue: {e}")
+            await asyncio.sleep(timeout)
+            return None
+        finally:
+            if pubsub is not None:
+                try:
+                    await pubsub.unsubscribe(self.q_wakeup)
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+    async def dequeue_task_nowait(
+        self, visibility_timeout_sec: int = 180
+    ) -> Optional[str]:
+        """Fetch a task without blocking; used to round-robin across shards."""
+        client = await self._get_client()
+        if not client:
+            return None
+
+        try:
+            return await self._pop_pending_to_processing(client, visibility_timeout_sec)
+        except Exception as e:
+            logger.error(f"[Redis Queue] Failed non-blocking dequeue: {e}")
+            return None
+
+    async def migrate_legacy_pending(
+        self, chunk_size: int = LEGACY_MIGRATION_CHUNK_SIZE
+    ) -> int:
+        """Move tasks left in the pre-ZSET pending/temp lists into the pending ZSET.
+
+        Runs in chunks so a 100k-entry list never blocks Redis for one long
+        script. Safe to call repeatedly; returns the number of tasks moved.
+        """
+        client = await self._get_client()
+        if not client:
+            return 0
+
+        moved_total = 0
+        try:
+            for legacy_key in (self.q_temp, self.q_pending_legacy):
+                while True:
+                    # Keep migrated scores below any wall-clock enqueue score
+                    # and above front pushes, preserving the old FIFO order.
+                    moved = int(
+                        await client.eval(
+                            LUA_MIGRATE_LEGACY_PENDING,
+                            2,
+                            legacy_key,
+                            self.q_pending,
+                            chunk_size,
+                            moved_total,
+                        )
+                        or 0
+                    )
+                    moved_total += moved
+                    if moved < chunk_size:
+                        break
+        except Exception as e:
+            logger.error(f"[Redis Queue] Failed legacy pending migration for {self.pack_id}: {e}")
+        if moved_total:
+            logger.warning(
+                f"[Redis Queue] Migrated {moved_total} legacy pending task(s) for {self.pack_id}"
+            )
+            await self.notify_pending()
+        return moved_total
+
+    async def promote_pending_task_by_id(
+        self,
+        task_id: str,
+        visibility_timeout_sec: int = 180,
+    ) -> Optional[str]:
+        """Move a known pending-list member into processing if it is still queued."""
+        client = await self._get_client()
+        if not client:
+            return None
+
+        normalized_task_id = str(task_id or "").strip()
+        if not normalized_task_id:
+            return None
+
+        try:
+            deadline = self._utc_now_timestamp() + visibility_timeout_sec
+            moved = await client.eval(
+                LUA_REMOVE_PENDING_AND_PROCESS,
+                2,
+                self.q_pending,
+                self.q_processing,
+                normalized_task_id,
+                deadline,
+            )
+            return normalized_task_id if int(moved or 0) > 0 else None
+        except Exception as e:
+            logger.error(f"[Redis Queue] Failed targeted dequeue {normalized_task_id}: {e}")
+            return None
+
+    async def reroute_pending_task(
+        self,
+        task_id: str,
+        *,
+        source_shards: list[str] | tuple[str, ...],
+        route_identity: dict | None = None,
+    ) -> dict:
+        """Move a pending task into this queue atomically with route projection."""
+        client = await self._get_client()
+        if not client:
+            return {"removed_count": 0, "pushed": False}
+
+        normalized_task_id = str(task_id or "").strip()
+        if not normalized_task_id:
+            return {"removed_count": 0, "pushed": False}
+
+        source_keys: list[str] = []
+        for shard in source_shards or []:
+            normalized_shard = str(shard or "").strip()
+            if not normalized_shard:
+                continue
+            key = runner_ready_queue_key(normalized_shard)
+            if key != self.q_pending and key not in source_keys:
+                source_keys.append(key)
+
+        try:
+            result = await client.eval(
+                LUA_REROUTE_PENDING,
+                2 + len(source_keys),
+                route_identity_key(normalized_task_id),
+                self.q_pending,
+                *source_keys,
+                normalized_task_id,
+                serialize_route_identity_projection(normalized_task_id, route_identity),
+                ROUTE_IDENTITY_TTL_SECONDS,
+            )
+            if isinstance(result, (list, tuple)):
+                removed_count = int(result[0] or 0) if result else 0
+                pushed = bool(int(result[1] or 0)) if len(result) > 1 else False
+            else:
+                removed_count = int(result or 0)
+                pushed = removed_count > 0
+            if pushed:
+                await self.notify_pending(normalized_task_id)
+            return {"removed_count": removed_count, "pushed": pushed}
+        except Exception as e:
+            logger.error(f"[Redis Queue] Failed pending reroute {normalized_task_id}: {e}")
+            return {"removed_count": 0, "pushed": False}
+
+    async def notify_pending(self, task_id: str = "") -> bool:
+        """Wake runners waiting on this partition; best effort, never raises."""
+        client = await self._get_client()
+        if not client or not hasattr(client, "publish"):
+            return False
+        try:
+            await client.publish(self.q_wakeup, task_id)
+            return True
+        except Exception as e:
+            logger.debug(f"[Redis Queue] Failed wakeup publish for {self.pack_id}: {e}")
+            return False
+
+
+__all__ = [
+    "LEGACY_MIGRATION_CHUNK_SIZE",
+    "LUA_MIGRATE_LEGACY_PENDING",
+    "LUA_POP_PENDING_TO_PROCESSING",
+    "LUA_REMOVE_PENDING_AND_PROCESS",
+    "LUA_REROUTE_PENDING",
+    "RunnerReadyQueueMixin",
+    "pending_enqueue_score",
+    "pending_front_score",
+    "runner_queue_wakeup_channel",
+    "runner_ready_queue_key",
+]
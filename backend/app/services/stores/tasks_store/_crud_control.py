@@ -459,6 +459,25 @@ def _publish_terminal_event(
         )
         try:
             client.publish(channel, message)
+            execution_id = payload["execution_id"] or task_id
+            # Wake open execution streams for terminal writes made outside
+            # the runner, e.g. user cancellation.
+            from backend.app.services.cache.async_redis import (
+                execution_progress_channel,
+            )
+
+            client.publish(
+                execution_progress_channel(execution_id),
+                json.dumps(
+                    {
+                        "type": "status",
+                        "task_id": task_id,
+                        "execution_id": execution_id,
+                        "status": status_raw,
+                        "terminal": True,
+                    }
+                ),
+            )
         finally:
             client.close()
     except Exception:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy import text
 
@@ -11,6 +11,10 @@ from app.models.workspace import Task
 from backend.app.services.meeting_command_status_sync import (
     sync_meeting_command_from_task_safely,
 )
+from backend.app.services.mindscape_graph_changes import (
+    GRAPH_CHANGE_TASK,
+    record_graph_change,
+)
 from backend.app.services.task_admission_service import (
     ADMISSION_DEFERRED_REASON,
     TASK_ADMISSION_SERVICE,
@@ -230,6 +234,7 @@ class TasksStoreCreateReadMixin:
             return task
         sync_meeting_command_from_task_safely(task)
         self._enqueue_runner_task_after_commit(task)
+        record_graph_change(task.workspace_id, GRAPH_CHANGE_TASK, task.id)
         return task
 
     def create_task(self, task: Task) -> Task:
@@ -264,6 +269,30 @@ class TasksStoreCreateReadMixin:
                 return None
             return self._row_to_task(row)
 
+    def get_tasks_by_ids(self, task_ids: List[str]) -> List[Task]:
+        """
+        Get tasks by ID in one query
+
+        Args:
+            task_ids: Task IDs; duplicates and blanks are ignored
+
+        Returns:
+            Tasks that exist, in no particular order
+        """
+        ordered_ids = list(dict.fromkeys(task_id for task_id in task_ids if task_id))
+        if not ordered_ids:
+            return []
+        id_params = {
+            f"task_id_{index}": task_id for index, task_id in enumerate(ordered_ids)
+        }
+        id_placeholders = ", ".join(f":{key}" for key in id_params)
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                text(f"SELECT * FROM tasks WHERE id IN ({id_placeholders})"),
+                id_params,
+            ).fetchall()
+            return [self._row_to_task(row) for row in rows]
+
     def get_task_by_execution_id(self, execution_id: str) -> Optional[Task]:
         """
         Get task by execution_id
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Optional
 
 from sqlalchemy import text
 
 from app.models.workspace import TaskStatus
+from backend.app.services.mindscape_graph_changes import (
+    GRAPH_CHANGE_TASK,
+    record_graph_change,
+)
 
 
 class TasksStoreFrontierReleaseMixin:
@@ -17,6 +22,7 @@ class TasksStoreFrontierReleaseMixin:
         task_id: str,
         *,
         released_at: datetime,
+        workspace_id: Optional[str] = None,
     ) -> bool:
         with self.transaction() as conn:
             result = conn.execute(
@@ -50,7 +56,9 @@ class TasksStoreFrontierReleaseMixin:
             released = result.rowcount == 1
             if released:
                 self._refresh_task_projection(conn, task_id)
-            return released
+        if released:
+            record_graph_change(workspace_id, GRAPH_CHANGE_TASK, task_id)
+        return released
 
 
 __all__ = ["TasksStoreFrontierReleaseMixin"]
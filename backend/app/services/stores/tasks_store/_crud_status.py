@@ -13,6 +13,10 @@ from app.services.stores.base import StoreNotFoundError
 from backend.app.services.meeting_command_status_sync import (
     sync_meeting_command_from_task_safely,
 )
+from backend.app.services.mindscape_graph_changes import (
+    GRAPH_CHANGE_TASK,
+    record_graph_change,
+)
 from backend.app.services.task_payload_budget import apply_task_payload_budget
 
 from ._crud_control import _publish_terminal_event
@@ -245,5 +249,9 @@ class TasksStoreStatusUpdateMixin:
         # Activity stream: push terminal status change
         if status_transition_changed:
             _publish_terminal_event(task_id, status.value, updated_task)
+        if updated_task is not None:
+            record_graph_change(
+                getattr(updated_task, "workspace_id", None), GRAPH_CHANGE_TASK, task_id
+            )
 
         return updated_task
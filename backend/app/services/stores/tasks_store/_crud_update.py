@@ -10,9 +10,16 @@ from sqlalchemy import text
 
 from app.models.workspace import Task, TaskStatus
 from app.services.stores.base import StoreNotFoundError
+from backend.app.services.cache.execution_progress_publisher import (
+    publish_execution_progress_snapshot,
+)
 from backend.app.services.meeting_command_status_sync import (
     sync_meeting_command_from_task_safely,
 )
+from backend.app.services.mindscape_graph_changes import (
+    GRAPH_CHANGE_TASK,
+    record_graph_change,
+)
 from backend.app.services.task_payload_budget import apply_task_payload_budget
 from backend.app.services.task_projection_adapters import project_task_identity
 
@@ -51,6 +58,22 @@ _TASK_SUMMARY_PROJECTION_FIELDS = frozenset(
     }
 )
 
+# Task fields the derived mindscape graph reads into execution and intent nodes.
+_MINDSCAPE_GRAPH_FIELDS = frozenset(
+    {
+        "workspace_id",
+        "execution_id",
+        "pack_id",
+        "task_type",
+        "status",
+        "params",
+        "result",
+        "error",
+        "created_at",
+        "completed_at",
+    }
+)
+
 
 class TasksStoreUpdateMixin:
     """Task field update method."""
@@ -123,6 +146,7 @@ class TasksStoreUpdateMixin:
             return self.get_task(task_id)
 
         status_transition_changed = False
+        graph_workspace_id: Optional[str] = None
         with self.transaction() as conn:
             lock_clause = (
                 " FOR UPDATE"
@@ -350,6 +374,7 @@ class TasksStoreUpdateMixin:
                     persisted_error = (
                         mapping["error"] if mapping is not None else control_row[5]
                     )
+                    graph_workspace_id = workspace_id
                     event_time = persisted_completed_at or persisted_started_at or _utc_now()
                     run_id = self._run_id_for_task(task_id, execution_id)
                     self._run_attempts_store().upsert_run(
@@ -406,6 +431,19 @@ class TasksStoreUpdateMixin:
         if status_val is not None and status_transition_changed:
             raw = status_val.value if hasattr(status_val, "value") else str(status_val)
             _publish_terminal_event(task_id, raw, updated_task)
+        if (
+            execution_context is not None
+            or project_id is not None
+            or _MINDSCAPE_GRAPH_FIELDS.intersection(kwargs)
+        ):
+            if updated_task is not None:
+                graph_workspace_id = getattr(updated_task, "workspace_id", None)
+            record_graph_change(graph_workspace_id, GRAPH_CHANGE_TASK, task_id)
+        # Execution streams render progress from this event, not a re-read.
+        if execution_context is not None and updated_task is not None:
+            raw = getattr(updated_task.status, "value", updated_task.status)
+            if raw not in _TERMINAL_TASK_STATUSES:
+                publish_execution_progress_snapshot(updated_task)
 
         return updated_task
 
@@ -3,6 +3,7 @@
 from app.models.workspace import TaskStatus
 from backend.app.services.runner_live_state import RunnerLiveStateStore
 
+from ._runner_batch_claims import TasksStoreRunnerBatchClaimMixin
 from ._runner_claims import TasksStoreRunnerClaimMixin
 from ._runner_heartbeats import TasksStoreRunnerHeartbeatMixin
 from ._runner_helpers import (
@@ -27,6 +28,7 @@ from ._runner_lifecycle import TasksStoreRunnerLifecycleMixin
 
 class TasksStoreRunnerMixin(
     TasksStoreRunnerClaimMixin,
+    TasksStoreRunnerBatchClaimMixin,
     TasksStoreRunnerLifecycleMixin,
     TasksStoreRunnerHeartbeatMixin,
 ):
@@ -0,0 +1,394 @@
+"""TasksStore batch runner claims with row-level SKIP LOCKED."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from app.models.workspace import Task, TaskStatus
+from backend.app.services.mindscape_graph_changes import (
+    GRAPH_CHANGE_TASK,
+    record_graph_change,
+)
+from backend.app.services.runner_topology import build_queue_partition_filter_clause
+
+from ._base import _RUNNER_TASK_TYPES, _utc_now
+from ._runner_helpers import (
+    _build_claim_execution_context,
+    _clean_int,
+    _clean_string,
+    _json_mapping,
+    _normalize_concurrency_keys,
+    _quota_selectors,
+)
+
+
+def _candidate_selectors(task: Task) -> set[str]:
+    ctx = task.execution_context if isinstance(task.execution_context, dict) else {}
+    return {
+        value
+        for value in (
+            _clean_string(task.pack_id),
+            _clean_string(task.task_type),
+            _clean_string(ctx.get("playbook_code")),
+        )
+        if value
+    }
+
+
+class _QuotaLedger:
+    """Running-slot accounting for the allocations touched by one batch."""
+
+    def __init__(self, allocations: Iterable[Any]):
+        self._by_scope: Dict[tuple[str, str], List[Dict[str, Any]]] = {}
+        for row in allocations:
+            allocation = {
+                "allocation_id": row.allocation_id,
+                "state": _clean_string(getattr(row, "state", None)),
+                "max_parallel_task_claims": max(
+                    1,
+                    _clean_int(getattr(row, "max_parallel_task_claims", None), default=1),
+                ),
+                "metadata": _json_mapping(getattr(row, "metadata", None)),
+                "active": 0,
+            }
+            allocation["selectors"] = _quota_selectors(allocation)
+            scope = (str(row.workspace_id), str(row.queue_shard))
+            self._by_scope.setdefault(scope, []).append(allocation)
+
+    def _matching(
+        self, workspace_id: Any, queue_shard: Any, selectors: set[str]
+    ) -> List[Dict[str, Any]]:
+        return [
+            allocation
+            for allocation in self._by_scope.get(
+                (str(workspace_id or ""), str(queue_shard or "")), []
+            )
+            if not allocation["selectors"]
+            or selectors.intersection(allocation["selectors"])
+        ]
+
+    def note_running(
+        self, workspace_id: Any, queue_shard: Any, selectors: set[str]
+    ) -> None:
+        for allocation in self._matching(workspace_id, queue_shard, selectors):
+            allocation["active"] += 1
+
+    def match(self, task: Task) -> Optional[Dict[str, Any]]:
+        matching = self._matching(
+            task.workspace_id, task.queue_shard, _candidate_selectors(task)
+        )
+        return matching[0] if matching else None
+
+
+class TasksStoreRunnerBatchClaimMixin:
+    """Claim several ready tasks for one runner in a single transaction."""
+
+    def claim_ready_tasks(
+        self,
+        runner_id: str,
+        *,
+        queue_shards: Iterable[str],
+        limit: int,
+        scan_limit: Optional[int] = None,
+        task_filter: Optional[Callable[[Task], bool]] = None,
+        concurrency_keys_for: Optional[Callable[[Task], List[str]]] = None,
+        require_workspace_quota: bool = True,
+    ) -> List[Task]:
+        """
+        Claim up to ``limit`` ready pending tasks for ``runner_id``.
+
+        Candidates are locked with ``FOR UPDATE SKIP LOCKED`` so concurrent
+        runners split the ready frontier instead of racing for the same rows.
+        A candidate is skipped (left pending for the single-task path) when
+        ``task_filter`` rejects it, one of its concurrency keys is held by a
+        running task or an earlier claim of the batch, or its workspace
+        allocation is missing, disabled or full.
+
+        Returns:
+            The claimed tasks, rehydrated in their RUNNING state
+        """
+        limit = max(0, int(limit or 0))
+        if limit <= 0:
+            return []
+        try:
+            claimed = self._claim_ready_tasks_once(
+                runner_id,
+                queue_shards=queue_shards,
+                limit=limit,
+                scan_limit=scan_limit,
+                task_filter=task_filter,
+                concurrency_keys_for=concurrency_keys_for,
+                require_workspace_quota=require_workspace_quota,
+            )
+        except IntegrityError:
+            # A concurrent single-task claim took one of the concurrency keys;
+            # the batch rolled back and the caller falls back for this cycle.
+            return []
+        for task in claimed:
+            record_graph_change(task.workspace_id, GRAPH_CHANGE_TASK, task.id)
+        return claimed
+
+    def _claim_ready_tasks_once(
+        self,
+        runner_id: str,
+        *,
+        queue_shards: Iterable[str],
+        limit: int,
+        scan_limit: Optional[int],
+        task_filter: Optional[Callable[[Task], bool]],
+        concurrency_keys_for: Optional[Callable[[Task], List[str]]],
+        require_workspace_quota: bool,
+    ) -> List[Task]:
+        now = _utc_now()
+        with self.transaction() as conn:
+            is_sqlite = conn.dialect.name == "sqlite"
+            params: Dict[str, Any] = {
+                "pending_status": TaskStatus.PENDING.value,
+                "running_status": TaskStatus.RUNNING.value,
+                "ready_frontier_state": "ready",
+                "now": now,
+                "scan_limit": max(limit, int(scan_limit or limit * 4)),
+            }
+            type_placeholders = []
+            for index, task_type in enumerate(sorted(_RUNNER_TASK_TYPES)):
+                params[f"task_type_{index}"] = task_type
+                type_placeholders.append(f":task_type_{index}")
+            shard_clauses = []
+            for index, queue_shard in enumerate(queue_shards):
+                clause, clause_params = build_queue_partition_filter_clause(
+                    "queue_shard",
+                    queue_shard,
+                    param_prefix=f"queue_partition_{index}",
+                )
+                if clause:
+                    shard_clauses.append(clause)
+                    params.update(clause_params)
+            if not shard_clauses:
+                return []
+
+            rows = conn.execute(
+                text(
+                    f"""
+                    SELECT *
+                    FROM tasks
+                    WHERE status = :pending_status
+                      AND frontier_state = :ready_frontier_state
+                      AND (blocked_reason IS NULL OR blocked_reason = '')
+                      AND (next_eligible_at IS NULL OR next_eligible_at <= :now)
+                      AND task_type IN ({", ".join(type_placeholders)})
+                      AND ({" OR ".join(shard_clauses)})
+                    ORDER BY next_eligible_at ASC, created_at ASC, id ASC
+                    LIMIT :scan_limit
+                    {"" if is_sqlite else "FOR UPDATE SKIP LOCKED"}
+                    """
+                ),
+                params,
+            ).fetchall()
+            candidates = [self._row_to_task(row) for row in rows]
+            if task_filter is not None:
+                candidates = [task for task in candidates if task_filter(task)]
+            if not candidates:
+                return []
+
+            keys_by_task = {
+                task.id: _normalize_concurrency_keys(
+                    [
+                        *(
+                            concurrency_keys_for(task)
+                            if concurrency_keys_for is not None
+                            else []
+                        ),
+                        task.concurrency_key,
+                    ]
+                )
+                for task in candidates
+            }
+            held_keys = self._running_concurrency_keys(
+                conn,
+                {key for keys in keys_by_task.values() for key in keys},
+            )
+            quota = (
+                self._lock_quota_ledger(conn, candidates)
+                if require_workspace_quota
+                else None
+            )
+
+            selected: List[Task] = []
+            for task in candidates:
+                if len(selected) >= limit:
+                    break
+                keys = keys_by_task[task.id]
+                if held_keys.intersection(keys):
+                    continue
+                allocation = None
+                if quota is not None and task.workspace_id and task.queue_shard:
+                    allocation = quota.match(task)
+                    if (
+                        allocation is None
+                        or allocation["state"] != "enabled"
+                        or allocation["active"]
+                        >= allocation["max_parallel_task_claims"]
+                    ):
+                        continue
+                    allocation["active"] += 1
+                held_keys.update(keys)
+                selected.append(task)
+            if not selected:
+                return []
+
+            claim_params = [
+                {
+                    "task_id": task.id,
+                    "running_status": TaskStatus.RUNNING.value,
+                    "pending_status": TaskStatus.PENDING.value,
+                    "started_at": now,
+                    "runner_id": runner_id,
+                    "heartbeat_at": now,
+                    "frontier_state": "running",
+                    "execution_context": self.serialize_json(
+                        _build_claim_execution_context(
+                            task.execution_context or {},
+                            task_params=task.params,
+                            runner_id=runner_id,
+                            now=now,
+                        )
+                    ),
+                }
+                for task in selected
+            ]
+            conn.execute(
+                text(
+                    """
+                    UPDATE tasks
+                    SET status = :running_status,
+                        started_at = :started_at,
+                        runner_id = :runner_id,
+                        heartbeat_at = :heartbeat_at,
+                        execution_context = :execution_context,
+                        blocked_reason = NULL,
+                        blocked_payload = NULL,
+                        frontier_state = :frontier_state,
+                        frontier_enqueued_at = NULL
+                    WHERE id = :task_id AND status = :pending_status
+                    """
+                ),
+                claim_params,
+            )
+
+            claimed_ids = [task.id for task in selected]
+            if hasattr(self, "_record_task_claim"):
+                for task_id in claimed_ids:
+                    self._record_task_claim(
+                        conn,
+                        task_id=task_id,
+                        runner_id=runner_id,
+                        started_at=now,
+                    )
+            id_params = {f"claimed_{index}": task_id for index, task_id in enumerate(claimed_ids)}
+            claimed_rows = conn.execute(
+                text(
+                    f"""
+                    SELECT *
+                    FROM tasks
+                    WHERE id IN ({", ".join(f":{key}" for key in id_params)})
+                      AND status = :running_status
+                      AND runner_id = :runner_id
+                    """
+                ),
+                {
+                    **id_params,
+                    "running_status": TaskStatus.RUNNING.value,
+                    "runner_id": runner_id,
+                },
+            ).fetchall()
+            claimed_by_id = {row.id: self._row_to_task(row) for row in claimed_rows}
+            return [claimed_by_id[task_id] for task_id in claimed_ids if task_id in claimed_by_id]
+
+    def _running_concurrency_keys(self, conn, keys: set[str]) -> set[str]:
+        if not keys:
+            return set()
+        key_params = {f"concurrency_key_{index}": key for index, key in enumerate(sorted(keys))}
+        rows = conn.execute(
+            text(
+                f"""
+                SELECT DISTINCT concurrency_key
+                FROM tasks
+                WHERE status = :running_status
+                  AND concurrency_key IN ({", ".join(f":{key}" for key in key_params)})
+                """
+            ),
+            {"running_status": TaskStatus.RUNNING.value, **key_params},
+        ).fetchall()
+        return {row[0] for row in rows if row[0]}
+
+    def _lock_quota_ledger(self, conn, candidates: List[Task]) -> _QuotaLedger:
+        """Lock the candidates' workspace allocations and load their usage."""
+        scopes = sorted(
+            {
+                (str(task.workspace_id), str(task.queue_shard))
+                for task in candidates
+                if task.workspace_id and task.queue_shard
+            }
+        )
+        if not scopes:
+            return _QuotaLedger(())
+        params: Dict[str, Any] = {}
+        scope_clauses = []
+        for index, (workspace_id, queue_shard) in enumerate(scopes):
+            params[f"workspace_id_{index}"] = workspace_id
+            params[f"queue_shard_{index}"] = queue_shard
+            scope_clauses.append(
+                f"(workspace_id = :workspace_id_{index} AND queue_shard = :queue_shard_{index})"
+            )
+        # Same order as HostResourceWorkspaceAllocationStore.list_allocations,
+        # so the first matching allocation agrees with the single-task path.
+        allocations = conn.execute(
+            text(
+                f"""
+                SELECT allocation_id, workspace_id, queue_shard, state,
+                       max_parallel_task_claims, metadata
+                FROM host_resource_workspace_allocations
+                WHERE {" OR ".join(scope_clauses)}
+                ORDER BY {"allocation_id" if conn.dialect.name == "sqlite" else "updated_at DESC, allocation_id"}
+                {"" if conn.dialect.name == "sqlite" else "FOR UPDATE"}
+                """
+            ),
+            params,
+        ).fetchall()
+        ledger = _QuotaLedger(allocations)
+
+        playbook_expr = (
+            "json_extract(execution_context, '$.playbook_code')"
+            if conn.dialect.name == "sqlite"
+            else "execution_context::jsonb->>'playbook_code'"
+        )
+        running_rows = conn.execute(
+            text(
+                f"""
+                SELECT workspace_id, queue_shard, pack_id, task_type,
+                       {playbook_expr} AS playbook_code
+                FROM tasks
+                WHERE status = :running_status
+                  AND ({" OR ".join(scope_clauses)})
+                """
+            ),
+            {"running_status": TaskStatus.RUNNING.value, **params},
+        ).fetchall()
+        for row in running_rows:
+            ledger.note_running(
+                row.workspace_id,
+                row.queue_shard,
+                {
+                    value
+                    for value in (
+                        _clean_string(row.pack_id),
+                        _clean_string(row.task_type),
+                        _clean_string(row.playbook_code),
+                    )
+                    if value
+                },
+            )
+        return ledger
@@ -8,6 +8,10 @@ from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 
 from app.models.workspace import TaskStatus
+from backend.app.services.mindscape_graph_changes import (
+    GRAPH_CHANGE_TASK,
+    record_graph_change,
+)
 
 from ._base import _utc_now
 from ._runner_helpers import (
@@ -197,7 +201,9 @@ class TasksStoreRunnerClaimMixin:
             released = result.rowcount == 1
             if released:
                 self._refresh_task_projection(conn, task_id)
-            return released
+        if released:
+            record_graph_change(workspace_id, GRAPH_CHANGE_TASK, task_id)
+        return released
 
     def try_claim_task(
         self,
@@ -304,4 +310,8 @@ class TasksStoreRunnerClaimMixin:
                     runner_id=runner_id,
                     started_at=now,
                 )
-            return claimed
+        if claimed:
+            record_graph_change(
+                getattr(row, "workspace_id", None), GRAPH_CHANGE_TASK, task_id
+            )
+        return claimed
@@ -19,6 +19,7 @@ from app.models.workspace_resource_binding import (
     AccessMode,
 )
 from app.services.stores.postgres_base import PostgresStoreBase
+from app.services.tool_catalog_generation import bump_tool_catalog_generation
 
 
 class WorkspaceResourceBindingStore(PostgresStoreBase):
@@ -69,6 +70,8 @@ class WorkspaceResourceBindingStore(PostgresStoreBase):
                 },
             )
 
+        if binding.resource_type == ResourceType.TOOL:
+            self._tool_bindings_changed(binding.workspace_id)
         return binding
 
     def get_binding(
@@ -175,7 +178,11 @@ class WorkspaceResourceBindingStore(PostgresStoreBase):
 
         with self.transaction() as conn:
             result = conn.execute(text(" ".join(query_parts)), params)
-            return result.rowcount > 0
+            deleted = result.rowcount > 0
+        if deleted:
+            # The binding type is unknown here; tool overlays may have changed.
+            self._tool_bindings_changed(workspace_id)
+        return deleted
 
     def delete_binding_by_resource(
         self, workspace_id: str, resource_type: ResourceType, resource_id: str
@@ -197,7 +204,18 @@ class WorkspaceResourceBindingStore(PostgresStoreBase):
                     "resource_id": resource_id,
                 },
             )
-            return result.rowcount > 0
+            deleted = result.rowcount > 0
+        if deleted and resource_type == ResourceType.TOOL:
+            self._tool_bindings_changed(workspace_id)
+        return deleted
+
+    @staticmethod
+    def _tool_bindings_changed(workspace_id: Optional[str]) -> None:
+        """Drop tool lists and Tool RAG results derived from TOOL bindings."""
+        from backend.app.services.tool_rag import invalidate_tool_rag_cache
+
+        bump_tool_catalog_generation()
+        invalidate_tool_rag_cache(workspace_id=workspace_id)
 
     def _coerce_datetime(self, value: Optional[Any]) -> Optional[datetime]:
         if value is None:
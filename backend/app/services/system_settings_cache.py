@@ -0,0 +1,94 @@
+"""
+Process-local cache for hot system settings read on request paths.
+
+Values are cached per key with a short TTL so that other processes' writes
+converge quickly, and are invalidated immediately when this process writes
+the key through ``SystemSettingsStore``. Listeners let dependent caches
+(for example embedding caches keyed by model) drop state on change.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SettingLoader = Callable[[str], Any]
+SettingListener = Callable[[str], None]
+
+_LOCK = threading.Lock()
+_ENTRIES: Dict[str, Tuple[Any, float]] = {}
+_LISTENERS: Dict[str, List[SettingListener]] = {}
+
+
+def _default_ttl_seconds() -> float:
+    try:
+        return max(0.0, float(os.getenv("SYSTEM_SETTINGS_CACHE_TTL_SECONDS", "30")))
+    except ValueError:
+        return 30.0
+
+
+def _load_setting_value(key: str) -> Any:
+    from backend.app.services.system_settings_store import SystemSettingsStore
+
+    setting = SystemSettingsStore().get_setting(key)
+    return setting.value if setting else None
+
+
+def get_cached_setting_value(
+    key: str,
+    *,
+    loader: Optional[SettingLoader] = None,
+    ttl_seconds: Optional[float] = None,
+) -> Any:
+    """Return the setting value for ``key``, loading it at most once per TTL."""
+    now = time.monotonic()
+    with _LOCK:
+        cached = _ENTRIES.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    value = (loader or _load_setting_value)(key)
+    ttl = _default_ttl_seconds() if ttl_seconds is None else ttl_seconds
+    with _LOCK:
+        _ENTRIES[key] = (value, time.monotonic() + ttl)
+    return value
+
+
+def invalidate_cached_setting(key: Optional[str] = None) -> None:
+    """Drop one cached key, or every cached key when ``key`` is None."""
+    with _LOCK:
+        if key is None:
+            _ENTRIES.clear()
+        else:
+            _ENTRIES.pop(key, None)
+
+
+def add_setting_change_listener(key: str, listener: SettingListener) -> None:
+    """Register ``listener`` to run after ``key`` is written in this process."""
+    with _LOCK:
+        listeners = _LISTENERS.setdefault(key, [])
+        if listener not in listeners:
+            listeners.append(listener)
+
+
+def notify_setting_changed(key: str) -> None:
+    """Invalidate ``key`` and run its change listeners."""
+    invalidate_cached_setting(key)
+    with _LOCK:
+        listeners = list(_LISTENERS.get(key, ()))
+    for listener in listeners:
+        try:
+            listener(key)
+        except Exception as exc:
+            logger.warning("System setting listener failed for %s: %s", key, exc)
+
+
+__all__ = [
+    "add_setting_change_listener",
+    "get_cached_setting_value",
+    "invalidate_cached_setting",
+    "notify_setting_changed",
+]
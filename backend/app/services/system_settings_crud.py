@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Union
 from sqlalchemy import text
 
 from backend.app.models.system_settings import SystemSetting, SettingType
+from backend.app.services.system_settings_cache import notify_setting_changed
 from backend.app.services.system_settings_utils import _utc_now
 
 logger = logging.getLogger(__name__)
@@ -236,6 +237,7 @@ class SystemSettingsCRUDMixin:
                 },
             )
 
+        notify_setting_changed(setting.key)
         logger.info(
             "Saved system setting: %s (value length: %s)",
             setting.key,
@@ -297,6 +299,7 @@ class SystemSettingsCRUDMixin:
             deleted = result.rowcount > 0
 
         if deleted:
+            notify_setting_changed(key)
             logger.info("Deleted system setting: %s", key)
 
         return deleted
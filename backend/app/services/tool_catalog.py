@@ -0,0 +1,162 @@
+"""Indexed tool catalog behind ToolListService.
+
+The merged tool list (discovered, built-in and capability tools) is built
+once per tool catalog generation and indexed by id, source, category and
+capability pack. Tool installs, capability reloads and manifest changes on
+disk bump the generation; the next read rebuilds the catalog. Formatted
+prompt strings are cached on the catalog, so they expire with it.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.services.tool_catalog_generation import (
+    bump_tool_catalog_generation,
+    current_tool_catalog_generation,
+)
+
+if TYPE_CHECKING:
+    from app.services.tool_list_service import ToolInfo, ToolListService
+
+logger = logging.getLogger(__name__)
+
+_CAPABILITIES_DIR = Path(__file__).resolve().parents[1] / "capabilities"
+# Manifest edits on disk are noticed at most this long after they happen.
+_MANIFEST_SCAN_INTERVAL_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class ToolCatalog:
+    """Merged tool views and lookup indexes for one catalog generation."""
+
+    generation: int
+    all_tools: Tuple["ToolInfo", ...]
+    enabled_tools: Tuple["ToolInfo", ...]
+    by_id: Dict[str, "ToolInfo"]
+    by_source: Dict[str, Tuple["ToolInfo", ...]]
+    by_category: Dict[str, Tuple["ToolInfo", ...]]
+    by_capability: Dict[str, Tuple["ToolInfo", ...]]
+    tools_strings: Dict[tuple, Optional[str]] = field(default_factory=dict)
+
+    def tools(self, enabled_only: bool = True) -> List["ToolInfo"]:
+        return list(self.enabled_tools if enabled_only else self.all_tools)
+
+
+# data_dir -> catalog; replaced wholesale whenever the generation moves.
+_catalogs: Dict[str, ToolCatalog] = {}
+_manifest_scan_state: Dict[str, Any] = {"checked_at": None, "signature": None}
+
+
+def merge_tool_sources(*sources: Iterable["ToolInfo"]) -> Dict[str, "ToolInfo"]:
+    """Merge tool lists, keeping the first occurrence of every tool ID."""
+    merged: Dict[str, "ToolInfo"] = {}
+    for tools in sources:
+        for tool in tools:
+            merged.setdefault(tool.tool_id, tool)
+    return merged
+
+
+def _tool_capability_code(tool: "ToolInfo") -> Optional[str]:
+    if tool.source != "capability":
+        return None
+    tool_info = (tool.metadata or {}).get("tool_info") or {}
+    capability_code = tool_info.get("capability")
+    if capability_code:
+        return str(capability_code)
+    return tool.tool_id.split(".", 1)[0] if "." in tool.tool_id else None
+
+
+def _group_tools(
+    tools: Iterable["ToolInfo"], key_fn: Callable[["ToolInfo"], Optional[str]]
+) -> Dict[str, Tuple["ToolInfo", ...]]:
+    grouped: Dict[str, List["ToolInfo"]] = {}
+    for tool in tools:
+        key = key_fn(tool)
+        if key is not None:
+            grouped.setdefault(key, []).append(tool)
+    return {key: tuple(values) for key, values in grouped.items()}
+
+
+def _check_manifest_signature(service: "ToolListService") -> None:
+    """Bump the catalog generation when capability manifests change on disk."""
+    now = time.monotonic()
+    checked_at = _manifest_scan_state["checked_at"]
+    if checked_at is not None and now - checked_at < _MANIFEST_SCAN_INTERVAL_SECONDS:
+        return
+    signature = service._manifest_scan_signature(_CAPABILITIES_DIR)
+    _manifest_scan_state["checked_at"] = now
+    if signature != _manifest_scan_state["signature"]:
+        _manifest_scan_state["signature"] = signature
+        bump_tool_catalog_generation()
+
+
+def build_tool_catalog(service: "ToolListService", generation: int) -> ToolCatalog:
+    # Same precedence as ToolListService.get_all_tools: discovered tools,
+    # then built-in tools, then capability pack tools.
+    discovered_tools = service._get_discovered_tools(enabled_only=False)
+    builtin_tools = service._get_builtin_tools()
+    capability_tools = service._get_capability_tools()
+    static_tools = tuple(merge_tool_sources(builtin_tools, capability_tools).values())
+    all_tools = tuple(merge_tool_sources(discovered_tools, static_tools).values())
+    enabled_tools = tuple(
+        merge_tool_sources(
+            (tool for tool in discovered_tools if tool.enabled), static_tools
+        ).values()
+    )
+
+    logger.info(
+        f"ToolCatalog: Indexed {len(all_tools)} unique tools at generation "
+        f"{generation} ({len(discovered_tools)} discovered, "
+        f"{len(builtin_tools)} built-in, {len(capability_tools)} capability)"
+    )
+
+    return ToolCatalog(
+        generation=generation,
+        all_tools=all_tools,
+        enabled_tools=enabled_tools,
+        by_id={tool.tool_id: tool for tool in all_tools},
+        by_source=_group_tools(all_tools, lambda tool: tool.source),
+        by_category=_group_tools(all_tools, lambda tool: tool.category),
+        by_capability=_group_tools(all_tools, _tool_capability_code),
+    )
+
+
+def tool_catalog_for(service: "ToolListService") -> ToolCatalog:
+    """Return the indexed catalog, rebuilding it when the generation moved."""
+    _check_manifest_signature(service)
+    generation = current_tool_catalog_generation()
+    catalog = _catalogs.get(service.data_dir)
+    if catalog is not None and catalog.generation == generation:
+        return catalog
+    catalog = build_tool_catalog(service, generation)
+    _catalogs[service.data_dir] = catalog
+    return catalog
+
+
+def cached_tools_string(method: Callable[..., Optional[str]]):
+    """Cache ``get_tools_string`` results on the current catalog."""
+
+    @functools.wraps(method)
+    def wrapper(service: "ToolListService", *args: Any, **kwargs: Any) -> Optional[str]:
+        catalog = tool_catalog_for(service)
+        cache_key = (args, tuple(sorted(kwargs.items())))
+        if cache_key not in catalog.tools_strings:
+            catalog.tools_strings[cache_key] = method(service, *args, **kwargs)
+        return catalog.tools_strings[cache_key]
+
+    return wrapper
+
+
+__all__ = [
+    "ToolCatalog",
+    "build_tool_catalog",
+    "cached_tools_string",
+    "merge_tool_sources",
+    "tool_catalog_for",
+]
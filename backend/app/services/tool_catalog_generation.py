@@ -0,0 +1,41 @@
+"""Process-wide generation counter for the merged tool catalog.
+
+Every place that changes which tools exist, or what they describe, bumps the
+counter. ``ToolListService`` keeps its indexes and formatted prompt strings
+until the value moves.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+
+# The backend is importable through both roots during the compatibility period.
+# Keep one module object so both import forms observe the same counter.
+_CURRENT_MODULE = sys.modules[__name__]
+sys.modules.setdefault("app.services.tool_catalog_generation", _CURRENT_MODULE)
+sys.modules.setdefault(
+    "backend.app.services.tool_catalog_generation", _CURRENT_MODULE
+)
+
+_GENERATION_LOCK = threading.Lock()
+_generation = 0
+
+
+def current_tool_catalog_generation() -> int:
+    """Return the current catalog generation."""
+    return _generation
+
+
+def bump_tool_catalog_generation() -> int:
+    """Mark every cached tool catalog view as stale and return the new value."""
+    global _generation
+    with _GENERATION_LOCK:
+        _generation += 1
+        return _generation
+
+
+__all__ = [
+    "bump_tool_catalog_generation",
+    "current_tool_catalog_generation",
+]
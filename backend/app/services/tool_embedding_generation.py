@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple
 
 from backend.app.services.tool_embedding_service_core import NOMIC_MODELS
 
@@ -28,6 +28,37 @@ async def generate_embedding(
         return None, None
 
 
+async def generate_embeddings_batch(
+    service: Any,
+    texts: Sequence[str],
+    *,
+    model_name: Optional[str] = None,
+    is_query: bool = False,
+) -> List[Tuple[Optional[List[float]], Optional[str]]]:
+    """Embed many texts in batched provider calls, one (embedding, model) per text.
+
+    With an explicit ``model_name`` the OpenAI fallback is disabled so every
+    row keeps the requested model identity.
+    """
+    try:
+        from backend.app.services.vector_search import VectorSearchService
+
+        vs = VectorSearchService(postgres_config=service.postgres_config)
+        receipts = await vs.embedding_generator.generate_embeddings_batch(
+            texts,
+            is_query=is_query,
+            model=model_name,
+            allow_openai_fallback=model_name is None,
+        )
+    except Exception as e:
+        logger.warning(f"Batch embedding generation failed: {e}")
+        return [(None, None)] * len(texts)
+    return [
+        (list(receipt.embedding), receipt.model) if receipt else (None, None)
+        for receipt in receipts
+    ]
+
+
 async def generate_embedding_for_model(
     service: Any, text: str, model_name: str, *, is_query: bool = True
 ) -> Tuple[Optional[List[float]], Optional[str]]:
@@ -6,6 +6,9 @@ import json
 import logging
 from typing import Any, List
 
+from backend.app.services.tool_embedding_memory_index import (
+    invalidate_tool_retrieval_index,
+)
 from backend.app.services.tool_embedding_service_core import (
     IndexableEntry,
     MultiModelIndexingError,
@@ -85,6 +88,7 @@ async def index_tool(
                     ),
                 )
             conn.commit()
+            invalidate_tool_retrieval_index()
             return True
         finally:
             conn.close()
@@ -157,29 +161,118 @@ async def collect_indexable_entries(
     return entries
 
 
+_BULK_UPSERT_SQL = """
+    INSERT INTO tool_embeddings
+        (tool_id, display_name, description, category,
+         capability_code, embedding, embedding_model,
+         embedding_dim, affordance, updated_at)
+    VALUES %s
+    ON CONFLICT (tool_id, embedding_model)
+    DO UPDATE SET
+        display_name = EXCLUDED.display_name,
+        description = EXCLUDED.description,
+        category = EXCLUDED.category,
+        capability_code = EXCLUDED.capability_code,
+        embedding = EXCLUDED.embedding,
+        embedding_dim = EXCLUDED.embedding_dim,
+        affordance = EXCLUDED.affordance,
+        updated_at = now()
+"""
+_BULK_UPSERT_TEMPLATE = "(%s, %s, %s, %s, %s, %s::vector, %s, %s, %s, now())"
+
+
+def _entry_embed_text(service: Any, entry: IndexableEntry) -> str:
+    embed_text = build_embed_text(entry["display_name"], entry["description"])
+    if entry["capability_code"]:
+        try:
+            cap_meta = service._get_capability_manifest_context(
+                entry["capability_code"]
+            )
+            if cap_meta:
+                embed_text = build_embed_text(
+                    entry["display_name"],
+                    entry["description"],
+                    capability_context=cap_meta,
+                )
+        except Exception:
+            pass
+    return embed_text
+
+
+def _bulk_upsert_rows(service: Any, rows: List[tuple]) -> int:
+    """Upsert embedded rows in one transaction; returns rows written."""
+    if not rows:
+        return 0
+    # ON CONFLICT cannot touch the same key twice in one statement.
+    unique_rows = list({(row[0], row[6]): row for row in rows}.values())
+    from psycopg2.extras import execute_values
+
+    conn = service._get_connection()
+    try:
+        with conn.cursor() as cur:
+            execute_values(
+                cur,
+                _BULK_UPSERT_SQL,
+                unique_rows,
+                template=_BULK_UPSERT_TEMPLATE,
+                page_size=200,
+            )
+        conn.commit()
+    finally:
+        conn.close()
+    invalidate_tool_retrieval_index()
+    return len(unique_rows)
+
+
+async def _index_entries_batched(
+    service: Any,
+    entries: List[IndexableEntry],
+    *,
+    model_name: str | None = None,
+) -> int:
+    """Embed entries in batched provider calls and bulk-upsert the results."""
+    texts = [_entry_embed_text(service, entry) for entry in entries]
+    results = await service._generate_embeddings_batch(
+        texts, model_name=model_name, is_query=False
+    )
+    rows: List[tuple] = []
+    for entry, (embedding, used_model) in zip(entries, results):
+        if embedding is None or used_model is None:
+            logger.warning(
+                f"  Embed failed for {entry['tool_id']} ({model_name or 'default'})"
+            )
+            continue
+        rows.append(
+            (
+                entry["tool_id"],
+                entry["display_name"],
+                entry["description"],
+                entry["category"],
+                entry["capability_code"],
+                vector_to_pg_literal(embedding),
+                used_model,
+                len(embedding),
+                json.dumps(entry.get("affordance") or {}),
+            )
+        )
+    try:
+        return _bulk_upsert_rows(service, rows)
+    except Exception as e:
+        logger.error(
+            f"  Bulk DB write failed for {len(rows)} entries "
+            f"({model_name or 'default'}): {e}"
+        )
+        return 0
+
+
 async def index_all_tools(service: Any, *, include_playbooks: bool = True) -> int:
     """Index all tools from ToolListService."""
     entries = await service._collect_indexable_entries(
         include_playbooks=include_playbooks
     )
-    count = 0
-    tool_entries = 0
-    playbook_entries = 0
-    for entry in entries:
-        ok = await service.index_tool(
-            tool_id=entry["tool_id"],
-            display_name=entry["display_name"],
-            description=entry["description"],
-            category=entry["category"],
-            capability_code=entry["capability_code"],
-            affordance=entry.get("affordance"),
-        )
-        if ok:
-            count += 1
-        if entry["category"] == "playbook":
-            playbook_entries += 1
-        else:
-            tool_entries += 1
+    count = await _index_entries_batched(service, entries)
+    playbook_entries = sum(1 for entry in entries if entry["category"] == "playbook")
+    tool_entries = len(entries) - playbook_entries
 
     logger.info(
         "Indexed %d/%d entries (%d tools, %d playbooks)",
@@ -285,75 +378,7 @@ async def index_all_tools_for_model(
     entries = await service._collect_indexable_entries(
         include_playbooks=include_playbooks
     )
-    count = 0
-    for entry in entries:
-        embed_text = build_embed_text(entry["display_name"], entry["description"])
-        if entry["capability_code"]:
-            try:
-                cap_meta = service._get_capability_manifest_context(
-                    entry["capability_code"]
-                )
-                if cap_meta:
-                    embed_text = build_embed_text(
-                        entry["display_name"],
-                        entry["description"],
-                        capability_context=cap_meta,
-                    )
-            except Exception:
-                pass
-        emb, used_model = await service._generate_embedding_for_model(
-            embed_text, model_name, is_query=False
-        )
-        if emb is None:
-            logger.warning(f"  Embed failed for {entry['tool_id']} ({model_name})")
-            continue
-
-        embedding_str = vector_to_pg_literal(emb)
-        embedding_dim = len(emb)
-        try:
-            conn = service._get_connection()
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        INSERT INTO tool_embeddings
-                            (tool_id, display_name, description, category,
-                             capability_code, embedding, embedding_model,
-                             embedding_dim, affordance, updated_at)
-                        VALUES (%s, %s, %s, %s, %s, %s::vector, %s, %s, %s, now())
-                        ON CONFLICT (tool_id, embedding_model)
-                        DO UPDATE SET
-                            display_name = EXCLUDED.display_name,
-                            description = EXCLUDED.description,
-                            category = EXCLUDED.category,
-                            capability_code = EXCLUDED.capability_code,
-                            embedding = EXCLUDED.embedding,
-                            embedding_dim = EXCLUDED.embedding_dim,
-                            affordance = EXCLUDED.affordance,
-                            updated_at = now()
-                        """,
-                        (
-                            entry["tool_id"],
-                            entry["display_name"],
-                            entry["description"],
-                            entry["category"],
-                            entry["capability_code"],
-                            embedding_str,
-                            used_model,
-                            embedding_dim,
-                            json.dumps(entry.get("affordance") or {}),
-                        ),
-                    )
-                conn.commit()
-                count += 1
-            finally:
-                conn.close()
-        except Exception as e:
-            logger.error(
-                f"  DB write failed for {entry['tool_id']} ({model_name}): {e}"
-            )
-
-    return count
+    return await _index_entries_batched(service, entries, model_name=model_name)
 
 
 async def reindex_all(service: Any) -> int:
@@ -369,6 +394,7 @@ async def reindex_all(service: Any) -> int:
                     (current_model,),
                 )
             conn.commit()
+            invalidate_tool_retrieval_index()
         finally:
             conn.close()
     except Exception as e:
@@ -0,0 +1,306 @@
+"""In-process Tool RAG retrieval index.
+
+The tool corpus is a few thousand rows at most and changes rarely. This
+module loads ``tool_embeddings`` once into a normalised float32 matrix per
+embedding model and a BM25 index over name and description, so vector and
+lexical searches run without a database round trip. Indexing writes and
+``invalidate_tool_rag_cache`` drop the snapshot; the next search reloads it.
+When a snapshot cannot be loaded, callers keep using the pgvector queries.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.app.services.tool_embedding_service_core import ToolMatch
+
+logger = logging.getLogger(__name__)
+
+# Other processes that write embeddings cannot invalidate this snapshot, so it
+# is also refreshed once it is older than this.
+_INDEX_MAX_AGE_SECONDS = 300.0
+_LOAD_RETRY_SECONDS = 30.0
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+# Mirrors the ``simple`` text search parser: lowercase word runs, split on
+# punctuation and underscores.
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+_LOAD_SQL = """
+    SELECT tool_id, display_name, description, category, capability_code,
+           embedding_model, embedding::text
+    FROM tool_embeddings
+    ORDER BY embedding_model, tool_id
+"""
+
+# (tool_id, display_name, description, category, capability_code)
+ToolRow = Tuple[str, str, str, str, Optional[str]]
+
+
+def memory_index_enabled() -> bool:
+    return os.getenv("TOOL_RAG_MEMORY_INDEX_ENABLED", "true").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+
+
+def tokenize(text: str) -> List[str]:
+    return [token.lower() for token in _TOKEN_RE.findall(text or "")]
+
+
+def _to_match(row: ToolRow, similarity: float) -> ToolMatch:
+    return ToolMatch(
+        tool_id=row[0],
+        display_name=row[1],
+        description=row[2],
+        category=row[3],
+        capability_code=row[4],
+        similarity=similarity,
+    )
+
+
+class EmbeddingMatrix:
+    """Exact cosine top-k over one embedding model's rows."""
+
+    def __init__(self, model_name: str, rows: Sequence[ToolRow], vectors: np.ndarray):
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.model_name = model_name
+        self.rows = tuple(rows)
+        self.matrix = np.ascontiguousarray(vectors / norms, dtype=np.float32)
+
+    @property
+    def dim(self) -> int:
+        return int(self.matrix.shape[1])
+
+    def top_k(
+        self,
+        query_embedding: Sequence[float],
+        top_k: int,
+        min_score: float = 0.0,
+    ) -> List[ToolMatch]:
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if top_k <= 0 or not self.rows or query.shape != (self.dim,):
+            return []
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return []
+        scores = self.matrix @ (query / norm)
+        count = min(top_k, len(self.rows))
+        if count < len(self.rows):
+            candidates = np.argpartition(-scores, count - 1)[:count]
+        else:
+            candidates = np.arange(len(self.rows))
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [
+            _to_match(self.rows[index], float(scores[index]))
+            for index in ordered
+            if scores[index] >= min_score
+        ]
+
+
+class LexicalIndex:
+    """BM25 over ``display_name`` and ``description``.
+
+    Like ``plainto_tsquery``, a row only matches when it contains every query
+    term; matching rows are then ranked by BM25.
+    """
+
+    def __init__(self, rows: Sequence[ToolRow]):
+        self.rows = tuple(rows)
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.lengths: List[int] = []
+        for doc_index, row in enumerate(self.rows):
+            tokens = tokenize(f"{row[1] or ''} {row[2] or ''}")
+            self.lengths.append(len(tokens))
+            for token in tokens:
+                postings = self.postings.setdefault(token, {})
+                postings[doc_index] = postings.get(doc_index, 0) + 1
+        average_length = sum(self.lengths) / len(self.lengths) if self.lengths else 1.0
+        self.length_norms = [
+            _BM25_K1 * (1.0 - _BM25_B + _BM25_B * length / (average_length or 1.0))
+            for length in self.lengths
+        ]
+        self.idf = {
+            term: math.log(
+                1.0 + (len(self.rows) - len(postings) + 0.5) / (len(postings) + 0.5)
+            )
+            for term, postings in self.postings.items()
+        }
+
+    def search(self, query: str, top_k: int) -> List[ToolMatch]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if top_k <= 0 or not terms or any(term not in self.postings for term in terms):
+            return []
+        terms.sort(key=lambda term: len(self.postings[term]))
+        candidates = set(self.postings[terms[0]])
+        for term in terms[1:]:
+            candidates.intersection_update(self.postings[term])
+            if not candidates:
+                return []
+
+        weighted_terms = [(self.idf[term], self.postings[term]) for term in terms]
+        scored = []
+        for doc_index in candidates:
+            length_norm = self.length_norms[doc_index]
+            score = 0.0
+            for idf, postings in weighted_terms:
+                term_freq = postings[doc_index]
+                score += idf * term_freq * (_BM25_K1 + 1.0) / (term_freq + length_norm)
+            scored.append((-score, doc_index))
+        return [
+            _to_match(self.rows[doc_index], -negative_score)
+            for negative_score, doc_index in heapq.nsmallest(top_k, scored)
+        ]
+
+
+@dataclass(frozen=True)
+class ToolRetrievalSnapshot:
+    """Everything Tool RAG needs to answer a query without the database."""
+
+    matrices: Dict[str, EmbeddingMatrix]
+    lexical: LexicalIndex
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def models(self) -> List[str]:
+        return sorted(self.matrices)
+
+    def search_vectors(
+        self,
+        model_name: str,
+        query_embedding: Sequence[float],
+        top_k: int,
+        min_score: float = 0.0,
+    ) -> List[ToolMatch]:
+        matrix = self.matrices.get(model_name)
+        if matrix is None:
+            return []
+        return matrix.top_k(query_embedding, top_k, min_score=min_score)
+
+    def search_bm25(self, query: str, top_k: int) -> List[ToolMatch]:
+        return self.lexical.search(query, top_k)
+
+
+def build_snapshot(rows: Sequence[Sequence[Any]]) -> ToolRetrievalSnapshot:
+    """Build a snapshot from ``_LOAD_SQL`` shaped rows."""
+    by_model: Dict[str, Tuple[List[ToolRow], List[np.ndarray]]] = {}
+    lexical_rows: Dict[str, ToolRow] = {}
+    for row in rows:
+        tool_row: ToolRow = (
+            str(row[0]),
+            str(row[1] or row[0]),
+            str(row[2] or ""),
+            str(row[3] or ""),
+            row[4],
+        )
+        lexical_rows.setdefault(tool_row[0], tool_row)
+        vector = np.fromstring(str(row[6]).strip("[]"), dtype=np.float32, sep=",")
+        model_rows, vectors = by_model.setdefault(str(row[5]), ([], []))
+        if vectors and vector.shape != vectors[0].shape:
+            logger.warning(
+                "Tool RAG index: skipping %s for %s (dim %d != %d)",
+                tool_row[0],
+                row[5],
+                vector.shape[0],
+                vectors[0].shape[0],
+            )
+            continue
+        model_rows.append(tool_row)
+        vectors.append(vector)
+
+    return ToolRetrievalSnapshot(
+        matrices={
+            model_name: EmbeddingMatrix(model_name, model_rows, np.vstack(vectors))
+            for model_name, (model_rows, vectors) in by_model.items()
+        },
+        lexical=LexicalIndex(list(lexical_rows.values())),
+    )
+
+
+_lock = threading.Lock()
+_generation = 0
+_snapshots: Dict[str, ToolRetrievalSnapshot] = {}
+_failed_at: Dict[str, float] = {}
+
+
+def _snapshot_key(service: Any) -> str:
+    config = getattr(service, "postgres_config", None) or {}
+    return repr(sorted(config.items()))
+
+
+def invalidate_tool_retrieval_index() -> None:
+    """Drop every loaded snapshot; the next search reloads from the database."""
+    global _generation
+    with _lock:
+        _generation += 1
+        _snapshots.clear()
+        _failed_at.clear()
+
+
+def get_tool_retrieval_index(service: Any) -> Optional[ToolRetrievalSnapshot]:
+    """Return a fresh snapshot for *service*'s database, or None to use pgvector."""
+    if not memory_index_enabled():
+        return None
+    key = _snapshot_key(service)
+    now = time.monotonic()
+    with _lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is not None and now - snapshot.loaded_at < _INDEX_MAX_AGE_SECONDS:
+            return snapshot
+        failed_at = _failed_at.get(key)
+        if failed_at is not None and now - failed_at < _LOAD_RETRY_SECONDS:
+            return None
+        generation = _generation
+
+    try:
+        conn = service._get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(_LOAD_SQL)
+                rows = cur.fetchall()
+        finally:
+            conn.close()
+        snapshot = build_snapshot(rows)
+    except Exception as exc:
+        logger.warning("Tool RAG index load failed, using pgvector: %s", exc)
+        with _lock:
+            _failed_at[key] = now
+        return None
+
+    # An empty table usually means indexing has not run yet; keep asking the
+    # database instead of pinning the empty corpus for the snapshot lifetime.
+    if snapshot.matrices:
+        with _lock:
+            if generation == _generation:
+                _snapshots[key] = snapshot
+                _failed_at.pop(key, None)
+        logger.info(
+            "Tool RAG index loaded: %d rows across %s",
+            sum(len(matrix.rows) for matrix in snapshot.matrices.values()),
+            snapshot.models,
+        )
+    return snapshot
+
+
+__all__ = [
+    "EmbeddingMatrix",
+    "LexicalIndex",
+    "ToolRetrievalSnapshot",
+    "build_snapshot",
+    "get_tool_retrieval_index",
+    "invalidate_tool_retrieval_index",
+    "memory_index_enabled",
+    "tokenize",
+]
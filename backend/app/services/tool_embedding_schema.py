@@ -5,6 +5,10 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict
 
+from backend.app.services.tool_embedding_memory_index import (
+    invalidate_tool_retrieval_index,
+)
+
 logger = logging.getLogger(__name__)
 
 _REQUIRED_COLUMNS = {
@@ -76,6 +80,7 @@ async def remove_tool(service: Any, tool_id: str) -> bool:
                 )
                 deleted = cur.rowcount
             conn.commit()
+            invalidate_tool_retrieval_index()
             logger.info(f"Removed {deleted} embedding(s) for tool {tool_id}")
             return True
         finally:
@@ -97,6 +102,7 @@ async def remove_tools_by_capability(service: Any, capability_code: str) -> int:
                 )
                 deleted = cur.rowcount
             conn.commit()
+            invalidate_tool_retrieval_index()
             logger.info(
                 f"Removed {deleted} embedding(s) for capability {capability_code}"
             )
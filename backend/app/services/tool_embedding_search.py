@@ -7,6 +7,9 @@ import json
 import logging
 from typing import Any, List, Optional, Tuple
 
+from backend.app.services.tool_embedding_memory_index import (
+    get_tool_retrieval_index,
+)
 from backend.app.services.tool_embedding_service_core import (
     RAG_ERROR,
     RAG_HIT,
@@ -20,50 +23,74 @@ from backend.app.services.tool_embedding_service_core import (
 
 logger = logging.getLogger(__name__)
 
+_VECTOR_SEARCH_SQL = """
+    SELECT
+        tool_id,
+        display_name,
+        description,
+        category,
+        capability_code,
+        1 - (embedding <=> %s::vector) AS similarity
+    FROM tool_embeddings
+    WHERE embedding_model = %s
+    ORDER BY embedding <=> %s::vector
+    LIMIT %s
+"""
+
+
+def _fetch_vector_rows(
+    service: Any,
+    query_embedding: List[float],
+    model_name: str,
+    top_k: int,
+) -> List[Any]:
+    embedding_str = vector_to_pg_literal(query_embedding)
+    conn = service._get_connection()
+    try:
+        from psycopg2.extras import RealDictCursor
+
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                _VECTOR_SEARCH_SQL,
+                (embedding_str, model_name, embedding_str, top_k),
+            )
+            return cur.fetchall()
+    finally:
+        conn.close()
+
 
 async def search(
     service: Any,
     query: str,
     top_k: int = 15,
     min_score: float = 0.3,
+    *,
+    query_embedding: Optional[List[float]] = None,
+    model_name: Optional[str] = None,
 ) -> Tuple[List[ToolMatch], str]:
-    """Search tool embeddings by cosine similarity."""
-    query_embedding, model_name = await service._generate_embedding(query)
+    """Search tool embeddings by cosine similarity.
+
+    A caller that already embedded *query* passes the embedding and the
+    model that produced it to skip a second embedding call.
+    """
+    if query_embedding is None or model_name is None:
+        query_embedding, model_name = await service._generate_embedding(query)
     if query_embedding is None or model_name is None:
         return [], RAG_ERROR
 
-    embedding_str = vector_to_pg_literal(query_embedding)
-
-    try:
-        conn = service._get_connection()
+    index = get_tool_retrieval_index(service)
+    # A snapshot loaded before this model was indexed has no matrix for it.
+    if index is not None and model_name in index.matrices:
+        matches = index.search_vectors(
+            model_name, query_embedding, top_k, min_score=min_score
+        )
+    else:
         try:
-            from psycopg2.extras import RealDictCursor
-
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(
-                    """
-                    SELECT
-                        tool_id,
-                        display_name,
-                        description,
-                        category,
-                        capability_code,
-                        1 - (embedding <=> %s::vector) AS similarity
-                    FROM tool_embeddings
-                    WHERE embedding_model = %s
-                    ORDER BY embedding <=> %s::vector
-                    LIMIT %s
-                    """,
-                    (embedding_str, model_name, embedding_str, top_k),
-                )
-                rows = cur.fetchall()
-        finally:
-            conn.close()
-    except Exception as e:
-        logger.error(f"Tool embedding search failed: {e}")
-        return [], RAG_ERROR
-
-    matches = filter_mapping_rows_by_score(rows, min_score=min_score)
+            rows = _fetch_vector_rows(service, query_embedding, model_name, top_k)
+        except Exception as e:
+            logger.error(f"Tool embedding search failed: {e}")
+            return [], RAG_ERROR
+        matches = filter_mapping_rows_by_score(rows, min_score=min_score)
 
     if matches:
         logger.info(
@@ -78,6 +105,9 @@ async def search(
 
 async def get_indexed_models(service: Any) -> List[str]:
     """Return all distinct embedding_model values that have rows."""
+    index = get_tool_retrieval_index(service)
+    if index is not None:
+        return index.models
     try:
         conn = service._get_connection()
         try:
@@ -101,32 +131,13 @@ async def search_single_model(
     min_score: float = 0.0,
 ) -> List[ToolMatch]:
     """Vector search restricted to one embedding_model."""
-    embedding_str = vector_to_pg_literal(query_embedding)
+    index = get_tool_retrieval_index(service)
+    if index is not None and model_name in index.matrices:
+        return index.search_vectors(
+            model_name, query_embedding, top_k, min_score=min_score
+        )
     try:
-        conn = service._get_connection()
-        try:
-            from psycopg2.extras import RealDictCursor
-
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(
-                    """
-                    SELECT
-                        tool_id,
-                        display_name,
-                        description,
-                        category,
-                        capability_code,
-                        1 - (embedding <=> %s::vector) AS similarity
-                    FROM tool_embeddings
-                    WHERE embedding_model = %s
-                    ORDER BY embedding <=> %s::vector
-                    LIMIT %s
-                    """,
-                    (embedding_str, model_name, embedding_str, top_k),
-                )
-                rows = cur.fetchall()
-        finally:
-            conn.close()
+        rows = _fetch_vector_rows(service, query_embedding, model_name, top_k)
     except Exception as e:
         logger.warning(f"_search_single_model({model_name}) failed: {e}")
         return []
@@ -139,7 +150,10 @@ async def search_bm25(
     query: str,
     top_k: int = 15,
 ) -> List[ToolMatch]:
-    """BM25 lexical search using PostgreSQL tsvector."""
+    """BM25 lexical search, in process when the retrieval index is loaded."""
+    index = get_tool_retrieval_index(service)
+    if index is not None:
+        return index.search_bm25(query, top_k)
     try:
         conn = service._get_connection()
         try:
@@ -171,16 +185,29 @@ async def search_rrf(
     top_k: int = 15,
     min_score: float = 0.3,
     rrf_k: int = 60,
+    *,
+    query_embedding: Optional[List[float]] = None,
+    model_name: Optional[str] = None,
 ) -> Tuple[List[ToolMatch], str]:
-    """Multi-model Reciprocal Rank Fusion search."""
-    query_embedding, model_name = await service._generate_embedding(query)
+    """Multi-model Reciprocal Rank Fusion search.
+
+    *query_embedding*/*model_name* are reused as in :func:`search`.
+    """
+    if query_embedding is None or model_name is None:
+        query_embedding, model_name = await service._generate_embedding(query)
     if query_embedding is None or model_name is None:
         return [], RAG_ERROR
 
     indexed_models = await service.get_indexed_models()
 
     if len(indexed_models) <= 1:
-        return await service.search(query, top_k=top_k, min_score=min_score)
+        return await service.search(
+            query,
+            top_k=top_k,
+            min_score=min_score,
+            query_embedding=query_embedding,
+            model_name=model_name,
+        )
 
     async def _embed_for_model(m: str) -> Tuple[str, Optional[List[float]]]:
         if m == model_name:
@@ -8,12 +8,13 @@ remains the single caller-facing path.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from backend.app.database.vector_connection import get_vector_dbapi_connection
 from backend.app.services.tool_embedding_generation import (
     generate_embedding as _generate_embedding,
     generate_embedding_for_model as _generate_embedding_for_model,
+    generate_embeddings_batch as _generate_embeddings_batch,
 )
 from backend.app.services.tool_embedding_indexing import (
     collect_indexable_entries as _collect_indexable_entries,
@@ -89,6 +90,18 @@ class ToolEmbeddingService:
             self, text, model_name, is_query=is_query
         )
 
+    async def _generate_embeddings_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        model_name: Optional[str] = None,
+        is_query: bool = False,
+    ) -> List[Tuple[Optional[List[float]], Optional[str]]]:
+        """Generate embeddings for many texts in batched provider calls."""
+        return await _generate_embeddings_batch(
+            self, texts, model_name=model_name, is_query=is_query
+        )
+
     async def ensure_table(self) -> None:
         """Verify the migration-owned tool_embeddings schema."""
         await _ensure_table(self)
@@ -160,9 +173,19 @@ class ToolEmbeddingService:
         query: str,
         top_k: int = 15,
         min_score: float = 0.3,
+        *,
+        query_embedding: Optional[List[float]] = None,
+        model_name: Optional[str] = None,
     ) -> Tuple[List[ToolMatch], str]:
         """Search tool embeddings by cosine similarity."""
-        return await _search(self, query, top_k=top_k, min_score=min_score)
+        return await _search(
+            self,
+            query,
+            top_k=top_k,
+            min_score=min_score,
+            query_embedding=query_embedding,
+            model_name=model_name,
+        )
 
     async def get_indexed_models(self) -> List[str]:
         """Return all distinct indexed embedding models."""
@@ -189,7 +212,7 @@ class ToolEmbeddingService:
         query: str,
         top_k: int = 15,
     ) -> List[ToolMatch]:
-        """BM25 lexical search using PostgreSQL tsvector."""
+        """BM25 lexical search over tool names and descriptions."""
         return await _search_bm25(self, query, top_k=top_k)
 
     async def search_rrf(
@@ -198,6 +221,9 @@ class ToolEmbeddingService:
         top_k: int = 15,
         min_score: float = 0.3,
         rrf_k: int = 60,
+        *,
+        query_embedding: Optional[List[float]] = None,
+        model_name: Optional[str] = None,
     ) -> Tuple[List[ToolMatch], str]:
         """Multi-model Reciprocal Rank Fusion search."""
         return await _search_rrf(
@@ -206,6 +232,8 @@ class ToolEmbeddingService:
             top_k=top_k,
             min_score=min_score,
             rrf_k=rrf_k,
+            query_embedding=query_embedding,
+            model_name=model_name,
         )
 
     async def search_by_affordance(
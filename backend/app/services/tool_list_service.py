@@ -18,6 +18,7 @@ from pathlib import Path
 import yaml
 
 from app.services.runtime_pack_hygiene import is_ignored_runtime_pack_dir
+from app.services.tool_catalog import cached_tools_string, tool_catalog_for
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +91,8 @@ class ToolListService:
         Returns:
             List of ToolInfo objects (deduplicated)
         """
+        if not workspace_id and not profile_id:
+            return tool_catalog_for(self).tools(enabled_only)
         all_tools: Dict[str, ToolInfo] = {}
 
         # 1. Get tools from ToolRegistryService (dynamically discovered)
@@ -120,6 +123,7 @@ class ToolListService:
 
         return list(all_tools.values())
 
+    @cached_tools_string
     def get_tools_string(
         self,
         workspace_id: Optional[str] = None,
@@ -367,11 +371,7 @@ class ToolListService:
         Returns:
             ToolInfo or None if not found
         """
-        all_tools = self.get_all_tools(enabled_only=False)
-        for tool in all_tools:
-            if tool.tool_id == tool_id:
-                return tool
-        return None
+        return tool_catalog_for(self).by_id.get(tool_id)
 
     def get_tools_by_source(self, source: str) -> List[ToolInfo]:
         """
@@ -383,8 +383,7 @@ class ToolListService:
         Returns:
             List of ToolInfo objects
         """
-        all_tools = self.get_all_tools(enabled_only=False)
-        return [tool for tool in all_tools if tool.source == source]
+        return list(tool_catalog_for(self).by_source.get(source, ()))
 
     def get_tools_by_category(self, category: str) -> List[ToolInfo]:
         """
@@ -396,8 +395,11 @@ class ToolListService:
         Returns:
             List of ToolInfo objects
         """
-        all_tools = self.get_all_tools(enabled_only=False)
-        return [tool for tool in all_tools if tool.category == category]
+        return list(tool_catalog_for(self).by_category.get(category, ()))
+
+    def get_tools_by_capability(self, capability_code: str) -> List[ToolInfo]:
+        """Get tools contributed by one capability pack"""
+        return list(tool_catalog_for(self).by_capability.get(capability_code, ()))
 
 
 # Global instance
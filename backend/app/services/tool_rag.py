@@ -4,35 +4,69 @@ Tool RAG retrieval helper.
 Thin wrapper over ToolEmbeddingService.search() for use in meeting engine
 and workspace chat ContextBuilder.
 
-P2 — Process-level TTL cache
------------------------------
+P2 — Result cache
+-----------------
 `retrieve_relevant_tools` is called up to **twice per chat turn** by
 ContextBuilder (build_qa_context + build_planning_context) and once per
 meeting turn by MeetingEngine (pre-fetch).  Because Ollama embed +
 pgvector query takes ~40–80 ms, caching the same query within a short
 window cuts latency noticeably.
 
-Cache key: (query_normalised, workspace_id_or_empty, top_k)
-TTL: 60 seconds (covers the lifetime of a single turn round-trip; stale
-     after a minute so new tool installs are picked up quickly).
-Max entries: 256 (protects against memory blow-up).
+Results live in a ``ResultCache``:
+- memory LRU with a per-entry TTL;
+- an optional Redis tier shared by every worker and runner
+  (``TOOL_RAG_CACHE_REDIS_ENABLED``);
+- an optional near-duplicate mode (``TOOL_RAG_CACHE_SEMANTIC_EPSILON``),
+  which reuses a result when the query embedding is within that cosine
+  distance of a cached query's.
+
+Cache key: (query_normalised, workspace_id_or_empty, top_k), scoped by
+workspace.  Tool installs/uninstalls start a new global generation;
+workspace binding changes only start a new generation for that workspace.
+TTL: 60 seconds by default (``TOOL_RAG_CACHE_TTL_SECONDS``).
 """
 
 import hashlib
 import logging
-import time
-from typing import Optional
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from backend.app.services.cache.result_cache import RedisResultTier, ResultCache
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Process-level cache
 # ---------------------------------------------------------------------------
-_CACHE_TTL_SECONDS: float = 60.0
-_CACHE_MAX_ENTRIES: int = 256
-
-# {cache_key: (expire_at: float, result: list[dict])}
-_cache: dict[str, tuple[float, list[dict]]] = {}
+_CACHE_TTL_SECONDS: float = float(os.getenv("TOOL_RAG_CACHE_TTL_SECONDS", "60"))
+_CACHE_MAX_ENTRIES: int = int(os.getenv("TOOL_RAG_CACHE_MAX_ENTRIES", "1024"))
+
+_cache: Optional[ResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache() -> ResultCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            shared_tier = None
+            if os.getenv("TOOL_RAG_CACHE_REDIS_ENABLED", "false").lower() in {
+                "1",
+                "true",
+                "yes",
+            }:
+                shared_tier = RedisResultTier()
+            _cache = ResultCache(
+                "tool_rag",
+                max_entries=_CACHE_MAX_ENTRIES,
+                ttl_seconds=_CACHE_TTL_SECONDS,
+                shared_tier=shared_tier,
+                semantic_epsilon=float(
+                    os.getenv("TOOL_RAG_CACHE_SEMANTIC_EPSILON", "0") or 0
+                ),
+            )
+        return _cache
 
 
 def _make_key(query: str, workspace_id: Optional[str], top_k: int) -> str:
@@ -42,31 +76,42 @@ def _make_key(query: str, workspace_id: Optional[str], top_k: int) -> str:
     return hashlib.md5(raw.encode()).hexdigest()
 
 
-def _cache_get(key: str) -> Optional[list[dict]]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    expire_at, result = entry
-    if time.monotonic() > expire_at:
-        _cache.pop(key, None)
-        return None
-    return result
+def invalidate_tool_rag_cache(workspace_id: Optional[str] = None) -> None:
+    """Start a new cache generation.
 
+    Without *workspace_id* (tool installs/uninstalls) every cached result and
+    the in-process retrieval index are dropped; with it, only that
+    workspace's results are.
+    """
+    if workspace_id:
+        _get_cache().invalidate(scope=workspace_id)
+        logger.debug("Tool RAG cache invalidated for workspace %s", workspace_id)
+        return
 
-def _cache_set(key: str, result: list[dict]) -> None:
-    # Evict oldest entries when at capacity (simple FIFO)
-    if len(_cache) >= _CACHE_MAX_ENTRIES:
-        oldest_key = next(iter(_cache))
-        _cache.pop(oldest_key, None)
-    _cache[key] = (time.monotonic() + _CACHE_TTL_SECONDS, result)
-
+    from backend.app.services.tool_embedding_memory_index import (
+        invalidate_tool_retrieval_index,
+    )
 
-def invalidate_tool_rag_cache() -> None:
-    """Clear the entire cache — call after tool installs/uninstalls."""
-    _cache.clear()
+    _get_cache().invalidate()
+    invalidate_tool_retrieval_index()
     logger.debug("Tool RAG cache invalidated")
 
 
+def tool_rag_cache_stats() -> Dict[str, float]:
+    """Hit/miss counters and hit ratio of the Tool RAG result cache."""
+    return _get_cache().stats()
+
+
+async def _embed_query(query: str) -> Tuple[Optional[List[float]], Optional[str]]:
+    try:
+        from backend.app.services.tool_embedding_service import ToolEmbeddingService
+
+        return await ToolEmbeddingService()._generate_embedding(query)
+    except Exception as exc:
+        logger.debug("Tool RAG query embedding for cache lookup failed: %s", exc)
+        return None, None
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -91,16 +136,40 @@ async def retrieve_relevant_tools(
     ``_CACHE_TTL_SECONDS`` seconds to avoid redundant Ollama calls within
     the same turn.
     """
+    cache = _get_cache()
+    scope = workspace_id or ""
     cache_key = _make_key(query, workspace_id, top_k)
-    cached = _cache_get(cache_key)
+    cached = await cache.get(cache_key, scope=scope)
     if cached is not None:
         logger.debug(
             "Tool RAG cache hit (key=%s, %d results)", cache_key[:8], len(cached)
         )
         return cached
 
-    result = await _retrieve_from_service(query, top_k, workspace_id)
-    _cache_set(cache_key, result)
+    embedding: Optional[List[float]] = None
+    model_name: Optional[str] = None
+    partition = str(top_k)
+    if cache.semantic is not None:
+        embedding, model_name = await _embed_query(query)
+        partition = f"{model_name}|{top_k}"
+        if embedding is not None:
+            similar = cache.get_similar(embedding, scope=scope, partition=partition)
+            if similar is not None:
+                logger.debug("Tool RAG near-duplicate cache hit (key=%s)", cache_key[:8])
+                await cache.set(cache_key, similar, scope=scope)
+                return similar
+
+    # The near-duplicate lookup already embedded the query; reuse it.
+    result = await _retrieve_from_service(
+        query,
+        top_k,
+        workspace_id,
+        query_embedding=embedding,
+        model_name=model_name,
+    )
+    await cache.set(
+        cache_key, result, scope=scope, embedding=embedding, partition=partition
+    )
     return result
 
 
@@ -108,11 +177,16 @@ async def _retrieve_from_service(
     query: str,
     top_k: int,
     workspace_id: Optional[str],
+    *,
+    query_embedding: Optional[List[float]] = None,
+    model_name: Optional[str] = None,
 ) -> list[dict]:
     """Actual retrieval — called only on cache miss.
 
     Prefers multi-model RRF search when more than one embedding model is
-    indexed; falls back to single-model search() gracefully.
+    indexed; falls back to single-model search() gracefully. A query
+    embedding computed for the near-duplicate lookup is passed through so
+    the query is not embedded twice.
     """
     try:
         from backend.app.services.tool_embedding_service import (
@@ -123,7 +197,12 @@ async def _retrieve_from_service(
         svc = ToolEmbeddingService()
         # search_rrf() automatically falls back to single-model when only one
         # model is indexed, so this is always safe to call.
-        matches, status = await svc.search_rrf(query, top_k=top_k)
+        matches, status = await svc.search_rrf(
+            query,
+            top_k=top_k,
+            query_embedding=query_embedding,
+            model_name=model_name,
+        )
         if status != RAG_HIT or not matches:
             return []
 
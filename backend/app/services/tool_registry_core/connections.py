@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from backend.app.models.tool_registry import RegisteredTool, ToolConnectionModel
+from backend.app.services.tool_catalog_generation import bump_tool_catalog_generation
 
 
 ConnectionKey = Tuple[str, str]
@@ -127,6 +128,7 @@ def delete_connection(
 
     if deleted:
         save_registry()
+        bump_tool_catalog_generation()
 
     return deleted
 
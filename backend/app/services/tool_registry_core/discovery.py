@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Any, Dict, Optional, Tuple
 
 from backend.app.models.tool_registry import RegisteredTool, ToolConnectionModel
+from backend.app.services.tool_catalog_generation import bump_tool_catalog_generation
 from backend.app.services.tools.base import ToolConnection
 from backend.app.services.tools.discovery_provider import DiscoveredTool, ToolConfig
 
@@ -125,6 +126,33 @@ async def discover_tool_capabilities_for_service(
     logger,
 ) -> Dict[str, Any]:
     """Run discovery through the canonical ToolRegistryService facade state."""
+    try:
+        return await _discover_tool_capabilities(
+            service,
+            provider_name=provider_name,
+            config=config,
+            connection_id=connection_id,
+            profile_id=profile_id,
+            register_dynamic_tool_fn=register_dynamic_tool_fn,
+            utc_now_fn=utc_now_fn,
+            logger=logger,
+        )
+    finally:
+        # Discovery can drop old tools before it fails; readers must rebuild.
+        bump_tool_catalog_generation()
+
+
+async def _discover_tool_capabilities(
+    service: Any,
+    *,
+    provider_name: str,
+    config: ToolConfig,
+    connection_id: Optional[str],
+    profile_id: str,
+    register_dynamic_tool_fn,
+    utc_now_fn,
+    logger,
+) -> Dict[str, Any]:
     provider = service._discovery_providers.get(provider_name)
     if not provider:
         available = list(service._discovery_providers.keys())
@@ -11,6 +11,7 @@ from typing import Any, Callable, Dict, Optional, Tuple
 from sqlalchemy import text
 
 from backend.app.models.tool_registry import RegisteredTool, ToolConnectionModel
+from backend.app.services.tool_catalog_generation import bump_tool_catalog_generation
 
 
 ConnectionKey = Tuple[str, str]
@@ -151,6 +152,7 @@ def load_registry_from_database(
                 connections_by_key[(row.profile_id, row.id)] = connection
             except Exception as exc:
                 logger.warning("Error loading connection %s: %s", row.id, exc)
+    bump_tool_catalog_generation()
 
 
 def load_registry_from_json(
@@ -162,6 +164,26 @@ def load_registry_from_json(
     logger: logging.Logger,
 ) -> None:
     """Load tool registry fallback data from JSON files."""
+    try:
+        _load_registry_json_files(
+            registry_file=registry_file,
+            connections_file=connections_file,
+            tools_by_id=tools_by_id,
+            connections_by_key=connections_by_key,
+            logger=logger,
+        )
+    finally:
+        bump_tool_catalog_generation()
+
+
+def _load_registry_json_files(
+    *,
+    registry_file: Path,
+    connections_file: Path,
+    tools_by_id: Dict[str, RegisteredTool],
+    connections_by_key: Dict[ConnectionKey, ToolConnectionModel],
+    logger: logging.Logger,
+) -> None:
     tools_by_id.clear()
     connections_by_key.clear()
 
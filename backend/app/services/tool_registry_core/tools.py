@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
 from backend.app.models.tool_registry import RegisteredTool
+from backend.app.services.tool_catalog_generation import bump_tool_catalog_generation
 from backend.app.services.tools.discovery_provider import ToolDiscoveryProvider
 
 
@@ -95,6 +96,7 @@ def update_tool(
 
     tool.updated_at = datetime.now()
     save_registry()
+    bump_tool_catalog_generation()
     return tool
 
 
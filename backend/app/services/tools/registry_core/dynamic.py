@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Optional
 
+from backend.app.services.tool_catalog_generation import bump_tool_catalog_generation
 from backend.app.services.tools.base import MindscapeTool, Tool, ToolConnection
 from backend.app.services.tools.registry_core.state import (
     CORE_TOOLS,
@@ -53,11 +54,15 @@ def unregister_dynamic_tool(registered_tool_id: str):
         del _dynamic_tools[registered_tool_id]
     if registered_tool_id in _mindscape_tools:
         del _mindscape_tools[registered_tool_id]
+        bump_tool_catalog_generation()
 
 
 def register_mindscape_tool(tool_id: str, tool: MindscapeTool):
     """Register a MindscapeTool instance."""
+    if _mindscape_tools.get(tool_id) is tool:
+        return
     _mindscape_tools[tool_id] = tool
+    bump_tool_catalog_generation()
 
 
 def get_mindscape_tool(tool_id: str) -> Optional[MindscapeTool]:
@@ -7,22 +7,33 @@ import logging
 from typing import List, Dict, Any, Optional
 
 from backend.app.database.config import get_vector_postgres_config
+from backend.app.database.connection_factory import ConnectionFactory
 from backend.app.database.vector_connection import get_vector_dbapi_connection
 from backend.app.services.vector_search_db import (
     search_vectors,
     update_last_used_at_records,
 )
+from backend.app.services.embedding_cache import get_embedding_cache
 from backend.app.services.vector_search_embeddings import VectorEmbeddingGenerator
+from backend.app.services.vector_search_scopes import (  # noqa: F401
+    VectorScope,
+    VectorSearchScopesMixin,
+    personal_context_scope,
+    playbook_sop_scope,
+)
+from backend.app.services.vector_usage_tracker import get_last_used_at_tracker
 
 logger = logging.getLogger(__name__)
 
 
-class VectorSearchService:
+class VectorSearchService(VectorSearchScopesMixin):
     """Semantic search service using pgvector"""
 
     def __init__(self, postgres_config=None):
         self.postgres_config = postgres_config
-        self.embedding_generator = VectorEmbeddingGenerator()
+        self.embedding_generator = VectorEmbeddingGenerator(
+            embedding_cache=get_embedding_cache()
+        )
 
     def _get_postgres_config(self):
         """Get PostgreSQL config from environment"""
@@ -32,6 +43,17 @@ class VectorSearchService:
         """Get PostgreSQL connection"""
         return get_vector_dbapi_connection(self.postgres_config)
 
+    def is_available(self) -> bool:
+        """
+        Check whether vector queries can be attempted, without a DB round trip
+
+        Pooled connections are validated on checkout, so an unreachable
+        server surfaces as a query error rather than a failed probe here.
+        """
+        if self.postgres_config:
+            return True
+        return ConnectionFactory().is_role_available("vector")
+
     async def check_connection(self) -> bool:
         """Check if Vector DB connection is available"""
         conn = None
@@ -145,123 +167,6 @@ class VectorSearchService:
             require_model_match=require_model_match,
         )
 
-    async def search_playbook_sop(
-        self, playbook_code: str, query: str, top_k: int = 5
-    ) -> List[Dict[str, Any]]:
-        """
-        Search for relevant Playbook SOP chunks
-
-        Args:
-            playbook_code: Playbook identifier
-            query: User query
-            top_k: Number of results
-
-        Returns:
-            List of relevant SOP chunks
-        """
-        query_embedding = await self._generate_embedding(query)
-        if not query_embedding:
-            return []
-
-        return await self.vector_search(
-            table="playbook_knowledge",
-            query_embedding=query_embedding,
-            filters={"playbook_code": playbook_code},
-            top_k=top_k,
-        )
-
-    async def search_personal_context(
-        self, user_id: str, query: str, top_k: int = 3
-    ) -> List[Dict[str, Any]]:
-        """
-        Search user's personal semantic memory (L2).
-
-        ADR-001 v2: queries memory_embeddings (L2) instead of mindscape_personal.
-        Falls back to mindscape_personal if memory_embeddings is empty.
-
-        Args:
-            user_id: User identifier
-            query: User query
-            top_k: Number of results
-
-        Returns:
-            List of relevant personal context
-        """
-        query_embedding = await self._generate_embedding(query)
-        if not query_embedding:
-            return []
-
-        # Primary: L2 memory_embeddings
-        results = await self.vector_search(
-            table="memory_embeddings",
-            query_embedding=query_embedding,
-            filters={"user_id": user_id},
-            top_k=top_k,
-        )
-
-        # Fallback: legacy mindscape_personal (frozen, read-only)
-        if not results:
-            results = await self.vector_search(
-                table="mindscape_personal",
-                query_embedding=query_embedding,
-                filters={"user_id": user_id},
-                top_k=top_k,
-            )
-
-        return results
-
-    async def execute_playbook_with_context(
-        self, playbook_code: str, user_query: str, user_id: str = "default_user"
-    ) -> Dict[str, Any]:
-        """
-        Execute playbook with combined context from SOP and personal memory
-
-        Searches both playbook SOP knowledge and user's personal context to provide
-        comprehensive context for AI agent execution.
-
-        Args:
-            playbook_code: Playbook identifier
-            user_query: User's query or task description
-            user_id: User identifier
-
-        Returns:
-            Combined context for AI with formatted text
-        """
-        playbook_chunks = await self.search_playbook_sop(
-            playbook_code=playbook_code, query=user_query, top_k=5
-        )
-
-        personal_context = await self.search_personal_context(
-            user_id=user_id, query=user_query, top_k=3
-        )
-
-        context = {
-            "playbook_sop": [
-                {
-                    "content": chunk["content"],
-                    "section_type": chunk["section_type"],
-                    "similarity": chunk["similarity"],
-                }
-                for chunk in playbook_chunks
-            ],
-            "personal_context": [
-                {
-                    "content": ctx["content"],
-                    "source_type": ctx["source_type"],
-                    "similarity": ctx["similarity"],
-                }
-                for ctx in personal_context
-            ],
-        }
-
-        context_text = self._format_context_for_llm(context)
-
-        return {
-            "context": context,
-            "context_text": context_text,
-            "playbook_code": playbook_code,
-        }
-
     def _format_context_for_llm(self, context: Dict[str, Any]) -> str:
         """Format context for LLM consumption"""
         parts = []
@@ -346,70 +251,6 @@ class VectorSearchService:
             for hit in result.hits
         ]
 
-    async def multi_scope_search(
-        self,
-        query: str,
-        user_id: str,
-        workspace_id: Optional[str] = None,
-        intent_id: Optional[str] = None,
-        scopes: List[str] = None,
-        top_k_per_scope: Dict[str, int] = None,
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        """
-        Multi-scope hierarchical memory search
-
-        Args:
-            query: Search query text
-            user_id: User identifier
-            workspace_id: Optional workspace ID
-            intent_id: Optional intent ID
-            scopes: List of scopes to search ('global', 'workspace', 'intent')
-            top_k_per_scope: Dict mapping scope to top_k (e.g., {'global': 3, 'workspace': 8})
-
-        Returns:
-            Dict mapping scope to list of results
-        """
-        if scopes is None:
-            scopes = ["global", "workspace", "intent"]
-
-        if top_k_per_scope is None:
-            top_k_per_scope = {"global": 3, "workspace": 8, "intent": 8}
-
-        query_embedding = await self._generate_embedding(query)
-        if not query_embedding:
-            return {scope: [] for scope in scopes}
-
-        results = {}
-
-        for scope in scopes:
-            filters = {"user_id": user_id, "scope": scope}
-
-            if scope == "workspace" and workspace_id:
-                filters["workspace_id"] = workspace_id
-            elif scope == "intent" and intent_id:
-                filters["intent_id"] = intent_id
-                if workspace_id:
-                    filters["workspace_id"] = workspace_id
-
-            top_k = top_k_per_scope.get(scope, 5)
-
-            scope_results = await self.vector_search(
-                table="memory_embeddings",
-                query_embedding=query_embedding,
-                filters=filters,
-                top_k=top_k * 2,  # Get more results for composite scoring
-            )
-
-            # Apply composite scoring
-            scored_results = await self._calculate_composite_scores(
-                scope_results, query_embedding
-            )
-
-            # Return top_k after scoring
-            results[scope] = scored_results[:top_k]
-
-        return results
-
     async def _calculate_composite_scores(
         self, results: List[Dict[str, Any]], query_embedding: List[float]
     ) -> List[Dict[str, Any]]:
@@ -487,10 +328,16 @@ class VectorSearchService:
         """
         Update last_used_at timestamp for records
 
+        With the default vector pool the ids are queued on the write-behind
+        tracker and written in batches; the call does no I/O.
+
         Args:
             record_ids: List of record IDs to update
             table: Table name
         """
+        if not self.postgres_config:
+            get_last_used_at_tracker().record(record_ids, table=table)
+            return
         await update_last_used_at_records(
             get_connection=self._get_connection,
             record_ids=record_ids,
@@ -2,17 +2,57 @@
 Vector database query and write helpers.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 
 from psycopg2.extras import RealDictCursor
 
+from backend.app.services.system_settings_cache import get_cached_setting_value
+from backend.app.services.vector_search_executor import run_vector_query
+
 logger = logging.getLogger(__name__)
 
 ConnectionFactory = Callable[[], Any]
 
 
-async def search_vectors(
+MODEL_SCOPED_TABLES = ("mindscape_personal", "memory_embeddings")
+
+
+@lru_cache(maxsize=256)
+def similarity_statement(
+    table: str,
+    filter_keys: Tuple[str, ...],
+    match_model: bool,
+) -> str:
+    """
+    Return the similarity SQL for one (table, filter shape) combination.
+
+    Statements are built once per shape and reused, so the hot path only
+    binds parameters instead of re-rendering the query text.
+    """
+    where_clauses = [f"{key} = %s" for key in filter_keys]
+    if match_model:
+        where_clauses.append("metadata->>'embedding_model' = %s")
+    where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    return f"""
+            SELECT
+                *,
+                1 - (embedding <=> %s::vector) as similarity
+            FROM {table}
+            {where_sql}
+            ORDER BY embedding <=> %s::vector
+            LIMIT %s
+        """
+
+
+def current_embedding_model_name() -> Optional[str]:
+    """Return the configured embedding model from the settings cache."""
+    value = get_cached_setting_value("embedding_model")
+    return str(value) if value else None
+
+
+def search_vectors_sync(
     get_connection: ConnectionFactory,
     table: str,
     query_embedding: List[float],
@@ -20,72 +60,32 @@ async def search_vectors(
     top_k: int = 5,
     require_model_match: bool = True,
 ) -> List[Dict[str, Any]]:
-    """
-    Run the generic pgvector similarity query.
-
-    Args:
-        get_connection: Existing VectorSearchService connection factory
-        table: Table name
-        query_embedding: Query vector
-        filters: Additional equality filters
-        top_k: Number of records to return
-        require_model_match: Whether to filter by configured embedding model
-
-    Returns:
-        Matching records with similarity scores.
-    """
+    """Blocking body of ``search_vectors``; runs on the vector query pool."""
     if table == "external_docs":
         raise ValueError(
             "external_docs_requires_authorization_aware_retrieval"
         )
+    current_model_name = None
+    if require_model_match and table in MODEL_SCOPED_TABLES:
+        current_model_name = current_embedding_model_name()
+
+    filter_items = list((filters or {}).items())
+    query = similarity_statement(
+        table,
+        tuple(key for key, _ in filter_items),
+        bool(current_model_name),
+    )
+    vector_literal = str(query_embedding)
+    params: List[Any] = [vector_literal]
+    params.extend(value for _, value in filter_items)
+    if current_model_name:
+        params.append(current_model_name)
+    params.extend([vector_literal, top_k])
+
     conn = get_connection()
     cursor = None
     try:
         cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        current_model_name = None
-        if require_model_match and table in (
-            "mindscape_personal",
-            "memory_embeddings",
-        ):
-            from backend.app.services.system_settings_store import (
-                SystemSettingsStore,
-            )
-
-            settings_store = SystemSettingsStore()
-            embedding_setting = settings_store.get_setting("embedding_model")
-            if embedding_setting:
-                current_model_name = str(embedding_setting.value)
-
-        where_clauses = []
-        params = []
-
-        if filters:
-            for key, value in filters.items():
-                where_clauses.append(f"{key} = %s")
-                params.append(value)
-
-        if (
-            require_model_match
-            and current_model_name
-            and table in ("mindscape_personal", "memory_embeddings")
-        ):
-            where_clauses.append("metadata->>'embedding_model' = %s")
-            params.append(current_model_name)
-
-        where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-
-        query = f"""
-            SELECT
-                *,
-                1 - (embedding <=> %s::vector) as similarity
-            FROM {table}
-            {where_sql}
-            ORDER BY embedding <=> %s::vector
-            LIMIT %s
-        """
-
-        params = [str(query_embedding)] + params + [str(query_embedding), top_k]
         cursor.execute(query, params)
 
         results = cursor.fetchall()
@@ -99,6 +99,43 @@ async def search_vectors(
             conn.close()
 
 
+async def search_vectors(
+    get_connection: ConnectionFactory,
+    table: str,
+    query_embedding: List[float],
+    filters: Optional[Dict[str, Any]] = None,
+    top_k: int = 5,
+    require_model_match: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Run the generic pgvector similarity query.
+
+    Args:
+        get_connection: Existing VectorSearchService connection factory
+        table: Table name
+        query_embedding: Query vector
+        filters: Additional equality filters
+        top_k: Number of records to return
+        require_model_match: Whether to filter by configured embedding model
+
+    Returns:
+        Matching records with similarity scores.
+    """
+    if table == "external_docs":
+        raise ValueError(
+            "external_docs_requires_authorization_aware_retrieval"
+        )
+    return await run_vector_query(
+        search_vectors_sync,
+        get_connection,
+        table,
+        query_embedding,
+        filters,
+        top_k,
+        require_model_match,
+    )
+
+
 async def search_external_docs_records(
     get_connection: ConnectionFactory,
     query_embedding: List[float],
@@ -122,19 +159,12 @@ async def search_external_docs_records(
     )
 
 
-async def update_last_used_at_records(
+def update_last_used_at_records_sync(
     get_connection: ConnectionFactory,
     record_ids: List[str],
     table: str = "memory_embeddings",
 ) -> None:
-    """
-    Update last_used_at for matching records.
-
-    Args:
-        get_connection: Existing VectorSearchService connection factory
-        record_ids: List of record IDs to update
-        table: Table name
-    """
+    """Blocking body of ``update_last_used_at_records``."""
     if not record_ids:
         return
 
@@ -163,6 +193,29 @@ async def update_last_used_at_records(
             conn.close()
 
 
+async def update_last_used_at_records(
+    get_connection: ConnectionFactory,
+    record_ids: List[str],
+    table: str = "memory_embeddings",
+) -> None:
+    """
+    Update last_used_at for matching records.
+
+    Args:
+        get_connection: Existing VectorSearchService connection factory
+        record_ids: List of record IDs to update
+        table: Table name
+    """
+    if not record_ids:
+        return
+    await run_vector_query(
+        update_last_used_at_records_sync,
+        get_connection,
+        record_ids,
+        table,
+    )
+
+
 async def save_external_doc(
     get_connection: ConnectionFactory,
     doc: Dict[str, Any],
@@ -0,0 +1,296 @@
+"""
+Batched and cached embedding generation for VectorEmbeddingGenerator.
+
+Batches go through the providers' multi-input endpoints, split by item count
+and an estimated token budget. Every receipt, single or batched, is looked up
+in the content-addressed ``EmbeddingCache`` under the requested model. Fresh
+batch receipts are written back under the model the provider reported, so a
+fallback result is never served as the requested model.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import os
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
+
+from backend.app.services.system_settings_cache import get_cached_setting_value
+
+if TYPE_CHECKING:
+    from backend.app.services.embedding_cache import CachedEmbedding
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EmbeddingGenerationReceipt:
+    """Internal embedding result with provider identity."""
+
+    embedding: tuple[float, ...]
+    provider: str
+    model: str
+
+    @property
+    def dimension(self) -> int:
+        return len(self.embedding)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+def estimate_embedding_tokens(text: str) -> int:
+    """Cheap upper-bound token estimate: ~4 ASCII chars or 1 CJK char per token."""
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+def plan_embedding_batches(
+    texts: Sequence[str],
+    *,
+    max_items: int,
+    max_tokens: int,
+) -> List[List[int]]:
+    """Split input indexes into ordered batches bounded by count and tokens.
+
+    An item whose own estimate exceeds ``max_tokens`` is sent alone.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for index, text in enumerate(texts):
+        tokens = estimate_embedding_tokens(text)
+        if current and (
+            len(current) >= max_items or current_tokens + tokens > max_tokens
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+class VectorEmbeddingBatchMixin:
+    """Cache lookups and multi-input generation over ``self.ollama_client``."""
+
+    async def _cached_embeddings(
+        self, model: str, texts: Sequence[str], *, is_query: bool
+    ) -> List["CachedEmbedding | None"]:
+        if self.embedding_cache is None or not texts:
+            return [None] * len(texts)
+        try:
+            return await self.embedding_cache.get_many(
+                model, texts, is_query=is_query
+            )
+        except Exception as e:
+            logger.warning("Embedding cache lookup failed: %s", e)
+            return [None] * len(texts)
+
+    async def _cached_embedding(
+        self, model: str, text: str, *, is_query: bool
+    ) -> "CachedEmbedding | None":
+        return (await self._cached_embeddings(model, [text], is_query=is_query))[0]
+
+    async def _cached_receipt(
+        self, model: str, text: str, *, is_query: bool
+    ) -> Optional[EmbeddingGenerationReceipt]:
+        cached = await self._cached_embedding(model, text, is_query=is_query)
+        if cached is None:
+            return None
+        return EmbeddingGenerationReceipt(
+            embedding=cached.embedding,
+            provider=cached.provider,
+            model=cached.model,
+        )
+
+    async def _remember_embeddings(
+        self,
+        model: str,
+        items: Iterable[tuple[str, Sequence[float], str]],
+        *,
+        is_query: bool,
+    ) -> None:
+        if self.embedding_cache is None:
+            return
+        try:
+            await self.embedding_cache.put_many(model, items, is_query=is_query)
+        except Exception as e:
+            logger.warning("Embedding cache write failed: %s", e)
+
+    async def generate_embeddings_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        is_query: bool = True,
+        model: Optional[str] = None,
+        allow_openai_fallback: bool = True,
+    ) -> List[EmbeddingGenerationReceipt | None]:
+        """
+        Embed many texts with the providers' multi-input endpoints.
+
+        Inputs are split into batches bounded by ``EMBEDDING_BATCH_MAX_ITEMS``
+        and an estimated ``EMBEDDING_BATCH_TOKEN_BUDGET``; at most
+        ``EMBEDDING_BATCH_CONCURRENCY`` provider requests run at once. The
+        model is selected once for the whole call; receipts carry the model
+        the provider reports.
+
+        Args:
+            texts: Texts to embed
+            is_query: True for search, False for indexing
+            model: Exact Ollama model; defaults to the selected embed model
+            allow_openai_fallback: Re-embed failed batches through OpenAI
+
+        Returns:
+            One receipt per input in order, or None for items that failed.
+        """
+        if not texts:
+            return []
+        preferred = model or await self.ollama_client.select_embedding_model(
+            os.getenv("OLLAMA_EMBED_MODEL", "")
+        )
+        semaphore = asyncio.Semaphore(_env_int("EMBEDDING_BATCH_CONCURRENCY", 2))
+        receipts: List[EmbeddingGenerationReceipt | None] = [None] * len(texts)
+        for index, cached in enumerate(
+            await self._cached_embeddings(preferred, texts, is_query=is_query)
+        ):
+            if cached is not None:
+                receipts[index] = EmbeddingGenerationReceipt(
+                    embedding=cached.embedding,
+                    provider=cached.provider,
+                    model=cached.model,
+                )
+        pending = [index for index, receipt in enumerate(receipts) if receipt is None]
+        if not pending:
+            return receipts
+        # Fresh receipts grouped by the model the provider reported.
+        fresh: dict[str, List[int]] = {}
+
+        async def run_batch(indexes: List[int]) -> None:
+            batch_texts = [texts[index] for index in indexes]
+            async with semaphore:
+                outcomes = await self.ollama_client.embed_many(
+                    batch_texts,
+                    model=preferred,
+                    is_query=is_query,
+                )
+                failed = []
+                for index, outcome in zip(indexes, outcomes):
+                    if outcome.ok:
+                        receipts[index] = EmbeddingGenerationReceipt(
+                            embedding=outcome.embedding,
+                            provider="ollama",
+                            model=outcome.model or preferred,
+                        )
+                        fresh.setdefault(receipts[index].model, []).append(index)
+                    else:
+                        failed.append(index)
+                if not failed or not allow_openai_fallback:
+                    return
+                openai_embeddings = await self.generate_openai_embeddings(
+                    [texts[index] for index in failed]
+                )
+                if not openai_embeddings:
+                    return
+                openai_model = self._configured_openai_model_name()
+                for index, embedding in zip(failed, openai_embeddings):
+                    receipts[index] = EmbeddingGenerationReceipt(
+                        embedding=tuple(embedding),
+                        provider="openai",
+                        model=openai_model,
+                    )
+                    fresh.setdefault(openai_model, []).append(index)
+
+        batches = plan_embedding_batches(
+            [texts[index] for index in pending],
+            max_items=_env_int("EMBEDDING_BATCH_MAX_ITEMS", 32),
+            max_tokens=_env_int("EMBEDDING_BATCH_TOKEN_BUDGET", 8192),
+        )
+        await asyncio.gather(
+            *(
+                run_batch([pending[position] for position in batch])
+                for batch in batches
+            )
+        )
+        for cache_model, indexes in fresh.items():
+            await self._remember_embeddings(
+                cache_model,
+                [
+                    (texts[index], receipts[index].embedding, receipts[index].provider)
+                    for index in indexes
+                ],
+                is_query=is_query,
+            )
+        return receipts
+
+    @staticmethod
+    def _openai_embedding_request_config() -> Optional[tuple[str, str]]:
+        """Return (api_key, model_name) for OpenAI embeddings, or None."""
+        from backend.app.services.config_store import ConfigStore
+        from backend.app.services.mindscape_store import MindscapeStore
+
+        configured_model = get_cached_setting_value("embedding_model")
+        if not configured_model:
+            logger.warning(
+                "No embedding model configured, using default: text-embedding-3-small"
+            )
+            model_name = "text-embedding-3-small"
+        else:
+            model_name = str(configured_model)
+
+        config_store = ConfigStore()
+        MindscapeStore().ensure_default_profile()
+
+        config = config_store.get_or_create_config("default-user")
+        api_key = config.agent_backend.openai_api_key or os.getenv("OPENAI_API_KEY")
+
+        if not api_key:
+            logger.warning("OpenAI API key not configured for embedding generation")
+            return None
+        return api_key, model_name
+
+    async def generate_openai_embeddings(
+        self, texts: Sequence[str]
+    ) -> Optional[List[List[float]]]:
+        """
+        Embed several texts with one OpenAI request, off the event loop.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings in input order, or None when OpenAI is unavailable.
+        """
+        if not texts:
+            return []
+
+        def request() -> Optional[List[List[float]]]:
+            request_config = self._openai_embedding_request_config()
+            if request_config is None:
+                return None
+            api_key, model_name = request_config
+
+            import openai
+
+            client = openai.OpenAI(api_key=api_key)
+            response = client.embeddings.create(model=model_name, input=list(texts))
+            ordered = sorted(response.data, key=lambda item: item.index)
+            return [list(item.embedding) for item in ordered]
+
+        try:
+            return await asyncio.to_thread(request)
+        except Exception as e:
+            logger.error("Failed to generate OpenAI batch embeddings: %s", e)
+            return None
+
+
+__all__ = [
+    "EmbeddingGenerationReceipt",
+    "VectorEmbeddingBatchMixin",
+    "estimate_embedding_tokens",
+    "plan_embedding_batches",
+]
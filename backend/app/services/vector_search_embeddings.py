@@ -2,39 +2,35 @@
 Embedding generation helpers for VectorSearchService.
 """
 
-from dataclasses import dataclass
 import logging
 import os
 import time
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
+from backend.app.services.system_settings_cache import get_cached_setting_value
+from backend.app.services.vector_search_embedding_batch import (
+    EmbeddingGenerationReceipt,
+    VectorEmbeddingBatchMixin,
+)
 from backend.app.services.vector_search_ollama import OllamaEmbeddingClient
 
-logger = logging.getLogger(__name__)
-
-
-@dataclass(frozen=True)
-class EmbeddingGenerationReceipt:
-    """Internal embedding result with provider identity."""
-
-    embedding: tuple[float, ...]
-    provider: str
-    model: str
+if TYPE_CHECKING:
+    from backend.app.services.embedding_cache import EmbeddingCache
 
-    @property
-    def dimension(self) -> int:
-        return len(self.embedding)
+logger = logging.getLogger(__name__)
 
 
-class VectorEmbeddingGenerator:
+class VectorEmbeddingGenerator(VectorEmbeddingBatchMixin):
     """Generate embeddings through the existing Ollama-first fallback path."""
 
     def __init__(
         self,
         *,
         ollama_client: OllamaEmbeddingClient | None = None,
+        embedding_cache: "EmbeddingCache | None" = None,
     ) -> None:
         self.ollama_client = ollama_client or OllamaEmbeddingClient()
+        self.embedding_cache = embedding_cache
 
     async def generate_embedding(self, text: str) -> Optional[List[float]]:
         """
@@ -79,18 +75,29 @@ class VectorEmbeddingGenerator:
         *,
         is_query: bool = True,
         allow_openai_fallback: bool = True,
+        use_cache: bool = True,
     ) -> EmbeddingGenerationReceipt | None:
         """Generate one vector while preserving provider and model identity."""
 
         preferred = await self.ollama_client.select_embedding_model(
             os.getenv("OLLAMA_EMBED_MODEL", "")
         )
+        if use_cache:
+            cached = await self._cached_receipt(preferred, text, is_query=is_query)
+            if cached is not None:
+                return cached
         ollama_outcome = await self.ollama_client.embed(
             text,
             model=preferred,
             is_query=is_query,
         )
         if ollama_outcome.ok:
+            if use_cache:
+                await self._remember_embeddings(
+                    preferred,
+                    [(text, ollama_outcome.embedding, "ollama")],
+                    is_query=is_query,
+                )
             return EmbeddingGenerationReceipt(
                 embedding=ollama_outcome.embedding,
                 provider="ollama",
@@ -99,15 +106,34 @@ class VectorEmbeddingGenerator:
 
         if not allow_openai_fallback:
             return None
+        openai_model = self._configured_openai_model_name()
+        if use_cache:
+            cached = await self._cached_receipt(openai_model, text, is_query=is_query)
+            if cached is not None:
+                return cached
         openai_embedding = await self.generate_openai_embedding(text)
         if openai_embedding:
+            if use_cache:
+                await self._remember_embeddings(
+                    openai_model,
+                    [(text, openai_embedding, "openai")],
+                    is_query=is_query,
+                )
             return EmbeddingGenerationReceipt(
                 embedding=tuple(openai_embedding),
                 provider="openai",
-                model=self._configured_openai_model_name(),
+                model=openai_model,
             )
         return None
 
+    async def embedding_model_signature(self) -> str:
+        """Identify the Ollama model and OpenAI fallback documents are embedded with."""
+
+        preferred = await self.ollama_client.select_embedding_model(
+            os.getenv("OLLAMA_EMBED_MODEL", "")
+        )
+        return f"ollama:{preferred}|openai:{self._configured_openai_model_name()}"
+
     async def probe_embedding_provider(
         self,
         text: str = "mindscape embedding provider admission",
@@ -119,6 +145,7 @@ class VectorEmbeddingGenerator:
             text,
             is_query=False,
             allow_openai_fallback=False,
+            use_cache=False,
         )
         elapsed = round(time.monotonic() - started, 6)
         if receipt is None:
@@ -163,28 +190,30 @@ class VectorEmbeddingGenerator:
             Embedding vector, or None when Ollama is unavailable.
         """
         embed_model = model or os.getenv("OLLAMA_EMBED_MODEL", "bge-m3")
+        cached = await self._cached_embedding(
+            embed_model, text, is_query=is_query
+        )
+        if cached is not None:
+            return list(cached.embedding)
         outcome = await self.ollama_client.embed(
             text,
             model=embed_model,
             is_query=is_query,
         )
-        return list(outcome.embedding) if outcome.ok else None
+        if not outcome.ok:
+            return None
+        await self._remember_embeddings(
+            embed_model,
+            [(text, outcome.embedding, "ollama")],
+            is_query=is_query,
+        )
+        return list(outcome.embedding)
 
     @staticmethod
     def _configured_openai_model_name() -> str:
         try:
-            from backend.app.services.system_settings_store import (
-                SystemSettingsStore,
-            )
-
-            embedding_setting = SystemSettingsStore().get_setting(
-                "embedding_model"
-            )
-            return (
-                str(embedding_setting.value)
-                if embedding_setting
-                else "text-embedding-3-small"
-            )
+            value = get_cached_setting_value("embedding_model")
+            return str(value) if value else "text-embedding-3-small"
         except Exception:
             return "text-embedding-3-small"
 
@@ -199,30 +228,10 @@ class VectorEmbeddingGenerator:
             Embedding vector, or None when OpenAI is unavailable.
         """
         try:
-            from backend.app.services.system_settings_store import SystemSettingsStore
-            from backend.app.services.config_store import ConfigStore
-            from backend.app.services.mindscape_store import MindscapeStore
-
-            settings_store = SystemSettingsStore()
-            embedding_setting = settings_store.get_setting("embedding_model")
-
-            if not embedding_setting:
-                logger.warning(
-                    "No embedding model configured, using default: text-embedding-3-small"
-                )
-                model_name = "text-embedding-3-small"
-            else:
-                model_name = str(embedding_setting.value)
-
-            config_store = ConfigStore()
-            MindscapeStore().ensure_default_profile()
-
-            config = config_store.get_or_create_config("default-user")
-            api_key = config.agent_backend.openai_api_key or os.getenv("OPENAI_API_KEY")
-
-            if not api_key:
-                logger.warning("OpenAI API key not configured for embedding generation")
+            request_config = self._openai_embedding_request_config()
+            if request_config is None:
                 return None
+            api_key, model_name = request_config
 
             import openai
 
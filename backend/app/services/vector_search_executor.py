@@ -0,0 +1,38 @@
+"""Bounded worker pool for blocking pgvector calls issued from async code.
+
+The pool is deliberately smaller than the vector engine's connection pool so
+concurrent searches queue here instead of exhausting DB connections, and the
+event loop never runs a psycopg2 call itself.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+_T = TypeVar("_T")
+
+_VECTOR_QUERY_WORKERS = max(2, int(os.getenv("VECTOR_QUERY_WORKERS", "8")))
+_VECTOR_QUERY_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_VECTOR_QUERY_WORKERS,
+    thread_name_prefix="vector-query",
+)
+
+
+def vector_query_worker_count() -> int:
+    return _VECTOR_QUERY_WORKERS
+
+
+async def run_vector_query(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    return await loop.run_in_executor(_VECTOR_QUERY_EXECUTOR, call)
+
+
+def submit_vector_query(func: Callable[..., _T], *args: Any, **kwargs: Any) -> "Future[_T]":
+    """Run a blocking pgvector call on the pool from code without an event loop."""
+    return _VECTOR_QUERY_EXECUTOR.submit(func, *args, **kwargs)
+
+
+__all__ = ["run_vector_query", "submit_vector_query", "vector_query_worker_count"]
@@ -6,7 +6,8 @@ from dataclasses import dataclass
 import logging
 import math
 import os
-from typing import Any, Iterable
+import time
+from typing import Any, Iterable, Sequence
 from urllib.parse import urlsplit
 
 import httpx
@@ -43,6 +44,8 @@ class OllamaEmbeddingClient:
     _CONNECT_TIMEOUT_SECONDS = 3.0
     _READ_TIMEOUT_SECONDS = 60.0
     _WRITE_TIMEOUT_SECONDS = 10.0
+    _SELECTION_TTL_SECONDS = 300.0
+    _selected_models: dict[tuple[str, ...], tuple[str, float]] = {}
 
     def candidate_base_urls(self) -> tuple[str, ...]:
         """Return ordered, normalized, duplicate-free provider endpoints."""
@@ -79,9 +82,14 @@ class OllamaEmbeddingClient:
         if preferred:
             return preferred
 
+        candidates = self.candidate_base_urls()
+        cached = self._selected_models.get(candidates)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
         timeout = httpx.Timeout(self._DISCOVERY_TIMEOUT_SECONDS)
         async with httpx.AsyncClient(timeout=timeout) as client:
-            for base_url in self.candidate_base_urls():
+            for base_url in candidates:
                 try:
                     response = await client.get(f"{base_url}/api/tags")
                 except httpx.HTTPError:
@@ -91,9 +99,19 @@ class OllamaEmbeddingClient:
                 names = self._installed_base_model_names(response)
                 for model_name in self._MODEL_PRIORITY:
                     if model_name in names:
+                        self._selected_models[candidates] = (
+                            model_name,
+                            time.monotonic() + self._SELECTION_TTL_SECONDS,
+                        )
                         return model_name
         return "nomic-embed-text"
 
+    @classmethod
+    def clear_model_selection_cache(cls) -> None:
+        """Forget discovered models, e.g. after models are pulled or removed."""
+
+        cls._selected_models.clear()
+
     async def embed(
         self,
         text: str,
@@ -103,11 +121,54 @@ class OllamaEmbeddingClient:
     ) -> OllamaEmbeddingOutcome:
         """Generate one embedding without retrying ambiguous provider work."""
 
-        prompt_text = self._provider_text(
-            text,
+        outcomes = await self._request_embeddings(
+            [text],
             model=model,
-            is_query=is_query,
+            provider_input=self._provider_text(
+                text,
+                model=model,
+                is_query=is_query,
+            ),
         )
+        return outcomes[0]
+
+    async def embed_many(
+        self,
+        texts: Sequence[str],
+        *,
+        model: str,
+        is_query: bool,
+    ) -> list[OllamaEmbeddingOutcome]:
+        """Embed several texts with one multi-input ``/api/embed`` request.
+
+        Returns one outcome per input in order; a transport or shape failure
+        applies to every item of the request.
+        """
+
+        if not texts:
+            return []
+        provider_inputs = [
+            self._provider_text(text, model=model, is_query=is_query)
+            for text in texts
+        ]
+        return await self._request_embeddings(
+            texts,
+            model=model,
+            provider_input=provider_inputs,
+        )
+
+    async def _request_embeddings(
+        self,
+        texts: Sequence[str],
+        *,
+        model: str,
+        provider_input: str | list[str],
+    ) -> list[OllamaEmbeddingOutcome]:
+        count = len(texts)
+
+        def fail_all(outcome: OllamaEmbeddingOutcome) -> list[OllamaEmbeddingOutcome]:
+            return [outcome] * count
+
         timeout = httpx.Timeout(
             self._READ_TIMEOUT_SECONDS,
             connect=self._CONNECT_TIMEOUT_SECONDS,
@@ -121,7 +182,7 @@ class OllamaEmbeddingClient:
                 try:
                     response = await client.post(
                         endpoint,
-                        json={"model": model, "input": prompt_text},
+                        json={"model": model, "input": provider_input},
                     )
                 except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
                     last_connect_failure = self._failure(
@@ -132,64 +193,71 @@ class OllamaEmbeddingClient:
                     )
                     continue
                 except httpx.ReadTimeout as exc:
-                    return self._failure(
+                    return fail_all(self._failure(
                         code="read_timeout",
                         model=model,
                         base_url=base_url,
                         detail=type(exc).__name__,
-                    )
+                    ))
                 except httpx.TimeoutException as exc:
-                    return self._failure(
+                    return fail_all(self._failure(
                         code="request_timeout",
                         model=model,
                         base_url=base_url,
                         detail=type(exc).__name__,
-                    )
+                    ))
                 except httpx.HTTPError as exc:
-                    return self._failure(
+                    return fail_all(self._failure(
                         code="transport_error",
                         model=model,
                         base_url=base_url,
                         detail=type(exc).__name__,
-                    )
+                    ))
 
                 if response.status_code != 200:
-                    return self._failure(
+                    return fail_all(self._failure(
                         code=f"http_{response.status_code}",
                         model=model,
                         base_url=base_url,
                         detail=response.text[:160],
-                    )
+                    ))
                 try:
                     payload = response.json()
                 except ValueError as exc:
-                    return self._failure(
+                    return fail_all(self._failure(
                         code="invalid_json",
                         model=model,
                         base_url=base_url,
                         detail=type(exc).__name__,
-                    )
-                embedding = self._validated_embedding(payload)
-                if embedding is None:
-                    return self._failure(
+                    ))
+                embeddings = self._validated_embeddings(payload, count)
+                if embeddings is None:
+                    return fail_all(self._failure(
                         code="invalid_embedding_shape",
                         model=model,
                         base_url=base_url,
-                        detail="expected_one_non_empty_finite_vector",
-                    )
+                        detail=(
+                            "expected_one_non_empty_finite_vector"
+                            if count == 1
+                            else f"expected_{count}_non_empty_finite_vectors"
+                        ),
+                    ))
                 resolved_model = str(payload.get("model") or model)
-                return OllamaEmbeddingOutcome(
-                    embedding=embedding,
-                    model=resolved_model,
-                    base_url=base_url,
-                )
+                return [
+                    OllamaEmbeddingOutcome(
+                        embedding=embedding,
+                        model=resolved_model,
+                        base_url=base_url,
+                    )
+                    for embedding in embeddings
+                ]
 
-        return last_connect_failure or self._failure(
+        return fail_all(last_connect_failure or self._failure(
             code="endpoint_unavailable",
             model=model,
             base_url="",
             detail="no_candidate_endpoint",
-        )
+        ))
 
     @classmethod
     def _provider_text(
@@ -217,23 +285,33 @@ class OllamaEmbeddingClient:
             if isinstance(model, dict) and model.get("name")
         }
 
+    @classmethod
+    def _validated_embedding(cls, payload: Any) -> tuple[float, ...] | None:
+        embeddings = cls._validated_embeddings(payload, 1)
+        return embeddings[0] if embeddings else None
+
     @staticmethod
-    def _validated_embedding(payload: Any) -> tuple[float, ...] | None:
+    def _validated_embeddings(
+        payload: Any,
+        expected: int,
+    ) -> list[tuple[float, ...]] | None:
         if not isinstance(payload, dict):
             return None
         embeddings = payload.get("embeddings")
-        if not isinstance(embeddings, list) or len(embeddings) != 1:
-            return None
-        candidate = embeddings[0]
-        if not isinstance(candidate, list) or not candidate:
+        if not isinstance(embeddings, list) or len(embeddings) != expected:
             return None
-        try:
-            embedding = tuple(float(value) for value in candidate)
-        except (TypeError, ValueError):
-            return None
-        if not all(math.isfinite(value) for value in embedding):
-            return None
-        return embedding
+        validated: list[tuple[float, ...]] = []
+        for candidate in embeddings:
+            if not isinstance(candidate, list) or not candidate:
+                return None
+            try:
+                embedding = tuple(float(value) for value in candidate)
+            except (TypeError, ValueError):
+                return None
+            if not all(math.isfinite(value) for value in embedding):
+                return None
+            validated.append(embedding)
+        return validated
 
     @staticmethod
     def _deduplicate(values: Iterable[str]) -> Iterable[str]:
@@ -0,0 +1,262 @@
+"""
+Scoped similarity queries for VectorSearchService.
+
+A search names one ``VectorScope`` per result bucket; the query is embedded
+once and the scopes' queries run concurrently, with an optional fallback
+scope tried only when a scope finds nothing.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class VectorScope:
+    """One similarity query of a multi-scope search."""
+
+    table: str
+    filters: Optional[Dict[str, Any]] = None
+    top_k: int = 5
+    # Queried with the same embedding only when this scope finds nothing.
+    fallback: Optional["VectorScope"] = None
+
+
+def playbook_sop_scope(playbook_code: str, top_k: int = 5) -> VectorScope:
+    return VectorScope(
+        table="playbook_knowledge",
+        filters={"playbook_code": playbook_code},
+        top_k=top_k,
+    )
+
+
+def personal_context_scope(user_id: str, top_k: int = 3) -> VectorScope:
+    # ADR-001 v2: L2 memory_embeddings first, frozen mindscape_personal as fallback.
+    return VectorScope(
+        table="memory_embeddings",
+        filters={"user_id": user_id},
+        top_k=top_k,
+        fallback=VectorScope(
+            table="mindscape_personal",
+            filters={"user_id": user_id},
+            top_k=top_k,
+        ),
+    )
+
+
+class VectorSearchScopesMixin:
+    """Scope fan-out over ``self.vector_search`` and ``self._generate_embedding``."""
+
+    async def search_scopes(
+        self,
+        query: str,
+        scopes: Dict[str, VectorScope],
+        query_embedding: Optional[List[float]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run several similarity queries for one query text
+
+        The query is embedded once and every scope's query runs
+        concurrently, so wall time is that of the slowest scope.
+
+        Args:
+            query: Query text
+            scopes: Scope name to the query to run for it
+            query_embedding: Precomputed embedding of ``query``
+
+        Returns:
+            Dict mapping scope name to at most ``top_k`` results
+        """
+        if query_embedding is None:
+            query_embedding = await self._generate_embedding(query)
+        if not query_embedding:
+            return {name: [] for name in scopes}
+
+        results = await asyncio.gather(
+            *(self._search_scope(scope, query_embedding) for scope in scopes.values())
+        )
+        return dict(zip(scopes.keys(), results))
+
+    async def _search_scope(
+        self, scope: VectorScope, query_embedding: List[float]
+    ) -> List[Dict[str, Any]]:
+        results = await self.vector_search(
+            table=scope.table,
+            query_embedding=query_embedding,
+            filters=scope.filters,
+            top_k=scope.top_k,
+        )
+        if not results and scope.fallback is not None:
+            return await self._search_scope(scope.fallback, query_embedding)
+        return results[: scope.top_k]
+
+    async def search_playbook_sop(
+        self, playbook_code: str, query: str, top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for relevant Playbook SOP chunks
+
+        Args:
+            playbook_code: Playbook identifier
+            query: User query
+            top_k: Number of results
+
+        Returns:
+            List of relevant SOP chunks
+        """
+        results = await self.search_scopes(
+            query, {"playbook_sop": playbook_sop_scope(playbook_code, top_k)}
+        )
+        return results["playbook_sop"]
+
+    async def search_personal_context(
+        self, user_id: str, query: str, top_k: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Search user's personal semantic memory (L2).
+
+        ADR-001 v2: queries memory_embeddings (L2) instead of mindscape_personal.
+        Falls back to mindscape_personal if memory_embeddings is empty.
+
+        Args:
+            user_id: User identifier
+            query: User query
+            top_k: Number of results
+
+        Returns:
+            List of relevant personal context
+        """
+        results = await self.search_scopes(
+            query, {"personal_context": personal_context_scope(user_id, top_k)}
+        )
+        return results["personal_context"]
+
+    async def execute_playbook_with_context(
+        self, playbook_code: str, user_query: str, user_id: str = "default_user"
+    ) -> Dict[str, Any]:
+        """
+        Execute playbook with combined context from SOP and personal memory
+
+        Searches both playbook SOP knowledge and user's personal context to provide
+        comprehensive context for AI agent execution. The query is embedded once
+        and both searches run concurrently.
+
+        Args:
+            playbook_code: Playbook identifier
+            user_query: User's query or task description
+            user_id: User identifier
+
+        Returns:
+            Combined context for AI with formatted text
+        """
+        results = await self.search_scopes(
+            user_query,
+            {
+                "playbook_sop": playbook_sop_scope(playbook_code, top_k=5),
+                "personal_context": personal_context_scope(user_id, top_k=3),
+            },
+        )
+        playbook_chunks = results["playbook_sop"]
+        personal_context = results["personal_context"]
+
+        context = {
+            "playbook_sop": [
+                {
+                    "content": chunk["content"],
+                    "section_type": chunk["section_type"],
+                    "similarity": chunk["similarity"],
+                }
+                for chunk in playbook_chunks
+            ],
+            "personal_context": [
+                {
+                    "content": ctx["content"],
+                    "source_type": ctx["source_type"],
+                    "similarity": ctx["similarity"],
+                }
+                for ctx in personal_context
+            ],
+        }
+
+        context_text = self._format_context_for_llm(context)
+
+        return {
+            "context": context,
+            "context_text": context_text,
+            "playbook_code": playbook_code,
+        }
+
+    async def multi_scope_search(
+        self,
+        query: str,
+        user_id: str,
+        workspace_id: Optional[str] = None,
+        intent_id: Optional[str] = None,
+        scopes: List[str] = None,
+        top_k_per_scope: Dict[str, int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Multi-scope hierarchical memory search
+
+        Args:
+            query: Search query text
+            user_id: User identifier
+            workspace_id: Optional workspace ID
+            intent_id: Optional intent ID
+            scopes: List of scopes to search ('global', 'workspace', 'intent')
+            top_k_per_scope: Dict mapping scope to top_k (e.g., {'global': 3, 'workspace': 8})
+
+        Returns:
+            Dict mapping scope to list of results
+        """
+        if scopes is None:
+            scopes = ["global", "workspace", "intent"]
+
+        if top_k_per_scope is None:
+            top_k_per_scope = {"global": 3, "workspace": 8, "intent": 8}
+
+        query_embedding = await self._generate_embedding(query)
+        if not query_embedding:
+            return {scope: [] for scope in scopes}
+
+        vector_scopes = {}
+        for scope in scopes:
+            filters = {"user_id": user_id, "scope": scope}
+
+            if scope == "workspace" and workspace_id:
+                filters["workspace_id"] = workspace_id
+            elif scope == "intent" and intent_id:
+                filters["intent_id"] = intent_id
+                if workspace_id:
+                    filters["workspace_id"] = workspace_id
+
+            vector_scopes[scope] = VectorScope(
+                table="memory_embeddings",
+                filters=filters,
+                # Get more results for composite scoring
+                top_k=top_k_per_scope.get(scope, 5) * 2,
+            )
+
+        scope_results = await self.search_scopes(
+            query, vector_scopes, query_embedding=query_embedding
+        )
+
+        results = {}
+        for scope in scopes:
+            # Apply composite scoring
+            scored_results = await self._calculate_composite_scores(
+                scope_results[scope], query_embedding
+            )
+
+            # Return top_k after scoring
+            results[scope] = scored_results[: top_k_per_scope.get(scope, 5)]
+
+        return results
+
+
+__all__ = [
+    "VectorScope",
+    "VectorSearchScopesMixin",
+    "personal_context_scope",
+    "playbook_sop_scope",
+]
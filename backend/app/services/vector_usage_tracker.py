@@ -0,0 +1,189 @@
+"""
+Write-behind buffer for ``last_used_at`` updates on vector memory tables.
+
+Retrieval used to commit one UPDATE per scope before the chat turn could
+continue. Reads now only record the ids they returned; ids are coalesced per
+table and written as one UPDATE per table, either every flush interval or as
+soon as a size threshold is reached. A failed flush is logged and dropped:
+usage timestamps are a ranking signal, not data the turn depends on.
+
+The API starts the flusher on the application loop at startup. Processes
+that never run app startup (runner children, scripts) get one started by the
+first ``record`` made on a running loop, and a new one once that loop is gone.
+Other threads only signal the flusher's loop through ``call_soon_threadsafe``;
+with no loop at all, a full batch is written straight on the vector pool.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Dict, Iterable, Optional, Set
+
+from backend.app.database.vector_connection import get_vector_dbapi_connection
+from backend.app.services.vector_search_db import update_last_used_at_records_sync
+from backend.app.services.vector_search_executor import (
+    run_vector_query,
+    submit_vector_query,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+_DEFAULT_FLUSH_BATCH_SIZE = 500
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+class LastUsedAtWriteBehind:
+    """Coalesce record ids per table and flush them in batches."""
+
+    def __init__(
+        self,
+        *,
+        flush_interval_seconds: Optional[float] = None,
+        flush_batch_size: Optional[int] = None,
+        get_connection=None,
+    ):
+        self.flush_interval_seconds = (
+            _env_number(
+                "MEMORY_USAGE_FLUSH_INTERVAL_SECONDS", _DEFAULT_FLUSH_INTERVAL_SECONDS
+            )
+            if flush_interval_seconds is None
+            else flush_interval_seconds
+        )
+        self.flush_batch_size = int(
+            _env_number("MEMORY_USAGE_FLUSH_BATCH_SIZE", _DEFAULT_FLUSH_BATCH_SIZE)
+            if flush_batch_size is None
+            else flush_batch_size
+        )
+        self._get_connection = get_connection or get_vector_dbapi_connection
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Set[str]] = {}
+        self._pending_count = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_now: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        """Run the background flusher on the current loop unless one is live."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._flusher_live():
+                return
+            self._loop = loop
+            self._flush_now = asyncio.Event()
+            self._flusher = loop.create_task(self._run())
+
+    def record(self, record_ids: Iterable[str], table: str = "memory_embeddings") -> None:
+        """Queue ids whose ``last_used_at`` should be bumped. Never blocks on I/O."""
+        with self._lock:
+            pending = self._pending.setdefault(table, set())
+            before = len(pending)
+            pending.update(record_id for record_id in record_ids if record_id)
+            self._pending_count += len(pending) - before
+            over_threshold = self._pending_count >= self.flush_batch_size
+            live = self._flusher_live()
+            loop, flush_now = self._loop, self._flush_now
+        if not live:
+            try:
+                self.start()
+            except RuntimeError:
+                # No running loop in this thread and no flusher anywhere.
+                if over_threshold:
+                    submit_vector_query(self._write_batches, self._take_pending())
+                return
+            loop, flush_now = self._loop, self._flush_now
+        if over_threshold and loop is not None and flush_now is not None:
+            try:
+                loop.call_soon_threadsafe(flush_now.set)
+            except RuntimeError:
+                # The flusher's loop closed meanwhile; the next record restarts it.
+                pass
+
+    def pending_count(self) -> int:
+        return self._pending_count
+
+    async def flush(self) -> int:
+        """Write every queued id now; returns how many ids were flushed."""
+        batches = self._take_pending()
+        if not batches:
+            return 0
+        return await run_vector_query(self._write_batches, batches)
+
+    def _flusher_live(self) -> bool:
+        return (
+            self._flusher is not None
+            and not self._flusher.done()
+            and self._loop is not None
+            and self._loop.is_running()
+        )
+
+    def _take_pending(self) -> Dict[str, Set[str]]:
+        with self._lock:
+            batches = self._pending
+            self._pending = {}
+            self._pending_count = 0
+        return batches
+
+    def _write_batches(self, batches: Dict[str, Set[str]]) -> int:
+        flushed = 0
+        for table, record_ids in batches.items():
+            if not record_ids:
+                continue
+            try:
+                update_last_used_at_records_sync(
+                    self._get_connection, sorted(record_ids), table
+                )
+                flushed += len(record_ids)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to flush last_used_at for {len(record_ids)} records in {table}: {e}"
+                )
+        return flushed
+
+    async def aclose(self) -> None:
+        """Stop the background flusher and write whatever is still queued."""
+        flusher = self._flusher
+        self._flusher = None
+        self._loop = None
+        self._flush_now = None
+        if flusher is not None and not flusher.done():
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def _run(self) -> None:
+        flush_now = self._flush_now
+        while True:
+            try:
+                await asyncio.wait_for(
+                    flush_now.wait(), timeout=self.flush_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            flush_now.clear()
+            if self._pending_count:
+                await self.flush()
+
+
+_tracker: Optional[LastUsedAtWriteBehind] = None
+_tracker_lock = threading.Lock()
+
+
+def get_last_used_at_tracker() -> LastUsedAtWriteBehind:
+    """Return the process-wide ``last_used_at`` write-behind buffer."""
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = LastUsedAtWriteBehind()
+    return _tracker
@@ -6,7 +6,7 @@ import hashlib
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
 
 from backend.app.services.cache.redis_cache import get_cache_service
 
@@ -185,10 +185,53 @@ def publish_committed_workspace_event(event: Any) -> bool:
     return publish_committed_workspace_cloud_event(payload)
 
 
+def publish_committed_workspace_events(events: Iterable[Any]) -> int:
+    """Fan out a batch of committed events in one pipelined Redis round trip.
+
+    Ineligible events are skipped with the same warning as the single-event
+    path. Returns the number of events published.
+    """
+    messages: List[Tuple[str, str]] = []
+    for event in events:
+        workspace_id = _text(getattr(event, "workspace_id", ""))
+        if not workspace_id:
+            continue
+        try:
+            payload = validate_workspace_lifecycle_event(
+                serialize_mind_event_cloud_event(event),
+                workspace_id=workspace_id,
+            )
+        except (TypeError, ValueError) as exc:
+            logger.warning(
+                "Committed workspace event is not eligible for live fan-out "
+                "workspace=%s event=%s reason=%s",
+                workspace_id[:8],
+                _text(getattr(event, "id", ""))[:8],
+                exc,
+            )
+            continue
+        messages.append(
+            (
+                workspace_event_channel(workspace_id),
+                json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+            )
+        )
+    if not messages:
+        return 0
+    published = get_cache_service().publish_many(messages)
+    if not published:
+        logger.warning(
+            "Committed workspace event batch fan-out unavailable events=%s",
+            len(messages),
+        )
+    return published
+
+
 __all__ = [
     "MAX_WORKSPACE_EVENT_BYTES",
     "publish_committed_workspace_cloud_event",
     "publish_committed_workspace_event",
+    "publish_committed_workspace_events",
     "serialize_mind_event_cloud_event",
     "validate_workspace_lifecycle_event",
     "workspace_event_payload_checksum",
@@ -49,6 +49,7 @@ class GraphResponse(BaseModel):
     scope_type: str
     scope_id: str
     derived_at: str
+    graph_version: int = 0
 
 
 class NodeResponse(BaseModel):
@@ -42,4 +42,5 @@ def build_graph_response(graph: MindscapeGraph) -> GraphResponse:
         scope_type=graph.scope_type,
         scope_id=graph.scope_id,
         derived_at=graph.derived_at.isoformat(),
+        graph_version=graph.last_event_seq,
     )
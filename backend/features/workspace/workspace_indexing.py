@@ -5,8 +5,10 @@ Provides endpoints for indexing workspace data sources into vector database.
 """
 
 import asyncio
+import json
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Optional
 import logging
 
@@ -92,6 +94,83 @@ async def index_workspace_data_sources(
         raise HTTPException(status_code=500, detail="Indexing failed.") from e
 
 
+@router.post("/workspaces/{workspace_id}/data-sources/index/stream")
+async def stream_workspace_data_source_indexing(
+    workspace_id: str,
+    full: bool = False,
+    auth: AuthContext = Depends(get_current_user),
+):
+    """
+    Index the workspace local_folder and stream progress as SSE
+
+    Only files changed since the last run are re-embedded unless ``full``
+    is set; deleted files are revoked from the index.
+
+    Args:
+        workspace_id: Workspace ID
+        full: Re-index every file instead of only changed ones
+
+    Returns:
+        ``text/event-stream`` of indexing progress events
+    """
+    try:
+        context = await asyncio.to_thread(
+            build_retrieval_access_context,
+            auth,
+            requested_workspace_ids=(workspace_id,),
+        )
+    except (PermissionError, RetrievalScopeDenied) as e:
+        raise HTTPException(
+            status_code=403,
+            detail="Knowledge access is not authorized for this workspace.",
+        ) from e
+
+    store = MindscapeStore()
+    workspace = await store.get_workspace(workspace_id)
+    if not workspace:
+        raise HTTPException(
+            status_code=404, detail=f"Workspace not found: {workspace_id}"
+        )
+
+    local_folder = (workspace.data_sources or {}).get("local_folder")
+    if not local_folder:
+        raise HTTPException(
+            status_code=400,
+            detail="No local_folder configured in workspace data_sources",
+        )
+
+    indexer = LocalFolderIndexer(
+        vector_service=VectorSearchService(),
+        workspace_id=workspace_id,
+        access_context=context,
+    )
+
+    async def event_generator():
+        try:
+            async for event in indexer.index_folder_stream(
+                local_folder, incremental=not full
+            ):
+                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+        except asyncio.CancelledError:
+            return
+        except Exception as exc:
+            logger.error(
+                f"Streaming index failed for workspace {workspace_id}: {exc}",
+                exc_info=True,
+            )
+            yield f"data: {json.dumps({'type': 'error', 'error': 'Indexing failed.'})}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("/workspaces/{workspace_id}/data-sources/status")
 async def get_workspace_data_sources_status(
     workspace_id: str,
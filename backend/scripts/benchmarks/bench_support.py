@@ -0,0 +1,41 @@
+"""Shared latency/throughput reporting helpers for backend benchmarks."""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def ensure_repo_on_path() -> None:
+    for path in (REPO_ROOT, REPO_ROOT / "backend"):
+        path_str = str(path)
+        if path_str not in sys.path:
+            sys.path.insert(0, path_str)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize_latencies(samples_seconds: Iterable[float]) -> dict[str, Any]:
+    samples_ms = [value * 1000.0 for value in samples_seconds]
+    return {
+        "count": len(samples_ms),
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p90_ms": round(percentile(samples_ms, 90), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "max_ms": round(max(samples_ms), 3) if samples_ms else 0.0,
+    }
+
+
+def print_report(name: str, results: Mapping[str, Any]) -> None:
+    print(json.dumps({"benchmark": name, "results": results}, indent=2, sort_keys=True))
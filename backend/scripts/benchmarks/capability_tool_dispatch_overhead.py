@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Measure per-call dispatch overhead of a no-op capability tool.
+
+Writes a throwaway pack with a no-op function tool and a no-op
+``Class.method`` tool, loads it into the capability registry, and times:
+
+- ``uncompiled``: the previous per-call path, which resolves the backend
+  (import roots, module import, class construction) and inspects the
+  signature on every call;
+- ``compiled``: ``call_tool`` through the compiled dispatch table.
+
+    python backend/scripts/benchmarks/capability_tool_dispatch_overhead.py
+    python backend/scripts/benchmarks/capability_tool_dispatch_overhead.py --calls 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from bench_support import ensure_repo_on_path, print_report, summarize_latencies
+
+ensure_repo_on_path()
+
+from app.services import capability_registry  # noqa: E402
+from app.services.capability_backend_loader import (  # noqa: E402
+    resolve_capability_backend_callable,
+)
+from app.services.capability_tool_invocation import (  # noqa: E402
+    invoke_capability_tool,
+)
+
+_PACK = "bench_dispatch_pack"
+
+
+def _write_pack(root: Path) -> Path:
+    pack_dir = root / _PACK
+    pack_dir.mkdir(parents=True)
+    (pack_dir / "tools.py").write_text(
+        "def noop(event=None):\n"
+        "    return event\n"
+        "\n"
+        "\n"
+        "class Observer:\n"
+        "    def observe_event(self, event=None):\n"
+        "        return event\n",
+        encoding="utf-8",
+    )
+    (pack_dir / "manifest.yaml").write_text(
+        f"code: {_PACK}\n"
+        "tools:\n"
+        "  - name: noop\n"
+        f"    backend: capabilities.{_PACK}.tools:noop\n"
+        "  - name: observe_event\n"
+        f"    backend: capabilities.{_PACK}.tools:Observer.observe_event\n"
+        "    instance_lifecycle: capability\n",
+        encoding="utf-8",
+    )
+    return pack_dir
+
+
+def _time_calls(call, calls: int) -> dict:
+    samples = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    summary = summarize_latencies(samples)
+    summary["mean_us"] = round(sum(samples) / len(samples) * 1e6, 2)
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        pack_dir = _write_pack(root)
+        capability_registry.load_capabilities(root, reset=True)
+        results = {}
+        for tool in ("noop", "observe_event"):
+            backend_path = capability_registry.get_tool_backend(_PACK, tool)
+
+            def uncompiled(backend_path=backend_path):
+                func = resolve_capability_backend_callable(
+                    backend_path=backend_path,
+                    capability_dir=pack_dir,
+                )
+                return invoke_capability_tool(func, {"event": "tick"})
+
+            def compiled(tool=tool):
+                return capability_registry.call_tool(_PACK, tool, event="tick")
+
+            results[tool] = {
+                "uncompiled": _time_calls(uncompiled, args.calls),
+                "compiled": _time_calls(compiled, args.calls),
+            }
+    print_report("capability_tool_dispatch_overhead", results)
+
+
+if __name__ == "__main__":
+    main()
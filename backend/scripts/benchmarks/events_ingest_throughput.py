@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Measure mind event ingestion in events/s for batch sizes 1, 50 and 500.
+
+Compares one ``create_event`` per event (one INSERT transaction and one
+Redis publish each) with ``create_events``, which writes a batch as
+multi-row INSERTs in one transaction and fans out with one pipelined
+publish.
+
+The store runs on in-memory SQLite with ``--rtt-ms`` of latency added to
+every statement and to every Redis round trip, so the numbers show how many
+round trips each path costs rather than raw database speed:
+
+    python backend/scripts/benchmarks/events_ingest_throughput.py
+    python backend/scripts/benchmarks/events_ingest_throughput.py --events 5000 --rtt-ms 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from bench_support import ensure_repo_on_path, print_report
+
+ensure_repo_on_path()
+
+from sqlalchemy import create_engine, event, text  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from backend.app.models.mindscape import EventActor, EventType, MindEvent  # noqa: E402
+from backend.app.services import workspace_event_lifecycle  # noqa: E402
+from backend.app.services.stores.postgres import events_store  # noqa: E402
+
+_EVENTS_DDL = """
+CREATE TABLE mind_events (
+    id TEXT PRIMARY KEY,
+    timestamp TIMESTAMP,
+    actor TEXT,
+    channel TEXT,
+    profile_id TEXT,
+    project_id TEXT,
+    workspace_id TEXT,
+    thread_id TEXT,
+    event_type TEXT,
+    payload TEXT,
+    entity_ids TEXT,
+    metadata TEXT
+)
+"""
+
+
+class _RoundTripCache:
+    """Stands in for the Redis cache service, charging one RTT per call."""
+
+    def __init__(self, rtt_seconds: float) -> None:
+        self._rtt_seconds = rtt_seconds
+        self.round_trips = 0
+        self.messages = 0
+
+    def publish(self, channel: str, payload: str) -> bool:
+        time.sleep(self._rtt_seconds)
+        self.round_trips += 1
+        self.messages += 1
+        return True
+
+    def publish_many(self, messages) -> int:
+        time.sleep(self._rtt_seconds)
+        self.round_trips += 1
+        self.messages += len(messages)
+        return len(messages)
+
+
+class _BenchEventsStore(events_store.PostgresEventsStore):
+    def __init__(self, *, rtt_seconds: float) -> None:
+        self._lock = threading.RLock()
+        self._engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        with self._engine.begin() as conn:
+            conn.execute(text(_EVENTS_DDL))
+
+        if rtt_seconds > 0:
+
+            @event.listens_for(self._engine, "before_cursor_execute")
+            def _simulate_round_trip(*_args, **_kwargs):
+                time.sleep(rtt_seconds)
+
+    @contextmanager
+    def get_connection(self):
+        with self._lock, self._engine.connect() as conn:
+            yield conn
+
+    def serialize_json(self, data):
+        return json.dumps(data)
+
+    def count(self) -> int:
+        with self._engine.connect() as conn:
+            return conn.execute(text("SELECT COUNT(*) FROM mind_events")).scalar_one()
+
+
+def _events(count: int) -> list[MindEvent]:
+    now = datetime.now(timezone.utc)
+    return [
+        MindEvent(
+            id=str(uuid.uuid4()),
+            timestamp=now,
+            actor=EventActor.ASSISTANT,
+            channel="bench",
+            profile_id="bench-profile",
+            workspace_id="ws-bench",
+            thread_id="thread-bench",
+            event_type=EventType.MESSAGE,
+            payload={"message": f"tool call trace {index}", "seq": index},
+            entity_ids=[],
+            metadata={"aggregate_id": "thread-bench", "aggregate_version": index + 1},
+        )
+        for index in range(count)
+    ]
+
+
+def _run(args, *, batch_size: int, batched: bool) -> dict:
+    rtt_seconds = args.rtt_ms / 1000.0
+    store = _BenchEventsStore(rtt_seconds=rtt_seconds)
+    cache = _RoundTripCache(rtt_seconds)
+    workspace_event_lifecycle.get_cache_service = lambda: cache
+    pending = _events(args.events)
+
+    started = time.perf_counter()
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start : start + batch_size]
+        if batched:
+            store.create_events(batch)
+        else:
+            for item in batch:
+                store.create_event(item)
+    elapsed = time.perf_counter() - started
+
+    stored = store.count()
+    return {
+        "events": stored,
+        "seconds": round(elapsed, 3),
+        "events_per_second": round(stored / elapsed, 1) if elapsed else 0.0,
+        "redis_round_trips": cache.round_trips,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 50, 500])
+    args = parser.parse_args()
+
+    results = {"rtt_ms": args.rtt_ms, "events": args.events}
+    for batch_size in args.batch_sizes:
+        results[f"batch_{batch_size}"] = {
+            "create_event_loop": _run(args, batch_size=batch_size, batched=False),
+            "create_events": _run(args, batch_size=batch_size, batched=True),
+        }
+    print_report("events_ingest_throughput", results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
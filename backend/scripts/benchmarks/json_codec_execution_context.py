@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Compare the PostgresStoreBase JSON paths on task ``execution_context`` payloads.
+
+``baseline`` is the previous behaviour: ``json.dumps``/``json.loads`` with an
+unconditional ``replace_json_nul_codepoints`` deep copy, and a second deep
+copy of values psycopg2 had already decoded. ``codec`` is ``json_codec``:
+one scan for an escaped NUL, and orjson for decoding when installed.
+``read_text`` is also the JSONB decode cost once the typecaster is
+registered; ``read_decoded`` is the scan the store then runs on the value.
+
+    python backend/scripts/benchmarks/json_codec_execution_context.py
+    python backend/scripts/benchmarks/json_codec_execution_context.py --steps 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from bench_support import ensure_repo_on_path, print_report, summarize_latencies
+
+ensure_repo_on_path()
+
+from backend.app.services.json_codec import (  # noqa: E402
+    dumps_json,
+    fast_json_available,
+    loads_json,
+    without_json_nul,
+)
+from backend.app.services.json_safety import replace_json_nul_codepoints  # noqa: E402
+
+
+def _execution_context(steps: int, rng: random.Random) -> dict:
+    """A running playbook task: route context, governance and step outputs."""
+    return {
+        "status": "running",
+        "playbook_code": "ig_weekly_performance_report",
+        "workspace_id": "ws-7c1f9d2e",
+        "project_id": "proj-42",
+        "trace_id": f"trace-{rng.getrandbits(64):016x}",
+        "execution_id": f"exec-{rng.getrandbits(64):016x}",
+        "sandbox_id": "sbx-3b9e",
+        "current_step_index": steps - 1,
+        "total_steps": steps + 2,
+        "last_tool_id": "ig.ig_fetch_insights",
+        "execution_backend_hint": "local",
+        "executor_route_context": {
+            "runtime": "playbook",
+            "model": "default-chat",
+            "capabilities": ["ig", "content_scheduler", "core_files"],
+        },
+        "governance": {
+            "policy": "workspace-default",
+            "approvals": [{"tool_id": "ig.ig_publish_post", "state": "pending"}],
+        },
+        "resource_admission": {"slots": 1, "queue": "default", "admitted_at": 1760000000.5},
+        "step_outputs": {
+            f"step_{index}": {
+                "tool_id": f"ig.tool_{index}",
+                "started_at": "2026-10-16T08:00:00+00:00",
+                "duration_ms": rng.randint(20, 4000),
+                "result": {
+                    "summary": "Engagement rose on carousel posts; reels flat week over week. "
+                    * 2,
+                    "rows": [
+                        {
+                            "post_id": f"p{index}-{row}",
+                            "caption": "Nouvelle collection — café ☕ et croissants",
+                            "likes": rng.randint(0, 5000),
+                            "reach": rng.randint(0, 90000),
+                            "rate": round(rng.random(), 4),
+                            "tags": ["autumn", "launch", "cafe"],
+                        }
+                        for row in range(4)
+                    ],
+                },
+            }
+            for index in range(steps)
+        },
+    }
+
+
+def _time(fn, payloads, rounds: int) -> list:
+    samples = []
+    for _ in range(rounds):
+        for payload in payloads:
+            started = time.perf_counter()
+            fn(payload)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payloads", type=int, default=50)
+    parser.add_argument("--steps", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=40)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    values = [_execution_context(args.steps, rng) for _ in range(args.payloads)]
+    texts = [json.dumps(value) for value in values]
+
+    paths = {
+        "write": (
+            lambda value: json.dumps(replace_json_nul_codepoints(value)),
+            dumps_json,
+            values,
+        ),
+        "read_text": (
+            lambda text: replace_json_nul_codepoints(json.loads(text)),
+            loads_json,
+            texts,
+        ),
+        # A value psycopg2 (or a caller) already decoded: deep copy versus
+        # one encode-and-scan.
+        "read_decoded": (
+            replace_json_nul_codepoints,
+            without_json_nul,
+            values,
+        ),
+    }
+
+    report = {
+        "corpus": {
+            "payloads": args.payloads,
+            "steps": args.steps,
+            "avg_payload_bytes": sum(len(text) for text in texts) // len(texts),
+            "orjson": fast_json_available(),
+        }
+    }
+    for name, (baseline, codec, payloads) in paths.items():
+        baseline_stats = summarize_latencies(_time(baseline, payloads, args.rounds))
+        codec_stats = summarize_latencies(_time(codec, payloads, args.rounds))
+        report[name] = {"baseline": baseline_stats, "codec": codec_stats}
+    print_report("json_codec_execution_context", report)
+
+
+if __name__ == "__main__":
+    main()
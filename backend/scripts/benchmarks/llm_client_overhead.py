@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Measure per-request overhead and time-to-first-token of the LLM providers.
+
+Compares a fresh ``openai.AsyncOpenAI`` client per request, which is what
+the providers did before, with the pooled clients from
+``llm_providers.client_pool``. Requests go to a local OpenAI-compatible stub
+server that answers instantly, so the numbers are client-side cost: client
+construction, TCP handshake and response parsing. Add ``--delay-ms`` to
+simulate server think time before the first token:
+
+    python backend/scripts/benchmarks/llm_client_overhead.py
+    python backend/scripts/benchmarks/llm_client_overhead.py --requests 500 --chunks 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+from bench_support import ensure_repo_on_path, print_report, summarize_latencies
+
+ensure_repo_on_path()
+
+import openai  # noqa: E402
+
+from backend.app.services.llm_providers.base import (  # noqa: E402
+    collect_stream,
+    iter_chat_deltas,
+)
+from backend.app.services.llm_providers.client_pool import (  # noqa: E402
+    LLMClientRegistry,
+)
+
+_API_KEY = "bench"
+
+
+def _completion_body() -> bytes:
+    return json.dumps(
+        {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "bench",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "ok"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+    ).encode()
+
+
+def _chunk_event(content: str) -> bytes:
+    payload = json.dumps(
+        {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "bench",
+            "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": None}],
+        }
+    )
+    data = f"data: {payload}\n\n".encode()
+    return b"%x\r\n%s\r\n" % (len(data), data)
+
+
+class StubServer:
+    """Minimal keep-alive HTTP/1.1 server for ``/v1/chat/completions``."""
+
+    def __init__(self, chunks: int, delay_ms: float):
+        self.chunks = chunks
+        self.delay = delay_ms / 1000.0
+        self.connections = 0
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b""):
+                        break
+                    name, _, value = header.decode().partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value.strip())
+                body = json.loads(await reader.readexactly(length)) if length else {}
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                if body.get("stream"):
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\n"
+                        b"transfer-encoding: chunked\r\n\r\n"
+                    )
+                    for index in range(self.chunks):
+                        writer.write(_chunk_event(f"t{index} "))
+                        await writer.drain()
+                    done = b"data: [DONE]\n\n"
+                    writer.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(done), done))
+                else:
+                    payload = _completion_body()
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                        b"content-length: %d\r\n\r\n%s" % (len(payload), payload)
+                    )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _fresh_client(base_url: str):
+    return openai.AsyncOpenAI(api_key=_API_KEY, base_url=base_url)
+
+
+async def _measure(server: StubServer, base_url: str, mode: str, requests: int) -> dict:
+    registry = LLMClientRegistry()
+    registry.bind_running_loop()
+    messages = [{"role": "user", "content": "ping"}]
+    server.connections = 0
+    per_request = []
+    first_token = []
+    stream_total = []
+    fresh_clients = []
+
+    def _client():
+        if mode == "pooled":
+            return registry.get_openai_client(_API_KEY, base_url=base_url)
+        client = _fresh_client(base_url)
+        fresh_clients.append(client)
+        return client
+
+    for _ in range(requests):
+        started = time.perf_counter()
+        await _client().chat.completions.create(model="bench", messages=messages)
+        per_request.append(time.perf_counter() - started)
+
+    for _ in range(requests):
+        started = time.perf_counter()
+        stream = await _client().chat.completions.create(
+            model="bench", messages=messages, stream=True
+        )
+        deltas = iter_chat_deltas(stream)
+        first = await deltas.__anext__()
+        first_token.append(time.perf_counter() - started)
+        rest = await collect_stream(deltas)
+        stream_total.append(time.perf_counter() - started)
+        assert first and rest
+
+    connections = server.connections
+    await registry.aclose()
+    for client in fresh_clients:
+        await client.close()
+    return {
+        "tcp_connections": connections,
+        "request": summarize_latencies(per_request),
+        "time_to_first_token": summarize_latencies(first_token),
+        "stream_complete": summarize_latencies(stream_total),
+    }
+
+
+async def _main(args) -> int:
+    server = StubServer(args.chunks, args.delay_ms)
+    base_url = await server.start()
+    results: dict = {
+        "requests": args.requests,
+        "chunks_per_stream": args.chunks,
+        "delay_ms": args.delay_ms,
+    }
+    try:
+        results["fresh_client"] = await _measure(server, base_url, "fresh", args.requests)
+        results["pooled_client"] = await _measure(server, base_url, "pooled", args.requests)
+    finally:
+        await server.stop()
+    print_report("llm_client_overhead", results)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--chunks", type=int, default=50)
+    parser.add_argument("--delay-ms", type=float, default=0.0)
+    return asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Measure claimed tasks per second for 1, 4 and 16 runners.
+
+Compares the single-task claim path (``get_task`` then ``try_claim_task``
+per popped id) with ``claim_ready_tasks``, which claims up to the free
+inflight capacity in one transaction.
+
+The store runs on in-memory SQLite with ``--rtt-ms`` of latency added to
+every statement, so the numbers show how many DB round-trips each claim
+costs. SQLite serializes transactions, so runner counts above one measure
+contention on a single writer; on PostgreSQL ``FOR UPDATE SKIP LOCKED``
+lets batch claims from different runners proceed in parallel:
+
+    python backend/scripts/benchmarks/runner_claim_throughput.py
+    python backend/scripts/benchmarks/runner_claim_throughput.py --tasks 2000 --rtt-ms 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from bench_support import ensure_repo_on_path, print_report
+
+ensure_repo_on_path()
+
+from sqlalchemy import create_engine, event, text  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from backend.app.services.stores.tasks_store._runner import (  # noqa: E402
+    TasksStoreRunnerMixin,
+)
+from backend.app.services.stores.tasks_store._task_row_projection import (  # noqa: E402
+    TasksStoreRowProjectionMixin,
+)
+
+_TASKS_DDL = """
+CREATE TABLE tasks (
+    id TEXT PRIMARY KEY,
+    workspace_id TEXT,
+    message_id TEXT,
+    execution_id TEXT,
+    status TEXT NOT NULL,
+    params TEXT,
+    result TEXT,
+    execution_context TEXT,
+    pack_id TEXT NOT NULL,
+    task_type TEXT,
+    queue_shard TEXT,
+    concurrency_key TEXT,
+    created_at TIMESTAMP,
+    next_eligible_at TIMESTAMP,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    runner_id TEXT,
+    heartbeat_at TIMESTAMP,
+    error TEXT,
+    blocked_reason TEXT,
+    blocked_payload TEXT,
+    frontier_state TEXT,
+    frontier_enqueued_at TIMESTAMP
+)
+"""
+
+_ALLOCATIONS_DDL = """
+CREATE TABLE host_resource_workspace_allocations (
+    allocation_id TEXT PRIMARY KEY,
+    workspace_id TEXT NOT NULL,
+    queue_shard TEXT NOT NULL,
+    state TEXT NOT NULL,
+    max_parallel_task_claims INTEGER NOT NULL,
+    metadata TEXT
+)
+"""
+
+
+class _BenchClaimStore(TasksStoreRunnerMixin, TasksStoreRowProjectionMixin):
+    def __init__(self, *, rtt_seconds: float, task_count: int) -> None:
+        self._lock = threading.RLock()
+        self._engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        with self._engine.begin() as conn:
+            conn.execute(text(_TASKS_DDL))
+            conn.execute(text(_ALLOCATIONS_DDL))
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO host_resource_workspace_allocations
+                    VALUES ('bench', 'ws-bench', 'default_local', 'enabled', :cap, '{}')
+                    """
+                ),
+                {"cap": task_count + 1},
+            )
+            created_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO tasks (
+                        id, workspace_id, message_id, execution_id, status, params,
+                        execution_context, pack_id, task_type, queue_shard,
+                        created_at, next_eligible_at, frontier_state
+                    ) VALUES (
+                        :id, 'ws-bench', :id, :id, 'pending', '{}',
+                        '{}', 'bench_tool', 'tool_execution', 'default_local',
+                        :created_at, :created_at, 'ready'
+                    )
+                    """
+                ),
+                [
+                    {"id": f"task-{index:06d}", "created_at": created_at}
+                    for index in range(task_count)
+                ],
+            )
+
+        if rtt_seconds > 0:
+
+            @event.listens_for(self._engine, "before_cursor_execute")
+            def _simulate_round_trip(*_args, **_kwargs):
+                time.sleep(rtt_seconds)
+
+    @contextmanager
+    def get_connection(self):
+        with self._lock, self._engine.begin() as conn:
+            yield conn
+
+    @contextmanager
+    def transaction(self):
+        with self.get_connection() as conn:
+            yield conn
+
+    def serialize_json(self, data):
+        return json.dumps(data)
+
+    def deserialize_json(self, data, default=None):
+        if data is None:
+            return default
+        if isinstance(data, (dict, list)):
+            return data
+        return json.loads(data)
+
+    def _coerce_datetime(self, value):
+        if value is None or isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(value)
+
+    def get_task(self, task_id: str):
+        with self.get_connection() as conn:
+            row = conn.execute(
+                text("SELECT * FROM tasks WHERE id = :task_id"),
+                {"task_id": task_id},
+            ).fetchone()
+        return self._row_to_task(row) if row else None
+
+
+def _run(args, *, runners: int, batch: bool) -> dict:
+    store = _BenchClaimStore(
+        rtt_seconds=args.rtt_ms / 1000.0,
+        task_count=args.tasks,
+    )
+    # Stands in for the Redis ready queue the single-task path pops from.
+    ready_ids = deque(f"task-{index:06d}" for index in range(args.tasks))
+    ready_lock = threading.Lock()
+    claimed_counts = [0] * runners
+
+    def single_runner(slot: int) -> None:
+        while True:
+            with ready_lock:
+                if not ready_ids:
+                    return
+                task_id = ready_ids.popleft()
+            task = store.get_task(task_id)
+            if task is None:
+                continue
+            if store.try_claim_task(task.id, runner_id=f"runner-{slot}"):
+                claimed_counts[slot] += 1
+
+    def batch_runner(slot: int) -> None:
+        while True:
+            claimed = store.claim_ready_tasks(
+                f"runner-{slot}",
+                queue_shards=["default_local"],
+                limit=args.max_inflight,
+            )
+            if not claimed:
+                return
+            claimed_counts[slot] += len(claimed)
+
+    target = batch_runner if batch else single_runner
+    threads = [threading.Thread(target=target, args=(slot,)) for slot in range(runners)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    total = sum(claimed_counts)
+    return {
+        "claimed": total,
+        "seconds": round(elapsed, 3),
+        "tasks_per_second": round(total / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--max-inflight", type=int, default=8)
+    parser.add_argument("--runners", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    results = {
+        "rtt_ms": args.rtt_ms,
+        "max_inflight": args.max_inflight,
+        "tasks": args.tasks,
+    }
+    for runners in args.runners:
+        results[f"runners_{runners}"] = {
+            "single_claim": _run(args, runners=runners, batch=False),
+            "batch_claim": _run(args, runners=runners, batch=True),
+        }
+    print_report("runner_claim_throughput", results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
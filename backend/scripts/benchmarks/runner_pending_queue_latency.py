@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Measure targeted claim and reroute latency at 1k, 10k and 100k pending tasks.
+
+Compares the pre-ZSET pending LIST scripts (``LREM`` scans) with the ZSET
+scripts ``RedisRunnerQueueStore`` now uses. Each sample claims or reroutes a
+task picked at random from the queue, which is what the fairness scheduler's
+``promote_pending_task_by_id`` and host-resource reroutes do.
+
+Needs a reachable Redis (``REDIS_HOST``/``REDIS_PORT``/``REDIS_DB``, same as
+the backend). Keys live under ``mindscape:bench:`` and are deleted afterwards:
+
+    REDIS_HOST=localhost python backend/scripts/benchmarks/runner_pending_queue_latency.py
+    REDIS_HOST=localhost python backend/scripts/benchmarks/runner_pending_queue_latency.py --sizes 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from bench_support import ensure_repo_on_path, print_report, summarize_latencies
+
+ensure_repo_on_path()
+
+from redis.asyncio import Redis  # noqa: E402
+
+from backend.app.services.stores.redis.runner_queue_store import (  # noqa: E402
+    LUA_REMOVE_PENDING_AND_PROCESS,
+    LUA_REROUTE_PENDING,
+)
+
+_LEGACY_REMOVE_PENDING_AND_PROCESS = """
+local removed = redis.call("lrem", KEYS[1], 1, ARGV[1])
+if removed > 0 then
+    redis.call("zadd", KEYS[2], ARGV[2], ARGV[1])
+    return 1
+else
+    return 0
+end
+"""
+
+_LEGACY_REROUTE_PENDING = """
+local removed = 0
+for index = 3, #KEYS do
+    removed = removed + redis.call("lrem", KEYS[index], 0, ARGV[1])
+end
+removed = removed + redis.call("lrem", KEYS[2], 0, ARGV[1])
+if removed <= 0 then
+    return {0, 0}
+end
+redis.call("setex", KEYS[1], ARGV[3], ARGV[2])
+redis.call("lpush", KEYS[2], ARGV[1])
+return {removed, 1}
+"""
+
+_PREFIX = "mindscape:bench:pending"
+
+
+def _keys(layout: str) -> dict[str, str]:
+    return {
+        "source": f"{_PREFIX}:{layout}:source",
+        "other": f"{_PREFIX}:{layout}:other",
+        "target": f"{_PREFIX}:{layout}:target",
+        "processing": f"{_PREFIX}:{layout}:processing",
+        "route": f"{_PREFIX}:{layout}:route",
+    }
+
+
+async def _fill(client: Redis, layout: str, size: int) -> list[str]:
+    keys = _keys(layout)
+    await client.delete(*keys.values())
+    task_ids = [f"task-{index:07d}" for index in range(size)]
+    for start in range(0, size, 5000):
+        chunk = task_ids[start : start + 5000]
+        if layout == "list":
+            await client.lpush(keys["source"], *chunk)
+            await client.lpush(keys["other"], *[f"other-{task_id}" for task_id in chunk])
+        else:
+            await client.zadd(
+                keys["source"],
+                {task_id: start + offset for offset, task_id in enumerate(chunk)},
+            )
+            await client.zadd(
+                keys["other"],
+                {f"other-{task_id}": start + offset for offset, task_id in enumerate(chunk)},
+            )
+    return task_ids
+
+
+async def _measure(client: Redis, layout: str, size: int, samples: int) -> dict:
+    keys = _keys(layout)
+    task_ids = await _fill(client, layout, size)
+    rng = random.Random(size)
+    claim_script = (
+        _LEGACY_REMOVE_PENDING_AND_PROCESS if layout == "list" else LUA_REMOVE_PENDING_AND_PROCESS
+    )
+    reroute_script = _LEGACY_REROUTE_PENDING if layout == "list" else LUA_REROUTE_PENDING
+
+    picks = rng.sample(task_ids, min(len(task_ids), samples * 2))
+    claim_latencies = []
+    for task_id in picks[:samples]:
+        started = time.perf_counter()
+        await client.eval(
+            claim_script, 2, keys["source"], keys["processing"], task_id, time.time() + 180
+        )
+        claim_latencies.append(time.perf_counter() - started)
+
+    reroute_latencies = []
+    for task_id in picks[samples:]:
+        started = time.perf_counter()
+        await client.eval(
+            reroute_script,
+            4,
+            keys["route"],
+            keys["target"],
+            keys["source"],
+            keys["other"],
+            task_id,
+            "{}",
+            60,
+        )
+        reroute_latencies.append(time.perf_counter() - started)
+
+    await client.delete(*keys.values())
+    return {
+        "targeted_claim": summarize_latencies(claim_latencies),
+        "reroute": summarize_latencies(reroute_latencies),
+    }
+
+
+async def _main(args) -> int:
+    client = Redis(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        password=os.getenv("REDIS_PASSWORD") or None,
+        db=int(os.getenv("REDIS_DB", "0")),
+        decode_responses=True,
+    )
+    await client.ping()
+    results: dict = {"samples": args.samples}
+    try:
+        for size in args.sizes:
+            results[f"pending_{size}"] = {
+                "list_lrem": await _measure(client, "list", size, args.samples),
+                "zset": await _measure(client, "zset", size, args.samples),
+            }
+    finally:
+        await client.aclose()
+    print_report("runner_pending_queue_latency", results)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--samples", type=int, default=200)
+    return asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
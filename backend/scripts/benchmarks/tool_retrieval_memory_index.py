@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Measure in-process Tool RAG retrieval latency.
+
+Builds a synthetic ``tool_embeddings`` snapshot (one matrix per embedding
+model plus the BM25 index) and times what ``search_rrf`` does per query once
+the embeddings exist: vector top-k for every model, BM25 and local RRF
+fusion. Snapshot build time is reported separately because it is paid once
+per reload, not per query.
+
+    python backend/scripts/benchmarks/tool_retrieval_memory_index.py
+    python backend/scripts/benchmarks/tool_retrieval_memory_index.py --tools 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from bench_support import ensure_repo_on_path, print_report, summarize_latencies
+
+ensure_repo_on_path()
+
+from backend.app.services.tool_embedding_memory_index import (  # noqa: E402
+    build_snapshot,
+)
+from backend.app.services.tool_embedding_service_core import (  # noqa: E402
+    fuse_ranked_tool_matches,
+)
+
+# Tool descriptions share a few common verbs and a long tail of domain terms.
+_WORDS = (
+    "publish post schedule calendar read write file image video render clip "
+    "analyze follower report summary search web translate audio caption"
+).split() + [f"term{index}" for index in range(600)]
+
+
+def _rows(tools: int, dim: int, models: int, rng: np.random.Generator) -> list:
+    rows = []
+    for model_index in range(models):
+        vectors = rng.normal(size=(tools, dim)).astype(np.float32)
+        for tool_index, vector in enumerate(vectors):
+            words = rng.choice(_WORDS, size=8)
+            rows.append(
+                (
+                    f"pack{tool_index % 40}.tool_{tool_index}",
+                    " ".join(words[:2]),
+                    " ".join(words),
+                    "capability",
+                    f"pack{tool_index % 40}",
+                    f"model-{model_index}",
+                    "[" + ",".join(f"{value:.6f}" for value in vector) + "]",
+                )
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=1000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--models", type=int, default=2)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--top-k", type=int, default=15)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    rows = _rows(args.tools, args.dim, args.models, rng)
+    started = time.perf_counter()
+    snapshot = build_snapshot(rows)
+    build_ms = (time.perf_counter() - started) * 1000.0
+
+    queries = [
+        (
+            [rng.normal(size=args.dim).tolist() for _ in range(args.models)],
+            " ".join(rng.choice(_WORDS[:20], size=2)),
+        )
+        for _ in range(args.queries)
+    ]
+    samples = []
+    for embeddings, text in queries:
+        started = time.perf_counter()
+        per_model = [
+            snapshot.search_vectors(f"model-{index}", embedding, args.top_k * 2)
+            for index, embedding in enumerate(embeddings)
+        ]
+        bm25 = snapshot.search_bm25(text, args.top_k * 2)
+        fuse_ranked_tool_matches(
+            per_model_results=per_model,
+            bm25_results=bm25,
+            top_k=args.top_k,
+            min_score=0.0,
+            rrf_k=60,
+        )
+        samples.append(time.perf_counter() - started)
+
+    print_report(
+        "tool_retrieval_memory_index",
+        {
+            "corpus": {
+                "tools": args.tools,
+                "dim": args.dim,
+                "models": args.models,
+                "snapshot_build_ms": round(build_ms, 1),
+            },
+            "rrf_query": summarize_latencies(samples),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
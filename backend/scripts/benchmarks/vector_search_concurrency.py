@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Measure p50/p99 vector search latency under concurrent callers.
+
+Compares the legacy inline path (blocking psycopg2 call on the event loop)
+with the pooled path used by ``search_vectors``.
+
+Simulated mode (default) uses a connection whose ``execute`` sleeps for
+``--query-ms`` to model one pgvector scan, so it runs without a database:
+
+    python backend/scripts/benchmarks/vector_search_concurrency.py
+
+Live mode issues real queries through the default vector connection:
+
+    python backend/scripts/benchmarks/vector_search_concurrency.py --live \
+        --table playbook_knowledge --dimension 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Callable, List
+
+from bench_support import ensure_repo_on_path, print_report, summarize_latencies
+
+ensure_repo_on_path()
+
+from backend.app.services.vector_search_db import (  # noqa: E402
+    search_vectors,
+    search_vectors_sync,
+)
+
+
+class _SimulatedCursor:
+    def __init__(self, query_seconds: float):
+        self._query_seconds = query_seconds
+
+    def execute(self, query, params=None):
+        time.sleep(self._query_seconds)
+
+    def fetchall(self):
+        return [{"id": "row-1", "similarity": 0.9}]
+
+    def close(self):
+        pass
+
+
+class _SimulatedConnection:
+    def __init__(self, query_seconds: float):
+        self._query_seconds = query_seconds
+
+    def cursor(self, **kwargs):
+        return _SimulatedCursor(self._query_seconds)
+
+    def close(self):
+        pass
+
+
+def _connection_factory(args) -> Callable[[], Any]:
+    if args.live:
+        from backend.app.database.vector_connection import get_vector_dbapi_connection
+
+        return get_vector_dbapi_connection
+    query_seconds = args.query_ms / 1000.0
+    return lambda: _SimulatedConnection(query_seconds)
+
+
+async def _run_round(args, *, pooled: bool) -> List[float]:
+    get_connection = _connection_factory(args)
+    rng = random.Random(7)
+
+    async def one_search() -> float:
+        embedding = [rng.random() for _ in range(args.dimension)]
+        started = time.perf_counter()
+        kwargs = dict(
+            get_connection=get_connection,
+            table=args.table,
+            query_embedding=embedding,
+            top_k=5,
+            require_model_match=False,
+        )
+        if pooled:
+            await search_vectors(**kwargs)
+        else:
+            search_vectors_sync(**kwargs)
+        return time.perf_counter() - started
+
+    async def timed_search() -> float:
+        # Latency as seen by a caller whose coroutine was scheduled at t0.
+        started = time.perf_counter()
+        await asyncio.sleep(0)
+        await one_search()
+        return time.perf_counter() - started
+
+    latencies: List[float] = []
+    for _ in range(args.rounds):
+        latencies.extend(
+            await asyncio.gather(*(timed_search() for _ in range(args.concurrency)))
+        )
+    return latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--query-ms", type=float, default=20.0)
+    parser.add_argument("--dimension", type=int, default=1024)
+    parser.add_argument("--table", default="playbook_knowledge")
+    parser.add_argument("--live", action="store_true")
+    args = parser.parse_args()
+
+    before = asyncio.run(_run_round(args, pooled=False))
+    after = asyncio.run(_run_round(args, pooled=True))
+    print_report(
+        "vector_search_concurrency",
+        {
+            "mode": "live" if args.live else "simulated",
+            "concurrency": args.concurrency,
+            "before_inline": summarize_latencies(before),
+            "after_pooled": summarize_latencies(after),
+        },
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
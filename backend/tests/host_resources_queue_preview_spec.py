@@ -14,7 +14,7 @@ async def test_route_reservation_candidate_preview_selects_matching_pending_task
         def __init__(self):
             self.projections = {}
 
-        async def lrange(self, key, start, end):
+        async def zrange(self, key, start, end):
             return ["low-task", "high-task"]
 
         async def mget(self, keys):
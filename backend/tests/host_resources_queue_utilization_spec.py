@@ -238,7 +238,7 @@ async def test_live_queue_utilization_uses_bounded_redis_data(monkeypatch):
         "delayed": 1,
         "deadletter": 0,
     }
-    assert queue.client.lrange_calls == [("pending:browser_local", 0, 2)]
+    assert queue.client.zrange_calls == [("pending:browser_local", 0, 2)]
     assert snapshot["visible_lane_count"]["browser_local"] == 2
     assert [
         lane["lane_key"] for lane in snapshot["visible_lanes"]["browser_local"]
@@ -9,12 +9,12 @@ class FakeRedisClient:
         self.projections = {}
         self.llen_values = {}
         self.zcard_values = {}
-        self.lrange_calls = []
+        self.zrange_calls = []
         self.lease_available = True
         self.set_calls = []
 
-    async def lrange(self, key, start, end):
-        self.lrange_calls.append((key, start, end))
+    async def zrange(self, key, start, end):
+        self.zrange_calls.append((key, start, end))
         return self.pending_ids[start : end + 1]
 
     async def mget(self, keys):
@@ -42,7 +42,7 @@ class FakeQueue:
         self.q_delayed = f"delayed:{pack_id}"
         self.q_deadletter = f"deadletter:{pack_id}"
         self.client = FakeRedisClient(pending_ids)
-        self.client.llen_values[self.q_pending] = len(pending_ids)
+        self.client.zcard_values[self.q_pending] = len(pending_ids)
         self.client.llen_values[self.q_deadletter] = 0
         self.client.zcard_values[self.q_processing] = 2
         self.client.zcard_values[self.q_delayed] = 1
@@ -282,10 +282,10 @@ async def test_worker_route_candidate_scan_promotes_permitted_task(monkeypatch):
         def __init__(self):
             self.projections = {}
 
-        async def lrange(self, key, start, end):
+        async def zrange(self, key, start, end):
             return ["low-task", "high-task"]
 
-        async def llen(self, key):
+        async def zcard(self, key):
             return 2
 
         async def mget(self, keys):
@@ -0,0 +1,225 @@
+"""Hierarchical graph communities stay nested, deterministic and incremental."""
+
+from __future__ import annotations
+
+import time
+
+from backend.app.services.knowledge_graph import community as community_module
+from backend.app.services.knowledge_graph.community import (
+    build_visibility_partitioned_communities,
+    update_visibility_partitioned_communities,
+)
+from backend.app.services.knowledge_graph.community_engine import (
+    VisibilityPartitionCommunityEngine,
+    build_csr,
+    louvain_levels,
+)
+from backend.app.services.knowledge_graph.contracts import (
+    GraphEntityWrite,
+    GraphRelationWrite,
+)
+
+
+PARTITION = "a" * 64
+
+
+def _entity(key: str) -> GraphEntityWrite:
+    return GraphEntityWrite(key, "concept", "exact.v1")
+
+
+def _relation(source: str, target: str, confidence: float = 1.0):
+    return GraphRelationWrite(
+        relation_key=f"{source}->{target}",
+        source_entity_key=source,
+        target_entity_key=target,
+        relation_kind="related_to",
+        origin="extracted",
+        confidence=confidence,
+        supporting_evidence_unit_keys=("unit-1",),
+        supporting_citations=({"anchor": "unit-1"},),
+        extractor_revision="extractor.v1",
+    )
+
+
+def _clique(prefix: str, size: int) -> list[GraphRelationWrite]:
+    keys = [f"{prefix}{index}" for index in range(size)]
+    return [
+        _relation(source, target)
+        for offset, source in enumerate(keys)
+        for target in keys[offset + 1 :]
+    ]
+
+
+def _two_cliques_and_isolated():
+    relations = _clique("a", 5) + _clique("b", 5) + [_relation("a0", "b0", 0.1)]
+    entities = [_entity(key) for key in ("a0", "b0", "solo")]
+    return entities, relations
+
+
+def test_bridged_cliques_split_below_their_component() -> None:
+    entities, relations = _two_cliques_and_isolated()
+
+    communities = build_visibility_partitioned_communities(
+        entities=entities,
+        relations=relations,
+        visibility_partition_hash=PARTITION,
+    )
+
+    by_level = {}
+    for community in communities:
+        by_level.setdefault(community.level, []).append(community)
+    roots = by_level[0]
+    assert [root.entity_keys for root in roots] == [
+        tuple(sorted(f"{prefix}{index}" for prefix in "ab" for index in range(5))),
+        ("solo",),
+    ]
+    assert roots[0].parent_community_key is None
+    children = by_level[1]
+    assert sorted(child.entity_keys for child in children) == [
+        tuple(f"a{index}" for index in range(5)),
+        tuple(f"b{index}" for index in range(5)),
+    ]
+    assert {child.parent_community_key for child in children} == {
+        roots[0].community_key
+    }
+    assert all("a0->b0" not in child.relation_keys for child in children)
+    assert len(children[0].relation_keys) == 10
+    assert "a0->b0" in roots[0].relation_keys
+    seen = set()
+    for community in communities:
+        assert (
+            community.parent_community_key is None
+            or community.parent_community_key in seen
+        )
+        seen.add(community.community_key)
+
+
+def test_output_is_deterministic_for_any_input_order() -> None:
+    entities, relations = _two_cliques_and_isolated()
+
+    forward = build_visibility_partitioned_communities(
+        entities=entities,
+        relations=relations,
+        visibility_partition_hash=PARTITION,
+    )
+    backward = build_visibility_partitioned_communities(
+        entities=list(reversed(entities)),
+        relations=list(reversed(relations)),
+        visibility_partition_hash=PARTITION,
+    )
+    other_partition = build_visibility_partitioned_communities(
+        entities=entities,
+        relations=relations,
+        visibility_partition_hash="b" * 64,
+    )
+
+    assert forward == backward
+    assert {item.community_key for item in forward}.isdisjoint(
+        item.community_key for item in other_partition
+    )
+
+
+def test_incremental_updates_match_a_full_rebuild_and_reuse_clean_components() -> None:
+    entities, relations = _two_cliques_and_isolated()
+    engine = VisibilityPartitionCommunityEngine(
+        visibility_partition_hash=PARTITION,
+        entities=entities,
+        relations=relations,
+    )
+    untouched = next(
+        community
+        for community in engine.communities()
+        if community.entity_keys == ("solo",)
+    )
+
+    updated = engine.apply_delta(
+        added_entities=[_entity("c0")],
+        added_relations=[_relation("a1", "c0")],
+        removed_entity_keys=["b4"],
+        removed_relation_keys=["a0->b0"],
+    )
+
+    remaining = [
+        relation
+        for relation in relations
+        if relation.relation_key != "a0->b0" and "b4" not in relation.relation_key
+    ] + [_relation("a1", "c0")]
+    rebuilt = build_visibility_partitioned_communities(
+        entities=[entity for entity in entities if entity.canonical_key != "b4"]
+        + [_entity("c0")],
+        relations=remaining,
+        visibility_partition_hash=PARTITION,
+    )
+    assert updated == rebuilt
+    assert untouched in updated
+    assert all("b4" not in community.entity_keys for community in updated)
+
+
+def test_ring_of_cliques_builds_a_bounded_multi_level_hierarchy() -> None:
+    relations = []
+    for group in range(400):
+        relations.extend(_clique(f"g{group}-", 5))
+        relations.append(_relation(f"g{group}-0", f"g{(group + 1) % 400}-1"))
+
+    started = time.perf_counter()
+    communities = build_visibility_partitioned_communities(
+        entities=(),
+        relations=relations,
+        visibility_partition_hash=PARTITION,
+    )
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 10
+    assert communities[0].level == 0 and len(communities[0].entity_keys) == 2000
+    assert max(community.level for community in communities) >= 2
+    finest = [
+        community
+        for community in communities
+        if community.level == max(item.level for item in communities)
+    ]
+    assert all(len(community.entity_keys) >= 2 for community in finest)
+
+
+def test_csr_merges_parallel_edges_and_keeps_loops_apart() -> None:
+    graph = build_csr(3, [(0, 1, 1.0), (1, 0, 0.5), (2, 2, 2.0)])
+
+    assert list(graph.indptr) == [0, 1, 2, 2]
+    assert list(graph.indices) == [1, 0]
+    assert list(graph.weights) == [1.5, 1.5]
+    assert graph.degrees() == [1.5, 1.5, 4.0]
+    assert louvain_levels(build_csr(2, [])) == []
+
+
+def test_persistent_engine_recompiles_match_a_full_rebuild() -> None:
+    entities, relations = _two_cliques_and_isolated()
+    first = update_visibility_partitioned_communities(
+        graph_key="spec:persistent",
+        entities=entities,
+        relations=relations,
+        visibility_partition_hash=PARTITION,
+    )
+    assert first == build_visibility_partitioned_communities(
+        entities=entities,
+        relations=relations,
+        visibility_partition_hash=PARTITION,
+    )
+    engine = community_module._engines["spec:persistent"]
+
+    changed_entities = [entity for entity in entities if entity.canonical_key != "solo"]
+    changed_relations = [
+        relation for relation in relations if relation.relation_key != "a0->b0"
+    ] + [_relation("b1", "c0", 0.5)]
+    second = update_visibility_partitioned_communities(
+        graph_key="spec:persistent",
+        entities=changed_entities,
+        relations=changed_relations,
+        visibility_partition_hash=PARTITION,
+    )
+
+    assert second == build_visibility_partitioned_communities(
+        entities=changed_entities,
+        relations=changed_relations,
+        visibility_partition_hash=PARTITION,
+    )
+    assert community_module._engines["spec:persistent"] is engine
+    assert all("solo" not in item.entity_keys for item in second)
@@ -0,0 +1,163 @@
+"""Graph seed search must stay index-driven as the corpus grows."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+
+import psycopg2
+import pytest
+
+from backend.app.services.knowledge_authorization import (
+    PrincipalRef,
+    RetrievalAccessContext,
+)
+from backend.app.services.knowledge_graph.query_store_common import (
+    common_parameters,
+)
+from backend.app.services.knowledge_graph.query_store_neighborhood import (
+    GRAPH_SEED_SQL,
+    search_document_sql,
+)
+from backend.app.services.knowledge_retrieval.keyword_query import (
+    cjk_prefix_tsquery,
+)
+from backend.app.services.knowledge_retrieval.store import (
+    AuthorizationAwareKnowledgeRetrievalStore,
+)
+
+
+TEST_VECTOR_URL = os.getenv("TEST_VECTOR_DATABASE_URL")
+requires_vector_db = pytest.mark.skipif(
+    not TEST_VECTOR_URL,
+    reason="TEST_VECTOR_DATABASE_URL is required",
+)
+MIGRATION_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "alembic_migrations/vector/versions"
+    / "20261016100000_knowledge_graph_seed_search_indexes.py"
+)
+
+
+def _migration():
+    spec = importlib.util.spec_from_file_location("seed_search_migration", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _seed_parameters(query: str) -> tuple:
+    context = RetrievalAccessContext.create(
+        subject_user_id="seed-index-spec",
+        tenant_id="local",
+        principals=(PrincipalRef("user", "seed-index-spec"),),
+    )
+    cjk_prefix_query = cjk_prefix_tsquery(query)
+    return (
+        *common_parameters(
+            context=context,
+            scope_type="workspace",
+            scope_id="workspace-seed-index-spec",
+            source_apps=(),
+            source_ids=(),
+            owner_capabilities=(),
+            modality_filter=None,
+        ),
+        cjk_prefix_query,
+        query,
+        query,
+        cjk_prefix_query,
+        f"%{query}%",
+        f"%{query}%",
+        None,
+        None,
+        20,
+    ), context
+
+
+def test_seed_predicates_match_the_indexed_expressions() -> None:
+    migration = _migration()
+    seed_mentions = GRAPH_SEED_SQL.split(", seed_mentions AS (", 1)[1]
+    candidate_sql, final_sql = seed_mentions.split("\n)\nSELECT", 1)
+
+    for column in (
+        "entity.canonical_key",
+        "mention.surface_text",
+        "record.search_text",
+    ):
+        assert search_document_sql(column) == migration.search_document_sql(column)
+        assert f"{search_document_sql(column)} @@" in candidate_sql
+    assert "search_vector" not in GRAPH_SEED_SQL
+    assert "ILIKE" not in final_sql
+    assert "to_tsvector" not in final_sql
+
+
+def test_migration_only_builds_indexes_concurrently() -> None:
+    source = MIGRATION_PATH.read_text(encoding="utf-8")
+
+    assert "ALTER TABLE" not in source
+    assert "GENERATED ALWAYS" not in source
+
+
+def test_migration_indexes_every_seed_predicate() -> None:
+    migration = _migration()
+    indexes = dict(migration.INDEXES)
+
+    assert migration.down_revision == "20261016010000"
+    assert {table for table, _ in migration.SEARCH_DOCUMENT_COLUMNS} == {
+        "knowledge_graph_entities",
+        "knowledge_graph_mentions",
+        "knowledge_projection_records",
+    }
+    for table, column in migration.SEARCH_DOCUMENT_COLUMNS:
+        assert indexes[f"idx_{table}_search_document"] == (
+            f"ON {table} USING gin (({migration.search_document_sql(column)}))"
+        )
+    assert "canonical_key gin_trgm_ops" in (
+        indexes["idx_knowledge_graph_entities_canonical_key_trgm"]
+    )
+    assert "surface_text gin_trgm_ops" in (
+        indexes["idx_knowledge_graph_mentions_surface_text_trgm"]
+    )
+    assert migration.BIGRAM_FUNCTION in indexes["idx_external_docs_cjk_bigram_simple"]
+
+
+@requires_vector_db
+def test_cjk_bigram_text_matches_query_side_bigrams() -> None:
+    with psycopg2.connect(TEST_VECTOR_URL) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT public.knowledge_cjk_bigram_text(%s)",
+                ("HRV 瑜伽包含呼吸",),
+            )
+            document_terms = set(cursor.fetchone()[0].split())
+    query_terms = {
+        term.removesuffix(":*") for term in cjk_prefix_tsquery("瑜伽包含呼吸").split(" | ")
+    }
+    assert document_terms == query_terms
+
+
+@requires_vector_db
+def test_seed_query_plan_uses_search_indexes() -> None:
+    parameters, context = _seed_parameters("alpha 瑜伽包含")
+    with psycopg2.connect(TEST_VECTOR_URL) as connection:
+        with connection.cursor() as cursor:
+            AuthorizationAwareKnowledgeRetrievalStore._set_local_context(
+                cursor, context
+            )
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("EXPLAIN (COSTS OFF) " + GRAPH_SEED_SQL, parameters)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        connection.rollback()
+
+    for index_name in (
+        "idx_knowledge_graph_entities_search_document",
+        "idx_knowledge_graph_entities_canonical_key_trgm",
+        "idx_knowledge_graph_mentions_search_document",
+        "idx_knowledge_graph_mentions_surface_text_trgm",
+        "idx_knowledge_projection_records_search_document",
+        "idx_external_docs_lexical_simple",
+        "idx_external_docs_cjk_bigram_simple",
+    ):
+        assert index_name in plan
@@ -0,0 +1,245 @@
+"""Scheduling, memoization and persistence tests for CompositionGraphRunner."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from backend.app.models.object_runtime import (
+    CompositionGraphEdge,
+    CompositionGraphNode,
+    CompositionGraphNodeProviderNode,
+    CompositionGraphRun,
+    CompositionGraphRunNodeState,
+)
+from backend.app.services.object_runtime.composition_graph_node_registry import (
+    build_provider_node_map,
+    load_installed_composition_graph_node_providers,
+)
+from backend.app.services.object_runtime.composition_graph_output_cache import (
+    CompositionGraphNodeOutputCache,
+)
+from backend.app.services.object_runtime.composition_graph_run_store import utc_iso
+from backend.app.services.object_runtime.composition_graph_runner import (
+    CompositionGraphRunner,
+)
+from backend.tests.object_runtime.composition_graph_service_test_support import (
+    write_node_manifest,
+)
+
+_MODULE = "cg_runner_spec_nodes"
+
+
+class RecordingRunStore:
+    def __init__(self):
+        self.updates = []
+
+    def update_run(self, run):
+        updated = run.model_copy(update={"updated_at": utc_iso()})
+        self.updates.append(updated.status)
+        return updated
+
+
+@pytest.fixture
+def node_module(monkeypatch):
+    module = types.ModuleType(_MODULE)
+    module.events = []
+    module.calls = []
+
+    async def run_node(**kwargs):
+        node_id = kwargs["node_id"]
+        payload = kwargs["payload"]
+        module.calls.append(node_id)
+        module.events.append(("start", node_id))
+        await asyncio.sleep(payload.get("delay", 0))
+        module.events.append(("end", node_id))
+        joined = "+".join(str(value) for value in kwargs["input_values"].values())
+        return {"status": "succeeded", "outputs": {"out": f"{payload['tag']}({joined})"}}
+
+    module.run_node = run_node
+    monkeypatch.setitem(sys.modules, _MODULE, module)
+    return module
+
+
+def _provider():
+    return CompositionGraphNodeProviderNode(
+        id="step",
+        label="Step",
+        executor={"backend": f"{_MODULE}:run_node"},
+    )
+
+
+def _edge(source, target):
+    return CompositionGraphEdge(
+        id=f"{source}->{target}",
+        source=source,
+        source_port="out",
+        target=target,
+        target_port=f"in_{source}",
+    )
+
+
+def _run(payloads, edges):
+    nodes = [
+        CompositionGraphNode(id=node_id, type="step", payload=payload)
+        for node_id, payload in payloads.items()
+    ]
+    now = utc_iso()
+    return CompositionGraphRun(
+        id="cg_run_spec",
+        graph_id="graph",
+        workspace_id="ws",
+        nodes=nodes,
+        edges=edges,
+        node_states={
+            node.id: CompositionGraphRunNodeState(node_id=node.id, node_type=node.type)
+            for node in nodes
+        },
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _cacheable_provider():
+    return _provider().model_copy(update={"metadata": {"cacheable": True}})
+
+
+def _runner(store, cache, provider=None):
+    return CompositionGraphRunner(
+        run_store=store,
+        provider_nodes={"step": provider or _provider()},
+        output_cache=cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_successor_starts_when_its_own_inputs_finish(node_module):
+    run = _run(
+        {
+            "slow": {"tag": "slow", "delay": 0.2},
+            "fast": {"tag": "fast", "delay": 0.01},
+            "after_fast": {"tag": "after_fast"},
+            "after_slow": {"tag": "after_slow"},
+        },
+        [_edge("fast", "after_fast"), _edge("slow", "after_slow")],
+    )
+
+    result = await _runner(RecordingRunStore(), CompositionGraphNodeOutputCache()).run(run)
+
+    assert result.status == "succeeded"
+    events = node_module.events
+    assert events.index(("start", "after_fast")) < events.index(("end", "slow"))
+    assert result.outputs["after_slow"] == {"out": "after_slow(slow())"}
+
+
+@pytest.mark.asyncio
+async def test_rerun_replays_unchanged_subgraph_from_output_cache(node_module):
+    cache = CompositionGraphNodeOutputCache()
+    payloads = {
+        "source": {"tag": "source"},
+        "left": {"tag": "left"},
+        "right": {"tag": "right"},
+        "sink": {"tag": "sink"},
+    }
+    edges = [
+        _edge("source", "left"),
+        _edge("source", "right"),
+        _edge("left", "sink"),
+        _edge("right", "sink"),
+    ]
+
+    provider = _cacheable_provider()
+
+    first = await _runner(RecordingRunStore(), cache, provider).run(
+        _run(payloads, edges)
+    )
+    assert sorted(node_module.calls) == ["left", "right", "sink", "source"]
+
+    node_module.calls.clear()
+    second = await _runner(RecordingRunStore(), cache, provider).run(
+        _run(payloads, edges)
+    )
+    assert node_module.calls == []
+    assert second.outputs == first.outputs
+    assert second.node_states["sink"].metadata["output_cache"] == "hit"
+
+    node_module.calls.clear()
+    changed = {**payloads, "right": {"tag": "right-v2"}}
+    third = await _runner(RecordingRunStore(), cache, provider).run(
+        _run(changed, edges)
+    )
+    assert sorted(node_module.calls) == ["right", "sink"]
+    assert third.outputs["sink"] == {"out": "sink(left(source())+right-v2(source()))"}
+
+
+@pytest.mark.asyncio
+async def test_manifest_declared_cacheable_provider_hits_on_rerun(
+    node_module, monkeypatch, tmp_path
+):
+    monkeypatch.setitem(sys.modules, "capabilities.pure_demo.nodes", node_module)
+    write_node_manifest(
+        tmp_path,
+        "pure_demo",
+        {
+            "enabled": True,
+            "nodes": [
+                {
+                    "id": "step",
+                    "label": "Step",
+                    "executor": {"backend": "capabilities.pure_demo.nodes:run_node"},
+                    "metadata": {"cacheable": True},
+                }
+            ],
+        },
+    )
+    providers, diagnostics = load_installed_composition_graph_node_providers(
+        local_core_root=tmp_path
+    )
+    provider_nodes = build_provider_node_map(providers)
+    cache = CompositionGraphNodeOutputCache()
+
+    results = []
+    for _ in range(2):
+        runner = CompositionGraphRunner(
+            run_store=RecordingRunStore(),
+            provider_nodes=provider_nodes,
+            output_cache=cache,
+        )
+        results.append(await runner.run(_run({"only": {"tag": "only"}}, [])))
+
+    assert diagnostics == []
+    assert node_module.calls == ["only"]
+    assert cache.hits == 1
+    assert results[1].node_states["only"].metadata["output_cache"] == "hit"
+    assert results[1].outputs == results[0].outputs
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("metadata", [{}, {"cacheable": False}])
+async def test_providers_without_cacheable_opt_in_always_execute(node_module, metadata):
+    cache = CompositionGraphNodeOutputCache()
+    provider = _provider().model_copy(update={"metadata": metadata})
+    for _ in range(2):
+        await _runner(RecordingRunStore(), cache, provider).run(
+            _run({"only": {"tag": "only"}}, [])
+        )
+
+    assert node_module.calls == ["only", "only"]
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_node_state_changes_are_persisted_once_per_tick(node_module):
+    store = RecordingRunStore()
+    payloads = {f"n{index}": {"tag": f"n{index}"} for index in range(6)}
+
+    result = await _runner(store, CompositionGraphNodeOutputCache()).run(
+        _run(payloads, [])
+    )
+
+    assert result.status == "succeeded"
+    # Six nodes make twelve running/succeeded transitions; they share ticks.
+    assert len(store.updates) < 12
+    assert store.updates[0] == "running"
+    assert store.updates[-1] == "succeeded"
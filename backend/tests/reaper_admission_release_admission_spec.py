@@ -41,6 +41,7 @@ async def test_releases_due_deferred_task_when_capacity_available(monkeypatch):
     assert released == 1
     assert store.release_candidate_calls == 1
     assert queue._client.enqueued == ["task-1"]
+    assert queue._client.published == [(queue.q_wakeup, "task-1")]
     assert store.updated[0][0] == "task-1"
     assert store.updated[0][1]["blocked_reason"] is None
     assert store.updated[0][1]["frontier_state"] == "ready"
@@ -76,6 +77,7 @@ async def test_reextends_deferred_task_when_capacity_still_exceeded(monkeypatch)
 
     assert released == 0
     assert queue._client.enqueued == []
+    assert queue._client.published == []
     assert store.updated[0][1]["blocked_reason"] == ADMISSION_DEFERRED_REASON
     assert store.updated[0][1]["frontier_state"] == "cold"
     assert store.updated[0][1]["next_eligible_at"] == next_eligible_at
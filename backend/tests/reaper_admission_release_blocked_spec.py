@@ -77,7 +77,7 @@ async def test_releases_due_concurrency_locked_task_to_ready_queue():
     assert released == 1
     assert store.concurrency_locked_calls == 1
     assert queue._client.enqueued == ["task-locked"]
-    assert queue._client.operations == [("rpush", "task-locked")]
+    assert queue._client.operations == [("zadd", "task-locked")]
     assert store.updated[0][0] == "task-locked"
     update = store.updated[0][1]
     assert update["blocked_reason"] is None
@@ -206,7 +206,7 @@ async def test_releases_due_dependency_hold_task_to_ready_queue():
     assert released == 1
     assert store.dependency_hold_calls == 1
     assert queue._client.enqueued == ["task-dependency"]
-    assert queue._client.operations == [("rpush", "task-dependency")]
+    assert queue._client.operations == [("zadd", "task-dependency")]
     update = store.updated[0][1]
     assert update["blocked_reason"] is None
     assert update["blocked_payload"] is None
@@ -250,7 +250,7 @@ async def test_releases_due_resource_wait_task_to_ready_queue():
     assert released == 1
     assert store.resource_wait_calls == 1
     assert queue._client.enqueued == ["task-resource"]
-    assert queue._client.operations == [("rpush", "task-resource")]
+    assert queue._client.operations == [("zadd", "task-resource")]
     update = store.updated[0][1]
     assert update["blocked_reason"] is None
     assert update["blocked_payload"] is None
@@ -269,7 +269,7 @@ async def test_resource_wait_uses_atomic_store_transition_before_enqueue():
             self.transitioned = transitioned
             self.transition_calls = []
 
-        def try_release_resource_wait_task(self, task_id, *, released_at):
+        def try_release_resource_wait_task(self, task_id, *, released_at, workspace_id=None):
             self.transition_calls.append((task_id, released_at))
             return self.transitioned
 
@@ -291,7 +291,7 @@ async def test_resource_wait_uses_atomic_store_transition_before_enqueue():
 @pytest.mark.asyncio
 async def test_resource_wait_atomic_transition_race_does_not_enqueue():
     class _RacedStore(_FakeTasksStore):
-        def try_release_resource_wait_task(self, task_id, *, released_at):
+        def try_release_resource_wait_task(self, task_id, *, released_at, workspace_id=None):
             return False
 
     store = _RacedStore([_build_resource_wait_task()])
@@ -12,24 +12,31 @@ class _FakePipeline:
         self.client = client
         self._pending: list[str] = []
         self._ops: list[tuple[str, str]] = []
+        self._published: list[tuple[str, str]] = []
 
     def lpush(self, _queue_name, task_id):
         self._pending.append(task_id)
         self._ops.append(("lpush", task_id))
 
-    def rpush(self, _queue_name, task_id):
-        self._pending.append(task_id)
-        self._ops.append(("rpush", task_id))
+    def zadd(self, _queue_name, mapping):
+        for task_id in mapping:
+            self._pending.append(task_id)
+            self._ops.append(("zadd", task_id))
+
+    def publish(self, channel, task_id):
+        self._published.append((channel, task_id))
 
     async def execute(self):
         self.client.enqueued.extend(self._pending)
         self.client.operations.extend(self._ops)
+        self.client.published.extend(self._published)
 
 
 class _FakeRedisClient:
     def __init__(self):
         self.enqueued: list[str] = []
         self.operations: list[tuple[str, str]] = []
+        self.published: list[tuple[str, str]] = []
         self.pending_members: list[str] = []
         self.processing_members: list[str] = []
         self.delayed_members: list[str] = []
@@ -41,6 +48,8 @@ class _FakeRedisClient:
         return list(self.pending_members)
 
     async def zrange(self, queue_name, _start, _end):
+        if "pending" in queue_name:
+            return list(self.pending_members)
         if "processing" in queue_name:
             return list(self.processing_members)
         if "delayed" in queue_name:
@@ -58,6 +67,7 @@ class _FakeRedisQueue:
         self.q_temp = f"{pack_id}:temp"
         self.q_processing = f"{pack_id}:processing"
         self.q_delayed = f"{pack_id}:delayed"
+        self.q_wakeup = f"{pack_id}:wakeup"
         self._client = _FakeRedisClient()
 
     async def _get_client(self):
@@ -0,0 +1,151 @@
+from datetime import timedelta
+
+from sqlalchemy import text
+
+from backend.app.models.workspace import TaskStatus
+from backend.app.services.stores.tasks_store import _runner_batch_claims, _runner_claims
+from backend.app.services.stores.tasks_store._task_row_projection import (
+    TasksStoreRowProjectionMixin,
+)
+from backend.tests.runner.try_claim_task_concurrency_guard_support import (
+    _SqliteClaimStore,
+    _following_ctx,
+    _utc_now,
+)
+
+
+class _BatchClaimStore(_SqliteClaimStore, TasksStoreRowProjectionMixin):
+    def __init__(self) -> None:
+        super().__init__()
+        with self._engine.begin() as conn:
+            conn.execute(text("ALTER TABLE tasks ADD COLUMN result TEXT"))
+
+    def insert_ready(self, task_id: str, **kwargs) -> None:
+        kwargs.setdefault("status", TaskStatus.PENDING.value)
+        kwargs.setdefault("pack_id", "ig_analyze_following")
+        kwargs.setdefault("task_type", "playbook_execution")
+        kwargs.setdefault("execution_context", _following_ctx(f"/profiles/{task_id}"))
+        kwargs.setdefault("concurrency_key", None)
+        kwargs.setdefault("created_at", _utc_now() - timedelta(minutes=1))
+        self.insert_task(task_id=task_id, **kwargs)
+
+
+def _claim(store, **kwargs):
+    kwargs.setdefault("queue_shards", ["browser_local"])
+    kwargs.setdefault("limit", 4)
+    return store.claim_ready_tasks("runner-a", **kwargs)
+
+
+def test_claim_ready_tasks_claims_up_to_limit_in_eligibility_order():
+    store = _BatchClaimStore()
+    base = _utc_now() - timedelta(minutes=10)
+    for index in range(5):
+        store.insert_ready(
+            f"task-{index}",
+            created_at=base + timedelta(seconds=index),
+        )
+    allocation = store.insert_allocation(
+        max_parallel_task_claims=10,
+        selectors=["ig_analyze_following"],
+    )
+    assert allocation["state"] == "enabled"
+
+    claimed = _claim(store, limit=3)
+
+    assert [task.id for task in claimed] == ["task-0", "task-1", "task-2"]
+    assert all(task.status == TaskStatus.RUNNING for task in claimed)
+    assert all(task.runner_id == "runner-a" for task in claimed)
+    assert claimed[0].execution_context["runner_id"] == "runner-a"
+    assert store.fetch_status("task-3") == TaskStatus.PENDING.value
+    assert store.fetch_frontier("task-0") == "running"
+
+
+def test_claim_ready_tasks_skips_held_and_in_batch_concurrency_keys():
+    store = _BatchClaimStore()
+    store.insert_allocation(max_parallel_task_claims=10, selectors=["ig_analyze_following"])
+    store.insert_task(
+        task_id="running-1",
+        status=TaskStatus.RUNNING.value,
+        pack_id="ig_analyze_following",
+        task_type="playbook_execution",
+        execution_context=_following_ctx("/profiles/a"),
+        concurrency_key="profile:a",
+    )
+    base = _utc_now() - timedelta(minutes=5)
+    store.insert_ready("pending-a", concurrency_key="profile:a", created_at=base)
+    store.insert_ready(
+        "pending-b1",
+        concurrency_key="profile:b",
+        created_at=base + timedelta(seconds=1),
+    )
+    store.insert_ready(
+        "pending-b2",
+        concurrency_key="profile:b",
+        created_at=base + timedelta(seconds=2),
+    )
+
+    claimed = _claim(store)
+
+    assert [task.id for task in claimed] == ["pending-b1"]
+    assert store.fetch_status("pending-a") == TaskStatus.PENDING.value
+    assert store.fetch_status("pending-b2") == TaskStatus.PENDING.value
+
+
+def test_claim_ready_tasks_honours_workspace_quota_and_missing_allocations():
+    store = _BatchClaimStore()
+    store.insert_allocation(max_parallel_task_claims=2, selectors=["ig_analyze_following"])
+    store.insert_task(
+        task_id="running-1",
+        status=TaskStatus.RUNNING.value,
+        pack_id="ig_analyze_following",
+        task_type="playbook_execution",
+        execution_context=_following_ctx("/profiles/running"),
+        concurrency_key=None,
+    )
+    base = _utc_now() - timedelta(minutes=5)
+    for index in range(3):
+        store.insert_ready(f"quota-{index}", created_at=base + timedelta(seconds=index))
+    store.insert_ready("other-workspace", workspace_id="ws-2", created_at=base)
+
+    claimed = _claim(store)
+
+    assert [task.id for task in claimed] == ["quota-0"]
+    assert store.fetch_status("other-workspace") == TaskStatus.PENDING.value
+
+
+def test_claim_ready_tasks_ignores_unrunnable_and_filtered_tasks():
+    store = _BatchClaimStore()
+    store.insert_allocation(max_parallel_task_claims=10, selectors=["ig_analyze_following"])
+    store.insert_ready("blocked", blocked_reason="dependency_hold")
+    store.insert_ready("cold", frontier_state="cold")
+    store.insert_ready("future", next_eligible_at=_utc_now() + timedelta(minutes=5))
+    store.insert_ready("other-shard", queue_shard="vision_local")
+    store.insert_ready("filtered")
+    store.insert_ready("ready")
+
+    claimed = _claim(store, task_filter=lambda task: task.id != "filtered")
+
+    assert [task.id for task in claimed] == ["ready"]
+
+
+def test_claims_record_graph_changes_for_claimed_tasks_only(monkeypatch):
+    changes = []
+    for module in (_runner_batch_claims, _runner_claims):
+        monkeypatch.setattr(
+            module, "record_graph_change", lambda *args: changes.append(args)
+        )
+    store = _BatchClaimStore()
+    store.insert_allocation(max_parallel_task_claims=10, selectors=["ig_analyze_following"])
+    base = _utc_now() - timedelta(minutes=5)
+    for index in range(3):
+        store.insert_ready(f"task-{index}", created_at=base + timedelta(seconds=index))
+
+    assert [task.id for task in _claim(store, limit=2)] == ["task-0", "task-1"]
+    assert store.try_claim_task("task-2", runner_id="runner-b")
+    assert not store.try_claim_task("task-2", runner_id="runner-c")
+
+    assert changes == [
+        ("ws-1", "task", "task-0"),
+        ("ws-1", "task", "task-1"),
+        ("ws-1", "task", "task-2"),
+    ]
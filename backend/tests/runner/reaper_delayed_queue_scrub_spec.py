@@ -21,14 +21,14 @@ class _FakeRedisClient:
         self.zremoved.append((queue_name, task_id))
         return 1
 
-    async def llen(self, _queue_name):
+    async def zcard(self, _queue_name):
         return 0
 
 
 class _FakeRedisQueue:
     def __init__(self, client):
         self.pack_id = "vision_local"
-        self.q_pending = "mindscape:queue:pending:vision_local"
+        self.q_pending = "mindscape:queue:ready:vision_local"
         self.q_processing = "mindscape:queue:processing:vision_local"
         self.q_delayed = "mindscape:queue:delayed:vision_local"
         self.q_temp = "mindscape:queue:temp:vision_local"
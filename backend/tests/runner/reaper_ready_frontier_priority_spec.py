@@ -20,27 +20,27 @@ class _FakeRedisClient:
         return []
 
     async def lrange(self, queue_name, _start, _end):
-        if "pending" in queue_name:
-            return list(self.pending_members)
         if "temp" in queue_name:
             return list(self.temp_members)
         return []
 
     async def zrange(self, queue_name, _start, _end):
+        if "ready" in queue_name:
+            return list(self.pending_members)
         if "processing" in queue_name:
             return list(self.processing_members)
         if "delayed" in queue_name:
             return list(self.delayed_members)
         return []
 
-    async def llen(self, _queue_name):
+    async def zcard(self, _queue_name):
         return len(self.pending_members)
 
 
 class _FakeRedisQueue:
     def __init__(self, client, pack_id="vision_local"):
         self.pack_id = pack_id
-        self.q_pending = f"mindscape:queue:pending:{pack_id}"
+        self.q_pending = f"mindscape:queue:ready:{pack_id}"
         self.q_temp = f"mindscape:queue:temp:{pack_id}"
         self.q_processing = f"mindscape:queue:processing:{pack_id}"
         self.q_delayed = f"mindscape:queue:delayed:{pack_id}"
@@ -52,7 +52,7 @@ class _FakeRedisQueue:
 
     async def enqueue_task(self, task_id, route_identity=None):
         self.enqueued.append((task_id, route_identity or {}))
-        self._client.pending_members.insert(0, task_id)
+        self._client.pending_members.append(task_id)
         return True
 
     def _utc_now_timestamp(self):
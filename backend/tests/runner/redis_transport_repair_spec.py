@@ -21,8 +21,8 @@ class _FakePipeline:
     def zrem(self, *args):
         self.calls.append(("zrem", args))
 
-    def lpush(self, *args):
-        self.calls.append(("lpush", args))
+    def zadd(self, *args):
+        self.calls.append(("zadd", args))
 
     async def execute(self):
         return [1] * len(self.calls)
@@ -58,11 +58,15 @@ async def test_reconcile_transport_membership_removes_all_transport_lists_and_re
     )
 
     calls = client.pipeline_instance.calls
-    assert ("lrem", (queue.q_pending, 0, "task-1")) in calls
+    assert ("zrem", (queue.q_pending, "task-1")) in calls
     assert ("lrem", (queue.q_temp, 0, "task-1")) in calls
     assert ("zrem", (queue.q_processing, "task-1")) in calls
     assert ("zrem", (queue.q_delayed, "task-1")) in calls
-    assert ("lpush", (queue.q_pending, "task-1")) in calls
+    assert [
+        args[0]
+        for name, args in calls
+        if name == "zadd" and "task-1" in args[1]
+    ] == [queue.q_pending]
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,221 @@
+import asyncio
+
+import pytest
+
+from backend.app.runner.worker_transport import _dequeue_from_ready_queues
+from backend.app.runner.worker_wakeup import (
+    RunnerQueueWakeup,
+    _wait_for_inflight_slot,
+    runner_queue_wakeup,
+)
+from backend.app.services.stores.redis.runner_queue_store import RedisRunnerQueueStore
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def setex(self, *args):
+        self.calls.append(("setex", args))
+
+    def zadd(self, key, mapping, nx=False):
+        self.calls.append(("zadd", (key, mapping)))
+
+    def publish(self, channel, message):
+        self.calls.append(("publish", (channel, message)))
+
+    async def execute(self):
+        for name, args in self.calls:
+            if name == "zadd":
+                self.client.lists.setdefault(args[0], []).extend(args[1])
+            elif name == "publish":
+                await self.client.publish(*args)
+        return [1] * len(self.calls)
+
+
+class _FakePubSub:
+    def __init__(self, client):
+        self.client = client
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.channels: set[str] = set()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+        self.client.subscribers.append(self)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def close(self):
+        pass
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.lists: dict[str, list[str]] = {}
+        self.subscribers: list[_FakePubSub] = []
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def pubsub(self):
+        return _FakePubSub(self)
+
+    async def publish(self, channel, message):
+        for subscriber in self.subscribers:
+            if channel in subscriber.channels:
+                await subscriber.messages.put(
+                    {"type": "message", "channel": channel, "data": message}
+                )
+        return len(self.subscribers)
+
+
+class _NowaitQueue(RedisRunnerQueueStore):
+    def __init__(self, pack_id, client):
+        super().__init__(pack_id=pack_id)
+        self.client = client
+
+    async def _get_client(self):
+        return self.client
+
+    async def dequeue_task_nowait(self, visibility_timeout_sec=180):
+        pending = self.client.lists.get(self.q_pending) or []
+        return pending.pop(0) if pending else None
+
+    async def dequeue_task_blocking(self, timeout=2, visibility_timeout_sec=180):
+        raise AssertionError("wakeup path must not block on a single partition")
+
+
+async def _started_wakeup(client, queues):
+    async def _client_factory():
+        return client
+
+    wakeup = RunnerQueueWakeup(queues, client_factory=_client_factory)
+    wakeup.start()
+    for _ in range(50):
+        if wakeup.active:
+            break
+        await asyncio.sleep(0.01)
+    assert wakeup.active
+    return wakeup
+
+
+@pytest.mark.asyncio
+async def test_enqueue_task_publishes_partition_wakeup(monkeypatch):
+    client = _FakeRedis()
+    monkeypatch.setattr(
+        "backend.app.services.stores.redis.runner_queue_store.get_async_redis_client",
+        lambda: asyncio.sleep(0, result=client),
+    )
+    store = RedisRunnerQueueStore(pack_id="default_local")
+    pubsub = client.pubsub()
+    await pubsub.subscribe(store.q_wakeup)
+
+    assert await store.enqueue_task("task-1")
+
+    message = await pubsub.get_message(timeout=0.1)
+    assert store.q_wakeup == "mindscape:queue:wakeup:default_local"
+    assert message["channel"] == store.q_wakeup
+    assert client.lists[store.q_pending] == ["task-1"]
+
+
+@pytest.mark.asyncio
+async def test_dequeue_wakes_on_publish_from_any_accepted_partition():
+    client = _FakeRedis()
+    queues = [_NowaitQueue("default_local", client), _NowaitQueue("vision_local", client)]
+    wakeup = await _started_wakeup(client, queues)
+    try:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        dequeue = asyncio.create_task(
+            _dequeue_from_ready_queues(
+                queues,
+                cursor=0,
+                visibility_timeout_sec=60,
+                block_timeout_sec=5,
+                wakeup=wakeup,
+            )
+        )
+        await asyncio.sleep(0.05)
+        assert await queues[1].enqueue_task("task-vision")
+
+        task_id, task_queue, _cursor = await asyncio.wait_for(dequeue, timeout=1)
+        assert task_id == "task-vision"
+        assert task_queue is queues[1]
+        assert loop.time() - started < 1
+    finally:
+        await wakeup.close()
+
+
+@pytest.mark.asyncio
+async def test_dequeue_falls_back_to_timeout_without_publish():
+    client = _FakeRedis()
+    queues = [_NowaitQueue("default_local", client)]
+    wakeup = await _started_wakeup(client, queues)
+    try:
+        result = await _dequeue_from_ready_queues(
+            queues,
+            cursor=0,
+            visibility_timeout_sec=60,
+            block_timeout_sec=0.05,
+            wakeup=wakeup,
+        )
+        assert result[:2] == (None, None)
+    finally:
+        await wakeup.close()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_inflight_slot_returns_when_a_task_finishes():
+    release = asyncio.Event()
+    inflight = {
+        asyncio.create_task(release.wait()),
+        asyncio.create_task(asyncio.sleep(10)),
+    }
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    loop.call_later(0.05, release.set)
+
+    await _wait_for_inflight_slot(inflight, timeout=5)
+
+    assert loop.time() - started < 1
+    for task in inflight:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_wakeup_context_subscribes_for_the_loop_and_unsubscribes_on_exit():
+    client = _FakeRedis()
+    queues = [_NowaitQueue("default_local", client)]
+
+    async def _client_factory():
+        return client
+
+    async with runner_queue_wakeup(queues, client_factory=_client_factory) as wakeup:
+        for _ in range(50):
+            if wakeup.active:
+                break
+            await asyncio.sleep(0.01)
+        assert wakeup.active
+
+    assert not wakeup.active
+    assert wakeup._listener is None
+
+
+@pytest.mark.asyncio
+async def test_disabled_wakeup_context_falls_back_to_polling():
+    client = _FakeRedis()
+    queues = [_NowaitQueue("default_local", client)]
+
+    async with runner_queue_wakeup(queues, enabled=False) as wakeup:
+        assert wakeup._listener is None
+        assert await wakeup.wait(0.01) is False
+
+    assert client.subscribers == []
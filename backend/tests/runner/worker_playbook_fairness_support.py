@@ -17,10 +17,10 @@ class FakeFairClient:
         self.incrby_calls = []
         self.expire_calls = []
 
-    async def llen(self, queue_name):
+    async def zcard(self, queue_name):
         return len(self.ids)
 
-    async def lrange(self, queue_name, start, end):
+    async def zrange(self, queue_name, start, end):
         return self.ids[start : end + 1]
 
     async def mget(self, keys):
@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+
+from backend.app.services.stores.redis import runner_queue_store
+from backend.app.services.stores.redis.runner_queue_store import (
+    RedisRunnerQueueStore,
+    pending_enqueue_score,
+    pending_front_score,
+)
+
+
+class _RecordingPipeline:
+    def __init__(self):
+        self.calls = []
+
+    def setex(self, *args):
+        self.calls.append(("setex", args, {}))
+
+    def zadd(self, *args, **kwargs):
+        self.calls.append(("zadd", args, kwargs))
+
+    def publish(self, *args):
+        self.calls.append(("publish", args, {}))
+
+    async def execute(self):
+        return [1] * len(self.calls)
+
+
+class _LegacyListClient:
+    """Emulates LUA_MIGRATE_LEGACY_PENDING over in-memory lists."""
+
+    def __init__(self, lists):
+        self.lists = {key: list(values) for key, values in lists.items()}
+        self.pending: dict[str, float] = {}
+        self.eval_calls = []
+        self.published = []
+
+    async def eval(self, script, numkeys, source, target, chunk_size, start_score):
+        assert script == runner_queue_store.LUA_MIGRATE_LEGACY_PENDING
+        self.eval_calls.append((source, int(chunk_size), start_score))
+        items = self.lists.get(source, [])
+        moved = 0
+        while items and moved < int(chunk_size):
+            self.pending.setdefault(items.pop(), float(start_score) + moved)
+            moved += 1
+        return moved
+
+    async def publish(self, channel, message):
+        self.published.append(channel)
+        return 1
+
+
+def _store_with(client, pack_id="default_local"):
+    store = RedisRunnerQueueStore(pack_id=pack_id)
+
+    async def _get_client():
+        return client
+
+    store._get_client = _get_client
+    return store
+
+
+def test_pending_scores_put_front_pushes_ahead_of_fifo_enqueues():
+    assert pending_enqueue_score(100.0) < pending_enqueue_score(101.0)
+    assert pending_front_score(100.0) < pending_enqueue_score(0.0)
+    # A later front push pops first, like the RPUSH it replaces.
+    assert pending_front_score(101.0) < pending_front_score(100.0)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_task_adds_to_pending_zset_without_moving_duplicates():
+    pipeline = _RecordingPipeline()
+
+    class _Client:
+        def pipeline(self):
+            return pipeline
+
+    store = _store_with(_Client())
+
+    assert await store.enqueue_task("task-1")
+
+    zadd_calls = [call for call in pipeline.calls if call[0] == "zadd"]
+    assert len(zadd_calls) == 1
+    key, mapping = zadd_calls[0][1]
+    assert key == "mindscape:queue:ready:default_local"
+    assert list(mapping) == ["task-1"]
+    assert zadd_calls[0][2] == {"nx": True}
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_pending_drains_lists_in_fifo_chunks():
+    store = RedisRunnerQueueStore(pack_id="default_local")
+    client = _LegacyListClient(
+        {
+            # LPUSH order: index 0 is the newest, the right end pops first.
+            store.q_pending_legacy: ["task-4", "task-3", "task-2", "task-1"],
+            store.q_temp: ["task-0"],
+        }
+    )
+    store = _store_with(client)
+
+    moved = await store.migrate_legacy_pending(chunk_size=2)
+
+    assert moved == 5
+    assert sorted(client.pending, key=client.pending.get) == [
+        "task-0",
+        "task-1",
+        "task-2",
+        "task-3",
+        "task-4",
+    ]
+    assert [call[0] for call in client.eval_calls] == [
+        store.q_temp,
+        store.q_pending_legacy,
+        store.q_pending_legacy,
+        store.q_pending_legacy,
+    ]
+    assert client.published == [store.q_wakeup]
+    assert await store.migrate_legacy_pending(chunk_size=2) == 0
+
+
+class _WakeupPubSub:
+    def __init__(self, client):
+        self.client = client
+        self.subscribed = []
+
+    async def subscribe(self, channel):
+        self.subscribed.append(channel)
+
+    async def unsubscribe(self, channel):
+        self.subscribed.remove(channel)
+
+    async def close(self):
+        pass
+
+    async def get_message(self, ignore_subscribe_messages, timeout):
+        if self.client.enqueue_on_wait:
+            task_id = self.client.enqueue_on_wait.pop(0)
+            self.client.pending[task_id] = pending_enqueue_score()
+            return {"type": "message", "data": task_id}
+        await asyncio.sleep(timeout)
+        return None
+
+
+class _ReadyQueueClient:
+    """Emulates LUA_POP_PENDING_TO_PROCESSING plus the wakeup channel."""
+
+    def __init__(self, pending=None, enqueue_on_wait=()):
+        self.pending: dict[str, float] = dict(pending or {})
+        self.processing: dict[str, float] = {}
+        self.enqueue_on_wait = list(enqueue_on_wait)
+        self.pubsubs = []
+
+    def pubsub(self):
+        pubsub = _WakeupPubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def eval(self, script, numkeys, pending_key, processing_key, deadline):
+        assert script == runner_queue_store.LUA_POP_PENDING_TO_PROCESSING
+        if not self.pending:
+            return None
+        task_id = min(self.pending, key=self.pending.get)
+        del self.pending[task_id]
+        self.processing[task_id] = deadline
+        return task_id
+
+
+@pytest.mark.asyncio
+async def test_blocking_dequeue_claims_through_the_atomic_script_after_a_wakeup():
+    client = _ReadyQueueClient(enqueue_on_wait=["task-1"])
+    store = _store_with(client)
+
+    assert await store.dequeue_task_blocking(timeout=1) == "task-1"
+
+    assert client.pending == {}
+    assert list(client.processing) == ["task-1"]
+    assert client.pubsubs[0].subscribed == []
+
+
+@pytest.mark.asyncio
+async def test_blocking_dequeue_times_out_without_touching_the_queue():
+    client = _ReadyQueueClient()
+    store = _store_with(client)
+
+    assert await store.dequeue_task_blocking(timeout=0.05) is None
+
+    assert client.pending == {} and client.processing == {}
+    assert client.pubsubs[0].subscribed == []
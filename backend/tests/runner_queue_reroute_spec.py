@@ -36,7 +36,7 @@ async def test_redis_runner_queue_store_reroute_uses_single_lua_call(monkeypatch
     call = client.eval_calls[0]
     assert call[0] == runner_queue_store.LUA_REROUTE_PENDING
     assert call[1] == 4
-    assert call[3] == "mindscape:queue:pending:vision_mlx_high"
+    assert call[3] == "mindscape:queue:ready:vision_mlx_high"
     assert call[-3] == "task-1"
 
 
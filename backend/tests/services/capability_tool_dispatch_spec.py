@@ -0,0 +1,162 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import capability_registry
+from app.services import capability_tool_dispatch
+
+
+TOOLS_MODULE = '''
+def observe(value):
+    return {"observed": value, "version": VERSION}
+
+
+async def observe_standard(inputs, ctx):
+    return {"value": inputs["value"], "execution_id": ctx.execution_id}
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def bump(self):
+        self.calls += 1
+        return self.calls
+
+    def bump_fresh(self):
+        self.calls += 1
+        return self.calls
+'''
+
+
+def _write_pack(root: Path, version: int) -> None:
+    pack_dir = root / "dispatch_pack"
+    pack_dir.mkdir(parents=True, exist_ok=True)
+    (pack_dir / "tools.py").write_text(
+        f"VERSION = {version}\n{TOOLS_MODULE}", encoding="utf-8"
+    )
+    (pack_dir / "manifest.yaml").write_text(
+        "code: dispatch_pack\n"
+        "tools:\n"
+        "  - name: observe\n"
+        "    backend: capabilities.dispatch_pack.tools:observe\n"
+        "  - name: observe_standard\n"
+        "    backend: capabilities.dispatch_pack.tools:observe_standard\n"
+        "  - name: bump\n"
+        "    backend: capabilities.dispatch_pack.tools:Counter.bump\n"
+        "    instance_lifecycle: capability\n"
+        "  - name: bump_fresh\n"
+        "    backend: capabilities.dispatch_pack.tools:Counter.bump_fresh\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def pack_root(tmp_path, monkeypatch):
+    registry = capability_registry._registry
+    saved = (
+        dict(registry.capabilities),
+        dict(registry.tools),
+        dict(registry.compiled_tools),
+        dict(capability_registry.CAPABILITY_REGISTRY),
+        dict(capability_registry.TOOL_REGISTRY),
+    )
+    imports = []
+    original_import = capability_tool_dispatch.import_capability_backend_module
+
+    def _counting_import(**kwargs):
+        imports.append(kwargs["backend_path"])
+        return original_import(**kwargs)
+
+    monkeypatch.setattr(
+        capability_tool_dispatch,
+        "import_capability_backend_module",
+        _counting_import,
+    )
+    _write_pack(tmp_path, version=1)
+    capability_registry.load_capabilities(tmp_path, reset=True)
+    try:
+        yield SimpleNamespace(root=tmp_path, imports=imports)
+    finally:
+        for target, snapshot in zip(
+            (
+                registry.capabilities,
+                registry.tools,
+                registry.compiled_tools,
+                capability_registry.CAPABILITY_REGISTRY,
+                capability_registry.TOOL_REGISTRY,
+            ),
+            saved,
+        ):
+            target.clear()
+            target.update(snapshot)
+
+
+def test_repeated_calls_resolve_the_backend_once(pack_root):
+    results = [
+        capability_registry.call_tool("dispatch_pack", "observe", value=index)
+        for index in range(5)
+    ]
+
+    assert results[-1] == {"observed": 4, "version": 1}
+    assert pack_root.imports == ["capabilities.dispatch_pack.tools:observe"]
+    compiled = capability_registry._registry.compiled_tools["dispatch_pack.observe"]
+    assert compiled.standard_signature is False
+    assert compiled.is_async is False
+
+
+def test_class_backends_follow_their_declared_instance_lifecycle(pack_root):
+    shared = [capability_registry.call_tool("dispatch_pack", "bump") for _ in range(3)]
+    fresh = [
+        capability_registry.call_tool("dispatch_pack", "bump_fresh") for _ in range(3)
+    ]
+
+    assert shared == [1, 2, 3]
+    # Undeclared lifecycles keep a fresh instance per call.
+    assert fresh == [1, 1, 1]
+    compiled = capability_registry._registry.compiled_tools
+    assert compiled["dispatch_pack.bump_fresh"].instance_lifecycle == "per_call"
+
+
+@pytest.mark.asyncio
+async def test_async_standard_tool_uses_the_precomputed_binding_plan(pack_root):
+    result = await capability_registry.call_tool_async(
+        "dispatch_pack",
+        "observe_standard",
+        value=3,
+        execution_id="execution-1",
+    )
+
+    compiled = capability_registry._registry.compiled_tools[
+        "dispatch_pack.observe_standard"
+    ]
+    assert result == {"value": 3, "execution_id": "execution-1"}
+    assert compiled.standard_signature is True
+    assert compiled.is_async is True
+
+
+def test_reload_capability_invalidates_compiled_entries(pack_root):
+    assert capability_registry.call_tool("dispatch_pack", "bump") == 1
+    assert capability_registry.call_tool("dispatch_pack", "observe", value="a") == {
+        "observed": "a",
+        "version": 1,
+    }
+
+    _write_pack(pack_root.root, version=2)
+    assert capability_registry.reload_capability("dispatch_pack", pack_root.root) is True
+
+    assert capability_registry._registry.compiled_tools == {}
+    assert capability_registry.call_tool("dispatch_pack", "bump") == 1
+    assert capability_registry.call_tool("dispatch_pack", "observe", value="b") == {
+        "observed": "b",
+        "version": 2,
+    }
+
+
+def test_unknown_instance_lifecycle_fails_the_call(pack_root):
+    tool_info = capability_registry._registry.tools["dispatch_pack.bump"]
+    tool_info["tool_info"] = {**tool_info["tool_info"], "instance_lifecycle": "forever"}
+
+    with pytest.raises(RuntimeError, match="unknown instance_lifecycle"):
+        capability_registry.call_tool("dispatch_pack", "bump")
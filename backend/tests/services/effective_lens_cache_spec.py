@@ -0,0 +1,162 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.graph import (
+    GraphNode,
+    GraphNodeCategory,
+    GraphNodeType,
+    LensNodeState,
+)
+from app.services.lens.effective_lens_cache import EffectiveLensCache
+from app.services.lens.effective_lens_resolver import EffectiveLensResolver
+from app.services.lens.session_override_store import InMemorySessionStore
+
+
+class _GraphStore:
+    def __init__(self, node_count=4):
+        self.nodes = [
+            GraphNode(
+                id=f"n{index}",
+                profile_id="p1",
+                category=GraphNodeCategory.DIRECTION,
+                node_type=GraphNodeType.VALUE,
+                label=f"Node {index}",
+            )
+            for index in range(node_count)
+        ]
+        self.preset_states = {"n0": LensNodeState.EMPHASIZE}
+        self.workspace_states = {}
+        self.calls = []
+
+    def list_nodes(self, profile_id, is_active=True, limit=10000):
+        self.calls.append("list_nodes")
+        return list(self.nodes)
+
+    def get_active_lens(self, profile_id, workspace_id=None):
+        self.calls.append("get_active_lens")
+        return SimpleNamespace(id="preset-1", name="Default")
+
+    def get_lens_profile_nodes(self, preset_id):
+        self.calls.append("get_lens_profile_nodes")
+        return [
+            SimpleNamespace(node_id=node_id, state=state)
+            for node_id, state in self.preset_states.items()
+        ]
+
+    def get_workspace_override(self, workspace_id):
+        self.calls.append("get_workspace_override")
+        return dict(self.workspace_states)
+
+
+def _uncached(graph_store, session_store, profile_id, workspace_id, session_id):
+    resolver = EffectiveLensResolver(graph_store, session_store, EffectiveLensCache())
+    return resolver.resolve(profile_id, workspace_id, session_id)
+
+
+def _assert_same_lens(actual, expected):
+    assert actual.hash == expected.hash
+    assert actual.nodes == expected.nodes
+    assert actual.workspace_override_count == expected.workspace_override_count
+    assert actual.session_override_count == expected.session_override_count
+    assert actual.session_id == expected.session_id
+
+
+@pytest.fixture
+def cache():
+    return EffectiveLensCache(ttl_seconds=60)
+
+
+def test_repeat_resolve_is_served_without_store_reads(cache):
+    graph_store = _GraphStore()
+    resolver = EffectiveLensResolver(graph_store, InMemorySessionStore(), cache)
+
+    first = resolver.resolve("p1", "ws-1")
+    graph_store.calls.clear()
+    second = resolver.resolve("p1", "ws-1")
+
+    assert graph_store.calls == []
+    _assert_same_lens(second, first)
+    assert second.nodes is not first.nodes
+
+
+def test_workspace_override_change_remerges_only_that_layer(cache):
+    graph_store = _GraphStore()
+    resolver = EffectiveLensResolver(graph_store, InMemorySessionStore(), cache)
+    resolver.resolve("p1", "ws-1")
+
+    graph_store.workspace_states = {"n1": LensNodeState.OFF, "n0": LensNodeState.KEEP}
+    cache.workspace_override_changed("ws-1")
+    graph_store.calls.clear()
+    lens = resolver.resolve("p1", "ws-1")
+
+    assert graph_store.calls == ["get_workspace_override"]
+    _assert_same_lens(
+        lens, _uncached(graph_store, InMemorySessionStore(), "p1", "ws-1", None)
+    )
+    assert lens.workspace_override_count == 2
+
+    graph_store.workspace_states = {"n1": LensNodeState.OFF}
+    cache.workspace_override_changed("ws-1")
+    lens = resolver.resolve("p1", "ws-1")
+    assert lens.workspace_override_count == 1
+    assert lens.nodes[0].state is LensNodeState.EMPHASIZE
+
+
+def test_graph_and_preset_changes_force_a_full_resolve(cache):
+    graph_store = _GraphStore()
+    resolver = EffectiveLensResolver(graph_store, InMemorySessionStore(), cache)
+    resolver.resolve("p1", "ws-1")
+
+    graph_store.nodes = graph_store.nodes[:2]
+    cache.graph_changed("p1")
+    assert len(resolver.resolve("p1", "ws-1").nodes) == 2
+
+    graph_store.preset_states = {"n1": LensNodeState.OFF}
+    cache.presets_changed()
+    lens = resolver.resolve("p1", "ws-1")
+    assert [node.state for node in lens.nodes] == [LensNodeState.KEEP, LensNodeState.OFF]
+
+
+def test_session_layer_is_applied_on_top_of_the_cached_base(cache, monkeypatch):
+    from app.services.lens import session_override_store
+
+    monkeypatch.setattr(session_override_store, "get_effective_lens_cache", lambda: cache)
+    graph_store = _GraphStore()
+    graph_store.workspace_states = {"n2": LensNodeState.EMPHASIZE}
+    session_store = InMemorySessionStore()
+    resolver = EffectiveLensResolver(graph_store, session_store, cache)
+    base = resolver.resolve("p1", "ws-1")
+
+    session_store.set("s1", {"n2": LensNodeState.OFF, "n3": LensNodeState.EMPHASIZE})
+    graph_store.calls.clear()
+    lens = resolver.resolve("p1", "ws-1", "s1")
+
+    assert graph_store.calls == []
+    _assert_same_lens(lens, _uncached(graph_store, session_store, "p1", "ws-1", "s1"))
+    assert lens.session_override_count == 2
+    assert lens.workspace_override_count == 0
+
+    session_store.update("s1", "n3", LensNodeState.KEEP)
+    lens = resolver.resolve("p1", "ws-1", "s1")
+    _assert_same_lens(lens, _uncached(graph_store, session_store, "p1", "ws-1", "s1"))
+
+    session_store.clear("s1")
+    lens = resolver.resolve("p1", "ws-1", "s1")
+    assert lens.hash == base.hash
+    assert lens.session_id == "s1"
+
+
+def test_expired_entries_are_resolved_again():
+    graph_store = _GraphStore()
+    resolver = EffectiveLensResolver(
+        graph_store, InMemorySessionStore(), EffectiveLensCache(ttl_seconds=0)
+    )
+    resolver.resolve("p1", "ws-1")
+    graph_store.preset_states = {}
+    graph_store.calls.clear()
+
+    lens = resolver.resolve("p1", "ws-1")
+
+    assert "list_nodes" in graph_store.calls
+    assert lens.nodes[0].state is LensNodeState.KEEP
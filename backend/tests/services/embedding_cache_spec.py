@@ -0,0 +1,103 @@
+import pytest
+
+from backend.app.services.embedding_cache import (
+    EmbeddingCache,
+    EmbeddingMemoryTier,
+    embedding_cache_key,
+    embedding_role,
+    normalize_embedding_text,
+)
+from backend.app.services.embedding_cache.store import (
+    pack_embedding,
+    unpack_embedding,
+)
+
+
+class FakeStore:
+    def __init__(self, rows=None):
+        self.rows = dict(rows or {})
+        self.available = True
+        self.evictions = 0
+        self.reads = []
+        self.touched = []
+
+    def get_many(self, keys):
+        self.reads.append(list(keys))
+        return {key: self.rows[key] for key in keys if key in self.rows}
+
+    def put_many(self, entries):
+        for key, entry in entries.items():
+            self.rows[key] = (entry["provider"], tuple(entry["embedding"]))
+
+    def touch(self, keys):
+        self.touched.extend(keys)
+
+
+def test_key_normalizes_whitespace_and_separates_roles():
+    assert normalize_embedding_text("  hello \n  world ") == "hello world"
+    assert embedding_cache_key("bge-m3", "symmetric", "hello  world") == (
+        embedding_cache_key("bge-m3", "symmetric", " hello world")
+    )
+    assert embedding_cache_key("bge-m3", "symmetric", "x") != embedding_cache_key(
+        "nomic-embed-text", "symmetric", "x"
+    )
+
+
+def test_only_prefixed_models_split_query_and_document_roles():
+    assert embedding_role("nomic-embed-text:latest", is_query=True) == "query"
+    assert embedding_role("nomic-embed-text", is_query=False) == "document"
+    assert embedding_role("bge-m3", is_query=True) == "symmetric"
+    assert embedding_role("bge-m3", is_query=False) == "symmetric"
+
+
+def test_memory_tier_evicts_least_recently_used():
+    tier = EmbeddingMemoryTier(max_entries=2)
+    tier.put_many({"a": ("ollama", [1.0]), "b": ("ollama", [2.0])})
+    assert tier.get("a") == ("ollama", (1.0,))
+    tier.put_many({"c": ("ollama", [3.0])})
+
+    assert tier.get("b") is None
+    assert tier.get("a") is not None
+    assert tier.evictions == 1
+
+
+def test_packed_embedding_round_trips_float32():
+    assert unpack_embedding(pack_embedding([0.5, -1.25])) == (0.5, -1.25)
+
+
+@pytest.mark.asyncio
+async def test_cache_reads_memory_then_store_and_counts_hits():
+    key = embedding_cache_key("bge-m3", "symmetric", "stored")
+    store = FakeStore({key: ("ollama", (0.25,))})
+    cache = EmbeddingCache(memory_tier=EmbeddingMemoryTier(8), store=store)
+
+    await cache.put_many("bge-m3", [("fresh", [0.5], "ollama")], is_query=True)
+    results = await cache.get_many(
+        "bge-m3", ["fresh", "stored", "missing"], is_query=False
+    )
+
+    assert [result.embedding if result else None for result in results] == [
+        (0.5,),
+        (0.25,),
+        None,
+    ]
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["store_hits"], stats["misses"]) == (1, 1, 1)
+    assert store.reads == [[key, embedding_cache_key("bge-m3", "symmetric", "missing")]]
+
+    again = await cache.get_many("bge-m3", ["stored"], is_query=True)
+    assert again[0].embedding == (0.25,)
+    assert cache.stats()["memory_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_model_env_change_drops_memory_tier(monkeypatch):
+    monkeypatch.setenv("OLLAMA_EMBED_MODEL", "bge-m3")
+    cache = EmbeddingCache(memory_tier=EmbeddingMemoryTier(8))
+    await cache.put_many("bge-m3", [("text", [0.1], "ollama")], is_query=True)
+
+    monkeypatch.setenv("OLLAMA_EMBED_MODEL", "nomic-embed-text")
+    results = await cache.get_many("bge-m3", ["text"], is_query=True)
+
+    assert results == [None]
+    assert cache.stats()["generation"] == 1
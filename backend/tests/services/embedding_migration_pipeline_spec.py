@@ -0,0 +1,273 @@
+from datetime import datetime
+
+import pytest
+
+from backend.app.models.embedding_migration import (
+    EmbeddingMigration,
+    ItemStatus,
+    MigrationStatus,
+)
+from backend.app.services import embedding_migration_pipeline as pipeline_module
+from backend.app.services.embedding_migration_pipeline import (
+    EmbeddingMigrationPipeline,
+    MigrationPipelineConfig,
+    migration_item_id,
+    migration_progress,
+    read_checkpoint,
+)
+from backend.app.services.embedding_migration_queries import (
+    fetch_embedding_page,
+    fetch_embeddings_by_ids,
+)
+
+
+class FakeStore:
+    def __init__(self, cancel_after_updates=None, failed_ids=()):
+        self.items = {}
+        self.updates = []
+        self.cancel_after_updates = cancel_after_updates
+        self.failed_ids = list(failed_ids)
+
+    def list_retryable_failed_source_ids(self, migration_id, *, max_retries):
+        return list(self.failed_ids)
+
+    def save_migration_page(self, migration, items):
+        cancelled = (
+            self.cancel_after_updates is not None
+            and len(self.updates) >= self.cancel_after_updates
+        )
+        if cancelled:
+            migration.status = MigrationStatus.CANCELLED
+        for item in items:
+            self.items[item.id] = item
+        self.updates.append(migration.model_copy(deep=True))
+        return not cancelled
+
+
+def _rows(count):
+    return [
+        {
+            "id": f"00000000-0000-0000-0000-{index:012d}",
+            "content": f"text {index}",
+            "created_at": datetime(2026, 1, 1, 0, 0, index),
+        }
+        for index in range(count)
+    ]
+
+
+def _migration(total):
+    return EmbeddingMigration(
+        source_model="old-model",
+        target_model="new-model",
+        source_provider="openai",
+        target_provider="openai",
+        user_id="user-1",
+        total_count=total,
+        status=MigrationStatus.IN_PROGRESS,
+    )
+
+
+def _install_fakes(monkeypatch, rows, applied):
+    seen_cursors = []
+
+    async def fake_fetch(get_connection, migration, *, after=None, limit=256):
+        seen_cursors.append(after)
+        start = 0
+        if after is not None:
+            start = next(i for i, row in enumerate(rows) if row["id"] == after[1]) + 1
+        return rows[start : start + limit]
+
+    async def fake_apply(get_connection, migration, records):
+        applied.append([record["id"] for record, _ in records])
+        return [record["id"] for record, _ in records]
+
+    async def fake_fetch_by_ids(get_connection, migration, ids):
+        return [row for row in rows if row["id"] in ids]
+
+    monkeypatch.setattr(pipeline_module, "fetch_embedding_page", fake_fetch)
+    monkeypatch.setattr(pipeline_module, "fetch_embeddings_by_ids", fake_fetch_by_ids)
+    monkeypatch.setattr(pipeline_module, "apply_migration_batch", fake_apply)
+    return seen_cursors
+
+
+@pytest.mark.asyncio
+async def test_pipeline_batches_pages_and_checkpoints_last_row(monkeypatch):
+    rows = _rows(5)
+    rows[3]["content"] = ""
+    applied = []
+    _install_fakes(monkeypatch, rows, applied)
+    batches = []
+
+    async def embed_batch(texts):
+        batches.append(list(texts))
+        return [None if text == "text 4" else [0.1, 0.2] for text in texts]
+
+    store = FakeStore()
+    migration = _migration(total=5)
+    pipeline = EmbeddingMigrationPipeline(
+        get_connection=lambda: None,
+        store=store,
+        embed_batch=embed_batch,
+        config=MigrationPipelineConfig(page_size=2, batch_size=1, concurrency=2),
+    )
+
+    assert await pipeline.run(migration) is True
+
+    assert sorted(sum(batches, [])) == ["text 0", "text 1", "text 2", "text 4"]
+    assert applied == [[rows[0]["id"], rows[1]["id"]], [rows[2]["id"]]]
+    assert migration.processed_count == 3
+    assert migration.failed_count == 2
+    assert read_checkpoint(migration) == (
+        rows[4]["created_at"].isoformat(),
+        rows[4]["id"],
+    )
+    failed = store.items[migration_item_id(migration.id, rows[3]["id"])]
+    assert failed.status == ItemStatus.FAILED
+    assert "Could not extract text" in failed.error_message
+    completed = store.items[migration_item_id(migration.id, rows[0]["id"])]
+    assert completed.status == ItemStatus.COMPLETED
+    assert completed.target_embedding_id == rows[0]["id"]
+
+    progress = migration_progress(migration)
+    assert progress.rows_per_second > 0
+    assert progress.eta_seconds == 0.0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_resumes_after_checkpoint_and_stops_on_cancel(monkeypatch):
+    rows = _rows(6)
+    applied = []
+    seen_cursors = _install_fakes(monkeypatch, rows, applied)
+
+    async def embed_batch(texts):
+        return [[1.0] for _ in texts]
+
+    migration = _migration(total=6)
+    migration.metadata = {
+        "pipeline": {
+            "checkpoint": {
+                "created_at": rows[1]["created_at"].isoformat(),
+                "id": rows[1]["id"],
+            }
+        }
+    }
+    store = FakeStore(cancel_after_updates=1)
+    pipeline = EmbeddingMigrationPipeline(
+        get_connection=lambda: None,
+        store=store,
+        embed_batch=embed_batch,
+        config=MigrationPipelineConfig(page_size=2, prefetch_pages=1),
+    )
+
+    assert await pipeline.run(migration) is False
+
+    assert seen_cursors[0] == (rows[1]["created_at"].isoformat(), rows[1]["id"])
+    assert applied == [[rows[2]["id"], rows[3]["id"]], [rows[4]["id"], rows[5]["id"]]]
+    assert migration.status == MigrationStatus.CANCELLED
+    assert read_checkpoint(store.updates[-1]) == (
+        rows[5]["created_at"].isoformat(),
+        rows[5]["id"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_embedding_page_uses_keyset_cursor():
+    executed = []
+
+    class Cursor:
+        def execute(self, query, params=None):
+            executed.append((query, params))
+
+        def fetchall(self):
+            return [{"id": "embedding-3"}]
+
+        def close(self):
+            pass
+
+    class Connection:
+        def cursor(self, **kwargs):
+            return Cursor()
+
+        def close(self):
+            pass
+
+    rows = await fetch_embedding_page(
+        lambda: Connection(),
+        _migration(total=3),
+        after=("2026-01-01T00:00:00", "embedding-2"),
+        limit=50,
+    )
+
+    query, params = executed[0]
+    assert rows == [{"id": "embedding-3"}]
+    assert "(created_at, id) > (%s, %s::uuid)" in query
+    assert "ORDER BY created_at, id" in query
+    assert "OFFSET" not in query
+    assert params == ["old-model", "openai", "2026-01-01T00:00:00", "embedding-2", 50]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_retries_recorded_failures_without_moving_checkpoint(monkeypatch):
+    rows = _rows(3)
+    applied = []
+    _install_fakes(monkeypatch, rows, applied)
+
+    async def embed_batch(texts):
+        return [[1.0] for _ in texts]
+
+    checkpoint = {"created_at": rows[2]["created_at"].isoformat(), "id": rows[2]["id"]}
+    migration = _migration(total=3)
+    migration.processed_count = 1
+    migration.failed_count = 2
+    migration.metadata = {"pipeline": {"checkpoint": checkpoint}}
+    gone_id = "00000000-0000-0000-0000-999999999999"
+    store = FakeStore(failed_ids=[rows[0]["id"], gone_id])
+    pipeline = EmbeddingMigrationPipeline(
+        get_connection=lambda: None,
+        store=store,
+        embed_batch=embed_batch,
+        config=MigrationPipelineConfig(page_size=2),
+    )
+
+    assert await pipeline.run(migration) is True
+
+    assert applied == [[rows[0]["id"]]]
+    assert (migration.processed_count, migration.failed_count) == (2, 1)
+    assert store.updates[0].metadata["pipeline"]["checkpoint"] == checkpoint
+    retried = store.items[migration_item_id(migration.id, rows[0]["id"])]
+    assert retried.status == ItemStatus.COMPLETED
+    gone = store.items[migration_item_id(migration.id, gone_id)]
+    assert gone.status == ItemStatus.FAILED
+    assert "no longer matches" in gone.error_message
+
+
+@pytest.mark.asyncio
+async def test_fetch_embeddings_by_ids_keeps_the_source_filter():
+    executed = []
+
+    class Cursor:
+        def execute(self, query, params=None):
+            executed.append((query, params))
+
+        def fetchall(self):
+            return [{"id": "embedding-1"}]
+
+        def close(self):
+            pass
+
+    class Connection:
+        def cursor(self, **kwargs):
+            return Cursor()
+
+        def close(self):
+            pass
+
+    rows = await fetch_embeddings_by_ids(
+        lambda: Connection(), _migration(total=1), ["embedding-1", "embedding-2"]
+    )
+
+    query, params = executed[0]
+    assert rows == [{"id": "embedding-1"}]
+    assert "id = ANY(%s::uuid[])" in query
+    assert params == ["old-model", "openai", ["embedding-1", "embedding-2"]]
+    assert await fetch_embeddings_by_ids(lambda: Connection(), _migration(total=1), []) == []
@@ -2,9 +2,13 @@ import pytest
 
 from backend.app.models.embedding_migration import (
     EmbeddingMigration,
-    EmbeddingMigrationItem,
     MigrationStrategy,
 )
+from backend.app.services import embedding_migration_apply
+from backend.app.services.embedding_migration_apply import (
+    apply_migration_batch,
+    migrated_embedding_id,
+)
 from backend.app.services.embedding_migration_service import EmbeddingMigrationService
 
 
@@ -48,12 +52,7 @@ class FakeConnection:
 
 
 class FakeStore:
-    def __init__(self):
-        self.updated_items = []
-
-    def update_migration_item(self, item):
-        self.updated_items.append(item)
-        return item
+    pass
 
 
 @pytest.mark.asyncio
@@ -88,39 +87,6 @@ async def test_count_embeddings_wrapper_preserves_filter_params():
     assert conn.closed is True
 
 
-@pytest.mark.asyncio
-async def test_fetch_embeddings_wrapper_uses_real_dict_cursor_and_ordering():
-    cursor = FakeCursor(
-        fetchall_result=[
-            {"id": "embedding-1", "content": "first"},
-            {"id": "embedding-2", "content": "second"},
-        ]
-    )
-    conn = FakeConnection(cursor)
-    service = EmbeddingMigrationService(store=FakeStore())
-    service._get_connection = lambda: conn
-    migration = EmbeddingMigration(
-        source_model="old-model",
-        target_model="new-model",
-        source_provider="openai",
-        target_provider="openai",
-        user_id="user-1",
-    )
-
-    result = await service._fetch_embeddings_to_migrate(migration)
-
-    query, params = cursor.executed[0]
-    assert result == [
-        {"id": "embedding-1", "content": "first"},
-        {"id": "embedding-2", "content": "second"},
-    ]
-    assert "ORDER BY created_at" in query
-    assert params == ["old-model", "openai"]
-    assert conn.cursor_kwargs[0]["cursor_factory"].__name__ == "RealDictCursor"
-    assert cursor.closed is True
-    assert conn.closed is True
-
-
 def test_extract_source_text_facade_keeps_direct_and_metadata_paths():
     service = EmbeddingMigrationService(store=FakeStore())
 
@@ -133,45 +99,32 @@ def test_extract_source_text_facade_keeps_direct_and_metadata_paths():
 
 
 @pytest.mark.asyncio
-async def test_replace_strategy_wrapper_updates_existing_embedding_and_item():
-    cursor = FakeCursor()
-    conn = FakeConnection(cursor)
-    store = FakeStore()
-    service = EmbeddingMigrationService(store=store)
-    service._get_connection = lambda: conn
+async def test_preserve_batch_writes_stable_copy_ids_and_skips_replays(monkeypatch):
+    captured = []
+    monkeypatch.setattr(
+        embedding_migration_apply,
+        "execute_values",
+        lambda cursor, sql, rows, **kwargs: captured.append((sql, rows)),
+    )
+    conn = FakeConnection(FakeCursor())
     migration = EmbeddingMigration(
         source_model="old-model",
         target_model="new-model",
         source_provider="openai",
         target_provider="openai",
         user_id="user-1",
-        strategy=MigrationStrategy.REPLACE,
-    )
-    item = EmbeddingMigrationItem(
-        migration_id=migration.id,
-        source_embedding_id="embedding-1",
-        source_table="mindscape_personal",
+        strategy=MigrationStrategy.PRESERVE,
     )
+    record = {"id": "embedding-1", "metadata": {"keep": "yes"}}
 
-    await service._apply_migration_strategy(
-        migration=migration,
-        embedding_record={"id": "embedding-1", "metadata": {"keep": "yes"}},
-        new_embedding=[0.1, 0.2],
-        migration_item=item,
-    )
+    first = await apply_migration_batch(lambda: conn, migration, [(record, [0.1, 0.2])])
+    replay = await apply_migration_batch(lambda: conn, migration, [(record, [0.1, 0.2])])
 
-    query, params = cursor.executed[0]
-    metadata = params[1].adapted
-    assert "UPDATE mindscape_personal" in query
-    assert params[0] == [0.1, 0.2]
-    assert params[2] == "embedding-1"
+    sql, rows = captured[0]
+    metadata = rows[0][4].adapted
+    assert first == replay == [migrated_embedding_id(migration, record)]
+    assert "ON CONFLICT (id) DO NOTHING" in sql
     assert metadata["keep"] == "yes"
+    assert metadata["original_id"] == "embedding-1"
     assert metadata["embedding_model"] == "new-model"
-    assert metadata["embedding_provider"] == "openai"
-    assert metadata["embedding_dimension"] == 2
-    assert metadata["migrated_from"] == "old-model"
-    assert item.target_embedding_id == "embedding-1"
-    assert store.updated_items == [item]
     assert conn.committed is True
-    assert cursor.closed is True
-    assert conn.closed is True
@@ -0,0 +1,120 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import StaticPool
+
+from backend.app.models.embedding_migration import (
+    EmbeddingMigration,
+    EmbeddingMigrationItem,
+    ItemStatus,
+    MigrationStatus,
+)
+from backend.app.services.embedding_migration_store import EmbeddingMigrationStore
+
+
+class _SqliteMigrationStore(EmbeddingMigrationStore):
+    """Runs the store's own SQL on SQLite; only the row lock is stripped."""
+
+    def __init__(self):
+        self.db_role = "core"
+        self.db_path = None
+        self._engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+
+        @event.listens_for(self._engine, "before_cursor_execute", retval=True)
+        def _strip_row_lock(_conn, _cursor, statement, parameters, *_args):
+            return statement.replace(" FOR UPDATE", ""), parameters
+
+        with self._engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE embedding_migrations (id TEXT PRIMARY KEY, "
+                    "source_model TEXT, target_model TEXT, source_provider TEXT, "
+                    "target_provider TEXT, user_id TEXT, workspace_id TEXT, "
+                    "intent_id TEXT, scope TEXT, strategy TEXT, total_count INTEGER, "
+                    "processed_count INTEGER, failed_count INTEGER, status TEXT, "
+                    "started_at TIMESTAMP, completed_at TIMESTAMP, error_message TEXT, "
+                    "metadata TEXT, created_at TIMESTAMP, updated_at TIMESTAMP)"
+                )
+            )
+            conn.execute(
+                text(
+                    "CREATE TABLE embedding_migration_items (id TEXT PRIMARY KEY, "
+                    "migration_id TEXT, source_embedding_id TEXT, "
+                    "target_embedding_id TEXT, source_table TEXT, status TEXT, "
+                    "error_message TEXT, retry_count INTEGER DEFAULT 0, "
+                    "created_at TIMESTAMP, updated_at TIMESTAMP)"
+                )
+            )
+
+    @contextmanager
+    def get_connection(self):
+        with self._engine.connect() as conn:
+            yield conn
+
+
+def _migration():
+    return EmbeddingMigration(
+        source_model="old-model",
+        target_model="new-model",
+        source_provider="openai",
+        target_provider="openai",
+        user_id="user-1",
+        status=MigrationStatus.IN_PROGRESS,
+    )
+
+
+def _item(migration, source_id, status, **fields):
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return EmbeddingMigrationItem(
+        id=uuid4(),
+        migration_id=migration.id,
+        source_embedding_id=source_id,
+        source_table="mindscape_personal",
+        status=status,
+        created_at=now,
+        updated_at=now,
+        **fields,
+    )
+
+
+def test_saved_page_items_are_written_and_failures_become_retryable():
+    store = _SqliteMigrationStore()
+    migration = store.create_migration(_migration())
+    done = _item(migration, "src-1", ItemStatus.COMPLETED, target_embedding_id="tgt-1")
+    failed = _item(migration, "src-2", ItemStatus.FAILED, error_message="timeout")
+
+    assert store.save_migration_page(migration, [done, failed])
+
+    items = {item.source_embedding_id: item for item in store.get_migration_items(migration.id)}
+    assert set(items) == {"src-1", "src-2"}
+    assert items["src-1"].target_embedding_id == "tgt-1"
+    assert store.list_retryable_failed_source_ids(migration.id, max_retries=3) == ["src-2"]
+
+
+def test_upserting_an_item_again_updates_it_and_counts_the_retry():
+    store = _SqliteMigrationStore()
+    migration = store.create_migration(_migration())
+    failed = _item(migration, "src-1", ItemStatus.FAILED, error_message="timeout")
+    store.upsert_migration_items([failed])
+
+    failed.status = ItemStatus.FAILED
+    store.upsert_migration_items([failed])
+    assert store.list_retryable_failed_source_ids(migration.id, max_retries=1) == []
+
+    failed.status = ItemStatus.COMPLETED
+    failed.target_embedding_id = "tgt-1"
+    failed.error_message = None
+    store.upsert_migration_items([failed])
+
+    (item,) = store.get_migration_items(migration.id)
+    assert item.status == ItemStatus.COMPLETED
+    assert item.target_embedding_id == "tgt-1"
+    assert item.retry_count == 2
+    assert store.list_retryable_failed_source_ids(migration.id, max_retries=3) == []
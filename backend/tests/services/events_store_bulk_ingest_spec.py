@@ -0,0 +1,203 @@
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import StaticPool
+
+from backend.app.models.mindscape import EventActor, EventType, MindEvent
+from backend.app.services import workspace_event_lifecycle
+from backend.app.services.event_embedding_generator import EventEmbeddingGenerator
+from backend.app.services.event_embedding_generator_core import EventEmbeddingQueue
+from backend.app.services.stores.postgres import events_bulk_insert, events_store
+
+
+class _SqliteEventsStore(events_store.PostgresEventsStore):
+    def __init__(self):
+        self.statements = []
+        self._engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        with self._engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE mind_events (id TEXT PRIMARY KEY, timestamp TIMESTAMP, "
+                    "actor TEXT, channel TEXT, profile_id TEXT, project_id TEXT, "
+                    "workspace_id TEXT, thread_id TEXT, event_type TEXT, payload TEXT, "
+                    "entity_ids TEXT, metadata TEXT)"
+                )
+            )
+
+        @event.listens_for(self._engine, "before_cursor_execute")
+        def _record(_conn, _cursor, statement, *_args):
+            self.statements.append(statement)
+
+    @contextmanager
+    def get_connection(self):
+        with self._engine.connect() as conn:
+            yield conn
+
+    def serialize_json(self, data):
+        return json.dumps(data)
+
+
+class _RecordingCache:
+    def __init__(self):
+        self.batches = []
+
+    def publish(self, channel, payload):
+        self.batches.append([(channel, payload)])
+        return True
+
+    def publish_many(self, messages):
+        self.batches.append(list(messages))
+        return len(messages)
+
+
+def _event(index, workspace_id="ws-1"):
+    return MindEvent(
+        id=f"event-{index:04d}",
+        timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        actor=EventActor.ASSISTANT,
+        channel="api",
+        profile_id="profile-1",
+        workspace_id=workspace_id,
+        thread_id="thread-1",
+        event_type=EventType.MESSAGE,
+        payload={"message": f"hello {index}"},
+        entity_ids=[],
+        metadata={},
+    )
+
+
+def test_create_events_inserts_in_chunks_and_publishes_once(monkeypatch):
+    store = _SqliteEventsStore()
+    cache = _RecordingCache()
+    queued = []
+    monkeypatch.setattr(events_bulk_insert, "EVENT_INSERT_CHUNK_ROWS", 4)
+    monkeypatch.setattr(workspace_event_lifecycle, "get_cache_service", lambda: cache)
+    monkeypatch.setattr(
+        events_store.PostgresEventsStore,
+        "_queue_event_embeddings",
+        lambda self, events: queued.append([item.id for item in events]),
+    )
+    events = [_event(index) for index in range(10)]
+
+    created = store.create_events(events, generate_embedding=True)
+
+    assert created == events
+    inserts = [sql for sql in store.statements if sql.startswith("INSERT INTO mind_events")]
+    assert len(inserts) == 3
+    with store.get_connection() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM mind_events")).scalar_one() == 10
+    assert len(cache.batches) == 1
+    channels = {channel for channel, _payload in cache.batches[0]}
+    assert channels == {"workspace:ws-1:events:v1"}
+    assert [json.loads(payload)["id"] for _channel, payload in cache.batches[0]] == [
+        item.id for item in events
+    ]
+    assert queued == [[item.id for item in events]]
+
+
+
+def test_create_event_queues_its_embedding_on_the_bounded_queue(monkeypatch):
+    store = _SqliteEventsStore()
+    monkeypatch.setattr(
+        workspace_event_lifecycle, "get_cache_service", lambda: _RecordingCache()
+    )
+    queued = []
+    monkeypatch.setattr(
+        events_store.PostgresEventsStore,
+        "_queue_event_embeddings",
+        lambda self, events: queued.append([item.id for item in events]),
+    )
+
+    store.create_event(_event(1), generate_embedding=True)
+
+    assert queued == [["event-0001"]]
+
+def test_create_events_rolls_back_the_whole_batch(monkeypatch):
+    store = _SqliteEventsStore()
+    cache = _RecordingCache()
+    monkeypatch.setattr(workspace_event_lifecycle, "get_cache_service", lambda: cache)
+    store.create_events([_event(1)])
+
+    with pytest.raises(Exception):
+        store.create_events([_event(2), _event(1)])
+
+    with store.get_connection() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM mind_events")).scalar_one() == 1
+    assert len(cache.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_generator_embeds_a_batch_with_one_provider_call():
+    generator = EventEmbeddingGenerator(store=object())
+    calls = []
+    stored = []
+    generator._check_existing_embedding = lambda candidate: (
+        "seed-existing" if candidate.id == "event-0001" else None
+    )
+
+    async def fake_generate(texts):
+        calls.append(list(texts))
+        return [[0.1], None]
+
+    generator._generate_embeddings = fake_generate
+    generator._store_embedding = lambda candidate, text_value, embedding: (
+        stored.append(candidate.id) or f"seed-{candidate.id}"
+    )
+    events = [
+        SimpleNamespace(
+            id=f"event-{index:04d}",
+            event_type=EventType.MESSAGE,
+            payload={"message": f"hello {index}"},
+            metadata={"should_embed": True},
+        )
+        for index in range(3)
+    ]
+
+    results = await generator.generate_embeddings_for_events(events)
+
+    assert calls == [["hello 0", "hello 2"]]
+    assert stored == ["event-0000"]
+    assert results == {
+        "event-0000": "seed-event-0000",
+        "event-0001": "seed-existing",
+        "event-0002": None,
+    }
+
+
+def test_embedding_queue_batches_on_one_worker_and_drops_when_full():
+    release = threading.Event()
+    batches = []
+
+    class _Generator:
+        async def generate_embeddings_for_events(self, events):
+            release.wait(timeout=5)
+            batches.append([item.id for item in events])
+            return {}
+
+    embedding_queue = EventEmbeddingQueue(
+        max_size=3, batch_size=2, generator_factory=_Generator
+    )
+
+    assert embedding_queue.submit([_event(0)]) == 1
+    # Wait for the worker to take the first event so the queue has room.
+    for _ in range(100):
+        if embedding_queue.metrics()["queued"] == 0:
+            break
+        threading.Event().wait(0.01)
+    assert embedding_queue.submit([_event(index) for index in range(1, 6)]) == 3
+    release.set()
+    embedding_queue.join()
+
+    assert batches == [["event-0000"], ["event-0001", "event-0002"], ["event-0003"]]
+    assert embedding_queue.metrics()["dropped"] == 2
+    assert embedding_queue.metrics()["batches"] == 3
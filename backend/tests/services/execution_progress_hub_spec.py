@@ -0,0 +1,239 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.services.cache.execution_progress_hub import (
+    ExecutionProgressHub,
+    execution_id_from_channel,
+)
+
+
+class _FakePubSub:
+    def __init__(self):
+        self.patterns = []
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def psubscribe(self, pattern):
+        self.patterns.append(pattern)
+
+    async def punsubscribe(self, pattern):
+        pass
+
+    async def close(self):
+        pass
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.pubsubs: list[_FakePubSub] = []
+        self.published: list[tuple[str, str]] = []
+
+    def pubsub(self):
+        pubsub = _FakePubSub()
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        for pubsub in self.pubsubs:
+            await pubsub.messages.put(
+                {"type": "pmessage", "channel": channel, "data": message}
+            )
+        return len(self.pubsubs)
+
+
+def _hub(client) -> ExecutionProgressHub:
+    async def _client_factory():
+        return client
+
+    return ExecutionProgressHub(client_factory=_client_factory)
+
+
+async def _wait_active(hub):
+    for _ in range(50):
+        if hub.active:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("hub never subscribed")
+
+
+def test_execution_id_from_channel_accepts_only_progress_channels():
+    assert execution_id_from_channel("execution:exec-1:progress") == "exec-1"
+    assert execution_id_from_channel("workspace:ws-1:stream") is None
+    assert execution_id_from_channel("execution::progress") is None
+
+
+@pytest.mark.asyncio
+async def test_runner_publish_wakes_only_the_matching_watch():
+    from backend.app.runner.task_executor_events import _publish_execution_progress
+
+    client = _FakeRedis()
+    hub = _hub(client)
+    redis_queue = SimpleNamespace(_get_client=lambda: asyncio.sleep(0, result=client))
+    task = SimpleNamespace(id="task-1", execution_id="exec-1")
+    try:
+        async with hub.watch("exec-1") as watch, hub.watch("exec-2") as other:
+            await _wait_active(hub)
+            assert client.pubsubs[0].patterns == ["execution:*:progress"]
+
+            assert await _publish_execution_progress(
+                task,
+                redis_queue,
+                event_type="status",
+                status="succeeded",
+                terminal=True,
+            )
+
+            events = await watch.wait(1)
+            assert [event["status"] for event in events] == ["succeeded"]
+            assert events[0]["terminal"] is True
+            assert await other.wait(0.01) == []
+        assert hub.metrics()["executions"] == 0
+    finally:
+        await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_watch_coalesces_bursts_into_one_refresh():
+    hub = _hub(None)
+    try:
+        async with hub.watch("exec-1") as watch:
+            for seq in range(3):
+                hub.publish_local("exec-1", json.dumps({"type": "heartbeat", "seq": seq}))
+            hub.publish_local("exec-1", "not-json")
+
+            events = await watch.wait(0.1)
+            assert [event["seq"] for event in events] == [0, 1, 2]
+            assert await watch.wait(0.01) == []
+            assert not hub.active
+    finally:
+        await hub.close()
+
+
+class _FakeCacheService:
+    def __init__(self):
+        self.published: list[tuple[str, str]] = []
+
+    def publish_many(self, messages):
+        self.published.extend(messages)
+        return len(messages)
+
+
+def _running_task(progress, execution_id="exec-1"):
+    return SimpleNamespace(
+        id="task-1",
+        execution_id=execution_id,
+        status=SimpleNamespace(value="running"),
+        execution_context={"progress": progress, "runner_id": "r-1"},
+        blocked_reason=None,
+        blocked_payload=None,
+        frontier_state=None,
+        next_eligible_at=None,
+        heartbeat_at=None,
+        runner_id=None,
+    )
+
+
+@pytest.fixture
+def shared_cache(monkeypatch):
+    from backend.app.services.cache import execution_progress_publisher
+
+    cache = _FakeCacheService()
+    monkeypatch.setattr(execution_progress_publisher, "get_cache_service", lambda: cache)
+    monkeypatch.setattr(
+        execution_progress_publisher,
+        "_publisher_instance",
+        execution_progress_publisher.ExecutionProgressPublisher(),
+    )
+    return cache
+
+
+def test_progress_write_publishes_a_renderable_snapshot(shared_cache):
+    from backend.app.services.cache import execution_progress_publisher
+
+    task = _running_task({"step": 2, "total": 5})
+
+    assert execution_progress_publisher.publish_execution_progress_snapshot(task)
+    execution_progress_publisher.get_execution_progress_publisher().join()
+
+    channel, message = shared_cache.published[0]
+    event = json.loads(message)
+    assert channel == "execution:exec-1:progress"
+    assert event["status"] == "running" and event["terminal"] is False
+    assert event["snapshot"]["progress"] == {"step": 2, "total": 5}
+    assert event["snapshot"]["runner_id"] == "r-1"
+
+
+def test_progress_write_does_not_wait_for_redis(monkeypatch):
+    from backend.app.services.cache import execution_progress_publisher
+
+    release = threading.Event()
+
+    class _StalledCache(_FakeCacheService):
+        def publish_many(self, messages):
+            release.wait(5)
+            return super().publish_many(messages)
+
+    cache = _StalledCache()
+    monkeypatch.setattr(execution_progress_publisher, "get_cache_service", lambda: cache)
+    publisher = execution_progress_publisher.ExecutionProgressPublisher(max_size=1)
+    monkeypatch.setattr(execution_progress_publisher, "_publisher_instance", publisher)
+
+    started = time.monotonic()
+    for step in range(5):
+        execution_progress_publisher.publish_execution_progress_snapshot(
+            _running_task({"step": step})
+        )
+    assert time.monotonic() - started < 1.0
+
+    release.set()
+    publisher.join()
+    assert cache.published
+    assert publisher._dropped > 0
+
+
+def test_drained_batch_keeps_the_newest_snapshot_per_execution(shared_cache):
+    from backend.app.services.cache import execution_progress_publisher
+
+    publisher = execution_progress_publisher.ExecutionProgressPublisher()
+    for step in range(3):
+        publisher._queue.put_nowait(("execution:exec-1:progress", f"step-{step}"))
+    publisher._queue.put_nowait(("execution:exec-2:progress", "other"))
+    publisher._ensure_worker()
+    publisher.join()
+
+    assert shared_cache.published == [
+        ("execution:exec-1:progress", "step-2"),
+        ("execution:exec-2:progress", "other"),
+    ]
+
+
+def test_stream_payload_is_built_from_pushed_events():
+    from backend.app.services.cache.execution_progress_publisher import (
+        apply_execution_progress_events,
+    )
+
+    payload = {"type": "progress", "status": "running", "progress": {"step": 1}}
+    assert apply_execution_progress_events(
+        payload,
+        [
+            {"type": "progress", "status": "running", "snapshot": {"status": "running", "progress": {"step": 2}}},
+            {"type": "progress", "status": "running", "snapshot": {"status": "running", "progress": None}},
+            {"type": "heartbeat", "status": "running", "heartbeat_at": "t1", "runner_id": "r-1"},
+        ],
+    )
+    assert payload["progress"] == {"step": 2}
+    assert (payload["heartbeat_at"], payload["runner_id"]) == ("t1", "r-1")
+
+    assert not apply_execution_progress_events(dict(payload), [{"type": "status", "status": "succeeded", "terminal": True}])
+    assert not apply_execution_progress_events(dict(payload), [{"type": "status", "status": "pending"}])
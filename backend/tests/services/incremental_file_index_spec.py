@@ -0,0 +1,277 @@
+import os
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.services import incremental_file_index as engine
+from backend.app.services.incremental_file_index import (
+    FileManifest,
+    detect_changes,
+    stream_incremental_index,
+)
+from backend.app.services.content_vault_indexer import ContentVaultIndexer
+from backend.app.services.local_folder_indexer import LocalFolderIndexer
+
+
+def _write(path, text, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_detect_changes_skips_unchanged_stat_without_reading(tmp_path, monkeypatch):
+    root = tmp_path / "vault"
+    _write(root / "a.md", "alpha", mtime=1_000_000_000)
+    _write(root / "b.md", "beta", mtime=1_000_000_000)
+    manifest = FileManifest(tmp_path / "manifest.json")
+    first = detect_changes(root, sorted(root.glob("*.md")), manifest)
+    for change in first.changes:
+        manifest.record(
+            change.rel_path,
+            mtime_ns=change.mtime_ns,
+            size=change.size,
+            content_hash=change.content_hash,
+        )
+
+    reads = []
+    original_read = engine._read_text
+    monkeypatch.setattr(
+        engine, "_read_text", lambda path: reads.append(path.name) or original_read(path)
+    )
+    _write(root / "a.md", "alpha", mtime=2_000_000_000)
+    (root / "b.md").unlink()
+    _write(root / "c.md", "gamma")
+
+    second = detect_changes(root, sorted(root.glob("*.md")), manifest)
+
+    assert [change.rel_path for change in first.changes] == ["a.md", "b.md"]
+    assert sorted(reads) == ["a.md", "c.md"]
+    assert [change.rel_path for change in second.changes] == ["c.md"]
+    assert second.changes[0].is_new is True
+    assert second.unchanged == 1
+    assert second.deleted == ["b.md"]
+    assert manifest.get("a.md").mtime_ns == 2_000_000_000
+
+
+@pytest.mark.asyncio
+async def test_stream_records_successes_and_tombstones_removed(tmp_path):
+    root = tmp_path / "docs"
+    for name in ("a", "b", "c"):
+        _write(root / f"{name}.md", name)
+    manifest_path = tmp_path / "manifest.json"
+    manifest = FileManifest(manifest_path)
+    manifest.record("gone.md", mtime_ns=1, size=1, content_hash="x", annotations={"source_id": "s-gone"})
+    batches = []
+    removed = []
+
+    async def index_batch(changes):
+        batches.append([change.rel_path for change in changes])
+        for change in changes:
+            change.annotations["source_id"] = f"s-{change.rel_path}"
+        return ["boom" if change.rel_path == "b.md" else None for change in changes]
+
+    async def remove(rel_path, annotations):
+        removed.append((rel_path, annotations["source_id"]))
+
+    events = [
+        event
+        async for event in stream_incremental_index(
+            root,
+            sorted(root.glob("*.md")),
+            manifest,
+            index_batch=index_batch,
+            remove=remove,
+            batch_size=2,
+            workers=2,
+        )
+    ]
+
+    assert sorted(sum(batches, [])) == ["a.md", "b.md", "c.md"]
+    assert all(len(batch) <= 2 for batch in batches)
+    assert removed == [("gone.md", "s-gone")]
+    assert events[0]["type"] == "scan"
+    assert events[-1] == {
+        "type": "complete",
+        "files_found": 3,
+        "files_changed": 3,
+        "files_unchanged": 0,
+        "files_deleted": 1,
+        "files_indexed": 2,
+        "files_skipped": 0,
+        "files_failed": 1,
+        "files_removed": 1,
+    }
+    reloaded = FileManifest(manifest_path)
+    assert sorted(reloaded.live_paths()) == ["a.md", "c.md"]
+    assert reloaded.get("gone.md").tombstoned_at is not None
+    assert reloaded.get("a.md").annotations == {"source_id": "s-a.md"}
+
+
+def test_detect_changes_treats_another_embedding_model_as_changed(tmp_path):
+    root = tmp_path / "docs"
+    _write(root / "a.md", "alpha", mtime=1_000_000_000)
+    manifest = FileManifest(None)
+    manifest.record(
+        "a.md",
+        mtime_ns=1_000_000_000,
+        size=5,
+        content_hash=engine.sha256_text("alpha"),
+        embedding_model="ollama:bge-m3",
+    )
+
+    same = detect_changes(root, [root / "a.md"], manifest, embedding_model="ollama:bge-m3")
+    other = detect_changes(
+        root, [root / "a.md"], manifest, embedding_model="ollama:nomic-embed-text"
+    )
+
+    assert same.changes == [] and same.unchanged == 1
+    assert [change.rel_path for change in other.changes] == ["a.md"]
+    assert other.changes[0].is_new is False
+
+
+def test_expired_tombstones_are_pruned_on_save(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest = FileManifest(manifest_path)
+    for name in ("old.md", "recent.md", "live.md"):
+        manifest.record(name, mtime_ns=1, size=1, content_hash="x")
+    manifest.tombstone("old.md")
+    manifest.tombstone("recent.md")
+    manifest.entries["old.md"].tombstoned_at = "2000-01-01T00:00:00+00:00"
+
+    manifest.save()
+
+    reloaded = FileManifest(manifest_path)
+    assert sorted(reloaded.entries) == ["live.md", "recent.md"]
+    assert reloaded.prune_tombstones(timedelta(0)) == 1
+    assert sorted(reloaded.entries) == ["live.md"]
+
+
+class FakeFacade:
+    def __init__(self):
+        self.replaced = []
+        self.revoked = []
+
+    async def replace_document(self, **kwargs):
+        self.replaced.append(kwargs)
+
+    def revoke_document(self, **kwargs):
+        self.revoked.append(kwargs["source_id"])
+
+
+class FakeGenerator:
+    def __init__(self):
+        self.calls = []
+        self.model = "ollama:bge-m3"
+
+    async def embedding_model_signature(self):
+        return self.model
+
+    async def generate_embeddings_batch(self, texts, *, is_query=True):
+        self.calls.append(list(texts))
+        return [SimpleNamespace(embedding=(0.5, 0.5), model="bge-m3") for _ in texts]
+
+
+@pytest.mark.asyncio
+async def test_local_folder_indexer_reindexes_only_changed_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+    folder = tmp_path / "notes"
+    _write(folder / "one.md", "first note")
+    _write(folder / "two.txt", "second note")
+    generator = FakeGenerator()
+    vector_service = SimpleNamespace(
+        embedding_generator=generator, _get_connection=lambda: None
+    )
+    indexer = LocalFolderIndexer(
+        vector_service=vector_service,
+        workspace_id="ws-1",
+        access_context=object(),
+    )
+    facade = FakeFacade()
+    indexer.projection_facade = facade
+
+    first = await indexer.index_folder(str(folder))
+    _write(folder / "one.md", "first note, edited")
+    (folder / "two.txt").unlink()
+    second = await indexer.index_folder(str(folder))
+
+    assert first["files_indexed"] == 2
+    assert first["chunks_created"] == 2
+    assert sorted(generator.calls[0]) == ["first note", "second note"]
+    assert second["files_indexed"] == 1
+    assert second["files_removed"] == 1
+    assert generator.calls[1] == ["first note, edited"]
+    assert facade.revoked == [str((folder / "two.txt").resolve())]
+    chunk = facade.replaced[-1]["chunks"][0]
+    assert chunk.embedding == (0.5, 0.5)
+    assert chunk.metadata["embedding_model"] == "bge-m3"
+
+
+@pytest.mark.asyncio
+async def test_local_folder_indexer_reindexes_on_model_change_and_revokes_emptied_files(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+    folder = tmp_path / "notes"
+    _write(folder / "one.md", "first note")
+    _write(folder / "two.md", "second note")
+    generator = FakeGenerator()
+    indexer = LocalFolderIndexer(
+        vector_service=SimpleNamespace(
+            embedding_generator=generator, _get_connection=lambda: None
+        ),
+        workspace_id="ws-1",
+        access_context=object(),
+    )
+    facade = FakeFacade()
+    indexer.projection_facade = facade
+
+    await indexer.index_folder(str(folder))
+    unchanged = await indexer.index_folder(str(folder))
+    generator.model = "ollama:nomic-embed-text"
+    _write(folder / "two.md", "")
+    switched = await indexer.index_folder(str(folder))
+
+    assert unchanged["files_indexed"] == 0
+    assert switched["files_indexed"] == 2
+    assert generator.calls[-1] == ["first note"]
+    assert facade.revoked == [str((folder / "two.md").resolve())]
+
+
+@pytest.mark.asyncio
+async def test_content_vault_skips_posts_outside_the_series_and_revokes_moved_ones(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+    vault = tmp_path / "vault"
+    _write(vault / "series" / "alpha.md", "---\nseries_id: alpha\n---\n")
+    _write(vault / "posts" / "instagram" / "one.md", "---\nseries_id: alpha\n---\none")
+    _write(vault / "posts" / "instagram" / "two.md", "---\nseries_id: draft\n---\ntwo")
+    indexer = ContentVaultIndexer(
+        vector_service=SimpleNamespace(
+            embedding_generator=FakeGenerator(), _get_connection=lambda: None
+        ),
+        workspace_id="ws-1",
+        access_context=object(),
+    )
+    facade = FakeFacade()
+    indexer.projection_facade = facade
+
+    first = await indexer.index_all_series(str(vault))
+    _write(vault / "posts" / "instagram" / "one.md", "---\nseries_id: draft\n---\none!")
+    moved = await indexer.index_all_series(str(vault))
+    _write(vault / "series" / "draft.md", "---\nseries_id: draft\n---\n")
+    adopted = await indexer.index_all_series(str(vault))
+
+    assert first["total_posts"] == 1
+    assert [call["source_id"] for call in facade.replaced[:1]] == ["alpha:one"]
+    assert moved["total_posts"] == 0
+    assert moved["posts_removed"] == 1
+    assert facade.revoked == ["alpha:one"]
+    # Skipped posts never entered the manifest, so a new series picks them up.
+    assert adopted["total_posts"] == 2
+    assert sorted(call["source_id"] for call in facade.replaced[1:]) == [
+        "draft:one",
+        "draft:two",
+    ]
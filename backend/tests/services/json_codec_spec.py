@@ -0,0 +1,113 @@
+import json
+import math
+from datetime import datetime
+from uuid import uuid4
+
+import psycopg2.extensions
+import pytest
+
+from backend.app.services import json_codec
+from backend.app.services.json_codec import (
+    contains_json_nul,
+    dumps_json,
+    loads_json,
+    register_psycopg2_json_typecasters,
+)
+from backend.app.services.stores.postgres_base import PostgresStoreBase
+
+EXECUTION_CONTEXT = {
+    "status": "running",
+    "playbook_code": "ig_weekly_report",
+    "current_step_index": 3,
+    "step_outputs": {"fetch": {"rows": [{"id": i, "caption": "café ☕"} for i in range(5)]}},
+    "literal": "keeps \\u0000 text",
+}
+EXECUTION_CONTEXT_TEXT = json.dumps(EXECUTION_CONTEXT)
+
+
+def _count_replacements(monkeypatch):
+    calls = []
+    original = json_codec.replace_json_nul_codepoints
+
+    def counting(value):
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(json_codec, "replace_json_nul_codepoints", counting)
+    return calls
+
+
+def test_clean_payloads_round_trip_without_a_copy(monkeypatch):
+    calls = _count_replacements(monkeypatch)
+
+    encoded = dumps_json({"status": "ok", "count": 2})
+
+    assert json.loads(encoded) == {"status": "ok", "count": 2}
+    assert loads_json(encoded) == {"status": "ok", "count": 2}
+    assert calls == []
+
+
+def test_real_nul_is_replaced_and_literal_escape_is_kept():
+    encoded = dumps_json({"bad\x00key": ["x\x00"], "literal": "keeps \\u0000 text"})
+
+    assert json.loads(encoded) == {
+        "bad\ufffdkey": ["x\ufffd"],
+        "literal": "keeps \\u0000 text",
+    }
+    assert loads_json('{"a": "x\\u0000", "b": "\\\\u0000"}') == {
+        "a": "x\ufffd",
+        "b": "\\u0000",
+    }
+    assert loads_json(EXECUTION_CONTEXT_TEXT) == EXECUTION_CONTEXT
+    assert contains_json_nul({"a": [{"b": "x\x00"}]})
+    assert not contains_json_nul(EXECUTION_CONTEXT)
+
+
+def test_stdlib_semantics_are_kept_for_edge_values():
+    assert json.loads(dumps_json({1: 2 ** 70})) == {"1": 2 ** 70}
+    assert loads_json("[NaN]")[0] != loads_json("[NaN]")[0]
+    with pytest.raises(json.JSONDecodeError):
+        loads_json("{not json")
+
+    store = object.__new__(PostgresStoreBase)
+    with pytest.raises(ValueError):
+        store.serialize_json({"at": datetime(2026, 1, 1)})
+    assert store.deserialize_json("{not json", default={"d": 1}) == {"d": 1}
+
+
+def test_non_finite_floats_are_encoded_like_the_stdlib():
+    value = {"x": float("nan"), "y": [float("inf"), -float("inf")]}
+
+    assert dumps_json(value) == json.dumps(value)
+    assert math.isnan(loads_json(dumps_json(value))["x"])
+
+
+def test_types_the_stdlib_rejects_still_raise():
+    with pytest.raises(TypeError):
+        dumps_json({"u": uuid4()})
+
+    store = object.__new__(PostgresStoreBase)
+    with pytest.raises(ValueError):
+        store.serialize_json({"u": uuid4()})
+
+
+def test_decoded_values_are_only_copied_when_they_hold_nul():
+    register_psycopg2_json_typecasters()
+    store = object.__new__(PostgresStoreBase)
+    clean = {"a": ["b"]}
+
+    assert store.deserialize_json(clean) is clean
+    # In-memory values are scanned even with the typecasters registered.
+    assert store.deserialize_json({"a": "x\x00"}) == {"a": "x\ufffd"}
+    assert store.deserialize_json([{"b\x00": 1}]) == [{"b\ufffd": 1}]
+
+
+def test_psycopg2_typecasters_decode_jsonb_with_the_codec():
+    assert register_psycopg2_json_typecasters()
+    assert register_psycopg2_json_typecasters()
+
+    jsonb = psycopg2.extensions.string_types[3802]
+    json_type = psycopg2.extensions.string_types[114]
+
+    assert jsonb('{"a": "x\\u0000"}', None) == {"a": "x\ufffd"}
+    assert json_type(EXECUTION_CONTEXT_TEXT, None) == EXECUTION_CONTEXT
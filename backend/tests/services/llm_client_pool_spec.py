@@ -0,0 +1,125 @@
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.services.llm_providers import ollama as ollama_module
+from backend.app.services.llm_providers.base import collect_stream, iter_chat_deltas
+from backend.app.services.llm_providers.client_pool import LLMClientRegistry
+from backend.app.services.llm_providers.ollama import OllamaProvider
+
+
+def _chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class _FakeStream:
+    def __init__(self, contents):
+        self._chunks = [_chunk(content) for content in contents]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _FakeCompletions:
+    def __init__(self, contents):
+        self.contents = contents
+        self.requests = []
+
+    async def create(self, **params):
+        self.requests.append(params)
+        return _FakeStream(self.contents)
+
+
+class _FakeRegistry:
+    def __init__(self, contents):
+        self.completions = _FakeCompletions(contents)
+        self.lookups = []
+
+    def get_openai_client(self, api_key, base_url=None):
+        self.lookups.append((api_key, base_url))
+        return SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_one_client_per_endpoint_and_loop():
+    registry = LLMClientRegistry()
+    registry.bind_running_loop()
+
+    first = registry.get_openai_client("key", base_url="http://localhost:11434/v1")
+    again = registry.get_openai_client("key", base_url="http://localhost:11434/v1")
+    other = registry.get_openai_client("key", base_url="http://localhost:8080/v1")
+
+    assert first is again
+    assert first is not other
+
+    await registry.aclose()
+
+
+def test_registry_does_not_share_clients_across_event_loops():
+    registry = LLMClientRegistry()
+
+    async def _lookup():
+        registry.bind_running_loop()
+        client = registry.get_openai_client("key", base_url="http://localhost/v1")
+        await registry.aclose()
+        return client
+
+    assert asyncio.run(_lookup()) is not asyncio.run(_lookup())
+    assert registry._clients == {}
+
+
+def test_unbound_loops_get_unpooled_clients_and_leave_nothing_behind():
+    registry = LLMClientRegistry()
+
+    async def _lookup():
+        first = registry.get_openai_client("key", base_url="http://localhost/v1")
+        again = registry.get_openai_client("key", base_url="http://localhost/v1")
+        return first is again
+
+    for _ in range(5):
+        assert asyncio.run(_lookup()) is False
+    gc.collect()
+
+    assert registry._clients == {}
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_pooled_clients_and_unbinds_the_loop():
+    registry = LLMClientRegistry()
+    registry.bind_running_loop()
+    client = registry.get_openai_client("key", base_url="http://localhost/v1")
+
+    await registry.aclose()
+
+    assert client.is_closed()
+    assert registry.get_openai_client("key", base_url="http://localhost/v1") is not client
+    assert registry._clients == {}
+
+
+@pytest.mark.asyncio
+async def test_stream_deltas_skip_empty_chunks_and_join_once():
+    stream = _FakeStream(["Hel", None, "", "lo"])
+
+    assert await collect_stream(iter_chat_deltas(stream)) == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_ollama_uses_pooled_client_for_both_completion_paths(monkeypatch):
+    registry = _FakeRegistry(["a", "b", "c"])
+    monkeypatch.setattr(ollama_module, "get_llm_client_registry", lambda: registry)
+    provider = OllamaProvider(base_url="http://ollama:11434")
+    messages = [{"role": "user", "content": "hi"}]
+
+    text = await provider.chat_completion(messages, model="llama3", stream=True)
+    streamed = [chunk async for chunk in provider.chat_completion_stream(messages, model="llama3")]
+
+    assert text == "abc"
+    assert streamed == ["a", "b", "c"]
+    assert registry.lookups == [("ollama", "http://ollama:11434/v1")] * 2
+    assert all(request["stream"] for request in registry.completions.requests)
@@ -0,0 +1,251 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.models.workspace import TaskStatus, TimelineItemType
+from backend.app.services import mindscape_graph_changes as changes
+from backend.app.services import mindscape_graph_derivation as derivation
+from backend.app.services.mindscape_graph_changes import (
+    GRAPH_CHANGE_TASK,
+    GRAPH_CHANGE_TIMELINE,
+    record_graph_change,
+)
+from backend.app.services.mindscape_graph_materialized import (
+    MindscapeGraphMaterializer,
+)
+from backend.app.services.mindscape_graph_models import EdgeType, MindscapeGraph
+
+_BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._ops = []
+
+    def sadd(self, key, member):
+        self._ops.append(lambda: self._client.sets.setdefault(key, set()).add(member))
+
+    def incr(self, key):
+        def _incr():
+            self._client.values[key] = int(self._client.values.get(key, 0)) + 1
+            return self._client.values[key]
+
+        self._ops.append(_incr)
+
+    def get(self, key):
+        self._ops.append(lambda: self._client.values.get(key))
+
+    def smembers(self, key):
+        self._ops.append(lambda: set(self._client.sets.get(key, set())))
+
+    def execute(self):
+        return [op() for op in self._ops]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(members)
+
+
+class _FakeCache:
+    def __init__(self, client):
+        self._client = client
+
+    def _ensure_connected(self):
+        return self._client is not None
+
+
+class _FragmentStore:
+    def __init__(self):
+        self.fragments = {}
+        self.saves = 0
+
+    def get_fragment(self, workspace_id):
+        return self.fragments.get(workspace_id)
+
+    def save_fragment(self, fragment):
+        self.saves += 1
+        self.fragments[fragment.workspace_id] = fragment
+
+
+class _TimelineStore:
+    def __init__(self, items):
+        self.items = {item.id: item for item in items}
+        self.calls = []
+
+    def list_timeline_items_by_workspace(self, workspace_id, limit=None):
+        self.calls.append(("list", workspace_id))
+        items = [item for item in self.items.values() if item.workspace_id == workspace_id]
+        return sorted(items, key=lambda item: item.created_at, reverse=True)[:limit]
+
+    def list_timeline_items_by_ids(self, item_ids):
+        self.calls.append(("by_ids", tuple(item_ids)))
+        return [self.items[item_id] for item_id in item_ids if item_id in self.items]
+
+
+class _TasksStore:
+    def __init__(self, tasks):
+        self.tasks = {task.id: task for task in tasks}
+        self.calls = []
+
+    def get_task(self, task_id):
+        raise AssertionError("derivation must batch task lookups")
+
+    def get_tasks_by_ids(self, task_ids):
+        self.calls.append(("by_ids", tuple(task_ids)))
+        return [self.tasks[task_id] for task_id in task_ids if task_id in self.tasks]
+
+    def list_tasks_by_workspace(self, workspace_id, limit=None):
+        self.calls.append(("list", workspace_id))
+        return [task for task in self.tasks.values() if task.workspace_id == workspace_id]
+
+
+def _item(index, task_id=None, workspace_id="ws-1"):
+    return SimpleNamespace(
+        id=f"ti-{index}",
+        workspace_id=workspace_id,
+        message_id=f"msg-{index}",
+        task_id=task_id,
+        type=TimelineItemType.INTENT_SEEDS,
+        title=f"Intent {index}",
+        summary=None,
+        data={},
+        created_at=_BASE + timedelta(minutes=index),
+    )
+
+
+def _task(task_id, status=TaskStatus.RUNNING, workspace_id="ws-1"):
+    return SimpleNamespace(
+        id=task_id,
+        workspace_id=workspace_id,
+        execution_id=f"exec-{task_id}",
+        task_type="playbook_execution",
+        pack_id="pack",
+        status=status,
+        result=None,
+        execution_context={"playbook_code": "pb_demo"},
+        params={},
+        completed_at=None,
+        error=None,
+        created_at=_BASE,
+        project_id=None,
+    )
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = _FakeRedis()
+    monkeypatch.setattr(changes, "get_cache_service", lambda: _FakeCache(client))
+    return client
+
+
+def test_timeline_derivation_batches_tasks_and_indexes_spawn_edges():
+    tasks = _TasksStore([_task("task-1"), _task("task-2")])
+    timeline = _TimelineStore(
+        [_item(1, "task-1"), _item(2, "task-2"), _item(3, "task-1"), _item(4)]
+    )
+    graph = MindscapeGraph()
+
+    graph.nodes.extend(derivation.list_timeline_nodes("ws-1", timeline, tasks))
+    graph.nodes.extend(derivation.list_execution_nodes("ws-1", tasks))
+    derivation.derive_edges(graph)
+
+    assert tasks.calls[0] == ("by_ids", ("task-1", "task-2"))
+    spawns = {
+        (edge.from_id, edge.to_id) for edge in graph.edges if edge.type is EdgeType.SPAWNS
+    }
+    assert spawns == {
+        ("intent:ti-1", "execution:exec-task-1"),
+        ("intent:ti-3", "execution:exec-task-1"),
+        ("intent:ti-2", "execution:exec-task-2"),
+    }
+    assert sum(edge.type is EdgeType.TEMPORAL for edge in graph.edges) == 3
+
+
+def test_materializer_serves_fragment_until_a_change_is_recorded(redis_client):
+    tasks = _TasksStore([_task("task-1"), _task("task-2")])
+    timeline = _TimelineStore([_item(1, "task-1"), _item(2, "task-2")])
+    fragments = _FragmentStore()
+    materializer = MindscapeGraphMaterializer(
+        fragment_store=fragments, timeline_store=timeline, tasks_store=tasks
+    )
+
+    first, version = materializer.load_workspace_nodes("ws-1")
+    assert version == 0 and fragments.saves == 1
+    timeline.calls.clear()
+    tasks.calls.clear()
+
+    cached, cached_version = materializer.load_workspace_nodes("ws-1")
+    assert [node.id for node in cached] == [node.id for node in first]
+    assert cached_version == 0
+    assert timeline.calls == [] and tasks.calls == []
+
+    tasks.tasks["task-1"].status = TaskStatus.SUCCEEDED
+    assert record_graph_change("ws-1", GRAPH_CHANGE_TASK, "task-1")
+    timeline.items["ti-3"] = _item(3, "task-2")
+    assert record_graph_change("ws-1", GRAPH_CHANGE_TIMELINE, "ti-3")
+
+    patched, patched_version = materializer.load_workspace_nodes("ws-1")
+
+    assert patched_version == 2
+    assert ("list", "ws-1") not in timeline.calls + tasks.calls
+    assert tasks.calls[0] == ("by_ids", ("task-1",))
+    by_id = {node.id: node for node in patched}
+    assert by_id["execution:exec-task-1"].metadata["status"] == "succeeded"
+    assert by_id["intent:ti-3"].metadata["linked_playbook_codes"] == ["pb_demo"]
+    assert [node.id for node in patched if node.type == "intent"] == [
+        "intent:ti-3",
+        "intent:ti-2",
+        "intent:ti-1",
+    ]
+    assert redis_client.sets[changes.graph_changes_key("ws-1")] == set()
+    assert fragments.fragments["ws-1"].version == 2
+
+
+def test_materializer_rederives_when_redis_is_unavailable(monkeypatch):
+    monkeypatch.setattr(changes, "get_cache_service", lambda: _FakeCache(None))
+    tasks = _TasksStore([_task("task-1")])
+    timeline = _TimelineStore([_item(1, "task-1")])
+    fragments = _FragmentStore()
+    materializer = MindscapeGraphMaterializer(
+        fragment_store=fragments, timeline_store=timeline, tasks_store=tasks
+    )
+
+    assert not record_graph_change("ws-1", GRAPH_CHANGE_TASK, "task-1")
+    for _ in range(2):
+        nodes, version = materializer.load_workspace_nodes("ws-1")
+        assert version == 0
+        assert len(nodes) == 2
+    assert timeline.calls.count(("list", "ws-1")) == 2
+    assert fragments.saves == 0
+
+
+@pytest.mark.asyncio
+async def test_scope_version_sums_workspace_versions(redis_client):
+    tasks = _TasksStore([_task("task-1"), _task("task-2", workspace_id="ws-2")])
+    timeline = _TimelineStore([_item(1, "task-1"), _item(2, "task-2", "ws-2")])
+    materializer = MindscapeGraphMaterializer(
+        fragment_store=_FragmentStore(), timeline_store=timeline, tasks_store=tasks
+    )
+    record_graph_change("ws-1", GRAPH_CHANGE_TASK, "task-1")
+    record_graph_change("ws-2", GRAPH_CHANGE_TASK, "task-2")
+    record_graph_change("ws-2", GRAPH_CHANGE_TIMELINE, "ti-2")
+
+    nodes, version = await materializer.load_scope_nodes(["ws-1", "ws-2"])
+
+    assert version == 3
+    assert [node.id for node in nodes] == [
+        "intent:ti-1",
+        "execution:exec-task-1",
+        "intent:ti-2",
+        "execution:exec-task-2",
+    ]
@@ -0,0 +1,208 @@
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+
+from backend.app.models.mindscape import EventType
+from backend.app.services import obsidian_note_retraction as retraction
+from backend.app.services.obsidian_scanner import ObsidianScanner
+from backend.app.services.obsidian_sync_service import ObsidianSyncService
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+class _FakeEventsStore:
+    def __init__(self, event_ids):
+        self.event_ids = list(event_ids)
+        self.statements = []
+        self.created = []
+
+    @contextmanager
+    def get_connection(self):
+        yield self
+
+    @contextmanager
+    def transaction(self):
+        yield self
+
+    def execute(self, statement, params):
+        sql = str(statement)
+        self.statements.append((sql, params))
+        if sql.lstrip().startswith("SELECT"):
+            return _Result([(event_id,) for event_id in self.event_ids])
+        return _Result([])
+
+    def create_events(self, events, generate_embedding=False):
+        self.created.append((generate_embedding, list(events)))
+        return events
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        if self.conn.fail:
+            raise RuntimeError("vector db unavailable")
+        self.conn.deleted.append((sql, params))
+        self.rowcount = len(params[0])
+
+
+class _FakeVectorConnection:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.deleted = []
+        self.committed = False
+        self.rolled_back = False
+        self.closed = False
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def vector_conn(monkeypatch):
+    conn = _FakeVectorConnection()
+    monkeypatch.setattr(
+        "backend.app.database.vector_connection.get_vector_dbapi_connection",
+        lambda: conn,
+    )
+    return conn
+
+
+def test_retract_deleted_notes_revokes_embeddings_and_keeps_history(vector_conn):
+    store = _FakeEventsStore(["evt-1", "evt-2"])
+
+    retracted = retraction.retract_deleted_notes(
+        store, "/vault", ["a.md"], profile_id="profile-1"
+    )
+
+    assert retracted == 2
+    select_sql, select_params = store.statements[0]
+    assert "payload->>'note_path' = ANY(:note_paths)" in select_sql
+    assert select_params["vault_path"] == "/vault"
+    assert select_params["note_paths"] == ["a.md"]
+    tables = [sql for sql, _ in vector_conn.deleted]
+    assert "memory_embeddings" in tables[0]
+    assert "mindscape_personal" in tables[1]
+    assert all(params == (["evt-1", "evt-2"],) for _, params in vector_conn.deleted)
+    assert vector_conn.committed and vector_conn.closed
+    assert not any("DELETE" in sql for sql, _ in store.statements)
+    assert store.event_ids == ["evt-1", "evt-2"]
+    ((generate_embedding, tombstones),) = store.created
+    assert generate_embedding is False
+    (tombstone,) = tombstones
+    assert tombstone.event_type == EventType.OBSIDIAN_NOTE_DELETED
+    assert tombstone.payload == {"note_path": "a.md", "vault_path": "/vault"}
+    assert tombstone.profile_id == "profile-1"
+
+
+def test_retract_deleted_notes_keeps_events_when_embeddings_fail(vector_conn):
+    vector_conn.fail = True
+    store = _FakeEventsStore(["evt-1"])
+
+    with pytest.raises(RuntimeError):
+        retraction.retract_deleted_notes(store, "/vault", ["a.md"])
+
+    assert vector_conn.rolled_back and vector_conn.closed
+    assert not any("DELETE" in sql for sql, _ in store.statements)
+    assert store.created == []
+
+
+def test_sync_tombstones_deleted_notes_only_after_retraction(tmp_path, monkeypatch):
+    scanner = ObsidianScanner(str(tmp_path), include_tags=[])
+    for rel_path in ("kept.md", "gone.md"):
+        scanner.manifest.record(rel_path, mtime_ns=1, size=1, content_hash="h")
+    scanner.deleted_notes = ["gone.md"]
+    scanner.scan_vault = lambda: []
+
+    service = ObsidianSyncService.__new__(ObsidianSyncService)
+    service.events_store = object()
+    service.create_scanners = lambda: {str(tmp_path): scanner}
+    calls = []
+
+    def failing_retract(events_store, vault_path, note_paths, **kwargs):
+        calls.append(list(note_paths))
+        raise RuntimeError("core db unavailable")
+
+    monkeypatch.setattr(
+        "backend.app.services.obsidian_sync_service.retract_deleted_notes",
+        failing_retract,
+    )
+    asyncio.run(service.sync_vaults())
+    assert calls == [["gone.md"]]
+    assert scanner.manifest.get("gone.md").live
+
+    monkeypatch.setattr(
+        "backend.app.services.obsidian_sync_service.retract_deleted_notes",
+        lambda events_store, vault_path, note_paths, **kwargs: calls.append(
+            list(note_paths)
+        ),
+    )
+    asyncio.run(service.sync_vaults())
+    assert calls[-1] == ["gone.md"]
+    assert not scanner.manifest.get("gone.md").live
+    assert scanner.manifest.live_paths() == ["kept.md"]
+
+
+def test_sync_writes_scanned_notes_as_one_batch_per_embedding_flag():
+    class _BatchStore:
+        def __init__(self):
+            self.batches = []
+
+        def create_events(self, events, generate_embedding=False):
+            self.batches.append(
+                (generate_embedding, [event.payload["note_path"] for event in events])
+            )
+            return events
+
+    def _note(note_path, should_embed):
+        return {
+            "note_path": note_path,
+            "modified": "2026-10-17T08:00:00",
+            "content": note_path,
+            "should_embed": should_embed,
+        }
+
+    service = ObsidianSyncService.__new__(ObsidianSyncService)
+    service.events_store = _BatchStore()
+
+    asyncio.run(
+        service._create_events_from_scan(
+            [
+                _note("a.md", True),
+                {"note_path": "bad.md"},
+                _note("b.md", False),
+                _note("c.md", True),
+            ],
+            "profile-1",
+            "/vault",
+        )
+    )
+
+    assert service.events_store.batches == [
+        (True, ["a.md", "c.md"]),
+        (False, ["b.md"]),
+    ]
@@ -0,0 +1,147 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.services.conversation.context_builder.builder_core import (
+    qa_context as qa_module,
+)
+from backend.app.services.conversation.context_builder.builder_core.qa_context import (
+    QAContextMixin,
+)
+
+
+class _SideChain:
+    def __init__(self):
+        self.counts = []
+
+    def should_include_side_chain(self, thread_context_count, **kwargs):
+        self.counts.append(thread_context_count)
+        return True
+
+    def build_workspace_side_chain_context(self, workspace_id):
+        return ["side-chain"]
+
+
+class _Builder(QAContextMixin):
+    def __init__(self, delays=None, governance_packet=None):
+        self.delays = delays or {}
+        self.governance_packet = governance_packet
+        self.store = object()
+        self.preset = {
+            "MAX_EVENTS_FOR_QUERY": 10,
+            "MAX_HISTORY_MESSAGES": 10,
+            "MAX_MESSAGE_CHARS": 100,
+        }
+        self.side_chain_handler = _SideChain()
+        self.memory_packet_compiler = SimpleNamespace(
+            compile_for_context=lambda packet: "packet",
+            build_route_plan=lambda packet, **kwargs: "route",
+        )
+        self.memory_retriever = SimpleNamespace(
+            get_long_term_memory_context=self._section("long_term_memory", "memory")
+        )
+        self.conversation_history_manager = SimpleNamespace(
+            get_conversation_history_with_summary=self._section(
+                "conversation_history", (["User: hi", "Assistant: hello"], None)
+            )
+        )
+
+    def _section(self, name, value):
+        async def _build(*args, **kwargs):
+            await asyncio.sleep(self.delays.get(name, 0))
+            return value
+
+        return _build
+
+    async def _load_governance_context_packet(self, **kwargs):
+        return await self._section("governance_packet", self.governance_packet)()
+
+    async def _build_layered_memory_context(self, *args):
+        return await self._section("layered_memory", ["layered"])()
+
+    def _build_workspace_metadata_context(self, workspace, workspace_id):
+        return ["metadata"]
+
+    async def _build_active_intents_context(self, profile_id):
+        return await self._section("active_intents", ["intents"])()
+
+    async def _build_current_tasks_context(self, workspace_id, thread_id):
+        return await self._section("current_tasks", ["tasks"])()
+
+    async def _build_recent_files_context(self, workspace_id):
+        return await self._section("recent_files", ["files"])()
+
+    async def _build_timeline_context(self, workspace_id, thread_id):
+        return await self._section("timeline", ["timeline"])()
+
+    async def _build_thread_references_context(self, workspace_id, thread_id):
+        return await self._section("thread_references", ["references"])()
+
+
+@pytest.fixture(autouse=True)
+def tool_context(monkeypatch):
+    async def _build_tool_context_section(message, workspace_id):
+        return ["tools"]
+
+    monkeypatch.setattr(qa_module, "build_tool_context_section", _build_tool_context_section)
+
+
+@pytest.mark.asyncio
+async def test_sections_run_concurrently_and_keep_their_order():
+    names = ["active_intents", "current_tasks", "recent_files", "timeline", "long_term_memory"]
+    builder = _Builder(delays={name: 0.2 for name in names})
+
+    started = time.perf_counter()
+    context = await builder.build_qa_context("ws-1", "question", thread_id="t-1")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.6
+    assert context.split("\n") == [
+        "layered",
+        "metadata",
+        "intents",
+        "tasks",
+        "files",
+        "timeline",
+        "references",
+        "",
+        "## Recent Conversation:",
+        "User: hi",
+        "Assistant: hello",
+        "side-chain",
+        "",
+        "## Long-term Knowledge:",
+        "memory",
+        "tools",
+    ]
+    assert builder.side_chain_handler.counts == [2]
+    assert set(builder.last_qa_context_timings) >= set(names) | {"side_chain"}
+    assert builder.last_qa_context_timings["timeline"] >= 200
+
+
+@pytest.mark.asyncio
+async def test_governance_packet_replaces_layered_memory():
+    builder = _Builder(governance_packet={"route": "packet"})
+
+    context = await builder.build_qa_context("ws-1", "question")
+
+    assert "layered" not in context
+    assert context.startswith("\n## Governance Context Packet:\npacket")
+    assert "## Semantic Memory Hits:\nmemory" in context
+    assert "layered_memory" not in builder.last_qa_context_timings
+
+
+@pytest.mark.asyncio
+async def test_section_past_its_budget_degrades_to_empty(monkeypatch):
+    monkeypatch.setenv("QA_CONTEXT_SECTION_TIMEOUT_SECONDS", "0.05")
+    builder = _Builder(delays={"recent_files": 5, "long_term_memory": 5})
+
+    started = time.perf_counter()
+    context = await builder.build_qa_context("ws-1", "question")
+
+    assert time.perf_counter() - started < 1
+    assert "files" not in context
+    assert "Long-term Knowledge" not in context
+    assert "timeline" in context and "tools" in context
@@ -0,0 +1,221 @@
+import asyncio
+
+import pytest
+
+import backend.app.services.tool_rag as tool_rag
+from backend.app.services.cache.result_cache import (
+    LruTtlCache,
+    RedisResultTier,
+    ResultCache,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def incr(self, key):
+        self.values[key] = str(int(self.values.get(key) or 0) + 1)
+
+
+def _shared_tier(redis):
+    async def factory():
+        return redis
+
+    return RedisResultTier(factory)
+
+
+def test_lru_keeps_hot_keys_and_expires_by_ttl():
+    clock = _Clock()
+    cache = LruTtlCache(2, ttl_seconds=10, clock=clock)
+    cache.set("hot", 1)
+    cache.set("cold", 2)
+    assert cache.get("hot") == 1
+
+    cache.set("new", 3)
+    clock.now = 5
+    assert cache.get("cold") is None
+    assert cache.get("hot") == 1
+
+    clock.now = 11
+    assert cache.get("new") is None
+    assert cache.stats() == {
+        "entries": 1,
+        "hits": 2,
+        "misses": 2,
+        "expirations": 1,
+        "evictions": 1,
+        "hit_ratio": 0.5,
+    }
+
+
+def test_scope_invalidation_keeps_other_scopes():
+    async def scenario():
+        cache = ResultCache("spec")
+        await cache.set("q", ["a"], scope="ws-a")
+        await cache.set("q", ["b"], scope="ws-b")
+        cache.invalidate(scope="ws-a")
+        scoped = (await cache.get("q", scope="ws-a"), await cache.get("q", scope="ws-b"))
+        cache.invalidate()
+        return scoped, await cache.get("q", scope="ws-b"), cache.stats()
+
+    scoped, after_global, stats = asyncio.run(scenario())
+
+    assert scoped == (None, ["b"])
+    assert after_global is None
+    assert stats["lookups"] == 3
+    assert stats["memory_hits"] == 1
+    assert stats["hit_ratio"] == pytest.approx(0.3333)
+
+
+def test_shared_tier_serves_other_processes_and_honours_generations():
+    redis = _FakeRedis()
+
+    async def scenario():
+        writer = ResultCache("spec", shared_tier=_shared_tier(redis))
+        reader = ResultCache("spec", shared_tier=_shared_tier(redis))
+        await writer.set("q", [{"tool_id": "t1"}], scope="ws")
+        first = await reader.get("q", scope="ws")
+        writer.invalidate(scope="ws")
+        await asyncio.sleep(0)
+        other_reader = ResultCache("spec", shared_tier=_shared_tier(redis))
+        return first, await other_reader.get("q", scope="ws"), reader.stats()
+
+    first, after_invalidation, stats = asyncio.run(scenario())
+
+    assert first == [{"tool_id": "t1"}]
+    assert after_invalidation is None
+    assert stats["shared_hits"] == 1
+
+
+def test_pending_generation_bump_keeps_scope_off_the_shared_tier():
+    class _SlowIncrRedis(_FakeRedis):
+        def __init__(self):
+            super().__init__()
+            self.release = asyncio.Event()
+
+        async def incr(self, key):
+            await self.release.wait()
+            await super().incr(key)
+
+    redis = _SlowIncrRedis()
+
+    async def scenario():
+        cache = ResultCache("spec", shared_tier=_shared_tier(redis))
+        await cache.set("q", ["old"], scope="ws")
+        cache.invalidate(scope="ws")
+        await asyncio.sleep(0)
+        during = await cache.get("q", scope="ws")
+        await cache.set("q", ["new"], scope="ws")
+        shared_writes = len(redis.values)
+        redis.release.set()
+        await asyncio.sleep(0)
+        reader = ResultCache("spec", shared_tier=_shared_tier(redis))
+        return during, shared_writes, await reader.get("q", scope="ws")
+
+    assert asyncio.run(scenario()) == (None, 1, None)
+
+
+def test_invalidation_outside_a_loop_is_sent_before_the_next_lookup():
+    redis = _FakeRedis()
+    cache = ResultCache("spec", shared_tier=_shared_tier(redis))
+    asyncio.run(cache.set("q", ["old"], scope="ws"))
+
+    cache.invalidate(scope="ws")
+
+    assert asyncio.run(cache.get("q", scope="ws")) is None
+    assert redis.values["spec:generation:ws"] == "1"
+
+
+def test_shared_tier_failure_degrades_to_memory_only():
+    calls = []
+
+    async def unavailable():
+        calls.append(1)
+        return None
+
+    async def scenario():
+        cache = ResultCache("spec", shared_tier=RedisResultTier(unavailable))
+        await cache.set("q", ["a"])
+        return await cache.get("q"), await cache.get("missing")
+
+    assert asyncio.run(scenario()) == (["a"], None)
+    assert len(calls) == 1
+
+
+def test_near_duplicate_embeddings_reuse_results():
+    async def scenario():
+        cache = ResultCache("spec", semantic_epsilon=0.01)
+        await cache.set("q1", ["a"], scope="ws", embedding=[1.0, 0.0], partition="m")
+        return (
+            cache.get_similar([0.999, 0.02], scope="ws", partition="m"),
+            cache.get_similar([0.7, 0.7], scope="ws", partition="m"),
+            cache.get_similar([0.999, 0.02], scope="ws", partition="other"),
+            cache.stats()["semantic_hits"],
+        )
+
+    assert asyncio.run(scenario()) == (["a"], None, None, 1)
+
+
+def test_tool_rag_binding_invalidation_is_workspace_scoped(monkeypatch):
+    calls = []
+
+    async def fake_retrieve(query, top_k, workspace_id, **kwargs):
+        calls.append(workspace_id)
+        return [{"tool_id": f"{workspace_id}-tool"}]
+
+    monkeypatch.setattr(tool_rag, "_retrieve_from_service", fake_retrieve)
+    tool_rag.invalidate_tool_rag_cache()
+
+    async def scenario():
+        for workspace_id in ("ws-a", "ws-b"):
+            await tool_rag.retrieve_relevant_tools("q", top_k=5, workspace_id=workspace_id)
+        tool_rag.invalidate_tool_rag_cache(workspace_id="ws-a")
+        for workspace_id in ("ws-a", "ws-b"):
+            await tool_rag.retrieve_relevant_tools("q", top_k=5, workspace_id=workspace_id)
+
+    asyncio.run(scenario())
+
+    assert calls == ["ws-a", "ws-b", "ws-a"]
+    assert tool_rag.tool_rag_cache_stats()["memory_hits"] >= 1
+
+
+def test_tool_rag_semantic_miss_reuses_the_lookup_embedding(monkeypatch):
+    embeds = []
+    searches = []
+
+    async def fake_embed_query(query):
+        embeds.append(query)
+        return [1.0, 0.0], "m"
+
+    async def fake_retrieve(query, top_k, workspace_id, **kwargs):
+        searches.append(kwargs)
+        return [{"tool_id": "tool"}]
+
+    monkeypatch.setattr(tool_rag, "_embed_query", fake_embed_query)
+    monkeypatch.setattr(tool_rag, "_retrieve_from_service", fake_retrieve)
+    monkeypatch.setattr(
+        tool_rag, "_cache", ResultCache("tool_rag", semantic_epsilon=0.01)
+    )
+
+    asyncio.run(tool_rag.retrieve_relevant_tools("semantic q", top_k=5))
+
+    assert embeds == ["semantic q"]
+    assert searches == [{"query_embedding": [1.0, 0.0], "model_name": "m"}]
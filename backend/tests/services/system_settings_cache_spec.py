@@ -0,0 +1,59 @@
+from backend.app.services import system_settings_cache
+from backend.app.services.system_settings_cache import (
+    add_setting_change_listener,
+    get_cached_setting_value,
+    invalidate_cached_setting,
+    notify_setting_changed,
+)
+
+
+def setup_function():
+    invalidate_cached_setting()
+
+
+def test_cached_setting_loads_once_within_ttl():
+    calls = []
+
+    def loader(key):
+        calls.append(key)
+        return "bge-m3"
+
+    assert get_cached_setting_value("embedding_model", loader=loader) == "bge-m3"
+    assert get_cached_setting_value("embedding_model", loader=loader) == "bge-m3"
+    assert calls == ["embedding_model"]
+
+
+def test_zero_ttl_reloads_every_call():
+    calls = []
+
+    def loader(key):
+        calls.append(key)
+        return len(calls)
+
+    assert get_cached_setting_value("k", loader=loader, ttl_seconds=0) == 1
+    assert get_cached_setting_value("k", loader=loader, ttl_seconds=0) == 2
+
+
+def test_notify_invalidates_and_runs_listeners():
+    seen = []
+    values = iter(["old", "new"])
+    add_setting_change_listener("embedding_model", seen.append)
+
+    assert get_cached_setting_value("embedding_model", loader=lambda _: next(values)) == "old"
+    notify_setting_changed("embedding_model")
+
+    assert seen == ["embedding_model"]
+    assert get_cached_setting_value("embedding_model", loader=lambda _: next(values)) == "new"
+    system_settings_cache._LISTENERS.pop("embedding_model", None)
+
+
+def test_failing_listener_does_not_block_invalidation():
+    def broken(_key):
+        raise RuntimeError("boom")
+
+    add_setting_change_listener("chat_model", broken)
+    get_cached_setting_value("chat_model", loader=lambda _: "a")
+    notify_setting_changed("chat_model")
+
+    assert get_cached_setting_value("chat_model", loader=lambda _: "b") == "b"
+    system_settings_cache._LISTENERS.pop("chat_model", None)
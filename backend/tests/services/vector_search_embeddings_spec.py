@@ -1,8 +1,7 @@
 import pytest
 
-from backend.app.services.vector_search_embeddings import (
-    VectorEmbeddingGenerator,
-)
+from backend.app.services.vector_search_embedding_batch import plan_embedding_batches
+from backend.app.services.vector_search_embeddings import VectorEmbeddingGenerator
 from backend.app.services.vector_search_ollama import (
     OllamaEmbeddingOutcome,
 )
@@ -21,6 +20,19 @@ class FakeOllamaClient:
         self.calls.append(("embed", text, model, is_query))
         return self.outcome
 
+    async def embed_many(self, texts, *, model, is_query):
+        self.calls.append(("embed_many", list(texts), model, is_query))
+        return [
+            self.outcome
+            if self.outcome.error_code
+            else OllamaEmbeddingOutcome(
+                embedding=(float(len(text)),),
+                model=model,
+                base_url="http://provider:11434",
+            )
+            for text in texts
+        ]
+
     def get_reachable_base_url(self):
         return "http://provider:11434"
 
@@ -143,3 +155,167 @@ def test_sync_url_wrapper_delegates_to_provider_leaf():
     )
 
     assert generator.get_ollama_url() == "http://provider:11434"
+
+
+def test_batch_plan_respects_item_and_token_budgets():
+    texts = ["a" * 40, "b" * 40, "c" * 40, "d" * 4000, "e"]
+
+    batches = plan_embedding_batches(texts, max_items=2, max_tokens=100)
+
+    assert batches == [[0, 1], [2], [3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_batch_selects_model_once_and_keeps_order(monkeypatch):
+    monkeypatch.delenv("OLLAMA_EMBED_MODEL", raising=False)
+    monkeypatch.setenv("EMBEDDING_BATCH_MAX_ITEMS", "2")
+    client = FakeOllamaClient(OllamaEmbeddingOutcome())
+    generator = VectorEmbeddingGenerator(ollama_client=client)
+
+    receipts = await generator.generate_embeddings_batch(
+        ["a", "bb", "ccc"],
+        is_query=False,
+    )
+
+    assert [receipt.embedding for receipt in receipts] == [(1.0,), (2.0,), (3.0,)]
+    assert {receipt.provider for receipt in receipts} == {"ollama"}
+    assert {receipt.model for receipt in receipts} == {"bge-m3"}
+    assert [call[0] for call in client.calls] == ["select", "embed_many", "embed_many"]
+
+
+@pytest.mark.asyncio
+async def test_batch_failures_fall_back_to_openai_per_batch(monkeypatch):
+    generator = VectorEmbeddingGenerator(
+        ollama_client=FakeOllamaClient(
+            OllamaEmbeddingOutcome(model="bge-m3", error_code="read_timeout")
+        )
+    )
+
+    async def fake_openai_batch(texts):
+        return [[0.5] for _ in texts]
+
+    monkeypatch.setattr(generator, "generate_openai_embeddings", fake_openai_batch)
+    monkeypatch.setattr(
+        generator,
+        "_configured_openai_model_name",
+        lambda: "text-embedding-3-small",
+    )
+
+    receipts = await generator.generate_embeddings_batch(["x", "y"])
+
+    assert [receipt.provider for receipt in receipts] == ["openai", "openai"]
+    assert receipts[0].model == "text-embedding-3-small"
+
+
+@pytest.mark.asyncio
+async def test_batch_with_explicit_model_can_disable_fallback():
+    client = FakeOllamaClient(
+        OllamaEmbeddingOutcome(model="nomic", error_code="http_500")
+    )
+    generator = VectorEmbeddingGenerator(ollama_client=client)
+
+    receipts = await generator.generate_embeddings_batch(
+        ["x"],
+        model="nomic-embed-text",
+        allow_openai_fallback=False,
+    )
+
+    assert receipts == [None]
+    assert client.calls[0][0] == "embed_many"
+
+
+@pytest.mark.asyncio
+async def test_cached_receipt_skips_provider_call(monkeypatch):
+    from backend.app.services.embedding_cache import (
+        EmbeddingCache,
+        EmbeddingMemoryTier,
+    )
+
+    monkeypatch.delenv("OLLAMA_EMBED_MODEL", raising=False)
+    client = FakeOllamaClient(
+        OllamaEmbeddingOutcome(
+            embedding=(0.5, 0.25),
+            model="bge-m3",
+            base_url="http://provider:11434",
+        )
+    )
+    generator = VectorEmbeddingGenerator(
+        ollama_client=client,
+        embedding_cache=EmbeddingCache(memory_tier=EmbeddingMemoryTier(8)),
+    )
+
+    first = await generator.generate_embedding_receipt("hello", is_query=True)
+    second = await generator.generate_embedding_receipt("hello", is_query=False)
+    receipts = await generator.generate_embeddings_batch(["hello", "new"])
+
+    assert first.embedding == second.embedding == (0.5, 0.25)
+    assert receipts[0].provider == "ollama"
+    assert [call[0] for call in client.calls].count("embed") == 1
+    assert client.calls[-1] == ("embed_many", ["new"], "bge-m3", True)
+
+
+@pytest.mark.asyncio
+async def test_batch_receipts_record_the_provider_model(monkeypatch):
+    from backend.app.services.embedding_cache import (
+        EmbeddingCache,
+        EmbeddingMemoryTier,
+    )
+
+    class TaggedOllamaClient(FakeOllamaClient):
+        async def embed_many(self, texts, *, model, is_query):
+            self.calls.append(("embed_many", list(texts), model, is_query))
+            return [
+                OllamaEmbeddingOutcome(
+                    embedding=(float(len(text)),),
+                    model=f"{model}:latest",
+                    base_url="http://provider:11434",
+                )
+                for text in texts
+            ]
+
+    monkeypatch.delenv("OLLAMA_EMBED_MODEL", raising=False)
+    client = TaggedOllamaClient(OllamaEmbeddingOutcome())
+    generator = VectorEmbeddingGenerator(
+        ollama_client=client,
+        embedding_cache=EmbeddingCache(memory_tier=EmbeddingMemoryTier(8)),
+    )
+
+    first = await generator.generate_embeddings_batch(["a", "bb"], is_query=False)
+    reported = await generator.generate_embeddings_batch(
+        ["a", "bb"], is_query=False, model="bge-m3:latest"
+    )
+    requested = await generator.generate_embeddings_batch(["a", "bb"], is_query=False)
+
+    assert {receipt.model for receipt in first} == {"bge-m3:latest"}
+    assert [receipt.embedding for receipt in reported] == [(1.0,), (2.0,)]
+    assert {receipt.model for receipt in requested} == {"bge-m3:latest"}
+    # Cached under the reported model only: the reported-model lookup hits,
+    # the requested-model lookup goes back to the provider.
+    assert [call[2] for call in client.calls if call[0] == "embed_many"] == [
+        "bge-m3",
+        "bge-m3",
+    ]
+
+
+def test_openai_model_name_is_read_through_the_settings_cache(monkeypatch):
+    from backend.app.services import system_settings_cache, system_settings_store
+
+    loads = []
+
+    def load_setting_value(key):
+        loads.append(key)
+        return "text-embedding-3-large"
+
+    def forbidden_store(*_args, **_kwargs):
+        raise AssertionError("embedding model must come from the settings cache")
+
+    system_settings_cache.invalidate_cached_setting()
+    monkeypatch.setattr(system_settings_cache, "_load_setting_value", load_setting_value)
+    monkeypatch.setattr(system_settings_store, "SystemSettingsStore", forbidden_store)
+    try:
+        names = [VectorEmbeddingGenerator._configured_openai_model_name() for _ in range(3)]
+    finally:
+        system_settings_cache.invalidate_cached_setting()
+
+    assert names == ["text-embedding-3-large"] * 3
+    assert loads == ["embedding_model"]
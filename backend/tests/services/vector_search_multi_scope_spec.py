@@ -0,0 +1,131 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.app.services.vector_search import (
+    VectorScope,
+    VectorSearchService,
+    personal_context_scope,
+    playbook_sop_scope,
+)
+
+
+class RecordingVectorSearchService(VectorSearchService):
+    def __init__(self, rows_by_table, delay=0.0):
+        super().__init__()
+        self.rows_by_table = rows_by_table
+        self.delay = delay
+        self.embeddings = []
+        self.queries = []
+
+    async def _generate_embedding(self, text):
+        self.embeddings.append(text)
+        return [0.1, 0.2]
+
+    async def vector_search(self, table, query_embedding, filters=None, top_k=5, **kwargs):
+        self.queries.append((table, dict(filters or {}), top_k))
+        await asyncio.sleep(self.delay)
+        return [dict(row) for row in self.rows_by_table.get(table, [])][:top_k]
+
+
+def _rows(prefix, count, **extra):
+    return [
+        {"id": f"{prefix}-{index}", "content": f"{prefix} {index}", "similarity": 0.9, **extra}
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_playbook_context_embeds_once_and_searches_concurrently():
+    service = RecordingVectorSearchService(
+        {
+            "playbook_knowledge": _rows("sop", 6, section_type="step"),
+            "memory_embeddings": _rows("mem", 5, source_type="note"),
+        },
+        delay=0.2,
+    )
+
+    started = time.perf_counter()
+    result = await service.execute_playbook_with_context("pb_demo", "draft a plan", "u1")
+    elapsed = time.perf_counter() - started
+
+    assert service.embeddings == ["draft a plan"]
+    assert elapsed < 0.35
+    assert len(result["context"]["playbook_sop"]) == 5
+    assert len(result["context"]["personal_context"]) == 3
+    assert ("playbook_knowledge", {"playbook_code": "pb_demo"}, 5) in service.queries
+    assert "## Playbook SOP:" in result["context_text"]
+
+
+@pytest.mark.asyncio
+async def test_personal_scope_falls_back_to_legacy_table_only_when_empty():
+    service = RecordingVectorSearchService(
+        {"mindscape_personal": _rows("legacy", 2, source_type="profile")}
+    )
+
+    results = await service.search_personal_context("u1", "who am I")
+
+    assert [row["id"] for row in results] == ["legacy-0", "legacy-1"]
+    assert [table for table, _, _ in service.queries] == [
+        "memory_embeddings",
+        "mindscape_personal",
+    ]
+
+    service.rows_by_table["memory_embeddings"] = _rows("mem", 1)
+    service.queries.clear()
+    await service.search_personal_context("u1", "who am I")
+    assert [table for table, _, _ in service.queries] == ["memory_embeddings"]
+
+
+@pytest.mark.asyncio
+async def test_search_scopes_applies_per_scope_quotas_and_reuses_embedding():
+    service = RecordingVectorSearchService({"memory_embeddings": _rows("mem", 10)})
+
+    results = await service.search_scopes(
+        "query",
+        {
+            "small": VectorScope(table="memory_embeddings", top_k=2),
+            "sop": playbook_sop_scope("pb", top_k=4),
+            "personal": personal_context_scope("u1", top_k=3),
+        },
+        query_embedding=[0.3],
+    )
+
+    assert service.embeddings == []
+    assert {name: len(rows) for name, rows in results.items()} == {
+        "small": 2,
+        "sop": 0,
+        "personal": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_multi_scope_search_runs_scopes_concurrently():
+    service = RecordingVectorSearchService(
+        {"memory_embeddings": _rows("mem", 10, importance=0.5)}, delay=0.2
+    )
+
+    started = time.perf_counter()
+    results = await service.multi_scope_search(
+        query="q",
+        user_id="u1",
+        workspace_id="ws-1",
+        intent_id="i-1",
+        top_k_per_scope={"global": 3, "workspace": 8, "intent": 4},
+    )
+
+    assert time.perf_counter() - started < 0.35
+    assert service.embeddings == ["q"]
+    assert {scope: len(rows) for scope, rows in results.items()} == {
+        "global": 3,
+        "workspace": 8,
+        "intent": 4,
+    }
+    filters = {query_filters["scope"]: query_filters for _, query_filters, _ in service.queries}
+    assert filters["intent"] == {
+        "user_id": "u1",
+        "scope": "intent",
+        "intent_id": "i-1",
+        "workspace_id": "ws-1",
+    }
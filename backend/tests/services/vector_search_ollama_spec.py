@@ -91,6 +91,48 @@ async def test_embed_uses_canonical_endpoint_and_response_shape(
     ]
 
 
+@pytest.mark.asyncio
+async def test_embed_many_sends_one_multi_input_request(monkeypatch):
+    monkeypatch.setenv("OLLAMA_HOST", "http://provider:11434")
+    calls = install_fake_client(
+        monkeypatch,
+        [FakeResponse(payload={"embeddings": [[0.1, 0.2], [0.3, 0.4]]})],
+    )
+
+    outcomes = await OllamaEmbeddingClient().embed_many(
+        ["first", "second"],
+        model="nomic-embed-text",
+        is_query=False,
+    )
+
+    assert [outcome.embedding for outcome in outcomes] == [(0.1, 0.2), (0.3, 0.4)]
+    assert len(calls) == 1
+    assert calls[0][2]["input"] == [
+        "search_document: first",
+        "search_document: second",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_embed_many_count_mismatch_fails_every_item(monkeypatch):
+    monkeypatch.setenv("OLLAMA_HOST", "http://provider:11434")
+    install_fake_client(
+        monkeypatch,
+        [FakeResponse(payload={"embeddings": [[0.1, 0.2]]})],
+    )
+
+    outcomes = await OllamaEmbeddingClient().embed_many(
+        ["first", "second"],
+        model="bge-m3",
+        is_query=False,
+    )
+
+    assert [outcome.error_code for outcome in outcomes] == [
+        "invalid_embedding_shape",
+        "invalid_embedding_shape",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_nomic_prefix_is_owned_by_provider_leaf(monkeypatch):
     monkeypatch.setenv("OLLAMA_HOST", "http://provider:11434")
@@ -191,6 +233,24 @@ async def test_model_selection_prefers_installed_bge(monkeypatch):
         ],
     )
 
+    OllamaEmbeddingClient.clear_model_selection_cache()
     model = await OllamaEmbeddingClient().select_embedding_model()
 
     assert model == "bge-m3"
+
+
+@pytest.mark.asyncio
+async def test_model_selection_is_cached_per_endpoint_set(monkeypatch):
+    monkeypatch.setenv("OLLAMA_HOST", "http://cached-provider:11434")
+    OllamaEmbeddingClient.clear_model_selection_cache()
+    calls = install_fake_client(
+        monkeypatch,
+        [FakeResponse(payload={"models": [{"name": "bge-m3:latest"}]})],
+    )
+
+    first = await OllamaEmbeddingClient().select_embedding_model()
+    second = await OllamaEmbeddingClient().select_embedding_model()
+
+    assert first == second == "bge-m3"
+    assert len(calls) == 1
+    OllamaEmbeddingClient.clear_model_selection_cache()
@@ -3,9 +3,11 @@ from pathlib import Path
 import pytest
 
 from backend.app.services.vector_search import VectorSearchService
+from backend.app.services import vector_search_db
 from backend.app.services.vector_search_db import (
     save_external_doc,
     search_vectors,
+    similarity_statement,
     update_last_used_at_records,
 )
 
@@ -89,6 +91,37 @@ async def test_search_vectors_preserves_filters_limit_and_close():
     assert connection.closed is True
 
 
+@pytest.mark.asyncio
+async def test_search_vectors_reads_model_from_settings_cache(monkeypatch):
+    cursor = FakeCursor()
+    connection = FakeConnection(cursor)
+    monkeypatch.setattr(
+        vector_search_db,
+        "get_cached_setting_value",
+        lambda key: "bge-m3" if key == "embedding_model" else None,
+    )
+
+    await search_vectors(
+        get_connection=lambda: connection,
+        table="memory_embeddings",
+        query_embedding=[0.5],
+        filters={"user_id": "user-1"},
+        top_k=3,
+    )
+
+    assert "metadata->>'embedding_model' = %s" in cursor.query
+    assert cursor.params == ["[0.5]", "user-1", "bge-m3", "[0.5]", 3]
+    assert connection.closed is True
+
+
+def test_similarity_statement_is_reused_per_filter_shape():
+    first = similarity_statement("playbook_knowledge", ("playbook_code",), False)
+    second = similarity_statement("playbook_knowledge", ("playbook_code",), False)
+
+    assert first is second
+    assert similarity_statement("playbook_knowledge", (), False) != first
+
+
 @pytest.mark.asyncio
 async def test_update_last_used_at_records_skips_empty_ids_without_connection():
     calls = {"connections": 0}
@@ -0,0 +1,230 @@
+import asyncio
+import threading
+
+import pytest
+
+from backend.app.services import vector_search as vector_search_module
+from backend.app.services.vector_search import VectorSearchService
+from backend.app.services.vector_usage_tracker import LastUsedAtWriteBehind
+
+
+class RecordingCursor:
+    def __init__(self, statements):
+        self.statements = statements
+
+    def execute(self, query, params=None):
+        self.statements.append((" ".join(query.split()), list(params or [])))
+
+    def close(self):
+        pass
+
+
+class RecordingConnection:
+    def __init__(self, statements):
+        self.statements = statements
+        self.commits = 0
+
+    def cursor(self, **kwargs):
+        return RecordingCursor(self.statements)
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def statements():
+    return []
+
+
+@pytest.fixture
+def connections(statements):
+    opened = []
+
+    def _connect():
+        connection = RecordingConnection(statements)
+        opened.append(connection)
+        return connection
+
+    _connect.opened = opened
+    return _connect
+
+
+@pytest.mark.asyncio
+async def test_record_coalesces_ids_per_table_without_touching_the_database(
+    connections, statements
+):
+    tracker = LastUsedAtWriteBehind(
+        flush_interval_seconds=60, flush_batch_size=100, get_connection=connections
+    )
+
+    tracker.record(["a", "b"])
+    tracker.record(["b", "c", ""])
+    tracker.record(["x"], table="mindscape_personal")
+
+    assert connections.opened == []
+    assert tracker.pending_count() == 4
+
+    assert await tracker.flush() == 4
+    assert len(connections.opened) == 2
+    by_table = {statement.split()[1]: params for statement, params in statements}
+    assert by_table == {"memory_embeddings": ["a", "b", "c"], "mindscape_personal": ["x"]}
+    assert tracker.pending_count() == 0
+    await tracker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_size_threshold_triggers_a_background_flush(connections, statements):
+    tracker = LastUsedAtWriteBehind(
+        flush_interval_seconds=60, flush_batch_size=3, get_connection=connections
+    )
+    tracker.start()
+
+    tracker.record(["a", "b"])
+    await asyncio.sleep(0.05)
+    assert statements == []
+
+    tracker.record(["c"])
+    for _ in range(50):
+        if statements:
+            break
+        await asyncio.sleep(0.01)
+
+    assert [params for _, params in statements] == [["a", "b", "c"]]
+    await tracker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_interval_flush_and_close_drain_the_buffer(connections, statements):
+    tracker = LastUsedAtWriteBehind(
+        flush_interval_seconds=0.05, flush_batch_size=100, get_connection=connections
+    )
+    tracker.start()
+
+    tracker.record(["a"])
+    await asyncio.sleep(0.2)
+    assert [params for _, params in statements] == [["a"]]
+
+    tracker.record(["b"])
+    await tracker.aclose()
+    assert [params for _, params in statements] == [["a"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_records_from_other_threads_and_loops_signal_the_app_loop(
+    connections, statements
+):
+    tracker = LastUsedAtWriteBehind(
+        flush_interval_seconds=60, flush_batch_size=3, get_connection=connections
+    )
+    tracker.start()
+    app_flusher = tracker._flusher
+
+    async def _short_lived_caller():
+        tracker.record(["a", "b"])
+
+    # A request handled under asyncio.run in a worker thread must not own the
+    # flusher, and a threshold hit from a plain thread must still wake it.
+    await asyncio.to_thread(asyncio.run, _short_lived_caller())
+    caller = threading.Thread(target=tracker.record, args=(["c"],))
+    caller.start()
+    caller.join()
+    for _ in range(50):
+        if statements:
+            break
+        await asyncio.sleep(0.01)
+
+    assert tracker._flusher is app_flusher and not app_flusher.done()
+    assert [params for _, params in statements] == [["a", "b", "c"]]
+    await tracker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_first_record_on_a_loop_starts_the_flusher_without_app_startup(
+    connections, statements
+):
+    tracker = LastUsedAtWriteBehind(
+        flush_interval_seconds=60, flush_batch_size=2, get_connection=connections
+    )
+
+    tracker.record(["a", "b"])
+    for _ in range(50):
+        if statements:
+            break
+        await asyncio.sleep(0.01)
+
+    assert tracker._flusher is not None and not tracker._flusher.done()
+    assert [params for _, params in statements] == [["a", "b"]]
+    await tracker.aclose()
+
+
+def test_short_lived_loops_hand_the_flusher_to_the_next_caller(connections, statements):
+    tracker = LastUsedAtWriteBehind(
+        flush_interval_seconds=60, flush_batch_size=3, get_connection=connections
+    )
+
+    async def _record(ids):
+        tracker.record(ids)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(_record(["a", "b"]))
+    assert statements == []
+    asyncio.run(_record(["c"]))
+
+    assert [params for _, params in statements] == [["a", "b", "c"]]
+
+
+def test_full_batch_without_any_loop_is_written_on_the_vector_pool(
+    connections, statements
+):
+    tracker = LastUsedAtWriteBehind(
+        flush_interval_seconds=60, flush_batch_size=2, get_connection=connections
+    )
+
+    tracker.record(["a"])
+    assert tracker.pending_count() == 1
+    tracker.record(["b"])
+    for _ in range(50):
+        if statements:
+            break
+        threading.Event().wait(0.01)
+
+    assert [params for _, params in statements] == [["a", "b"]]
+    assert tracker.pending_count() == 0
+    assert tracker._flusher is None
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_dropped_and_logged():
+    def _broken_connection():
+        raise RuntimeError("vector db down")
+
+    tracker = LastUsedAtWriteBehind(
+        flush_interval_seconds=60, flush_batch_size=100, get_connection=_broken_connection
+    )
+    tracker.record(["a"])
+
+    assert await tracker.flush() == 0
+    assert tracker.pending_count() == 0
+    await tracker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_service_queues_usage_for_the_default_pool(monkeypatch):
+    recorded = []
+
+    class _Tracker:
+        def record(self, record_ids, table):
+            recorded.append((list(record_ids), table))
+
+    async def _direct_update(**kwargs):
+        raise AssertionError("default pool must not write on the read path")
+
+    monkeypatch.setattr(vector_search_module, "get_last_used_at_tracker", lambda: _Tracker())
+    monkeypatch.setattr(vector_search_module, "update_last_used_at_records", _direct_update)
+
+    await VectorSearchService().update_last_used_at(["id-1"], table="memory_embeddings")
+
+    assert recorded == [(["id-1"], "memory_embeddings")]
@@ -0,0 +1,133 @@
+import asyncio
+import json
+
+import pytest
+
+from backend.app.services.cache.workspace_stream_hub import WorkspaceStreamHub
+
+
+class _FakePubSub:
+    def __init__(self):
+        self.patterns = []
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def psubscribe(self, pattern):
+        self.patterns.append(pattern)
+
+    async def punsubscribe(self, pattern):
+        pass
+
+    async def close(self):
+        pass
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.pubsubs: list[_FakePubSub] = []
+
+    def pubsub(self):
+        pubsub = _FakePubSub()
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+
+def _hub(**kwargs) -> WorkspaceStreamHub:
+    async def _no_client():
+        return None
+
+    kwargs.setdefault("client_factory", _no_client)
+    return WorkspaceStreamHub(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_hub_serializes_once_and_fans_out_to_matching_subscribers():
+    hub = _hub()
+    try:
+        async with hub.subscribe("ws-1") as first, hub.subscribe(
+            "ws-1"
+        ) as second, hub.subscribe(None) as every, hub.subscribe("ws-2") as other:
+            delivered = hub.publish_local("ws-1", json.dumps({"type": "task_completed"}))
+
+            assert delivered == 3
+            events = [await sub.next_event(timeout=0.1) for sub in (first, second, every)]
+            assert events[0] is events[1] is events[2]
+            assert events[0].sse_frame == 'data: {"type": "task_completed"}\n\n'
+            assert events[2].workspace_id == "ws-1"
+            assert await other.next_event(timeout=0.01) is None
+            assert hub.metrics()["subscribers"] == 4
+        assert hub.metrics()["subscribers"] == 0
+    finally:
+        await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_the_newest_events_and_counts_drops():
+    hub = _hub(max_queue=2, policy="drop_oldest")
+    try:
+        async with hub.subscribe("ws-1") as subscription:
+            for index in range(4):
+                hub.publish_local("ws-1", json.dumps({"seq": index}))
+
+            received = [
+                (await subscription.next_event(timeout=0.1)).data["seq"] for _ in range(2)
+            ]
+            assert received == [2, 3]
+            assert subscription.dropped == 2
+            assert hub.metrics()["events_dropped"] == 2
+    finally:
+        await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_closes_slow_subscriber_only():
+    hub = _hub(max_queue=1, policy="disconnect")
+    try:
+        async with hub.subscribe("ws-1") as slow, hub.subscribe(
+            "ws-1", max_queue=8
+        ) as fast:
+            hub.publish_local("ws-1", json.dumps({"seq": 0}))
+            hub.publish_local("ws-1", json.dumps({"seq": 1}))
+
+            with pytest.raises(StopAsyncIteration):
+                await slow.next_event(timeout=0.1)
+            assert [(await fast.next_event(timeout=0.1)).data["seq"] for _ in range(2)] == [0, 1]
+            assert hub.metrics()["slow_disconnects"] == 1
+    finally:
+        await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_many_subscribers_share_one_pattern_subscription():
+    client = _FakeRedis()
+
+    async def _client_factory():
+        return client
+
+    hub = WorkspaceStreamHub(client_factory=_client_factory)
+    try:
+        async with hub.subscribe("ws-1") as first, hub.subscribe("ws-1") as second:
+            async with hub.subscribe("ws-2"):
+                for _ in range(50):
+                    if client.pubsubs and client.pubsubs[0].patterns:
+                        break
+                    await asyncio.sleep(0.01)
+            await client.pubsubs[0].messages.put(
+                {
+                    "type": "pmessage",
+                    "channel": "workspace:ws-1:stream",
+                    "data": json.dumps({"type": "mind_event"}),
+                }
+            )
+
+            assert (await first.next_event(timeout=1)).data == {"type": "mind_event"}
+            assert (await second.next_event(timeout=1)).data == {"type": "mind_event"}
+            assert len(client.pubsubs) == 1
+            assert client.pubsubs[0].patterns == ["workspace:*:stream"]
+    finally:
+        await hub.close()
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 
+from backend.app.services.stores.tasks_store import _crud_frontier_release
 from backend.app.services.stores.tasks_store._crud_frontier_release import (
     TasksStoreFrontierReleaseMixin,
 )
@@ -76,3 +77,24 @@ def test_resource_wait_release_noop_does_not_refresh_projection():
         released_at=datetime.now(timezone.utc),
     ) is False
     assert store.refreshed == []
+
+
+def test_resource_wait_release_records_a_graph_change(monkeypatch):
+    changes = []
+    monkeypatch.setattr(
+        _crud_frontier_release,
+        "record_graph_change",
+        lambda *args: changes.append(args),
+    )
+
+    assert _Store(rowcount=1).try_release_resource_wait_task(
+        "task-1",
+        released_at=datetime.now(timezone.utc),
+        workspace_id="ws-1",
+    )
+    assert not _Store(rowcount=0).try_release_resource_wait_task(
+        "task-raced",
+        released_at=datetime.now(timezone.utc),
+        workspace_id="ws-1",
+    )
+    assert changes == [("ws-1", "task", "task-1")]
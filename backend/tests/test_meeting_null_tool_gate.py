@@ -334,7 +334,7 @@ class TestRagCacheInjection:
         ]
         call_count = [0]
 
-        async def counting_service(query, top_k, workspace_id):
+        async def counting_service(query, top_k, workspace_id, **kwargs):
             call_count[0] += 1
             return fake
 
@@ -364,7 +364,7 @@ class TestRagCacheInjection:
             "ws-b": [{"tool_id": "tool-b", "display_name": "B", "description": ""}],
         }
 
-        async def side_effect(query, top_k, workspace_id):
+        async def side_effect(query, top_k, workspace_id, **kwargs):
             return results.get(workspace_id, [])
 
         with patch.object(rag, "_retrieve_from_service", new=side_effect):
@@ -7,6 +7,9 @@ from backend.app.models.tool_registry import (
     ToolConnectionModel,
     ToolInputSchema,
 )
+from backend.app.services.tool_catalog_generation import (
+    current_tool_catalog_generation,
+)
 from backend.app.services.tool_registry_core.connections import (
     delete_connection,
     export_as_templates,
@@ -22,6 +25,7 @@ from backend.app.services.tool_registry_core.persistence import (
 from backend.app.services.tool_registry_core.tools import (
     get_tools,
     infer_side_effect_level,
+    update_tool,
 )
 
 
@@ -119,6 +123,7 @@ def test_delete_connection_unregisters_attached_tools():
     tools_by_id["tool-2"].site_id = "other"
     unregistered = []
     saved = []
+    generation = current_tool_catalog_generation()
 
     deleted = delete_connection(
         connections_by_key,
@@ -134,6 +139,23 @@ def test_delete_connection_unregisters_attached_tools():
     assert "tool-1" not in tools_by_id
     assert unregistered == ["tool-1"]
     assert saved == [True]
+    assert current_tool_catalog_generation() == generation + 1
+
+
+def test_update_tool_bumps_catalog_generation_only_for_known_tools():
+    tools_by_id = {"tool-1": _make_tool(tool_id="tool-1")}
+    generation = current_tool_catalog_generation()
+
+    missing = update_tool(
+        tools_by_id, save_registry=lambda: None, tool_id="missing", enabled=False
+    )
+    updated = update_tool(
+        tools_by_id, save_registry=lambda: None, tool_id="tool-1", enabled=False
+    )
+
+    assert missing is None
+    assert updated.enabled is False
+    assert current_tool_catalog_generation() == generation + 1
 
 
 def test_export_as_templates_redacts_sensitive_values():
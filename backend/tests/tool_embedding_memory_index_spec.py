@@ -0,0 +1,205 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from backend.app.services import tool_embedding_memory_index as memory_index
+from backend.app.services.tool_embedding_memory_index import (
+    LexicalIndex,
+    build_snapshot,
+    invalidate_tool_retrieval_index,
+)
+from backend.app.services.tool_embedding_service import RAG_HIT, ToolEmbeddingService
+from backend.app.services.tool_rag import invalidate_tool_rag_cache
+
+
+def _row(tool_id, name, description, model, vector, capability=None):
+    literal = "[" + ",".join(str(value) for value in vector) + "]"
+    return (tool_id, name, description, "tool", capability, model, literal)
+
+
+ROWS = [
+    _row("ig.ig_publish_post", "Publish post", "Publish media to Instagram", "primary", [1.0, 0.0, 0.0]),
+    _row("cs.cs_calendar_view", "Calendar view", "View scheduled posts", "primary", [0.0, 1.0, 0.0]),
+    _row("fs.read_file", "Read file", "Read a workspace file", "primary", [0.6, 0.8, 0.0]),
+    _row("ig.ig_publish_post", "Publish post", "Publish media to Instagram", "secondary", [0.0, 0.0, 1.0]),
+    _row("cs.cs_calendar_view", "Calendar view", "View scheduled posts", "secondary", [0.0, 1.0, 1.0]),
+]
+
+
+class _FakeCursor:
+    def __init__(self, database):
+        self.database = database
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.database.statements.append(" ".join(sql.split()))
+        if self.database.fail_load and "embedding::text" in sql:
+            raise RuntimeError("vector db unavailable")
+        if "embedding::text" in sql:
+            self.rows = list(self.database.rows)
+        elif "embedding <=>" in sql:
+            self.rows = [
+                {
+                    "tool_id": "pg.fallback",
+                    "display_name": "Fallback",
+                    "description": "pgvector row",
+                    "category": "tool",
+                    "capability_code": None,
+                    "similarity": 0.9,
+                }
+            ]
+
+    def fetchall(self):
+        return self.rows
+
+
+class _FakeConnection:
+    def __init__(self, database):
+        self.database = database
+
+    def cursor(self, cursor_factory=None):
+        return _FakeCursor(self.database)
+
+    def close(self):
+        pass
+
+
+class _FakeDatabase:
+    def __init__(self, rows, fail_load=False):
+        self.rows = rows
+        self.fail_load = fail_load
+        self.statements = []
+        self.connections = 0
+
+    def connect(self):
+        self.connections += 1
+        return _FakeConnection(self)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    invalidate_tool_retrieval_index()
+    database = _FakeDatabase(ROWS)
+    svc = ToolEmbeddingService(postgres_config={"database": "memory-index-spec"})
+    svc._get_connection = database.connect
+
+    async def fake_generate_embedding(query, *, is_query=True):
+        return [0.9, 0.1, 0.0], "primary"
+
+    async def fake_generate_embedding_for_model(query, model_name, *, is_query=True):
+        return [0.0, 0.2, 0.9], model_name
+
+    svc._generate_embedding = fake_generate_embedding
+    svc._generate_embedding_for_model = fake_generate_embedding_for_model
+    svc.database = database
+    yield svc
+    invalidate_tool_retrieval_index()
+
+
+def test_vector_top_k_matches_brute_force_cosine():
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(300, 16)).astype(np.float32)
+    rows = [
+        _row(f"tool-{index}", f"Tool {index}", "desc", "primary", vector.tolist())
+        for index, vector in enumerate(vectors)
+    ]
+    snapshot = build_snapshot(rows)
+    query = rng.normal(size=16).astype(np.float32)
+
+    matches = snapshot.search_vectors("primary", query.tolist(), top_k=10)
+
+    normalised = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(normalised @ (query / np.linalg.norm(query))))[:10]
+    assert [match.tool_id for match in matches] == [f"tool-{i}" for i in expected]
+    assert matches[0].similarity == pytest.approx(
+        float(normalised[expected[0]] @ (query / np.linalg.norm(query))), rel=1e-5
+    )
+    assert snapshot.search_vectors("primary", [1.0, 2.0], top_k=5) == []
+    assert snapshot.search_vectors("missing", query.tolist(), top_k=5) == []
+    assert all(
+        match.similarity >= 0.2
+        for match in snapshot.search_vectors("primary", query.tolist(), 50, 0.2)
+    )
+
+
+def test_bm25_requires_every_term_and_dedupes_models():
+    snapshot = build_snapshot(ROWS)
+
+    publish = snapshot.search_bm25("publish instagram", top_k=5)
+    posts = snapshot.search_bm25("Posts", top_k=5)
+
+    assert [match.tool_id for match in publish] == ["ig.ig_publish_post"]
+    assert [match.tool_id for match in posts] == ["cs.cs_calendar_view"]
+    assert snapshot.search_bm25("publish calendar", top_k=5) == []
+    assert snapshot.search_bm25("", top_k=5) == []
+
+    lexical = LexicalIndex(
+        [
+            ("a", "render clip", "render render clip", "tool", None),
+            ("b", "clip", "render a long clip with many other words", "tool", None),
+        ]
+    )
+    assert [match.tool_id for match in lexical.search("render", 2)] == ["a", "b"]
+
+
+def test_rrf_search_loads_the_corpus_once(service):
+    first, status = asyncio.run(service.search_rrf("publish post", top_k=2, min_score=0.1))
+    second, _ = asyncio.run(service.search_rrf("publish post", top_k=2, min_score=0.1))
+
+    assert status == RAG_HIT
+    assert first[0].tool_id == "ig.ig_publish_post"
+    assert [match.tool_id for match in second] == [match.tool_id for match in first]
+    assert service.database.connections == 1
+
+    invalidate_tool_rag_cache()
+    asyncio.run(service.search("publish post", top_k=2))
+    assert service.database.connections == 2
+
+
+def test_load_failure_falls_back_to_pgvector(service, monkeypatch):
+    service.database.fail_load = True
+
+    matches, status = asyncio.run(service.search("publish post", top_k=2))
+    asyncio.run(service.search("publish post", top_k=2))
+
+    assert status == RAG_HIT
+    assert [match.tool_id for match in matches] == ["pg.fallback"]
+    loads = [sql for sql in service.database.statements if "embedding::text" in sql]
+    assert len(loads) == 1
+
+
+def test_memory_index_can_be_disabled(service, monkeypatch):
+    monkeypatch.setenv("TOOL_RAG_MEMORY_INDEX_ENABLED", "false")
+
+    matches, _ = asyncio.run(service.search("publish post", top_k=2))
+
+    assert [match.tool_id for match in matches] == ["pg.fallback"]
+    assert not any("embedding::text" in sql for sql in service.database.statements)
+    assert memory_index._snapshots == {}
+
+
+def test_model_missing_from_the_snapshot_falls_back_to_pgvector(service):
+    async def fake_generate_embedding(query, *, is_query=True):
+        return [0.9, 0.1, 0.0], "newly-indexed"
+
+    service._generate_embedding = fake_generate_embedding
+
+    matches, status = asyncio.run(service.search("publish post", top_k=2))
+    single = asyncio.run(
+        service._search_single_model([0.9, 0.1, 0.0], "newly-indexed", 2)
+    )
+    indexed = asyncio.run(service._search_single_model([1.0, 0.0, 0.0], "primary", 1))
+
+    assert status == RAG_HIT
+    assert [match.tool_id for match in matches] == ["pg.fallback"]
+    assert [match.tool_id for match in single] == ["pg.fallback"]
+    assert [match.tool_id for match in indexed] == ["ig.ig_publish_post"]
+    loads = [sql for sql in service.database.statements if "embedding::text" in sql]
+    assert len(loads) == 1
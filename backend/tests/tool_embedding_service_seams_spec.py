@@ -1,6 +1,6 @@
 import asyncio
 
-from backend.app.services import tool_embedding_service
+from backend.app.services import tool_embedding_indexing, tool_embedding_service
 from backend.app.services.tool_embedding_service import (
     RAG_HIT,
     ToolEmbeddingService,
@@ -95,3 +95,69 @@ def test_search_rrf_uses_facade_methods_without_live_resources():
 
     assert status == RAG_HIT
     assert [match.tool_id for match in matches] == ["tool-beta", "tool-alpha"]
+
+
+def test_search_rrf_reuses_a_precomputed_query_embedding():
+    service = ToolEmbeddingService(postgres_config={"database": "unused"})
+    searched = []
+
+    async def fail_generate_embedding(query, *, is_query=True):
+        raise AssertionError("query was embedded again")
+
+    async def fake_get_indexed_models():
+        return ["primary"]
+
+    async def fake_search(query, top_k=15, min_score=0.3, **kwargs):
+        searched.append(kwargs)
+        return [], RAG_HIT
+
+    service._generate_embedding = fail_generate_embedding
+    service.get_indexed_models = fake_get_indexed_models
+    service.search = fake_search
+
+    asyncio.run(
+        service.search_rrf(
+            "render clip", top_k=2, query_embedding=[0.1, 0.2], model_name="primary"
+        )
+    )
+
+    assert searched == [{"query_embedding": [0.1, 0.2], "model_name": "primary"}]
+
+
+def test_index_all_tools_embeds_in_one_batch_and_bulk_upserts(monkeypatch):
+    service = ToolEmbeddingService(postgres_config={"database": "unused"})
+    entries = [
+        {
+            "tool_id": f"tool-{index}",
+            "display_name": f"Tool {index}",
+            "description": "desc",
+            "category": "tool",
+            "capability_code": None,
+            "affordance": None,
+        }
+        for index in range(3)
+    ]
+    batch_calls = []
+    written = []
+
+    async def fake_collect(*, include_playbooks=True):
+        return entries
+
+    async def fake_batch(texts, *, model_name=None, is_query=False):
+        batch_calls.append((list(texts), model_name, is_query))
+        return [([0.1], "bge-m3"), (None, None), ([0.2], "bge-m3")]
+
+    service._collect_indexable_entries = fake_collect
+    service._generate_embeddings_batch = fake_batch
+    monkeypatch.setattr(
+        tool_embedding_indexing,
+        "_bulk_upsert_rows",
+        lambda _service, rows: written.extend(rows) or len(rows),
+    )
+
+    count = asyncio.run(service.index_all_tools())
+
+    assert count == 2
+    assert len(batch_calls) == 1
+    assert batch_calls[0][2] is False
+    assert [row[0] for row in written] == ["tool-0", "tool-2"]
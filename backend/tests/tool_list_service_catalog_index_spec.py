@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import tool_catalog
+from backend.app.services.tool_catalog_generation import (
+    bump_tool_catalog_generation,
+    current_tool_catalog_generation,
+)
+from backend.app.services.tool_list_service import ToolInfo, ToolListService
+from backend.app.services.tools.registry_core import dynamic
+
+
+def _tool(tool_id: str, source: str, category: str = "general", **kwargs) -> ToolInfo:
+    return ToolInfo(
+        tool_id=tool_id,
+        name=tool_id,
+        description=f"{tool_id} description",
+        category=category,
+        source=source,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def sources(monkeypatch):
+    calls = {"discovered": 0, "builtin": 0, "capability": 0}
+    state = SimpleNamespace(
+        calls=calls,
+        discovered=[
+            _tool("shared.tool", "discovered"),
+            _tool("wp.disabled", "discovered", enabled=False),
+        ],
+        builtin=[
+            _tool("shared.tool", "builtin"),
+            _tool("wp.disabled", "builtin"),
+            _tool("filesystem_list_files", "builtin", category="filesystem"),
+        ],
+        capability=[
+            _tool(
+                "yogacoach.plan",
+                "capability",
+                category="capability",
+                metadata={"tool_info": {"capability": "yogacoach"}},
+            ),
+            _tool("yogacoach.review", "capability", category="capability"),
+        ],
+        signature=(1, 1),
+    )
+
+    def _discovered(self, workspace_id=None, profile_id=None, enabled_only=True):
+        calls["discovered"] += 1
+        return [tool for tool in state.discovered if tool.enabled or not enabled_only]
+
+    def _counted(source):
+        def _load(self):
+            calls[source] += 1
+            return list(getattr(state, source))
+
+        return _load
+
+    monkeypatch.setattr(ToolListService, "_get_discovered_tools", _discovered)
+    monkeypatch.setattr(ToolListService, "_get_builtin_tools", _counted("builtin"))
+    monkeypatch.setattr(
+        ToolListService, "_get_capability_tools", _counted("capability")
+    )
+    monkeypatch.setattr(
+        ToolListService,
+        "_manifest_scan_signature",
+        lambda self, capabilities_dir: state.signature,
+    )
+    monkeypatch.setattr(tool_catalog, "_catalogs", {})
+    monkeypatch.setattr(
+        tool_catalog,
+        "_manifest_scan_state",
+        {"checked_at": None, "signature": state.signature},
+    )
+    return state
+
+
+def test_lookups_are_served_from_one_indexed_catalog(sources):
+    service = ToolListService(data_dir="catalog-spec")
+
+    for _ in range(3):
+        assert service.get_tool_by_id("shared.tool").source == "discovered"
+        assert service.get_tool_by_id("missing.tool") is None
+    assert [tool.tool_id for tool in service.get_tools_by_source("builtin")] == [
+        "filesystem_list_files"
+    ]
+    assert [tool.tool_id for tool in service.get_tools_by_category("capability")] == [
+        "yogacoach.plan",
+        "yogacoach.review",
+    ]
+    assert [tool.tool_id for tool in service.get_tools_by_capability("yogacoach")] == [
+        "yogacoach.plan",
+        "yogacoach.review",
+    ]
+    enabled = {tool.tool_id: tool.source for tool in service.get_all_tools()}
+    assert enabled["wp.disabled"] == "builtin"
+    assert service.get_tool_by_id("wp.disabled").source == "discovered"
+    assert sources.calls == {"discovered": 1, "builtin": 1, "capability": 1}
+
+
+def test_generation_bump_rebuilds_catalog_and_prompt_strings(sources):
+    service = ToolListService(data_dir="catalog-spec")
+
+    first = service.get_tools_string(workspace_id="ws-1")
+    assert service.get_tools_string(workspace_id="ws-1") is first
+    assert "- yogacoach.plan: yogacoach.plan (capability)" in first
+    assert sources.calls == {"discovered": 2, "builtin": 2, "capability": 2}
+
+    sources.capability.append(_tool("yogacoach.extra", "capability"))
+    assert service.get_tool_by_id("yogacoach.extra") is None
+    bump_tool_catalog_generation()
+
+    assert service.get_tool_by_id("yogacoach.extra") is not None
+    assert "yogacoach.extra" in service.get_tools_string(workspace_id="ws-1")
+    assert sources.calls == {"discovered": 4, "builtin": 4, "capability": 4}
+
+
+def test_manifest_signature_change_bumps_generation(sources, monkeypatch):
+    monkeypatch.setattr(tool_catalog, "_MANIFEST_SCAN_INTERVAL_SECONDS", 0.0)
+    service = ToolListService(data_dir="catalog-spec")
+    service.get_tool_by_id("shared.tool")
+    generation = current_tool_catalog_generation()
+
+    service.get_tool_by_id("shared.tool")
+    assert current_tool_catalog_generation() == generation
+
+    sources.signature = (2, 5)
+    service.get_tool_by_id("shared.tool")
+    assert current_tool_catalog_generation() == generation + 1
+    assert sources.calls["builtin"] == 2
+
+
+def test_builtin_registration_bumps_only_on_change(monkeypatch):
+    monkeypatch.setattr(dynamic, "_mindscape_tools", {})
+    tool = object()
+    generation = current_tool_catalog_generation()
+
+    dynamic.register_mindscape_tool("spec.tool", tool)
+    dynamic.register_mindscape_tool("spec.tool", tool)
+    assert current_tool_catalog_generation() == generation + 1
+
+    dynamic.unregister_dynamic_tool("spec.tool")
+    dynamic.unregister_dynamic_tool("spec.tool")
+    assert current_tool_catalog_generation() == generation + 2
@@ -193,6 +193,25 @@ def _validate_composition_graph_nodes(
                         key_template,
                         errors,
                     )
+        metadata = node.get("metadata", {})
+        if metadata is not None and not isinstance(metadata, dict):
+            errors.append(
+                _manifest_error(
+                    capability_code,
+                    f"{field_prefix}.metadata",
+                    "metadata must be an object",
+                )
+            )
+        elif metadata and "cacheable" in metadata and not isinstance(
+            metadata["cacheable"], bool
+        ):
+            errors.append(
+                _manifest_error(
+                    capability_code,
+                    f"{field_prefix}.metadata.cacheable",
+                    "metadata.cacheable must be a boolean",
+                )
+            )
 
 
 def _validate_composition_graph_node_ports(
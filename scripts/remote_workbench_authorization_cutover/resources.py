@@ -52,6 +52,9 @@ for _, key in ipairs(queue_keys) do
   if string.find(key, 'mindscape:queue:pending:', 1, true) == 1 then
     if key_type ~= 'list' then return redis.error_reply('pending queue type mismatch') end
     totals.pending = totals.pending + redis.call('LLEN', key)
+  elseif string.find(key, 'mindscape:queue:ready:', 1, true) == 1 then
+    if key_type ~= 'zset' then return redis.error_reply('ready queue type mismatch') end
+    totals.pending = totals.pending + redis.call('ZCARD', key)
   elseif string.find(key, 'mindscape:queue:processing:', 1, true) == 1 then
     if key_type ~= 'zset' then return redis.error_reply('processing queue type mismatch') end
     totals.processing = totals.processing + redis.call('ZCARD', key)